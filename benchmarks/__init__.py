@@ -0,0 +1,12 @@
+"""Hardware-free benchmarks for the effect loops and backend write paths.
+
+Every software and reactive effect is driven against real backend device
+classes wired to recording fake transports, on a virtual clock, so frame
+contents, bytes and reports per frame are deterministic run to run. Compute
+time, device-write time and Python allocations are measured on top.
+
+    python -m benchmarks --output bench.json
+    python -m benchmarks --compare bench.json
+
+See ``benchmarks/README.md``.
+"""
@@ -0,0 +1,133 @@
+"""Command line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+from .compare import compare_results, load_results, load_thresholds
+from .harness import DEFAULT_FRAMES, DEFAULT_SEED, DEFAULT_WARMUP, EFFECTS, isolated_runtime, run_case
+from .targets import TARGETS, iter_targets
+
+RESULT_SCHEMA = 1
+
+
+def _csv(value: str) -> list[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Hardware-free benchmarks for KeyRGB effects and backend write paths.",
+    )
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="measured frames per case")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="unmeasured leading frames per case")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed for effects that use randomness")
+    parser.add_argument("--targets", type=_csv, default=None, help="comma-separated targets (default: all)")
+    parser.add_argument("--effects", type=_csv, default=None, help="comma-separated effects (default: all)")
+    parser.add_argument("--output", type=Path, default=None, help="write JSON results to this file")
+    parser.add_argument("--compare", type=Path, default=None, help="fail on regressions against this result file")
+    parser.add_argument("--thresholds", type=Path, default=None, help="threshold file (default: thresholds.json)")
+    parser.add_argument("--list", action="store_true", help="list targets and effects, then exit")
+    return parser
+
+
+def run_suite(
+    *,
+    targets: Sequence[str] | None = None,
+    effects: Sequence[str] | None = None,
+    frames: int = DEFAULT_FRAMES,
+    warmup: int = DEFAULT_WARMUP,
+    seed: int = DEFAULT_SEED,
+) -> dict[str, object]:
+    """Run every selected target × effect case and return the result document."""
+
+    effect_names = list(EFFECTS) if not effects else [name for name in EFFECTS if name in set(effects)]
+    cases: dict[str, object] = {}
+    with tempfile.TemporaryDirectory(prefix="keyrgb-bench-") as tmp:
+        workdir = Path(tmp)
+        with isolated_runtime(workdir):
+            for target in iter_targets(list(targets) if targets else None):
+                for effect in effect_names:
+                    case_name = f"{target.name}/{effect}"
+                    cases[case_name] = run_case(
+                        target,
+                        effect,
+                        workdir=workdir / target.name / effect,
+                        frames=max(1, int(frames)),
+                        warmup=max(0, int(warmup)),
+                        seed=int(seed),
+                    )
+    return {
+        "schema": RESULT_SCHEMA,
+        "python": platform.python_version(),
+        "frames": int(frames),
+        "warmup": int(warmup),
+        "seed": int(seed),
+        "cases": cases,
+    }
+
+
+def format_table(results: dict[str, object]) -> list[str]:
+    lines = [
+        f"{'case':<32} {'compute p50/p90 ms':>19} {'write p50/p90 ms':>17} {'bytes/f':>9} {'reports/f':>9} {'alloc/f':>9}"
+    ]
+    cases = results.get("cases")
+    for name, case in sorted(cases.items() if isinstance(cases, dict) else []):
+        compute = case["compute_ms"]
+        write = case["write_ms"]
+        lines.append(
+            f"{name:<32} {compute['p50']:>9.3f}/{compute['p90']:<9.3f} {write['p50']:>8.3f}/{write['p90']:<8.3f} "
+            f"{case['bytes_per_frame']:>9.1f} {case['reports_per_frame']:>9.2f} {case['alloc_bytes_per_frame']:>9.0f}"
+        )
+    return lines
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+
+    if args.list:
+        for target in TARGETS:
+            print(f"target  {target.name:<10} {target.description}")
+        for effect in EFFECTS:
+            print(f"effect  {effect}")
+        return 0
+
+    results = run_suite(
+        targets=args.targets,
+        effects=args.effects,
+        frames=args.frames,
+        warmup=args.warmup,
+        seed=args.seed,
+    )
+    for line in format_table(results):
+        print(line)
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    if args.compare is None:
+        return 0
+
+    try:
+        baseline = load_results(args.compare)
+    except (OSError, ValueError) as exc:
+        print(f"Cannot read baseline {args.compare}: {exc}", file=sys.stderr)
+        return 2
+
+    regressions = compare_results(baseline, results, load_thresholds(args.thresholds))
+    if not regressions:
+        print(f"No regressions against {args.compare}")
+        return 0
+    print(f"\n{len(regressions)} regression(s) against {args.compare}:")
+    for regression in regressions:
+        print(f"  {regression.describe()}")
+    return 1
@@ -0,0 +1,96 @@
+"""Compare two benchmark result files against regression thresholds."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_THRESHOLDS_PATH = Path(__file__).with_name("thresholds.json")
+
+
+@dataclass(frozen=True)
+class Threshold:
+    """A metric regresses when ``current > baseline * (1 + relative) + absolute``."""
+
+    relative: float = 0.0
+    absolute: float = 0.0
+
+    def limit(self, baseline: float) -> float:
+        return baseline * (1.0 + self.relative) + self.absolute
+
+
+@dataclass(frozen=True)
+class Regression:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+    limit: float
+
+    def describe(self) -> str:
+        return f"{self.case}: {self.metric} {self.baseline:g} -> {self.current:g} (limit {self.limit:g})"
+
+
+def load_thresholds(path: Path | None = None) -> dict[str, Threshold]:
+    raw = json.loads((DEFAULT_THRESHOLDS_PATH if path is None else path).read_text(encoding="utf-8"))
+    metrics = raw.get("metrics", {}) if isinstance(raw, Mapping) else {}
+    return {
+        str(name): Threshold(
+            relative=float(spec.get("relative", 0.0)),
+            absolute=float(spec.get("absolute", 0.0)),
+        )
+        for name, spec in metrics.items()
+        if isinstance(spec, Mapping)
+    }
+
+
+def load_results(path: Path) -> dict[str, object]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    cases = payload.get("cases") if isinstance(payload, dict) else None
+    if cases is None:
+        raise ValueError(f"{path} is not a benchmark result file")
+    return payload
+
+
+def metric_value(case: Mapping[str, object], metric: str) -> float | None:
+    """Look up a dotted metric such as ``compute_ms.p90`` in one case result."""
+
+    value: object = case
+    for part in metric.split("."):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(part)
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def compare_results(
+    baseline: Mapping[str, object],
+    current: Mapping[str, object],
+    thresholds: Mapping[str, Threshold],
+) -> list[Regression]:
+    """Return every thresholded metric that got worse; cases missing on either side are skipped."""
+
+    baseline_cases = baseline.get("cases")
+    current_cases = current.get("cases")
+    if not isinstance(baseline_cases, Mapping) or not isinstance(current_cases, Mapping):
+        return []
+
+    regressions: list[Regression] = []
+    for case_name in sorted(current_cases):
+        before = baseline_cases.get(case_name)
+        after = current_cases.get(case_name)
+        if not isinstance(before, Mapping) or not isinstance(after, Mapping):
+            continue
+        for metric, threshold in sorted(thresholds.items()):
+            old = metric_value(before, metric)
+            new = metric_value(after, metric)
+            if old is None or new is None:
+                continue
+            limit = threshold.limit(old)
+            if new > limit:
+                regressions.append(
+                    Regression(case=str(case_name), metric=metric, baseline=old, current=new, limit=round(limit, 4))
+                )
+    return regressions
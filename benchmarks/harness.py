@@ -0,0 +1,330 @@
+"""Drive one effect loop against one target and measure every frame.
+
+Effect loops run on the calling thread with the engine's frame writer left
+off, so each ``render()`` call is one frame written inline. Time as seen by
+the effects (``time.monotonic()``) is virtual and only advances when a loop
+waits on its stop event; animation state, diffs and therefore the bytes and
+reports written are identical on every run. Compute and write times use the
+real ``perf_counter`` and are measured in a first pass; allocations are
+measured in a second pass under ``tracemalloc`` so tracing overhead does not
+distort the timings.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import random
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from .targets import BenchTarget, TargetSession
+from .transports import RecordingTransport
+
+DEFAULT_FRAMES = 120
+DEFAULT_WARMUP = 2
+DEFAULT_SEED = 1
+
+# A loop that stops rendering must not spin forever on the virtual clock.
+_VIRTUAL_TIMEOUT_S_PER_FRAME = 2.0
+
+if TYPE_CHECKING:
+    from keyrgb.core.effects.engine import EffectsEngine
+
+EffectRunner = Callable[["EffectsEngine", "FrameProbe", int], None]
+
+
+class VirtualClock:
+    def __init__(self, start_s: float = 1000.0) -> None:
+        self.now_s = float(start_s)
+
+    def monotonic(self) -> float:
+        return self.now_s
+
+    def advance(self, seconds: float | None) -> None:
+        if seconds is not None and seconds > 0.0:
+            self.now_s += float(seconds)
+
+    @contextmanager
+    def installed(self) -> Iterator[None]:
+        original = time.monotonic
+        time.monotonic = self.monotonic
+        try:
+            yield
+        finally:
+            time.monotonic = original
+
+
+class VirtualStopEvent:
+    """``threading.Event`` stand-in whose ``wait()`` advances the virtual clock."""
+
+    def __init__(self, clock: VirtualClock, *, deadline_s: float) -> None:
+        self._clock = clock
+        self._deadline_s = float(deadline_s)
+        self._set = False
+
+    def is_set(self) -> bool:
+        return self._set
+
+    def set(self) -> None:
+        self._set = True
+
+    def clear(self) -> None:
+        self._set = False
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self._clock.advance(timeout)
+        if self._clock.now_s >= self._deadline_s:
+            self._set = True
+        return self._set
+
+
+class SyntheticPresses:
+    """Press source for reactive effects: one unmapped press per spawn interval of virtual time."""
+
+    def __init__(self, *, devices: object, synthetic: bool, spawn_interval_s: float, allow_synthetic: bool) -> None:
+        del devices, synthetic, allow_synthetic
+        self.spawn_interval_s = float(spawn_interval_s)
+        self._accumulated_s = 0.0
+
+    def poll_slot_ids(self, *, dt: float) -> list[str]:
+        self._accumulated_s += float(dt)
+        if self._accumulated_s < self.spawn_interval_s:
+            return []
+        self._accumulated_s = 0.0
+        return [""]
+
+    def close(self) -> None:
+        return
+
+
+def _software_runner(name: str) -> EffectRunner:
+    from keyrgb.core.effects.software import _effects_basic, _effects_particles, base as software_base
+
+    loop = getattr(_effects_basic, name, None) or getattr(_effects_particles, name)
+
+    def _run(engine: EffectsEngine, probe: FrameProbe, seed: int) -> None:
+        del seed
+        loop(engine, render_fn=probe.wrap(software_base.render))
+
+    return _run
+
+
+def _reactive_runner(kind: str) -> EffectRunner:
+    from keyrgb.core.effects.reactive import _fade_loop, _ripple_loop, effects as reactive_effects, render
+
+    def _run(engine: EffectsEngine, probe: FrameProbe, seed: int) -> None:
+        base_api = reactive_effects._fade_api if kind == "fade" else reactive_effects._ripple_api
+        # The uniform fallback renders internally; wrapping it keeps it one
+        # measured frame like any other render() call.
+        api = replace(
+            base_api,
+            _PressSource=SyntheticPresses,
+            try_open_evdev_keyboards=lambda: None,
+            reactive_synthetic_fallback_enabled=lambda: True,
+            load_active_profile_slot_keymap=dict,
+            random=random.Random(seed),
+            render=probe.wrap(render.render),
+            _render_uniform_fallback=probe.wrap(cast(Callable[..., None], base_api._render_uniform_fallback)),
+        )
+        if kind == "fade":
+            _fade_loop.run_reactive_fade_loop(engine, api=cast(_fade_loop._ReactiveFadeApiProtocol, api))
+        else:
+            _ripple_loop.run_reactive_ripple_loop(engine, api=cast(_ripple_loop._ReactiveRippleApiProtocol, api))
+
+    return _run
+
+
+EFFECTS: dict[str, Callable[[], EffectRunner]] = {
+    "breathing": lambda: _software_runner("run_breathing"),
+    "chase": lambda: _software_runner("run_chase"),
+    "color_cycle": lambda: _software_runner("run_color_cycle"),
+    "fire": lambda: _software_runner("run_fire"),
+    "rain": lambda: _software_runner("run_rain"),
+    "rainbow_swirl": lambda: _software_runner("run_rainbow_swirl"),
+    "rainbow_wave": lambda: _software_runner("run_rainbow_wave"),
+    "random": lambda: _software_runner("run_random"),
+    "spectrum_cycle": lambda: _software_runner("run_spectrum_cycle"),
+    "strobe": lambda: _software_runner("run_strobe"),
+    "twinkle": lambda: _software_runner("run_twinkle"),
+    "reactive_fade": lambda: _reactive_runner("fade"),
+    "reactive_ripple": lambda: _reactive_runner("ripple"),
+}
+
+
+@dataclass
+class FrameProbe:
+    """Wraps render callables; every wrapped call is one measured frame."""
+
+    transport: RecordingTransport
+    stop: Callable[[], None]
+    frames: int
+    warmup: int
+    trace_allocations: bool = False
+    rendered: int = 0
+    compute_ms: list[float] = field(default_factory=list)
+    write_ms: list[float] = field(default_factory=list)
+    reports: list[int] = field(default_factory=list)
+    payload_bytes: list[int] = field(default_factory=list)
+    alloc_bytes: list[int] = field(default_factory=list)
+    _frame_start: float = 0.0
+    _alloc_base: int = 0
+
+    def start(self) -> None:
+        if self.trace_allocations:
+            tracemalloc.reset_peak()
+            self._alloc_base = tracemalloc.get_traced_memory()[0]
+        self._frame_start = time.perf_counter()
+
+    def wrap(self, render: Callable[..., None]) -> Callable[..., None]:
+        def _measured(*args: object, **kwargs: object) -> None:
+            call_start = time.perf_counter()
+            reports_before, bytes_before = self.transport.counters()
+            try:
+                render(*args, **kwargs)
+            finally:
+                self._end_frame(call_start, reports_before, bytes_before)
+
+        return _measured
+
+    def _end_frame(self, call_start: float, reports_before: int, bytes_before: int) -> None:
+        end = time.perf_counter()
+        index = self.rendered
+        self.rendered += 1
+        if index >= self.warmup:
+            reports_after, bytes_after = self.transport.counters()
+            self.compute_ms.append((call_start - self._frame_start) * 1000.0)
+            self.write_ms.append((end - call_start) * 1000.0)
+            self.reports.append(reports_after - reports_before)
+            self.payload_bytes.append(bytes_after - bytes_before)
+            if self.trace_allocations:
+                _current, peak = tracemalloc.get_traced_memory()
+                self.alloc_bytes.append(max(0, peak - self._alloc_base))
+        if self.trace_allocations:
+            tracemalloc.reset_peak()
+            self._alloc_base = tracemalloc.get_traced_memory()[0]
+        if self.rendered >= self.warmup + self.frames:
+            self.stop()
+        self._frame_start = time.perf_counter()
+
+
+def _make_engine(session: TargetSession, stop_event: VirtualStopEvent) -> EffectsEngine:
+    from keyrgb.core.effects.engine import EffectsEngine
+
+    engine = EffectsEngine(backend=session.backend)
+    engine.kb = session.backend.get_device()  # type: ignore[assignment]
+    engine.device_available = True
+    engine.stop_event = stop_event  # type: ignore[assignment]
+    engine.running = True
+    return engine
+
+
+def _run_pass(
+    target: BenchTarget,
+    effect: str,
+    *,
+    workdir: Path,
+    frames: int,
+    warmup: int,
+    seed: int,
+    trace_allocations: bool,
+) -> FrameProbe:
+    runner = EFFECTS[effect]()
+    session = target.open(workdir)
+    clock = VirtualClock()
+    stop_event = VirtualStopEvent(clock, deadline_s=clock.now_s + (frames + warmup) * _VIRTUAL_TIMEOUT_S_PER_FRAME)
+
+    with clock.installed(), session.active():
+        random.seed(seed)
+        engine = _make_engine(session, stop_event)
+        engine.current_effect = effect
+
+        def _stop() -> None:
+            engine.running = False
+            stop_event.set()
+
+        probe = FrameProbe(
+            transport=session.transport,
+            stop=_stop,
+            frames=frames,
+            warmup=warmup,
+            trace_allocations=trace_allocations,
+        )
+        if trace_allocations:
+            tracemalloc.start()
+        try:
+            probe.start()
+            runner(engine, probe, seed)
+        finally:
+            if trace_allocations:
+                tracemalloc.stop()
+    return probe
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    mean = sum(ordered) / len(ordered) if ordered else 0.0
+    return {
+        "mean": round(mean, 4),
+        "p50": round(_percentile(ordered, 0.5), 4),
+        "p90": round(_percentile(ordered, 0.9), 4),
+        "max": round(ordered[-1] if ordered else 0.0, 4),
+    }
+
+
+def _mean(values: list[int]) -> float:
+    return round(sum(values) / len(values), 2) if values else 0.0
+
+
+def run_case(
+    target: BenchTarget,
+    effect: str,
+    *,
+    workdir: Path,
+    frames: int = DEFAULT_FRAMES,
+    warmup: int = DEFAULT_WARMUP,
+    seed: int = DEFAULT_SEED,
+) -> dict[str, object]:
+    """Benchmark ``effect`` on ``target`` and return its JSON-ready result."""
+
+    timing = _run_pass(
+        target, effect, workdir=workdir / "timing", frames=frames, warmup=warmup, seed=seed, trace_allocations=False
+    )
+    allocations = _run_pass(
+        target, effect, workdir=workdir / "alloc", frames=frames, warmup=warmup, seed=seed, trace_allocations=True
+    )
+    return {
+        "frames": len(timing.compute_ms),
+        "compute_ms": _distribution(timing.compute_ms),
+        "write_ms": _distribution(timing.write_ms),
+        "bytes_per_frame": _mean(timing.payload_bytes),
+        "reports_per_frame": _mean(timing.reports),
+        "alloc_bytes_per_frame": _mean(allocations.alloc_bytes),
+    }
+
+
+@contextmanager
+def isolated_runtime(workdir: Path) -> Iterator[None]:
+    """Keep the perf-metrics snapshot export out of the user's runtime dir."""
+
+    previous = os.environ.get("KEYRGB_RUNTIME_DIR")
+    os.environ["KEYRGB_RUNTIME_DIR"] = str(workdir / "run")
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("KEYRGB_RUNTIME_DIR", None)
+        else:
+            os.environ["KEYRGB_RUNTIME_DIR"] = previous
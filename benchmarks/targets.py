@@ -0,0 +1,141 @@
+"""Benchmark targets: a real backend device class on a recording transport."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+
+from keyrgb.core.backends.base import BackendCapabilities
+
+from .transports import (
+    RecordingHidrawTransport,
+    RecordingIte8291r3Usb,
+    RecordingSysfsWrites,
+    RecordingTransport,
+)
+
+
+class BenchBackend:
+    """Minimal backend facade handing the engine one pre-built device."""
+
+    def __init__(self, *, name: str, device: object, dimensions: tuple[int, int], per_key: bool) -> None:
+        self.name = name
+        self._device = device
+        self._dimensions = dimensions
+        self._per_key = per_key
+
+    def capabilities(self) -> BackendCapabilities:
+        return BackendCapabilities(
+            brightness=True,
+            per_key=self._per_key,
+            color=True,
+            hardware_effects=False,
+            palette=False,
+        )
+
+    def dimensions(self) -> tuple[int, int]:
+        return self._dimensions
+
+    def effects(self) -> dict[str, Callable[..., object]]:
+        return {}
+
+    def colors(self) -> dict[str, object]:
+        return {}
+
+    def get_device(self) -> object:
+        return self._device
+
+
+@dataclass
+class TargetSession:
+    backend: BenchBackend
+    transport: RecordingTransport
+    active: Callable[[], AbstractContextManager[None]] = nullcontext
+
+
+@dataclass(frozen=True)
+class BenchTarget:
+    name: str
+    description: str
+    open: Callable[[Path], TargetSession]
+
+
+def _open_ite8291r3(_workdir: Path) -> TargetSession:
+    from keyrgb.core.backends.ite8291r3_perkey import protocol
+    from keyrgb.core.backends.ite8291r3_perkey.device import Ite8291r3KeyboardDevice
+
+    usb = RecordingIte8291r3Usb()
+    device = Ite8291r3KeyboardDevice(
+        usb.send_control_report,
+        usb.read_control_report,
+        usb.write_row_data,
+        report_delay_s=0.0,
+    )
+    backend = BenchBackend(
+        name="ite8291r3_perkey",
+        device=device,
+        dimensions=(protocol.NUM_ROWS, protocol.NUM_COLS),
+        per_key=True,
+    )
+    return TargetSession(backend=backend, transport=usb)
+
+
+def _open_ite8910(_workdir: Path) -> TargetSession:
+    from keyrgb.core.backends.ite8910_perkey import protocol
+    from keyrgb.core.backends.ite8910_perkey.device import Ite8910KeyboardDevice
+
+    hidraw = RecordingHidrawTransport()
+    device = Ite8910KeyboardDevice(hidraw.send_feature_report, transport=hidraw)
+    backend = BenchBackend(
+        name="ite8910_perkey",
+        device=device,
+        dimensions=(protocol.NUM_ROWS, protocol.NUM_COLS),
+        per_key=True,
+    )
+    return TargetSession(backend=backend, transport=hidraw)
+
+
+def _open_ite8258(_workdir: Path) -> TargetSession:
+    from keyrgb.core.backends.ite8258_perkey_chassis import protocol
+    from keyrgb.core.backends.ite8258_perkey_chassis.device import Ite8258ChassisKeyboardDevice
+    from keyrgb.core.backends.ite8258_perkey_chassis.profile_coordinator import Ite8258ChassisProfileCoordinator
+
+    hidraw = RecordingHidrawTransport()
+    device = Ite8258ChassisKeyboardDevice(
+        hidraw.send_feature_report,
+        transport=hidraw,
+        profile_coordinator=Ite8258ChassisProfileCoordinator(),
+    )
+    backend = BenchBackend(
+        name="ite8258_perkey_chassis",
+        device=device,
+        dimensions=(protocol.NUM_ROWS, protocol.NUM_COLS),
+        per_key=True,
+    )
+    return TargetSession(backend=backend, transport=hidraw)
+
+
+def _open_sysfs(workdir: Path) -> TargetSession:
+    from keyrgb.core.backends.sysfs.device import SysfsLedKeyboardDevice
+
+    writes = RecordingSysfsWrites(workdir)
+    device = SysfsLedKeyboardDevice(primary_led_dir=writes.led_dir)
+    backend = BenchBackend(name="sysfs-leds", device=device, dimensions=(1, 1), per_key=False)
+    return TargetSession(backend=backend, transport=writes, active=writes.installed)
+
+
+TARGETS: tuple[BenchTarget, ...] = (
+    BenchTarget("ite8291r3", "ITE 8291r3 per-key row writes over USB", _open_ite8291r3),
+    BenchTarget("ite8910", "ITE 8910 per-key SET_LED feature reports", _open_ite8910),
+    BenchTarget("ite8258", "ITE 8258 chassis 960-byte profile packets", _open_ite8258),
+    BenchTarget("sysfs", "sysfs multi_intensity + brightness attribute writes", _open_sysfs),
+)
+
+
+def iter_targets(names: list[str] | None = None) -> Iterator[BenchTarget]:
+    wanted = None if not names else {name.strip().lower() for name in names}
+    for target in TARGETS:
+        if wanted is None or target.name in wanted:
+            yield target
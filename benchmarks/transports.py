@@ -0,0 +1,100 @@
+"""Recording fake transports, one per backend wire protocol.
+
+Each transport accepts what the real one would, returns what the device code
+expects and counts reports and payload bytes. Nothing sleeps: pacing delays
+are a property of the hardware, not of the code under test.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+class RecordingTransport:
+    """Report and byte counters shared by every fake transport."""
+
+    def __init__(self) -> None:
+        self.reports = 0
+        self.bytes = 0
+
+    def record(self, payload: bytes | str) -> int:
+        size = len(payload.encode("utf-8")) if isinstance(payload, str) else len(payload)
+        self.reports += 1
+        self.bytes += size
+        return size
+
+    def counters(self) -> tuple[int, int]:
+        return self.reports, self.bytes
+
+    def close(self) -> None:
+        return
+
+
+class RecordingHidrawTransport(RecordingTransport):
+    """Feature-report sink for hidraw backends (ITE 8910 per-key, ITE 8258 packets)."""
+
+    def send_feature_report(self, report: bytes) -> int:
+        return self.record(report)
+
+
+class RecordingIte8291r3Usb(RecordingTransport):
+    """Control + interrupt endpoints of the ITE 8291r3 USB interface.
+
+    Reads answer with the last SET_EFFECT control report so brightness and
+    user-mode queries see the state the device code asked for.
+    """
+
+    _SET_EFFECT = 0x08
+
+    def __init__(self, *, brightness: int = 25) -> None:
+        super().__init__()
+        self._effect_report = bytes((self._SET_EFFECT, 0x02, 0x33, 0x00, int(brightness), 0x00, 0x00, 0x00))
+
+    def send_control_report(self, report: bytes) -> int:
+        if report and report[0] == self._SET_EFFECT:
+            self._effect_report = bytes(report)
+        return self.record(report)
+
+    def read_control_report(self, length: int) -> bytes:
+        return self._effect_report[: int(length)].ljust(int(length), b"\x00")
+
+    def write_row_data(self, row_data: bytes) -> int:
+        return self.record(row_data)
+
+
+class RecordingSysfsWrites(RecordingTransport):
+    """A throwaway multicolor LED class directory whose attribute writes are counted."""
+
+    LED_NAME = "rgb:kbd_backlight"
+
+    def __init__(self, root: Path) -> None:
+        super().__init__()
+        self.led_dir = Path(root) / "leds" / self.LED_NAME
+        self.led_dir.mkdir(parents=True, exist_ok=True)
+        for name, value in (
+            ("brightness", "0"),
+            ("max_brightness", "50"),
+            ("multi_index", "red green blue"),
+            ("multi_intensity", "0 0 0"),
+        ):
+            (self.led_dir / name).write_text(f"{value}\n", encoding="utf-8")
+
+    @contextmanager
+    def installed(self) -> Iterator[None]:
+        """Route the sysfs backend's attribute writes through this recorder."""
+
+        from keyrgb.core.backends.sysfs import common
+
+        original = common._safe_write_text
+
+        def _recording_write(path: Path, content: str) -> None:
+            original(path, content)
+            self.record(content)
+
+        common._safe_write_text = _recording_write
+        try:
+            yield
+        finally:
+            common._safe_write_text = original
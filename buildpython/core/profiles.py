@@ -89,6 +89,7 @@ PROFILES: dict[str, Profile] = {
             "Code Hygiene",
             "Architecture Validation",
             "Repo Validation",
+            "Benchmarks",
         ],
     ),
     "release": Profile(
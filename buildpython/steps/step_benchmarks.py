@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import shutil
+
+from ..utils.paths import buildlog_dir, repo_root
+from ..utils.subproc import RunResult, python_exe, run
+
+RESULTS_FILENAME = "benchmarks.json"
+BASELINE_FILENAME = "benchmarks-baseline.json"
+
+
+def benchmarks_runner() -> RunResult:
+    """Run the hardware-free benchmarks and compare against the local baseline.
+
+    The first run on a machine records ``benchmarks-baseline.json``; later runs
+    fail when a case regresses past ``benchmarks/thresholds.json``. Delete the
+    baseline to re-record it after an intended change.
+    """
+
+    root = repo_root()
+    out_dir = buildlog_dir()
+    results = out_dir / RESULTS_FILENAME
+    baseline = out_dir / BASELINE_FILENAME
+
+    args = [python_exe(), "-m", "benchmarks", "--output", str(results)]
+    if baseline.is_file():
+        args += ["--compare", str(baseline)]
+
+    result = run(args, cwd=str(root), env_overrides={"KEYRGB_HW_TESTS": "0"})
+    if result.exit_code == 0 and not baseline.is_file() and results.is_file():
+        shutil.copyfile(results, baseline)
+        return RunResult(
+            command_str=result.command_str,
+            stdout=result.stdout + f"Recorded benchmark baseline {baseline}\n",
+            stderr=result.stderr,
+            exit_code=result.exit_code,
+        )
+    return result
@@ -47,6 +47,7 @@ def steps() -> list[Step]:
     from .exception_transparency.step import exception_transparency_runner
     from .file_size_analysis.step import file_size_runner
     from .step_architecture_validation import architecture_validation_runner
+    from .step_benchmarks import benchmarks_runner
     from .step_black import black_check_runner
     from .step_dead_code import dead_code_runner
     from .step_format import ruff_format_check_runner
@@ -207,4 +208,11 @@ def steps() -> list[Step]:
             log_file=_log("step-21-shellcheck.log"),
             runner=shellcheck_runner,
         ),
+        Step(
+            number=22,
+            name="Benchmarks",
+            description="Hardware-free effect/backend benchmarks against the local baseline",
+            log_file=_log("step-22-benchmarks.log"),
+            runner=benchmarks_runner,
+        ),
     ]
@@ -16,6 +16,7 @@ OPTIONAL_TOPLEVEL = {
     "gi",  # optional desktop integration / icon rasterization support
     "ruff",  # optional lint/format
     "pystray",  # optional tray icon (headless CI)
+    "numpy",  # optional vectorized software-effect kernels
     # Optional Tuxedo integration (not required for KeyRGB core)
     "backlight_control",
     "ite_backend",
@@ -0,0 +1,246 @@
+"""Per-device adaptive HID report pacing for USB keyboards.
+
+``AdaptiveReportPacing`` replaces the fixed ``sleep_after_hid_report()`` delay
+for one device: it learns the smallest delay the controller tolerates and
+persists it per ``VID:PID``. ``write_paced_report()`` sends one report through
+either pacing mode and records it in the HID metrics.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from keyrgb.core.runtime.metrics import record_hid_error, record_hid_report
+from keyrgb.core.utils.exceptions import is_device_disconnected
+
+from ._report_pacing import hid_report_delay_env_override, sleep_after_hid_report
+
+logger = logging.getLogger(__name__)
+
+ADAPTIVE_HID_PACING_ENV = "KEYRGB_ADAPTIVE_HID_PACING"
+HID_PACING_STATE_FILENAME = "hid_pacing.json"
+
+
+def _device_key(vendor_id: int, product_id: int) -> str:
+    return f"{int(vendor_id):04x}:{int(product_id):04x}"
+
+
+def _pacing_state_path() -> Path:
+    from keyrgb.core.config.paths import state_dir
+
+    return state_dir() / HID_PACING_STATE_FILENAME
+
+
+def _load_pacing_state(path: Path) -> dict[str, dict[str, float]]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    return {str(key): value for key, value in raw.items() if isinstance(value, dict)}
+
+
+def _save_pacing_state(path: Path, device_key: str, entry: dict[str, float]) -> None:
+    state = _load_pacing_state(path)
+    state[device_key] = entry
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.debug("Could not persist HID pacing state to %s: %s", path, exc)
+
+
+class AdaptiveReportPacing:
+    """Learn the smallest safe report delay for one USB device.
+
+    The delay starts at the backend's validated default (or the value learned
+    in an earlier session) and steps down toward ``floor_s`` after every
+    ``step_reports`` healthy reports, as long as write round-trips stay close
+    to the best observed. A failed write or a suspicious read (see
+    ``observe_brightness_read()``) doubles the delay and raises the learned
+    minimum above the delay that misbehaved, so the device never returns to
+    it. The delay and minimum are persisted per ``VID:PID`` in the user state
+    dir.
+    """
+
+    STEP_FACTOR = 0.8
+    BACKOFF_HOLD_S = 1.0
+    SAVE_INTERVAL_S = 60.0
+    # A zero brightness read this soon after KeyRGB wrote a non-zero level is
+    # a controller glitch, not the ~10 minute firmware sleep.
+    ZERO_BRIGHTNESS_GRACE_S = 5.0
+
+    def __init__(
+        self,
+        *,
+        vendor_id: int,
+        product_id: int,
+        default_s: float,
+        floor_s: float,
+        ceiling_s: float = 0.004,
+        step_reports: int = 240,
+        state_path: Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._device_key = _device_key(vendor_id, product_id)
+        self._floor_s = max(0.0, float(floor_s))
+        self._ceiling_s = max(self._floor_s, float(ceiling_s))
+        self._step_reports = max(1, int(step_reports))
+        self._state_path = _pacing_state_path() if state_path is None else Path(state_path)
+        self._clock = clock
+        self._sleep = sleep
+
+        entry = _load_pacing_state(self._state_path).get(self._device_key, {})
+        self._min_safe_s = self._clamp(self._ms_to_s(entry.get("min_safe_ms"), self._floor_s))
+        self._delay_s = max(self._min_safe_s, self._clamp(self._ms_to_s(entry.get("delay_ms"), float(default_s))))
+        self._saved_delay_s = self._delay_s
+        self._healthy_reports = 0
+        self._rtt_ewma_s: float | None = None
+        self._best_rtt_s: float | None = None
+        self._last_backoff_s = float("-inf")
+        self._last_save_s = clock()
+        self._level_written_s = float("-inf")
+
+    @staticmethod
+    def _ms_to_s(value: object, default_s: float) -> float:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value) / 1000.0
+        return default_s
+
+    def _clamp(self, delay_s: float) -> float:
+        return min(self._ceiling_s, max(self._floor_s, float(delay_s)))
+
+    @property
+    def delay_s(self) -> float:
+        return self._delay_s
+
+    @property
+    def min_safe_s(self) -> float:
+        return self._min_safe_s
+
+    def report_done(self, elapsed_s: float) -> None:
+        """Record a healthy report that took ``elapsed_s`` and sleep the current delay."""
+
+        elapsed = max(0.0, float(elapsed_s))
+        ewma = elapsed if self._rtt_ewma_s is None else self._rtt_ewma_s + 0.05 * (elapsed - self._rtt_ewma_s)
+        self._rtt_ewma_s = ewma
+        self._healthy_reports += 1
+        if self._healthy_reports >= self._step_reports:
+            self._healthy_reports = 0
+            best = ewma if self._best_rtt_s is None else min(self._best_rtt_s, ewma)
+            self._best_rtt_s = best
+            # Only step down while the device keeps up; rising round-trips
+            # mean the controller is already queueing.
+            if ewma <= best * 1.5 + 0.00005:
+                self._delay_s = max(self._min_safe_s, self._delay_s * self.STEP_FACTOR)
+                self._maybe_save()
+        if self._delay_s > 0.0:
+            self._sleep(self._delay_s)
+
+    def report_failed(self, reason: str = "write error") -> None:
+        """Back off after a failed write or a suspicious device response."""
+
+        self._healthy_reports = 0
+        now = self._clock()
+        if now - self._last_backoff_s < self.BACKOFF_HOLD_S:
+            return
+        self._last_backoff_s = now
+        misbehaved_s = self._delay_s
+        self._min_safe_s = self._clamp(max(self._min_safe_s, misbehaved_s * 1.25))
+        self._delay_s = max(self._min_safe_s, self._clamp(max(misbehaved_s * 2.0, self._floor_s)))
+        logger.info(
+            "HID pacing %s: %s at %.3f ms; backing off to %.3f ms",
+            self._device_key,
+            reason,
+            misbehaved_s * 1000.0,
+            self._delay_s * 1000.0,
+        )
+        self._maybe_save(force=True)
+
+    def observe_brightness_write(self, level: int) -> None:
+        # After writing 0, reading 0 back is expected rather than a transient glitch.
+        self._level_written_s = self._clock() if int(level) > 0 else float("-inf")
+
+    def observe_brightness_read(self, level: int) -> None:
+        if int(level) == 0 and self._clock() - self._level_written_s < self.ZERO_BRIGHTNESS_GRACE_S:
+            self.report_failed("transient zero brightness read")
+
+    def _maybe_save(self, *, force: bool = False) -> None:
+        now = self._clock()
+        if self._delay_s == self._saved_delay_s and not force:
+            return
+        if not force and now - self._last_save_s < self.SAVE_INTERVAL_S:
+            return
+        self._last_save_s = now
+        self._saved_delay_s = self._delay_s
+        _save_pacing_state(
+            self._state_path,
+            self._device_key,
+            {"delay_ms": round(self._delay_s * 1000.0, 4), "min_safe_ms": round(self._min_safe_s * 1000.0, 4)},
+        )
+
+    def flush(self) -> None:
+        """Persist the current delay if it changed since the last save."""
+
+        if self._delay_s != self._saved_delay_s:
+            self._maybe_save(force=True)
+
+
+def write_paced_report(
+    write: Callable[[bytes], int | None],
+    report: bytes,
+    *,
+    pacing: AdaptiveReportPacing | None,
+    delay_s: float,
+    error: str,
+) -> None:
+    """Send one report, record it in the HID metrics, then pace the next one."""
+
+    started = time.monotonic()
+    try:
+        if int(write(bytes(report)) or 0) < 0:
+            raise OSError(error)
+    except OSError as exc:
+        record_hid_error()
+        # A device that went away (unplug, suspend) says nothing about pacing.
+        if pacing is not None and not is_device_disconnected(exc):
+            pacing.report_failed()
+        raise
+    elapsed_s = time.monotonic() - started
+    record_hid_report(elapsed_s)
+    if pacing is None:
+        sleep_after_hid_report(delay_s=delay_s)
+    else:
+        pacing.report_done(elapsed_s)
+
+
+def adaptive_report_pacing(
+    *,
+    backend_name: str,
+    vendor_id: int | None,
+    product_id: int | None,
+    default_s: float,
+    floor_s: float,
+) -> AdaptiveReportPacing | None:
+    """Return an adaptive pacer for a device, or ``None`` to keep the fixed delay.
+
+    Adaptation is off when the user pinned a delay via ``KEYRGB_*_REPORT_DELAY_MS``,
+    when ``KEYRGB_ADAPTIVE_HID_PACING=0``, or when the device IDs are unknown.
+    """
+
+    if os.environ.get(ADAPTIVE_HID_PACING_ENV, "").strip() == "0":
+        return None
+    if hid_report_delay_env_override(backend_name=backend_name):
+        return None
+    if vendor_id is None or product_id is None:
+        return None
+    return AdaptiveReportPacing(vendor_id=vendor_id, product_id=product_id, default_s=default_s, floor_s=floor_s)
@@ -0,0 +1,64 @@
+"""Probe-cache handoff for backend auto-selection.
+
+``select_backend`` first probes only the backend remembered for this
+machine's hardware fingerprint (see ``probe_cache``) and falls back to a full
+probe when that backend is gone. Each fresh auto-selection result is stored
+again, and an empty result forgets the entry.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+
+from ._registry_specs import BackendSpec
+from .base import KeyboardBackend
+from .probe_cache import (
+    forget_cached_backend,
+    hardware_fingerprint,
+    load_cached_backend,
+    probe_cache_enabled,
+    store_cached_backend,
+)
+
+logger = logging.getLogger(__name__)
+
+SpecSelector = Callable[[Sequence[BackendSpec]], KeyboardBackend | None]
+
+
+def probe_cache_fingerprint(*, requested_name: str, use_probe_cache: bool) -> str | None:
+    """Return the hardware fingerprint when this selection may use the probe cache."""
+
+    if use_probe_cache and requested_name == "auto" and probe_cache_enabled():
+        return hardware_fingerprint()
+    return None
+
+
+def select_cached_backend(
+    fingerprint: str,
+    specs: Sequence[BackendSpec],
+    *,
+    select_fn: SpecSelector,
+) -> KeyboardBackend | None:
+    """Construct and probe only the remembered backend; ``None`` if none is remembered or it is gone."""
+
+    cached_name = load_cached_backend(fingerprint)
+    if cached_name is None:
+        return None
+    normalized = cached_name.strip().lower()
+    spec = next((spec for spec in specs if spec.name.strip().lower() == normalized), None)
+    cached = None if spec is None else select_fn([spec])
+    if cached is None:
+        logger.info("Cached backend '%s' is no longer available; probing all backends", cached_name)
+        return None
+    logger.debug("Backend '%s' selected from the probe cache.", cached.name)
+    return cached
+
+
+def remember_selection(fingerprint: str, selected: KeyboardBackend | None) -> None:
+    """Store the auto-selection result for ``fingerprint``, or forget it when nothing was selected."""
+
+    if selected is not None:
+        store_cached_backend(fingerprint, selected.name)
+    else:
+        forget_cached_backend()
@@ -0,0 +1,199 @@
+"""Backend specs for the registry: the static manifest or package markers.
+
+Selection builds its ``BackendSpec`` list from ``manifest.BACKEND_MANIFEST``,
+keeping only the backends whose hints match this machine or that were
+requested by name. ``KEYRGB_DISABLE_BACKEND_MANIFEST=1`` falls back to
+importing every backend package and reading its ``BACKEND_REGISTRATION``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .base import BackendMetadata, BackendRegistration, BackendRole, KeyboardBackend
+from .manifest import (
+    BACKEND_MANIFEST,
+    BackendManifestEntry,
+    MachineHints,
+    backend_manifest_enabled,
+    entry_matches_machine,
+    manifest_entry_for_name,
+)
+
+logger = logging.getLogger(__name__)
+
+# Map deprecated backend names to their canonical replacement. Users who set
+# KEYRGB_BACKEND=<old_name> will transparently resolve to the canonical backend.
+# See keyrgb/core/backends/README.md for the naming convention.
+_BACKEND_NAME_ALIASES: dict[str, str] = {
+    "ite8291r3": "ite8291r3_perkey",
+    "ite8910": "ite8910_perkey",
+    "ite8291": "ite8291_perkey",
+    "ite8291-zones": "ite8291_zones_clevo",
+    "ite8258": "ite8258_zones_lenovo_legion",
+    "ite8258-chassis": "ite8258_perkey_chassis",
+    "ite8295-zones": "ite8295_zones_lenovo_ideapad",
+    "ite8233": "ite8233_none_chassis_lightbar_clevo",
+    "ite8297": "ite8297_uniform",
+    # Pre-rename canonical names (persisted in user configs / KEYRGB_BACKEND).
+    "ite8291_zones": "ite8291_zones_clevo",
+    "ite8258_zones": "ite8258_zones_lenovo_legion",
+    "ite8258_chassis": "ite8258_perkey_chassis",
+    "ite8258_perkey_chassis_logo_neon_vent_lenovo_legion": "ite8258_perkey_chassis",
+    "ite8295_zones": "ite8295_zones_lenovo_ideapad",
+    "ite8233_lightbar": "ite8233_none_chassis_lightbar_clevo",
+}
+
+
+def requested_backend_names(requested: str | None) -> tuple[str, str]:
+    """Return the requested backend name and its canonical form (``auto`` by default)."""
+
+    requested_name = (requested or os.environ.get("KEYRGB_BACKEND") or "auto").strip().lower()
+    return requested_name, _BACKEND_NAME_ALIASES.get(requested_name, requested_name)
+
+
+@dataclass(frozen=True)
+class BackendSpec:
+    name: str
+    priority: int
+    factory: Callable[[], KeyboardBackend]
+
+
+def _spec_for_backend(factory: type[KeyboardBackend]) -> BackendSpec:
+    """Build a registry spec from class metadata without constructing a backend."""
+
+    return BackendSpec(name=factory.name, priority=factory.priority, factory=factory)
+
+
+def _spec_from_registration(reg: BackendRegistration) -> BackendSpec:
+    """Build a registry spec from a ``BackendRegistration`` marker."""
+
+    return BackendSpec(
+        name=reg.metadata.name,
+        priority=reg.metadata.priority,
+        factory=reg.factory,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Deterministic discovery of backend packages exposing BACKEND_REGISTRATION
+# ---------------------------------------------------------------------------
+
+_DISCOVERY_SKIP_NAMES = frozenset({"policies"})
+_discovered_registrations_cache: list[BackendRegistration] | None = None
+
+
+def discover_backend_registrations() -> list[BackendRegistration]:
+    """Scan backend sub-packages for ``BACKEND_REGISTRATION`` markers.
+
+    Discovery is deterministic (sorted by directory name) and resilient to
+    individual import failures: packages that cannot be imported or that do
+    not expose a ``BACKEND_REGISTRATION`` marker are silently skipped.
+    """
+    global _discovered_registrations_cache
+    if _discovered_registrations_cache is not None:
+        return list(_discovered_registrations_cache)
+
+    backend_dir = Path(__file__).parent
+    registrations: list[BackendRegistration] = []
+
+    for child in sorted(backend_dir.iterdir()):
+        if not child.is_dir():
+            continue
+        if child.name.startswith("_") or child.name in _DISCOVERY_SKIP_NAMES:
+            continue
+        if not (child / "__init__.py").exists():
+            continue
+
+        mod_name = f"keyrgb.core.backends.{child.name}"
+        try:
+            mod = importlib.import_module(mod_name)
+        except (AttributeError, ImportError, OSError, RuntimeError, TypeError, ValueError) as exc:
+            logger.debug("Skipping backend package %s: import failed: %s", mod_name, exc)
+            continue
+
+        reg = getattr(mod, "BACKEND_REGISTRATION", None)
+        if isinstance(reg, BackendRegistration):
+            registrations.append(reg)
+
+    _discovered_registrations_cache = registrations
+    return list(registrations)
+
+
+def _invalidate_discovery_cache() -> None:
+    """Reset the discovery cache (primarily for tests)."""
+    global _discovered_registrations_cache
+    _discovered_registrations_cache = None
+
+
+def get_metadata_for_backend_name(name: str) -> BackendMetadata | None:
+    """Look up static metadata by canonical backend name."""
+    if backend_manifest_enabled():
+        entry = manifest_entry_for_name(name)
+        if entry is not None:
+            return entry.metadata
+    normalized = (name or "").strip().lower()
+    for reg in discover_backend_registrations():
+        if reg.metadata.name.strip().lower() == normalized:
+            return reg.metadata
+    return None
+
+
+def _spec_from_manifest(entry: BackendManifestEntry) -> BackendSpec:
+    """Build a registry spec whose factory imports the backend package on first use."""
+
+    return BackendSpec(name=entry.metadata.name, priority=entry.metadata.priority, factory=entry.construct)
+
+
+def default_specs() -> list[BackendSpec]:
+    """Return specs for all PRIMARY built-in backends, from the manifest or via marker discovery."""
+    if backend_manifest_enabled():
+        specs = [_spec_from_manifest(entry) for entry in BACKEND_MANIFEST if entry.metadata.role is BackendRole.PRIMARY]
+    else:
+        specs = [
+            _spec_from_registration(reg)
+            for reg in discover_backend_registrations()
+            if reg.metadata.role is BackendRole.PRIMARY
+        ]
+    specs.sort(key=lambda spec: (-int(spec.priority), spec.name))
+    return specs
+
+
+def machine_specs(requested: str | None = None) -> list[BackendSpec]:
+    """Return the PRIMARY specs that could be available here: manifest hints match, or requested by name."""
+
+    if not backend_manifest_enabled():
+        return default_specs()
+    _requested_name, requested_effective = requested_backend_names(requested)
+    hints = MachineHints.read()
+    specs = [
+        _spec_from_manifest(entry)
+        for entry in BACKEND_MANIFEST
+        if entry.metadata.role is BackendRole.PRIMARY
+        and (entry.metadata.name.lower() == requested_effective or entry_matches_machine(entry, hints))
+    ]
+    specs.sort(key=lambda spec: (-int(spec.priority), spec.name))
+    return specs
+
+
+def iter_auxiliary_specs() -> list[BackendSpec]:
+    """Return specs for all AUXILIARY built-in backends via marker discovery.
+
+    Auxiliary backends (e.g. ``sysfs-mouse``) are excluded from primary
+    auto-selection but remain visible in diagnostics and secondary-device
+    workflows.
+    """
+    if backend_manifest_enabled():
+        return [
+            _spec_from_manifest(entry) for entry in BACKEND_MANIFEST if entry.metadata.role is BackendRole.AUXILIARY
+        ]
+    return [
+        _spec_from_registration(reg)
+        for reg in discover_backend_registrations()
+        if reg.metadata.role is BackendRole.AUXILIARY
+    ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import time
+from collections.abc import Callable
 
 DEFAULT_HID_REPORT_DELAY_S = 0.001
 GLOBAL_HID_REPORT_DELAY_ENV = "KEYRGB_HID_REPORT_DELAY_MS"
@@ -36,6 +37,16 @@ def _delay_s_from_env_key(env_key: str) -> float | None:
         return None
 
 
+def hid_report_delay_env_override(*, backend_name: str | None = None) -> bool:
+    """Return True when the user pinned the delay via a ``KEYRGB_*_REPORT_DELAY_MS`` variable."""
+
+    keys = [GLOBAL_HID_REPORT_DELAY_ENV]
+    specific_key = backend_report_delay_env_key(backend_name) if backend_name else None
+    if specific_key is not None:
+        keys.append(specific_key)
+    return any(_delay_s_from_env_key(key) is not None for key in keys)
+
+
 def hid_report_delay_s_from_env(*, backend_name: str | None = None, default_s: float | None = None) -> float:
     """Return the configured HID report pacing delay in seconds.
 
@@ -73,3 +84,46 @@ def sleep_after_hid_report(*, backend_name: str | None = None, delay_s: float |
     delay = hid_report_delay_s_from_env(backend_name=backend_name) if delay_s is None else max(0.0, float(delay_s))
     if delay > 0.0:
         time.sleep(delay)
+
+
+class HidReportPacer:
+    """Keep consecutive HID reports at least ``delay_s`` apart, start to start.
+
+    Unlike ``sleep_after_hid_report()``, time the transport spends inside a
+    report counts toward the gap: a report whose ioctl already took longer than
+    the delay is not followed by an extra sleep, and the last report of a burst
+    does not sleep at all.
+    """
+
+    def __init__(
+        self,
+        *,
+        backend_name: str | None = None,
+        delay_s: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if delay_s is None:
+            self._delay_s = hid_report_delay_s_from_env(backend_name=backend_name)
+        else:
+            self._delay_s = max(0.0, float(delay_s))
+        self._clock = clock
+        self._sleep = sleep
+        self._next_report_s = 0.0
+
+    @property
+    def delay_s(self) -> float:
+        return self._delay_s
+
+    def wait_for_slot(self) -> None:
+        """Block until the next report may start, then reserve the following slot."""
+
+        delay = self._delay_s
+        if delay <= 0.0:
+            return
+        now = self._clock()
+        remaining = self._next_report_s - now
+        if remaining > 0.0:
+            self._sleep(remaining)
+            now = self._next_report_s
+        self._next_report_s = now + delay
@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Protocol
+from typing import Any, Protocol, runtime_checkable
 
 
 class KeyboardDevice(Protocol):
@@ -34,6 +34,34 @@ class KeyboardDevice(Protocol):
         ...
 
 
+@runtime_checkable
+class PackedRgbFrame(Protocol):
+    """Frame that exposes packed row-major ``R, G, B`` rows.
+
+    ``keyrgb.core.effects.frame_buffer.FrameBuffer`` implements this next to
+    the ``Mapping[(row, col), rgb]`` surface, so devices can copy whole rows
+    without walking per-key tuples.
+    """
+
+    @property
+    def rows(self) -> int: ...
+
+    @property
+    def cols(self) -> int: ...
+
+    def row_view(self, row: int) -> memoryview: ...
+
+
+def packed_frame_rows(color_map: object, *, rows: int, cols: int) -> list[memoryview] | None:
+    """Return zero-copy row views when ``color_map`` is a packed frame of the given shape."""
+
+    if not isinstance(color_map, PackedRgbFrame):
+        return None
+    if int(color_map.rows) != int(rows) or int(color_map.cols) != int(cols):
+        return None
+    return [color_map.row_view(row) for row in range(int(rows))]
+
+
 @dataclass(frozen=True)
 class BackendCapabilities:
     brightness: bool
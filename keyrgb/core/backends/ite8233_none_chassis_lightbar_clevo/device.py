@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable, Sequence
 
+from keyrgb.core.runtime.metrics import timed_hid_report
+
 from . import protocol
 
 _logger = logging.getLogger(__name__)
@@ -34,7 +36,7 @@ class Ite8233LightbarDevice:
         self._is_off = self._brightness <= 0
 
     def _write_report(self, report: bytes) -> None:
-        result = self._send_feature_report(bytes(report))
+        result = timed_hid_report(self._send_feature_report, bytes(report))
         if int(result) < 0:
             raise OSError("Could not send ITE 8233 feature report")
 
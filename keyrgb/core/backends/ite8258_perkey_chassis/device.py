@@ -5,6 +5,8 @@ from collections.abc import Callable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, SupportsIndex, SupportsInt, cast
 
+from keyrgb.core.runtime.metrics import timed_hid_report
+
 from . import protocol
 
 if TYPE_CHECKING:
@@ -91,7 +93,7 @@ class Ite8258ChassisKeyboardDevice:
         self._is_off = self._current_brightness <= 0
 
     def _send(self, report: bytes) -> None:
-        result = self._send_feature_report(bytes(report))
+        result = timed_hid_report(self._send_feature_report, bytes(report))
         if int(result or 0) < 0:
             raise OSError("Could not send ITE 8258 chassis feature report")
 
@@ -238,7 +240,7 @@ class Ite8258ChassisZoneDevice:
         self._is_off = self._current_brightness <= 0
 
     def _send(self, report: bytes) -> None:
-        result = self._send_feature_report(bytes(report))
+        result = timed_hid_report(self._send_feature_report, bytes(report))
         if int(result or 0) < 0:
             raise OSError(f"Could not send ITE 8258 chassis {self._zone_name} feature report")
 
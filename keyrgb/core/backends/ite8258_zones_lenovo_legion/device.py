@@ -4,6 +4,8 @@ import logging
 from collections.abc import Callable, Mapping, Sequence
 from typing import SupportsIndex, SupportsInt, cast
 
+from keyrgb.core.runtime.metrics import timed_hid_report
+
 from . import protocol
 
 _logger = logging.getLogger(__name__)
@@ -70,7 +72,7 @@ class Ite8258KeyboardDevice:
         self._is_off = self._current_brightness <= 0
 
     def _send(self, report: bytes) -> None:
-        result = self._send_feature_report(bytes(report))
+        result = timed_hid_report(self._send_feature_report, bytes(report))
         if int(result or 0) < 0:
             raise OSError("Could not send ITE 8258 feature report")
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 import keyrgb.core.backends.base as _backend_base
@@ -24,7 +24,9 @@ def _find_matching_supported_hidraw_device() -> HidrawDeviceInfo | None:
     )
 
 
-def _open_matching_transport() -> tuple[HidrawFeatureOutputTransport, HidrawDeviceInfo]:
+def _open_matching_transport(
+    probed: HidrawDeviceInfo | None = None,
+) -> tuple[HidrawFeatureOutputTransport, HidrawDeviceInfo]:
     from ..shared_hidraw_probe import open_matching_ite8291_style_hidraw_transport
 
     return open_matching_ite8291_style_hidraw_transport(
@@ -33,6 +35,7 @@ def _open_matching_transport() -> tuple[HidrawFeatureOutputTransport, HidrawDevi
         backend_name="ite8291_perkey",
         vendor_id=protocol.VENDOR_ID,
         missing_label="ITE 8291",
+        probed=probed,
     )
 
 
@@ -50,11 +53,14 @@ class Ite8291Backend(_backend_base.KeyboardBackend):
     priority: int = 97
     stability: _backend_base.BackendStability = _backend_base.BackendStability.EXPERIMENTAL
     experimental_evidence: _backend_base.ExperimentalEvidence = _backend_base.ExperimentalEvidence.REVERSE_ENGINEERED
+    # Match from the last successful probe; get_device() opens it without rescanning.
+    _probed_match: HidrawDeviceInfo | None = field(default=None, init=False, repr=False, compare=False)
 
     def is_available(self) -> bool:
         return self.probe().available
 
     def probe(self) -> _backend_base.ProbeResult:
+        self._probed_match = None
         identifiers = {
             "usb_vid": f"0x{protocol.VENDOR_ID:04x}",
             "usb_pid": "/".join(f"0x{pid:04x}" for pid in protocol.SUPPORTED_PRODUCT_IDS),
@@ -106,6 +112,7 @@ class Ite8291Backend(_backend_base.KeyboardBackend):
                 identifiers=identifiers,
             )
 
+        self._probed_match = match
         return _backend_base.ProbeResult(
             available=True,
             reason=f"hidraw device present ({match.devnode})",
@@ -126,7 +133,8 @@ class Ite8291Backend(_backend_base.KeyboardBackend):
             )
 
         try:
-            transport, info = _open_matching_transport()
+            probed, self._probed_match = self._probed_match, None
+            transport, info = _open_matching_transport() if probed is None else _open_matching_transport(probed)
             if protocol.firmware_requires_zone_mode(info.product_id, info.bcd_device):
                 raise RuntimeError(
                     "Detected an ITE 8291 zone-only firmware variant; the experimental per-key HID backend does not support it yet."
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
+from keyrgb.core.runtime.metrics import timed_hid_report
+
 from . import protocol
 
 FeatureReportWriter = Callable[[bytes], int | None]
@@ -77,12 +79,12 @@ class Ite8291KeyboardDevice:
         self._transport = transport
 
     def _send_feature(self, report: bytes) -> None:
-        result = self._send_feature_report(bytes(report))
+        result = timed_hid_report(self._send_feature_report, bytes(report))
         if int(result or 0) < 0:
             raise OSError("Could not send ITE 8291 feature report")
 
     def _send_output(self, report: bytes) -> None:
-        result = self._write_output_report(bytes(report))
+        result = timed_hid_report(self._write_output_report, bytes(report))
         if int(result or 0) < 0:
             raise OSError("Could not send ITE 8291 output report")
 
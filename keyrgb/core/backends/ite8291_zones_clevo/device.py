@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable, Sequence
 
+from keyrgb.core.runtime.metrics import timed_hid_report
+
 from . import protocol
 
 _logger = logging.getLogger(__name__)
@@ -39,7 +41,7 @@ class Ite8291ZonesKeyboardDevice:
         self._is_off = self._current_brightness <= 0
 
     def _send(self, report: bytes) -> None:
-        result = self._send_feature_report(bytes(report))
+        result = timed_hid_report(self._send_feature_report, bytes(report))
         if int(result or 0) < 0:
             raise OSError("Could not send ITE 8291 zone feature report")
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from keyrgb.core.backends.exceptions import (
     BackendBusyError,
@@ -12,7 +12,7 @@ from keyrgb.core.backends.exceptions import (
 )
 from keyrgb.core.utils.exceptions import is_device_busy, is_device_disconnected, is_permission_denied
 
-from .._report_pacing import hid_report_delay_s_from_env
+from .. import _adaptive_pacing, _report_pacing
 from ..base import BackendCapabilities, BackendStability, KeyboardBackend, KeyboardDevice, ProbeResult
 from . import protocol
 from .device import Ite8291r3KeyboardDevice, _skip_unchanged_rows_enabled
@@ -85,6 +85,9 @@ def _unexpected_revision_reason(*, bcd_device: int | None) -> str | None:
 
 # Hardware-validated pacing default for the r3 USB path (see below).
 ITE8291R3_DEFAULT_REPORT_DELAY_S = 0.00025
+# Lowest delay adaptive pacing may learn; below this the controller has
+# nothing left to gain over the USB round-trip itself.
+ITE8291R3_REPORT_DELAY_FLOOR_S = 0.0001
 
 
 def _report_delay_s_from_env() -> float:
@@ -98,7 +101,7 @@ def _report_delay_s_from_env() -> float:
     via ``KEYRGB_ITE8291R3_PERKEY_REPORT_DELAY_MS`` or the global
     ``KEYRGB_HID_REPORT_DELAY_MS``; set to 0 to disable pacing entirely.
     """
-    return hid_report_delay_s_from_env(
+    return _report_pacing.hid_report_delay_s_from_env(
         backend_name="ite8291r3_perkey",
         default_s=ITE8291R3_DEFAULT_REPORT_DELAY_S,
     )
@@ -110,6 +113,9 @@ class Ite8291r3Backend(KeyboardBackend):
     priority: int = 100
     stability: BackendStability = BackendStability.VALIDATED
     experimental_evidence: None = None
+    # Device found by the last successful probe, handed to get_device() so it
+    # does not enumerate the bus a second time.
+    _probed_usb_device: object | None = field(default=None, init=False, repr=False, compare=False)
 
     def _load_usb_core(self):
         return _load_usb_core()
@@ -122,6 +128,7 @@ class Ite8291r3Backend(KeyboardBackend):
             return False
 
     def probe(self) -> ProbeResult:
+        self._probed_usb_device = None
         try:
             usb_core = self._load_usb_core()
         except _ITE_IMPORT_ERRORS as exc:
@@ -200,6 +207,7 @@ class Ite8291r3Backend(KeyboardBackend):
                         ),
                     )
 
+                self._probed_usb_device = dev
                 return ProbeResult(
                     available=True,
                     reason=f"usb device present (0x{vendor_id:04x}:0x{int(pid):04x})",
@@ -223,20 +231,34 @@ class Ite8291r3Backend(KeyboardBackend):
         return BackendCapabilities(brightness=True, per_key=True, color=True, hardware_effects=True, palette=True)
 
     def _open_matching_transport(self):
-        return open_matching_transport(
-            product_ids=tuple(pid for _vid, pid in _SUPPORTED_USB_IDS), required_bcd=protocol.REV_NUMBER
-        )
+        product_ids = tuple(pid for _vid, pid in _SUPPORTED_USB_IDS)
+        probed, self._probed_usb_device = self._probed_usb_device, None
+        if probed is not None:
+            try:
+                return open_matching_transport(product_ids=product_ids, required_bcd=protocol.REV_NUMBER, device=probed)
+            except OSError as exc:
+                # PyUSB's USBError is an OSError; the device may have been replugged since the probe.
+                logger.debug("Probed ITE 8291r3 device could not be opened (%s); scanning again", exc)
+        return open_matching_transport(product_ids=product_ids, required_bcd=protocol.REV_NUMBER)
 
     def get_device(self) -> KeyboardDevice:
         try:
             self._load_usb_core()
-            transport, _info = self._open_matching_transport()
+            transport, info = self._open_matching_transport()
+            pacing = _adaptive_pacing.adaptive_report_pacing(
+                backend_name=self.name,
+                vendor_id=getattr(info, "vendor_id", None),
+                product_id=getattr(info, "product_id", None),
+                default_s=ITE8291R3_DEFAULT_REPORT_DELAY_S,
+                floor_s=ITE8291R3_REPORT_DELAY_FLOOR_S,
+            )
             device = Ite8291r3KeyboardDevice(
                 transport.send_control_report,
                 transport.read_control_report,
                 transport.write_data,
                 transport=transport,
                 report_delay_s=_report_delay_s_from_env(),
+                report_pacing=pacing,
             )
         except (
             ImportError,
@@ -265,8 +287,9 @@ class Ite8291r3Backend(KeyboardBackend):
         # interpretable if the log records which lever configuration produced it.
         _policy_override = os.environ.get("KEYRGB_PER_KEY_MODE_POLICY", "").strip()
         logger.info(
-            "ite8291r3_perkey device config: report_delay_ms=%.3f skip_unchanged_rows=%s per_key_mode_policy=%s",
-            _report_delay_s_from_env() * 1000.0,
+            "ite8291r3_perkey device config: report_delay_ms=%.3f%s skip_unchanged_rows=%s per_key_mode_policy=%s",
+            (pacing.delay_s if pacing is not None else _report_delay_s_from_env()) * 1000.0,
+            f" (adaptive, min_safe_ms={pacing.min_safe_s * 1000.0:.3f})" if pacing is not None else "",
             _skip_unchanged_rows_enabled(),
             _policy_override or "init_once (backend default)",
         )
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, SupportsIndex, SupportsInt, cast
 
-from keyrgb.core.backends._report_pacing import DEFAULT_HID_REPORT_DELAY_S, sleep_after_hid_report
+from keyrgb.core.backends._adaptive_pacing import AdaptiveReportPacing, write_paced_report
+from keyrgb.core.backends._report_pacing import DEFAULT_HID_REPORT_DELAY_S
+from keyrgb.core.backends.base import packed_frame_rows
 
 from . import protocol
 
@@ -113,6 +115,21 @@ def _coerce_effect_payload(effect_data: object) -> tuple[int, ...]:
     raise ValueError("effect_data must be a dict, list, or tuple")
 
 
+def _row_payloads_for_color_map(color_map: object) -> list[bytes]:
+    """One row data report per matrix row; a packed 6x21 frame skips per-key coercion."""
+
+    packed_rows = packed_frame_rows(color_map, rows=protocol.NUM_ROWS, cols=protocol.NUM_COLS)
+    if packed_rows is not None:
+        return [protocol.build_row_data_report_from_rgb(row_rgb) for row_rgb in packed_rows]
+
+    rows = [[(0, 0, 0)] * protocol.NUM_COLS for _ in range(protocol.NUM_ROWS)]
+    for key_id, color in dict(cast(Mapping[object, object], color_map or {})).items():
+        if (row_col := _coerce_row_col(key_id)) is not None:
+            rows[row_col[0]][row_col[1]] = _coerce_rgb(color)
+
+    return [protocol.build_row_data_report(row_colors) for row_colors in rows]
+
+
 class Ite8291r3KeyboardDevice:
     keyrgb_hw_speed_policy = "inverted"
     # Hardware-validated 2026-07-31 (Tongfang ITE8291R3): firmware holds user
@@ -137,6 +154,7 @@ class Ite8291r3KeyboardDevice:
         *,
         transport: PyUsbTransport | None = None,
         report_delay_s: float = DEFAULT_HID_REPORT_DELAY_S,
+        report_pacing: AdaptiveReportPacing | None = None,
     ) -> None:
         if not callable(send_control_report):
             raise TypeError("send_control_report must be callable")
@@ -150,24 +168,22 @@ class Ite8291r3KeyboardDevice:
         self._write_row_data = write_row_data
         self._transport = transport
         self._report_delay_s = max(0.0, float(report_delay_s))
+        self._report_pacing = report_pacing
         # Last row payloads written via set_key_colors (see _SKIP_UNCHANGED_ROWS_ENV).
         self._last_row_payloads: list[bytes | None] = [None] * protocol.NUM_ROWS
 
     def _send_control(self, report: bytes) -> None:
-        result = self._send_control_report(bytes(report))
-        if int(result or 0) < 0:
-            raise OSError("Could not send ITE 8291r3 control report")
-        sleep_after_hid_report(delay_s=self._report_delay_s)
+        self._paced_write(self._send_control_report, report, error="Could not send ITE 8291r3 control report")
 
     def _read_control(self, length: int) -> bytes:
         data = self._read_control_report(int(length))
         return bytes(data)
 
     def _write_row(self, row_data: bytes) -> None:
-        result = self._write_row_data(bytes(row_data))
-        if int(result or 0) < 0:
-            raise OSError("Could not send ITE 8291r3 row data")
-        sleep_after_hid_report(delay_s=self._report_delay_s)
+        self._paced_write(self._write_row_data, row_data, error="Could not send ITE 8291r3 row data")
+
+    def _paced_write(self, write: ControlWriter, report: bytes, *, error: str) -> None:
+        write_paced_report(write, report, pacing=self._report_pacing, delay_s=self._report_delay_s, error=error)
 
     def get_fw_version(self) -> tuple[int, int, int, int]:
         """Return the firmware version as ``(major, minor, test, customer)``.
@@ -228,6 +244,8 @@ class Ite8291r3KeyboardDevice:
     def set_brightness(self, brightness: int) -> None:
         level = protocol.clamp_ui_brightness(brightness)
         self._send_control(protocol.build_set_brightness_report(level))
+        if self._report_pacing is not None:
+            self._report_pacing.observe_brightness_write(level)
 
     def freeze(self) -> None:
         effect = self.get_effect()
@@ -249,12 +267,16 @@ class Ite8291r3KeyboardDevice:
         # visibly blank the keyboard before userspace can repaint it.  Treat
         # those reads as controller state observations, not as proof that a
         # prior KeyRGB write requested an off transition.
-        effect = self.get_effect()
-        return int(effect[protocol.EffectAttrs.BRIGHTNESS])
+        level = int(self.get_effect()[protocol.EffectAttrs.BRIGHTNESS])
+        if self._report_pacing is not None:
+            self._report_pacing.observe_brightness_read(level)
+        return level
 
     def enable_user_mode(self, *, brightness: int | None = None, save: bool = False) -> None:
         level = self.get_brightness() if brightness is None else protocol.clamp_ui_brightness(brightness)
         self.set_effect((protocol.USER_MODE_EFFECT, 0x00, level, 0x00, 0x00, 0x01 if save else 0x00))
+        if self._report_pacing is not None:
+            self._report_pacing.observe_brightness_write(level)
 
     def set_color(self, color, *, brightness: int, save: bool = False):
         rgb = _coerce_rgb(color)
@@ -297,23 +319,13 @@ class Ite8291r3KeyboardDevice:
         save: bool = False,
         enable_user_mode: bool = True,
     ):
-        rows: list[list[tuple[int, int, int]]] = [
-            [(0, 0, 0) for _ in range(protocol.NUM_COLS)] for _ in range(protocol.NUM_ROWS)
-        ]
-
-        for key_id, color in dict(color_map or {}).items():
-            row_col = _coerce_row_col(key_id)
-            if row_col is None:
-                continue
-            row_idx, col_idx = row_col
-            rows[row_idx][col_idx] = _coerce_rgb(color)
+        payloads = _row_payloads_for_color_map(color_map)
 
         if enable_user_mode or save:
             self.enable_user_mode(brightness=brightness, save=save)
 
         skip_unchanged = _skip_unchanged_rows_enabled()
-        for row_idx, row_colors in enumerate(rows):
-            payload = protocol.build_row_data_report(row_colors)
+        for row_idx, payload in enumerate(payloads):
             if skip_unchanged and self._last_row_payloads[row_idx] == payload:
                 continue
             self._set_row_index(row_idx)
@@ -322,6 +334,8 @@ class Ite8291r3KeyboardDevice:
 
     def close(self) -> None:
         """Release the USB transport if one was provided."""
+        if self._report_pacing is not None:
+            self._report_pacing.flush()
         transport = self._transport
         if transport is not None:
             self._transport = None
@@ -187,6 +187,23 @@ def build_row_data_report(colors_for_row: Sequence[object]) -> bytes:
     return bytes(payload)
 
 
+def build_row_data_report_from_rgb(row_rgb: bytes | bytearray | memoryview) -> bytes:
+    """Build a row data report from one packed ``R, G, B`` row.
+
+    ``row_rgb`` holds ``3 * NUM_COLS`` bytes in column order, such as a
+    ``FrameBuffer.row_view()``. Channels are copied as strided slices rather
+    than per-key tuples.
+    """
+    if len(row_rgb) != 3 * NUM_COLS:
+        raise ValueError(f"row must contain exactly {3 * NUM_COLS} bytes")
+
+    payload = bytearray(ROW_BUFFER_LEN)
+    payload[ROW_RED_OFFSET : ROW_RED_OFFSET + NUM_COLS] = row_rgb[0::3]
+    payload[ROW_GREEN_OFFSET : ROW_GREEN_OFFSET + NUM_COLS] = row_rgb[1::3]
+    payload[ROW_BLUE_OFFSET : ROW_BLUE_OFFSET + NUM_COLS] = row_rgb[2::3]
+    return bytes(payload)
+
+
 def build_uniform_row_data_report(color_value) -> bytes:
     return build_row_data_report([color_value for _ in range(NUM_COLS)])
 
@@ -316,9 +316,18 @@ def open_matching_transport(
     product_ids: tuple[int, ...] | None = None,
     required_bcd: int | None = protocol.REV_NUMBER,
     interface_number: int = DEFAULT_INTERFACE_NUMBER,
+    device: _UsbDeviceProtocol | None = None,
 ) -> tuple[PyUsbTransport, UsbDeviceInfo]:
+    """Open the first matching device, or ``device`` (e.g. the one a probe found) without rescanning."""
     usb_core, usb_util = _load_pyusb_modules()
-    device = find_matching_device(loc=loc, product_ids=product_ids, required_bcd=required_bcd)
+    if device is None:
+        device = find_matching_device(loc=loc, product_ids=product_ids, required_bcd=required_bcd)
+    elif not _device_matches(
+        device,
+        product_ids=tuple(int(pid) for pid in (product_ids or tuple(protocol.PRODUCT_IDS))),
+        required_bcd=required_bcd,
+    ):
+        device = None
     if device is None:
         raise FileNotFoundError("no suitable device found")
 
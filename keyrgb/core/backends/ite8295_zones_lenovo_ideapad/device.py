@@ -4,6 +4,8 @@ import logging
 from collections.abc import Callable, Mapping
 from typing import SupportsIndex, SupportsInt, cast
 
+from keyrgb.core.runtime.metrics import timed_hid_report
+
 from . import protocol
 
 _logger = logging.getLogger(__name__)
@@ -78,7 +80,7 @@ class Ite8295ZonesKeyboardDevice:
         self._is_off = self._brightness <= 0
 
     def _send(self, report: bytes) -> None:
-        result = self._send_feature_report(bytes(report))
+        result = timed_hid_report(self._send_feature_report, bytes(report))
         if int(result or 0) < 0:
             raise OSError("Could not send ITE 8295 4-zone feature report")
 
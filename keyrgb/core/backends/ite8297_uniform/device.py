@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 
+from keyrgb.core.runtime.metrics import timed_hid_report
+
 from . import protocol
 
 _logger = logging.getLogger(__name__)
@@ -38,7 +40,7 @@ class Ite8297KeyboardDevice:
         self._current_brightness = protocol.clamp_ui_brightness(current_brightness)
 
     def _send(self, report: bytes) -> None:
-        result = self._send_feature_report(bytes(report))
+        result = timed_hid_report(self._send_feature_report, bytes(report))
         if result == -1:
             raise OSError("Could not send ITE 8297 feature report")
 
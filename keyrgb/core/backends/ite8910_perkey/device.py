@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Callable
 from typing import SupportsIndex, SupportsInt, cast
 
+from keyrgb.core.runtime.metrics import timed_hid_report
+
 from . import protocol
 
 FeatureReportWriter = Callable[[bytes], int | None]
 IntCoercible = SupportsInt | SupportsIndex | str | bytes | bytearray
+Color = tuple[int, int, int]
+
+# The ITE 8910 takes one 6-byte SET_LED report per key, so a full frame costs
+# ~120 paced ioctls. set_key_colors() only sends LEDs whose colour differs from
+# what the device last acknowledged. Set the env var to 0 to always resend every
+# key in the map.
+_SKIP_UNCHANGED_KEYS_ENV = "KEYRGB_ITE8910_SKIP_UNCHANGED_KEYS"
+
+
+def _skip_unchanged_keys_enabled() -> bool:
+    return str(os.environ.get(_SKIP_UNCHANGED_KEYS_ENV, "")).strip().lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
 
 
 def _coerce_int(value: object) -> int:
@@ -73,6 +92,7 @@ class Ite8910KeyboardDevice:
 
     keyrgb_hw_speed_policy = "direct"
     keyrgb_per_key_mode_policy = "init_once"
+    keyrgb_per_key_write_granularity = "key"
 
     def __init__(
         self,
@@ -92,6 +112,8 @@ class Ite8910KeyboardDevice:
         )
         self._current_brightness = _clamp_ui_brightness(current_brightness)
         self._transport = transport
+        # LED id -> colour the device last acknowledged; missing ids are unknown.
+        self._shown_colors: dict[int, Color] = {}
 
     @property
     def current_brightness_raw(self) -> int:
@@ -102,7 +124,7 @@ class Ite8910KeyboardDevice:
         return int(self._state.current_speed_raw)
 
     def _send(self, report: bytes) -> None:
-        result = self._send_feature_report(bytes(report))
+        result = timed_hid_report(self._send_feature_report, bytes(report))
         if result == -1:
             raise OSError("Could not send ITE 8910 feature report")
 
@@ -132,12 +154,33 @@ class Ite8910KeyboardDevice:
         self._current_brightness = requested
 
     def reset(self) -> None:
+        self._shown_colors.clear()
         self._send(self._state.reset())
         for led_id in protocol.iter_known_led_ids():
-            self._send(self._state.set_led_color(led_id, (0, 0, 0)))
+            self.set_led_color_by_id(led_id, (0, 0, 0))
 
     def set_led_color_by_id(self, led_id: int, color) -> None:
-        self._send(self._state.set_led_color(int(led_id), _coerce_rgb(color)))
+        self._send_led(int(led_id), _coerce_rgb(color))
+
+    def _send_led(self, led_id: int, rgb: Color) -> None:
+        try:
+            self._send(self._state.set_led_color(led_id, rgb))
+        except OSError:
+            # The report may or may not have landed; resend it next time.
+            self._shown_colors.pop(led_id, None)
+            raise
+        self._shown_colors[led_id] = rgb
+
+    def _write_led_batch(self, colors: dict[int, Color]) -> None:
+        """Send one SET_LED report per changed LED, in LED-id (hardware scan) order."""
+
+        skip_unchanged = _skip_unchanged_keys_enabled()
+        shown = self._shown_colors
+        for led_id in sorted(colors):
+            rgb = colors[led_id]
+            if skip_unchanged and shown.get(led_id) == rgb:
+                continue
+            self._send_led(led_id, rgb)
 
     def set_matrix_color(self, row: int, col: int, color) -> None:
         self.set_led_color_by_id(protocol.led_id_from_row_col(row, col), color)
@@ -148,6 +191,8 @@ class Ite8910KeyboardDevice:
         colors: list[tuple[int, int, int]] | None = None,
         direction: str | None = None,
     ) -> None:
+        # Hardware animations repaint every LED, so the per-key shadow is stale.
+        self._shown_colors.clear()
         for report in self._state.set_effect(effect, colors, direction):
             self._send(report)
 
@@ -171,8 +216,10 @@ class Ite8910KeyboardDevice:
         if enable_user_mode:
             self.enable_user_mode(brightness=brightness, save=False)
 
+        colors: dict[int, Color] = {}
         for key_id, color in (color_map or {}).items():
-            self.set_led_color_by_id(_coerce_led_id(key_id), color)
+            colors[_coerce_led_id(key_id)] = _coerce_rgb(color)
+        self._write_led_batch(colors)
 
     def set_effect(self, effect_data) -> None:
         direction = None
@@ -6,7 +6,7 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 
-from keyrgb.core.backends._report_pacing import sleep_after_hid_report
+from keyrgb.core.backends._report_pacing import HidReportPacer
 
 HIDRAW_PATH_ENV = "KEYRGB_ITE8910_HIDRAW_PATH"
 
@@ -139,8 +139,8 @@ class HidrawFeatureTransport:
     def __init__(self, devnode: Path, *, backend_name: str | None = None) -> None:
         flags = int(os.O_RDWR) | _os_cloexec_flag_or_zero()
         self.devnode = Path(devnode)
-        self._backend_name = backend_name
         self._fd: int | None = os.open(os.fspath(self.devnode), flags)
+        self._pacer = HidReportPacer(backend_name=backend_name)
 
     def close(self) -> None:
         try:
@@ -163,8 +163,8 @@ class HidrawFeatureTransport:
         if fd is None:
             raise RuntimeError("hidraw transport is closed")
 
+        self._pacer.wait_for_slot()
         fcntl.ioctl(int(fd), hidiocsfeature(len(payload)), payload, True)
-        sleep_after_hid_report(backend_name=self._backend_name)
         return len(payload)
 
     def __del__(self) -> None:
@@ -0,0 +1,295 @@
+"""Static manifest of the built-in backends.
+
+``discover_backend_registrations()`` imports every backend package to read its
+``BACKEND_REGISTRATION``, which pulls in protocol tables and USB/hidraw helpers
+even on machines that only use sysfs. Auto-selection reads this manifest
+instead. Each entry repeats the package's ``BackendMetadata`` and adds cheap
+match hints: the USB VID:PIDs the backend drives, LED name substrings under
+``/sys/class/leds``, executables it needs, and the environment variables that
+force a device path. A backend package is imported only when its hints match
+this machine, or when it is requested by name.
+
+tests/core/backends/test_backend_manifest_unit.py checks every entry against
+its package marker and protocol IDs, so a backend change that is not mirrored
+here fails the suite. ``KEYRGB_DISABLE_BACKEND_MANIFEST=1`` goes back to
+importing every package.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+from .base import (
+    BackendMetadata,
+    BackendRegistration,
+    BackendRole,
+    BackendStability,
+    ExperimentalEvidence,
+    KeyboardBackend,
+)
+
+DISABLE_BACKEND_MANIFEST_ENV = "KEYRGB_DISABLE_BACKEND_MANIFEST"
+
+_ITE = 0x048D
+# Substrings of keyboard LED names the sysfs backend considers (see sysfs.common._is_candidate_led).
+KEYBOARD_LED_PATTERNS: tuple[str, ...] = ("kbd", "keyboard", "ite_8291_lb", "ite_8297:")
+
+
+def backend_manifest_enabled() -> bool:
+    return str(os.environ.get(DISABLE_BACKEND_MANIFEST_ENV, "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def keyboard_led_name(name: str) -> bool:
+    lowered = name.lower()
+    return any(pattern in lowered for pattern in KEYBOARD_LED_PATTERNS)
+
+
+@dataclass(frozen=True)
+class BackendManifestEntry:
+    package: str
+    metadata: BackendMetadata
+    usb_ids: tuple[tuple[int, int], ...] = ()
+    led_patterns: tuple[str, ...] = ()
+    executables: tuple[str, ...] = ()
+    force_envs: tuple[str, ...] = ()
+
+    @property
+    def module_name(self) -> str:
+        return f"keyrgb.core.backends.{self.package}"
+
+    def load_registration(self) -> BackendRegistration:
+        """Import the backend package and return its marker."""
+
+        try:
+            module = importlib.import_module(self.module_name)
+        except ImportError as exc:
+            raise RuntimeError(f"backend package {self.module_name} failed to import: {exc}") from exc
+        registration = getattr(module, "BACKEND_REGISTRATION", None)
+        if not isinstance(registration, BackendRegistration):
+            raise TypeError(f"backend package {self.module_name} has no BACKEND_REGISTRATION")
+        return registration
+
+    def construct(self) -> KeyboardBackend:
+        return self.load_registration().factory()
+
+
+BACKEND_MANIFEST: tuple[BackendManifestEntry, ...] = (
+    BackendManifestEntry(
+        package="asusctl",
+        metadata=BackendMetadata(name="asusctl-aura", priority=120, stability=BackendStability.VALIDATED),
+        executables=("asusctl",),
+        force_envs=("KEYRGB_ASUSCTL_PATH",),
+    ),
+    BackendManifestEntry(
+        package="ite8233_none_chassis_lightbar_clevo",
+        metadata=BackendMetadata(
+            name="ite8233_none_chassis_lightbar_clevo",
+            priority=96,
+            provider="usb-userspace",
+            stability=BackendStability.EXPERIMENTAL,
+            experimental_evidence=ExperimentalEvidence.REVERSE_ENGINEERED,
+        ),
+        usb_ids=((_ITE, 0x6010), (_ITE, 0x7000), (_ITE, 0x7001)),
+        force_envs=("KEYRGB_ITE8233_HIDRAW_PATH",),
+    ),
+    BackendManifestEntry(
+        package="ite8258_perkey_chassis",
+        metadata=BackendMetadata(
+            name="ite8258_perkey_chassis",
+            priority=97,
+            provider="usb-userspace",
+            stability=BackendStability.EXPERIMENTAL,
+            experimental_evidence=ExperimentalEvidence.REVERSE_ENGINEERED,
+        ),
+        usb_ids=((_ITE, 0xC197),),
+        force_envs=("KEYRGB_ITE8258_CHASSIS_HIDRAW_PATH",),
+    ),
+    BackendManifestEntry(
+        package="ite8258_zones_lenovo_legion",
+        metadata=BackendMetadata(
+            name="ite8258_zones_lenovo_legion",
+            priority=98,
+            provider="usb-userspace",
+            stability=BackendStability.EXPERIMENTAL,
+            experimental_evidence=ExperimentalEvidence.REVERSE_ENGINEERED,
+        ),
+        usb_ids=((_ITE, 0xC195),),
+        force_envs=("KEYRGB_ITE8258_HIDRAW_PATH",),
+    ),
+    BackendManifestEntry(
+        package="ite8291_perkey",
+        metadata=BackendMetadata(
+            name="ite8291_perkey",
+            priority=97,
+            provider="usb-userspace",
+            stability=BackendStability.EXPERIMENTAL,
+            experimental_evidence=ExperimentalEvidence.REVERSE_ENGINEERED,
+        ),
+        usb_ids=((_ITE, 0x6004), (_ITE, 0x6008), (_ITE, 0x600B), (_ITE, 0xCE00)),
+        force_envs=("KEYRGB_ITE8291_HIDRAW_PATH",),
+    ),
+    BackendManifestEntry(
+        package="ite8291_zones_clevo",
+        metadata=BackendMetadata(
+            name="ite8291_zones_clevo",
+            priority=96,
+            provider="usb-userspace",
+            stability=BackendStability.EXPERIMENTAL,
+            experimental_evidence=ExperimentalEvidence.REVERSE_ENGINEERED,
+        ),
+        usb_ids=((_ITE, 0xCE00),),
+        force_envs=("KEYRGB_ITE8291_ZONES_HIDRAW_PATH",),
+    ),
+    BackendManifestEntry(
+        package="ite8291r3_perkey",
+        metadata=BackendMetadata(
+            name="ite8291r3_perkey",
+            priority=100,
+            provider="usb-userspace",
+            stability=BackendStability.VALIDATED,
+        ),
+        usb_ids=((_ITE, 0x6004), (_ITE, 0x6006), (_ITE, 0x600B), (_ITE, 0xCE00)),
+    ),
+    BackendManifestEntry(
+        package="ite8295_zones_lenovo_ideapad",
+        metadata=BackendMetadata(
+            name="ite8295_zones_lenovo_ideapad",
+            priority=97,
+            provider="usb-userspace",
+            stability=BackendStability.EXPERIMENTAL,
+            experimental_evidence=ExperimentalEvidence.REVERSE_ENGINEERED,
+        ),
+        usb_ids=tuple((_ITE, pid) for pid in (0xC955, 0xC963, 0xC965, 0xC973, 0xC975, 0xC984, 0xC985)),
+        force_envs=("KEYRGB_ITE8295_ZONES_HIDRAW_PATH",),
+    ),
+    BackendManifestEntry(
+        package="ite8297_uniform",
+        metadata=BackendMetadata(
+            name="ite8297_uniform",
+            priority=95,
+            provider="usb-userspace",
+            stability=BackendStability.EXPERIMENTAL,
+            experimental_evidence=ExperimentalEvidence.REVERSE_ENGINEERED,
+        ),
+        usb_ids=((_ITE, 0x8297),),
+        force_envs=("KEYRGB_ITE8297_HIDRAW_PATH",),
+    ),
+    BackendManifestEntry(
+        package="ite8910_perkey",
+        metadata=BackendMetadata(
+            name="ite8910_perkey",
+            priority=94,
+            provider="usb-userspace",
+            stability=BackendStability.VALIDATED,
+        ),
+        usb_ids=((_ITE, 0x8910),),
+        force_envs=("KEYRGB_ITE8910_HIDRAW_PATH",),
+    ),
+    BackendManifestEntry(
+        package="sysfs",
+        metadata=BackendMetadata(
+            name="sysfs-leds",
+            priority=150,
+            provider="kernel-sysfs",
+            stability=BackendStability.VALIDATED,
+        ),
+        led_patterns=KEYBOARD_LED_PATTERNS,
+    ),
+    BackendManifestEntry(
+        package="sysfs_mouse",
+        metadata=BackendMetadata(
+            name="sysfs-mouse",
+            priority=10,
+            role=BackendRole.AUXILIARY,
+            provider="kernel-sysfs",
+            stability=BackendStability.EXPERIMENTAL,
+            experimental_evidence=ExperimentalEvidence.SPECULATIVE,
+        ),
+    ),
+)
+
+
+def manifest_entry_for_name(name: str) -> BackendManifestEntry | None:
+    normalized = (name or "").strip().lower()
+    return next((entry for entry in BACKEND_MANIFEST if entry.metadata.name.lower() == normalized), None)
+
+
+def _read_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8", errors="replace").strip()
+    except OSError:
+        return ""
+
+
+def _present_usb_ids(sysfs_root: Path) -> frozenset[tuple[int, int]] | None:
+    """VID:PID of every USB device and hidraw node, or ``None`` when sysfs cannot be listed."""
+
+    ids: set[tuple[int, int]] = set()
+    try:
+        usb_devices = list((sysfs_root / "bus" / "usb" / "devices").iterdir())
+    except OSError:
+        return None
+    for device in usb_devices:
+        try:
+            ids.add((int(_read_text(device / "idVendor"), 16), int(_read_text(device / "idProduct"), 16)))
+        except ValueError:
+            continue
+    try:
+        hidraw_nodes = list((sysfs_root / "class" / "hidraw").iterdir())
+    except OSError:
+        hidraw_nodes = []
+    for node in hidraw_nodes:
+        for line in _read_text(node / "device" / "uevent").splitlines():
+            if line.startswith("HID_ID="):
+                parts = line.partition("=")[2].split(":")
+                try:
+                    ids.add((int(parts[1], 16), int(parts[2], 16)))
+                except (IndexError, ValueError):
+                    pass
+                break
+    return frozenset(ids)
+
+
+def _led_names(leds_root: Path) -> tuple[str, ...] | None:
+    try:
+        return tuple(entry.name for entry in leds_root.iterdir())
+    except OSError:
+        return None
+
+
+@dataclass(frozen=True)
+class MachineHints:
+    """What the manifest hints are matched against; ``None`` means unknown, which matches everything."""
+
+    usb_ids: frozenset[tuple[int, int]] | None
+    led_names: tuple[str, ...] | None
+
+    @classmethod
+    def read(cls, *, sysfs_root: Path = Path("/sys")) -> MachineHints:
+        usb_ids = None if os.environ.get("KEYRGB_DISABLE_USB_SCAN") == "1" else _present_usb_ids(sysfs_root)
+        leds_root = os.environ.get("KEYRGB_SYSFS_LEDS_ROOT")
+        return cls(
+            usb_ids=usb_ids,
+            led_names=_led_names(Path(leds_root) if leds_root else sysfs_root / "class" / "leds"),
+        )
+
+
+def entry_matches_machine(entry: BackendManifestEntry, hints: MachineHints) -> bool:
+    """Return whether ``entry`` could be available on the machine described by ``hints``."""
+
+    if not (entry.usb_ids or entry.led_patterns or entry.executables):
+        return True
+    if any(os.environ.get(env) for env in entry.force_envs):
+        return True
+    if entry.usb_ids and (hints.usb_ids is None or not hints.usb_ids.isdisjoint(entry.usb_ids)):
+        return True
+    if entry.led_patterns and (
+        hints.led_names is None
+        or any(pattern in name.lower() for name in hints.led_names for pattern in entry.led_patterns)
+    ):
+        return True
+    return any(shutil.which(executable) is not None for executable in entry.executables)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import os
+
+# How much of a per-key frame a device can accept in one ``set_key_colors()``
+# call without repainting the cells it was not given.
+#
+# - ``key``: any subset of cells; cells missing from the map keep their colour.
+# - ``row``: any subset of whole rows; rows missing from the map keep their colours.
+# - ``frame``: the whole frame every time; missing cells may be blanked.
+WRITE_GRANULARITY_KEY = "key"
+WRITE_GRANULARITY_ROW = "row"
+WRITE_GRANULARITY_FRAME = "frame"
+WRITE_GRANULARITY_ENV = "KEYRGB_PER_KEY_WRITE_GRANULARITY"
+
+_WRITE_GRANULARITIES = frozenset({WRITE_GRANULARITY_KEY, WRITE_GRANULARITY_ROW, WRITE_GRANULARITY_FRAME})
+# Finer granularities come later; a device accepting one also accepts the coarser ones.
+_GRANULARITY_ORDER = (WRITE_GRANULARITY_FRAME, WRITE_GRANULARITY_ROW, WRITE_GRANULARITY_KEY)
+
+
+def normalize_write_granularity(granularity: object) -> str:
+    value = str(granularity or WRITE_GRANULARITY_FRAME).strip().lower()
+    if value in _WRITE_GRANULARITIES:
+        return value
+    return WRITE_GRANULARITY_FRAME
+
+
+def per_key_write_granularity(kb: object) -> str:
+    declared = normalize_write_granularity(getattr(kb, "keyrgb_per_key_write_granularity", None))
+    override = str(os.environ.get(WRITE_GRANULARITY_ENV, "")).strip()
+    if not override:
+        return declared
+    # The override can only coarsen what the device declares: a ``frame`` device
+    # handed a partial map would blank the cells it was not given.
+    requested = normalize_write_granularity(override)
+    return min(declared, requested, key=_GRANULARITY_ORDER.index)
@@ -0,0 +1,158 @@
+"""Remember which backend auto-selection picked on this machine.
+
+Auto-selection imports and probes every backend in priority order, which on
+most laptops ends with the same answer every time. The winner is stored in the
+user state dir together with a fingerprint of what selection depends on: the
+DMI product, the ITE USB devices and hidraw nodes (VID:PID, bcdDevice,
+devnode), the kernel keyboard LEDs, whether ``asusctl`` is installed and the
+experimental-backends policy. The fingerprint is built from a handful of small
+sysfs reads; while it matches, only the remembered backend is probed. Any
+difference, or a remembered backend that no longer probes as available, falls
+back to the full selection, which then refreshes the file.
+
+``KEYRGB_DISABLE_PROBE_CACHE=1`` always runs the full selection.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DISABLE_PROBE_CACHE_ENV = "KEYRGB_DISABLE_PROBE_CACHE"
+PROBE_CACHE_STATE_FILENAME = "backend_probe.json"
+ITE_VENDOR_ID = 0x048D
+
+_FORMAT_VERSION = 1
+
+
+def probe_cache_enabled() -> bool:
+    return str(os.environ.get(DISABLE_PROBE_CACHE_ENV, "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def _probe_cache_path() -> Path:
+    from keyrgb.core.config.paths import state_dir
+
+    return state_dir() / PROBE_CACHE_STATE_FILENAME
+
+
+def _read_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8", errors="replace").strip()
+    except OSError:
+        return ""
+
+
+def _usb_topology(sysfs_root: Path) -> list[str]:
+    vendor = f"{ITE_VENDOR_ID:04x}"
+    out: list[str] = []
+    try:
+        devices = sorted((sysfs_root / "bus" / "usb" / "devices").iterdir())
+    except OSError:
+        return out
+    for device in devices:
+        if _read_text(device / "idVendor").lower() != vendor:
+            continue
+        product = _read_text(device / "idProduct").lower()
+        bcd = _read_text(device / "bcdDevice").lower()
+        try:
+            devnode = f"/dev/bus/usb/{int(_read_text(device / 'busnum')):03d}/{int(_read_text(device / 'devnum')):03d}"
+        except ValueError:
+            devnode = "?"
+        out.append(f"usb {vendor}:{product} bcd={bcd} {devnode}")
+    return out
+
+
+def _hidraw_topology(sysfs_root: Path) -> list[str]:
+    out: list[str] = []
+    try:
+        nodes = sorted((sysfs_root / "class" / "hidraw").iterdir())
+    except OSError:
+        return out
+    for node in nodes:
+        # HID_ID=0003:0000048D:0000CE00 (bus:vendor:product).
+        for line in _read_text(node / "device" / "uevent").splitlines():
+            key, _sep, value = line.partition("=")
+            if key != "HID_ID":
+                continue
+            parts = value.split(":")
+            try:
+                vendor_id, product_id = int(parts[1], 16), int(parts[2], 16)
+            except (IndexError, ValueError):
+                break
+            if vendor_id == ITE_VENDOR_ID:
+                out.append(f"hidraw {vendor_id:04x}:{product_id:04x} /dev/{node.name}")
+            break
+    return out
+
+
+def _keyboard_leds(sysfs_root: Path) -> list[str]:
+    from .manifest import keyboard_led_name
+
+    try:
+        names = sorted(entry.name for entry in (sysfs_root / "class" / "leds").iterdir())
+    except OSError:
+        return []
+    return [f"led {name}" for name in names if keyboard_led_name(name)]
+
+
+def hardware_fingerprint(*, sysfs_root: Path = Path("/sys"), experimental_enabled: bool | None = None) -> str:
+    """Return a digest of everything backend auto-selection depends on."""
+
+    if experimental_enabled is None:
+        from .policies.backend_selection import experimental_backends_enabled
+
+        experimental_enabled = experimental_backends_enabled()
+    dmi = sysfs_root / "class" / "dmi" / "id"
+    parts = [
+        f"dmi {_read_text(dmi / 'sys_vendor')} / {_read_text(dmi / 'product_name')}",
+        *_usb_topology(sysfs_root),
+        *_hidraw_topology(sysfs_root),
+        *_keyboard_leds(sysfs_root),
+        f"asusctl {shutil.which('asusctl') is not None}",
+        f"experimental {bool(experimental_enabled)}",
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def load_cached_backend(fingerprint: str, *, path: Path | None = None) -> str | None:
+    """Return the backend name remembered for ``fingerprint``, or ``None``."""
+
+    cache_path = _probe_cache_path() if path is None else Path(path)
+    try:
+        raw = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("version") != _FORMAT_VERSION or raw.get("fingerprint") != fingerprint:
+        return None
+    backend = raw.get("backend")
+    return backend if isinstance(backend, str) and backend else None
+
+
+def store_cached_backend(fingerprint: str, backend_name: str, *, path: Path | None = None) -> None:
+    """Remember ``backend_name`` as the auto-selection winner for ``fingerprint``."""
+
+    cache_path = _probe_cache_path() if path is None else Path(path)
+    state = {"version": _FORMAT_VERSION, "fingerprint": fingerprint, "backend": str(backend_name)}
+    tmp_path = cache_path.with_name(f".{cache_path.name}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.debug("Could not persist backend probe cache to %s: %s", cache_path, exc)
+
+
+def forget_cached_backend(*, path: Path | None = None) -> None:
+    cache_path = _probe_cache_path() if path is None else Path(path)
+    try:
+        cache_path.unlink()
+    except FileNotFoundError:
+        return
+    except OSError as exc:
+        logger.debug("Could not remove backend probe cache %s: %s", cache_path, exc)
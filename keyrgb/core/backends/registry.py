@@ -1,59 +1,44 @@
 from __future__ import annotations
 
-import importlib
 import logging
 import os
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
-from pathlib import Path
 from typing import TypeVar
 
-from .base import (
-    BackendMetadata,
-    BackendRegistration,
-    BackendRole,
-    KeyboardBackend,
-    ProbeResult,
+from ._registry_probe import probe_cache_fingerprint, remember_selection, select_cached_backend
+from ._registry_specs import (
+    BackendSpec,
+    default_specs,
+    discover_backend_registrations,
+    get_metadata_for_backend_name,
+    iter_auxiliary_specs,
+    machine_specs,
+    requested_backend_names,
 )
+from .base import KeyboardBackend, ProbeResult
 from .policies.backend_selection import (
     experimental_backends_enabled,
     selection_allowed_for_backend,
     stability_for_backend,
 )
 
+__all__ = [
+    "BackendProbeEvaluation",
+    "BackendSelectionReport",
+    "BackendSpec",
+    "build_backend_selection_report",
+    "discover_backend_registrations",
+    "get_metadata_for_backend_name",
+    "iter_auxiliary_specs",
+    "iter_backends",
+    "select_backend",
+]
+
 logger = logging.getLogger(__name__)
 _BACKEND_RUNTIME_ERRORS = (AttributeError, LookupError, OSError, RuntimeError, TypeError, ValueError)
 _T = TypeVar("_T")
 
-# Map deprecated backend names to their canonical replacement. Users who set
-# KEYRGB_BACKEND=<old_name> will transparently resolve to the canonical backend.
-# See keyrgb/core/backends/README.md for the naming convention.
-_BACKEND_NAME_ALIASES: dict[str, str] = {
-    "ite8291r3": "ite8291r3_perkey",
-    "ite8910": "ite8910_perkey",
-    "ite8291": "ite8291_perkey",
-    "ite8291-zones": "ite8291_zones_clevo",
-    "ite8258": "ite8258_zones_lenovo_legion",
-    "ite8258-chassis": "ite8258_perkey_chassis",
-    "ite8295-zones": "ite8295_zones_lenovo_ideapad",
-    "ite8233": "ite8233_none_chassis_lightbar_clevo",
-    "ite8297": "ite8297_uniform",
-    # Pre-rename canonical names (persisted in user configs / KEYRGB_BACKEND).
-    "ite8291_zones": "ite8291_zones_clevo",
-    "ite8258_zones": "ite8258_zones_lenovo_legion",
-    "ite8258_chassis": "ite8258_perkey_chassis",
-    "ite8258_perkey_chassis_logo_neon_vent_lenovo_legion": "ite8258_perkey_chassis",
-    "ite8295_zones": "ite8295_zones_lenovo_ideapad",
-    "ite8233_lightbar": "ite8233_none_chassis_lightbar_clevo",
-}
-
-
-@dataclass(frozen=True)
-class BackendSpec:
-    name: str
-    priority: int
-    factory: Callable[[], KeyboardBackend]
-
 
 @dataclass(frozen=True)
 class BackendProbeEvaluation:
@@ -77,82 +62,6 @@ class BackendSelectionReport:
     selected: KeyboardBackend | None
 
 
-def _spec_for_backend(factory: type[KeyboardBackend]) -> BackendSpec:
-    """Build a registry spec from class metadata without constructing a backend."""
-
-    return BackendSpec(name=factory.name, priority=factory.priority, factory=factory)
-
-
-def _spec_from_registration(reg: BackendRegistration) -> BackendSpec:
-    """Build a registry spec from a ``BackendRegistration`` marker."""
-
-    return BackendSpec(
-        name=reg.metadata.name,
-        priority=reg.metadata.priority,
-        factory=reg.factory,
-    )
-
-
-# ---------------------------------------------------------------------------
-# Deterministic discovery of backend packages exposing BACKEND_REGISTRATION
-# ---------------------------------------------------------------------------
-
-_DISCOVERY_SKIP_NAMES = frozenset({"policies"})
-_discovered_registrations_cache: list[BackendRegistration] | None = None
-
-
-def discover_backend_registrations() -> list[BackendRegistration]:
-    """Scan backend sub-packages for ``BACKEND_REGISTRATION`` markers.
-
-    Discovery is deterministic (sorted by directory name) and resilient to
-    individual import failures: packages that cannot be imported or that do
-    not expose a ``BACKEND_REGISTRATION`` marker are silently skipped.
-    """
-    global _discovered_registrations_cache
-    if _discovered_registrations_cache is not None:
-        return list(_discovered_registrations_cache)
-
-    backend_dir = Path(__file__).parent
-    registrations: list[BackendRegistration] = []
-
-    for child in sorted(backend_dir.iterdir()):
-        if not child.is_dir():
-            continue
-        if child.name.startswith("_") or child.name in _DISCOVERY_SKIP_NAMES:
-            continue
-        if not (child / "__init__.py").exists():
-            continue
-
-        mod_name = f"keyrgb.core.backends.{child.name}"
-        try:
-            mod = importlib.import_module(mod_name)
-        except (AttributeError, ImportError, OSError, RuntimeError, TypeError, ValueError) as exc:
-            logger.debug("Skipping backend package %s: import failed: %s", mod_name, exc)
-            continue
-
-        reg = getattr(mod, "BACKEND_REGISTRATION", None)
-        if isinstance(reg, BackendRegistration):
-            registrations.append(reg)
-
-    _discovered_registrations_cache = registrations
-    return list(registrations)
-
-
-def _invalidate_discovery_cache() -> None:
-    """Reset the discovery cache (primarily for tests)."""
-    global _discovered_registrations_cache
-    _discovered_registrations_cache = None
-
-
-def get_metadata_for_backend_name(name: str) -> BackendMetadata | None:
-    """Look up static metadata by canonical backend name."""
-    normalized = (name or "").strip().lower()
-    for reg in discover_backend_registrations():
-        if reg.metadata.name.strip().lower() == normalized:
-            return reg.metadata
-    return None
-
-
 def _run_recoverable_backend_boundary(
     action: Callable[[], _T],
     *,
@@ -171,34 +80,9 @@ def _unavailable_probe_result(boundary: str, exc: Exception) -> ProbeResult:
     return ProbeResult(available=False, reason=f"{boundary} exception: {exc}", confidence=0)
 
 
-def _default_specs() -> list[BackendSpec]:
-    """Return specs for all PRIMARY built-in backends via marker discovery."""
-    specs = [
-        _spec_from_registration(reg)
-        for reg in discover_backend_registrations()
-        if reg.metadata.role is BackendRole.PRIMARY
-    ]
-    specs.sort(key=lambda spec: (-int(spec.priority), spec.name))
-    return specs
-
-
-def iter_auxiliary_specs() -> list[BackendSpec]:
-    """Return specs for all AUXILIARY built-in backends via marker discovery.
-
-    Auxiliary backends (e.g. ``sysfs-mouse``) are excluded from primary
-    auto-selection but remain visible in diagnostics and secondary-device
-    workflows.
-    """
-    return [
-        _spec_from_registration(reg)
-        for reg in discover_backend_registrations()
-        if reg.metadata.role is BackendRole.AUXILIARY
-    ]
-
-
 def iter_backends(*, specs: Iterable[BackendSpec] | None = None) -> list[KeyboardBackend]:
     out: list[KeyboardBackend] = []
-    for spec in list(specs) if specs is not None else _default_specs():
+    for spec in list(specs) if specs is not None else default_specs():
         backend = _run_recoverable_backend_boundary(
             spec.factory,
             backend_name=spec.name,
@@ -266,8 +150,7 @@ def build_backend_selection_report(
     visible without independently reimplementing selection or probing.
     """
 
-    requested_name = (requested or os.environ.get("KEYRGB_BACKEND") or "auto").strip().lower()
-    requested_effective = _BACKEND_NAME_ALIASES.get(requested_name, requested_name)
+    requested_name, requested_effective = requested_backend_names(requested)
     evaluations: list[BackendProbeEvaluation] = []
 
     for backend in backends:
@@ -339,8 +222,15 @@ def build_backend_selection_report(
     )
 
 
+def _select_auto(specs: Sequence[BackendSpec]) -> KeyboardBackend | None:
+    return build_backend_selection_report(iter_backends(specs=specs), requested="auto").selected
+
+
 def select_backend(
-    *, requested: str | None = None, specs: Iterable[BackendSpec] | None = None
+    *,
+    requested: str | None = None,
+    specs: Iterable[BackendSpec] | None = None,
+    use_probe_cache: bool | None = None,
 ) -> KeyboardBackend | None:
     """Select a backend.
 
@@ -351,6 +241,9 @@ def select_backend(
 
     Allowed values: backend name, alias, or `auto`.
     Returns None if nothing is available.
+
+    Auto selection first tries the backend remembered in the probe cache (see
+    ``probe_cache``); ``use_probe_cache`` defaults to on for the built-in specs.
     """
 
     # Safety: under pytest, never auto-select real hardware backends by default.
@@ -361,8 +254,20 @@ def select_backend(
         if not allow_hardware:
             return None
 
-    backends = iter_backends(specs=specs)
+    spec_list = list(specs) if specs is not None else machine_specs(requested)
+    requested_name, _requested_effective = requested_backend_names(requested)
+    if use_probe_cache is None:
+        use_probe_cache = specs is None
+    fingerprint = probe_cache_fingerprint(requested_name=requested_name, use_probe_cache=use_probe_cache)
+    if fingerprint is not None:
+        cached = select_cached_backend(fingerprint, spec_list, select_fn=_select_auto)
+        if cached is not None:
+            return cached
+
+    backends = iter_backends(specs=spec_list)
     report = build_backend_selection_report(backends, requested=requested)
     if report.selected is not None:
         logger.debug("Backend '%s' selected (%s).", report.selected.name, report.requested_effective)
+    if fingerprint is not None:
+        remember_selection(fingerprint, report.selected)
     return report.selected
@@ -86,15 +86,22 @@ def open_matching_ite8291_style_hidraw_transport(
     backend_name: str,
     vendor_id: int,
     missing_label: str,
+    probed: HidrawDeviceInfo | None = None,
 ) -> tuple[HidrawFeatureOutputTransport, HidrawDeviceInfo]:
-    """Open a feature-output transport for an ite8291-style matched device."""
+    """Open a feature-output transport for an ite8291-style matched device.
+
+    ``probed`` is the match a backend probe already found; it is opened without
+    rescanning while its devnode still exists.
+    """
     from .ite8291_perkey import hidraw
 
     supported = tuple(int(pid) for pid in product_ids)
-    info = find_matching_ite8291_style_hidraw_device(
-        product_ids=supported,
-        forced_path_env=forced_path_env,
-    )
+    info = probed if probed is not None and Path(probed.devnode).exists() else None
+    if info is None:
+        info = find_matching_ite8291_style_hidraw_device(
+            product_ids=supported,
+            forced_path_env=forced_path_env,
+        )
     if info is None:
         raise FileNotFoundError(
             f"No hidraw device found for supported {missing_label} IDs: "
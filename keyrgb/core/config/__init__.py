@@ -13,7 +13,7 @@ from .config import Config, ConfigPersistenceError
 from .document import ConfigDocument
 from .domains import ConfigDomain
 from .file_storage import load_config_settings, save_config_settings_atomic
-from .paths import config_dir, config_file_path
+from .paths import config_dir, config_file_path, runtime_dir, state_dir
 from .perkey_colors import deserialize_per_key_colors, serialize_per_key_colors
 
 __all__ = [
@@ -25,6 +25,8 @@ __all__ = [
     "config_file_path",
     "deserialize_per_key_colors",
     "load_config_settings",
+    "runtime_dir",
     "save_config_settings_atomic",
     "serialize_per_key_colors",
+    "state_dir",
 ]
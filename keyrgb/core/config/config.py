@@ -219,6 +219,31 @@ class Config(
                         self._settings = deepcopy(self._persisted_settings)
                     raise ConfigPersistenceError("Could not persist configuration transaction")
 
+    @contextmanager
+    def defer_persistence(self) -> Iterator[Config]:
+        """Keep property updates in memory until ``persist_deferred_changes()`` writes them.
+
+        Unlike ``batch_update()``, leaving the block does not write the file; the
+        tray's control socket persists its updates later, off the apply path.
+        """
+
+        self._save_defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._save_defer_depth -= 1
+
+    def persist_deferred_changes(self) -> bool:
+        """Write updates left by ``defer_persistence()``; ``False`` when the write failed."""
+
+        if self._save_defer_depth > 0 or not self._save_pending:
+            return True
+        self._save_pending = False
+        if self._persist_changes():
+            return True
+        self._save_pending = True
+        return False
+
     def apply_perkey_profile_state(
         self,
         colors: Mapping[object, object] | None,
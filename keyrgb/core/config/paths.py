@@ -42,3 +42,46 @@ def config_file_path() -> Path:
     if p:
         return Path(p)
     return config_dir() / "config.json"
+
+
+def state_dir() -> Path:
+    """Return the directory used for machine-learned runtime state.
+
+    Unlike config, nothing here is user-edited; deleting it only loses
+    learned values.
+
+    Priority:
+    - KEYRGB_STATE_DIR
+    - XDG_STATE_HOME/keyrgb
+    - ~/.local/state/keyrgb
+    """
+
+    p = os.environ.get("KEYRGB_STATE_DIR")
+    if p:
+        return Path(p)
+
+    xdg = os.environ.get("XDG_STATE_HOME")
+    if xdg:
+        return Path(xdg) / "keyrgb"
+
+    return Path.home() / ".local" / "state" / "keyrgb"
+
+
+def runtime_dir() -> Path:
+    """Return the per-session directory for ephemeral runtime files.
+
+    Priority:
+    - KEYRGB_RUNTIME_DIR
+    - XDG_RUNTIME_DIR/keyrgb
+    - state_dir()/run (no per-session runtime dir available)
+    """
+
+    p = os.environ.get("KEYRGB_RUNTIME_DIR")
+    if p:
+        return Path(p)
+
+    xdg = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg:
+        return Path(xdg) / "keyrgb"
+
+    return state_dir() / "run"
@@ -0,0 +1,247 @@
+"""``keyrgbctl``: drive the running tray's lighting from scripts.
+
+Every command in a batch goes to the tray over one control-socket
+connection, so a batch costs one Python start and no config.json write::
+
+    keyrgbctl 'brightness 30; color 255,0,0; key esc 0,255,0'
+
+Commands are separated by ``;`` or newlines. Without arguments they are read
+from stdin. The whole batch is parsed before anything is sent, and then
+pipelined. With ``--frames``, stdin carries per-key frames instead: raw RGB
+bytes, ``rows * cols * 3`` per frame, row-major (``keyrgbctl state`` prints
+the matrix size). Each frame is pushed as soon as it has been read. Frames
+and ``key`` commands are shown but not saved to config.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from keyrgb.core.utils import control_wire
+from keyrgb.core.utils.control_wire import ControlConnection, ControlProtocolError, MessageType
+
+KeyCells = tuple[tuple[int, int], ...]
+
+# Frames sent before the first reply is awaited; bounds the tray's send backlog.
+_FRAME_WINDOW = 4
+_EXIT_FAILED = 1
+_EXIT_USAGE = 2
+_EXIT_UNREACHABLE = 3
+
+
+@dataclass(frozen=True)
+class ControlRequest:
+    text: str
+    kind: MessageType
+    payload: bytes = b""
+
+
+def _parse_color(text: str) -> bytes:
+    value = text.strip()
+    if value.startswith("#") and len(value) == 7:
+        try:
+            return bytes.fromhex(value[1:])
+        except ValueError:
+            pass
+    parts = value.split(",")
+    if len(parts) == 3:
+        try:
+            return control_wire.color_payload(int(part) for part in parts)
+        except ValueError:
+            pass
+    raise ControlProtocolError(f"{text!r} is not a color (R,G,B or #RRGGBB)")
+
+
+def load_active_keymap() -> dict[str, KeyCells]:
+    """Key cells by slot id from the active profile's keymap."""
+
+    from keyrgb.core.profile import profiles
+
+    return profiles.load_keymap(profiles.get_active_profile())
+
+
+def _key_cells(name: str, keymap: Mapping[str, KeyCells]) -> KeyCells:
+    text = name.strip().lower()
+    row, sep, col = text.partition(",")
+    if sep:
+        try:
+            return ((int(row), int(col)),)
+        except ValueError:
+            pass
+    from keyrgb.core.resources.layouts import slot_id_for_key_id
+
+    cells = keymap.get(str(slot_id_for_key_id("auto", text) or text)) or keymap.get(text)
+    if not cells:
+        raise ControlProtocolError(f"unknown key {name!r} (use a key name from the active keymap or ROW,COL)")
+    return tuple(cells)
+
+
+def parse_batch(
+    text: str,
+    *,
+    load_keymap: Callable[[], Mapping[str, KeyCells]] = load_active_keymap,
+) -> list[ControlRequest]:
+    """Parse ``;``/newline-separated commands; consecutive ``key`` commands become one request."""
+
+    requests: list[ControlRequest] = []
+    keymap: Mapping[str, KeyCells] | None = None
+    for raw in text.replace("\n", ";").split(";"):
+        command = raw.strip()
+        if not command or command.startswith("#"):
+            continue
+        verb, *args = command.split()
+        verb = verb.lower()
+        if verb == "brightness" and len(args) == 1 and args[0].isdigit():
+            requests.append(ControlRequest(command, MessageType.SET_BRIGHTNESS, bytes([min(255, int(args[0]))])))
+        elif verb == "color" and len(args) == 1:
+            requests.append(ControlRequest(command, MessageType.SET_COLOR, _parse_color(args[0])))
+        elif verb == "effect" and len(args) == 1:
+            requests.append(ControlRequest(command, MessageType.SET_EFFECT, args[0].encode("utf-8")))
+        elif verb == "key" and len(args) == 2:
+            if keymap is None and "," not in args[0]:
+                keymap = load_keymap()
+            color = _parse_color(args[1])
+            cells = _key_cells(args[0], keymap or {})
+            payload = control_wire.key_records_payload({cell: color for cell in cells})
+            if requests and requests[-1].kind is MessageType.SET_KEYS:
+                # Adjacent key commands go out as one request, so the tray applies them together.
+                previous = requests.pop()
+                requests.append(
+                    ControlRequest(f"{previous.text}; {command}", MessageType.SET_KEYS, previous.payload + payload)
+                )
+            else:
+                requests.append(ControlRequest(command, MessageType.SET_KEYS, payload))
+        elif verb in {"state", "watch"} and not args:
+            requests.append(ControlRequest(command, MessageType.QUERY if verb == "state" else MessageType.SUBSCRIBE))
+        else:
+            raise ControlProtocolError(f"cannot parse {command!r}")
+    if any(request.kind is MessageType.SUBSCRIBE for request in requests[:-1]):
+        raise ControlProtocolError("'watch' must be the last command")
+    return requests
+
+
+def _print_state(payload: bytes, out: TextIO) -> None:
+    print(json.dumps(control_wire.decode_state(payload), sort_keys=True), file=out, flush=True)
+
+
+def run_batch(connection: ControlConnection, requests: Iterable[ControlRequest], *, out: TextIO, err: TextIO) -> int:
+    """Pipeline ``requests`` and report each reply; a trailing ``watch`` then prints states until EOF."""
+
+    batch = list(requests)
+    connection.send_many((request.kind, request.payload) for request in batch)
+    status = 0
+    for request in batch:
+        kind, payload = connection.receive()
+        if kind is MessageType.ERROR:
+            print(f"keyrgbctl: {request.text}: {control_wire.decode_text(payload)}", file=err)
+            status = _EXIT_FAILED
+        elif kind is MessageType.STATE:
+            _print_state(payload, out)
+    if batch and batch[-1].kind is MessageType.SUBSCRIBE:
+        while True:
+            try:
+                kind, payload = connection.receive()
+            except ConnectionResetError:
+                # The tray exited.
+                return status
+            if kind is MessageType.STATE:
+                _print_state(payload, out)
+    return status
+
+
+def _read_frame(stream: BinaryIO, size: int) -> bytes:
+    chunks: list[bytes] = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def stream_frames(connection: ControlConnection, stream: BinaryIO, *, err: TextIO) -> int:
+    """Push every complete frame from ``stream``; returns the exit status."""
+
+    rows, cols = control_wire.state_geometry(control_wire.decode_state(connection.request(MessageType.QUERY)))
+    size = rows * cols * 3
+    in_flight = 0
+    status = 0
+
+    def take_reply() -> None:
+        nonlocal in_flight, status
+        in_flight -= 1
+        kind, payload = connection.receive()
+        if kind is MessageType.ERROR and not status:
+            print(f"keyrgbctl: frame rejected: {control_wire.decode_text(payload)}", file=err)
+            status = _EXIT_FAILED
+
+    while True:
+        frame = _read_frame(stream, size)
+        if len(frame) < size:
+            if frame:
+                print(f"keyrgbctl: ignoring a partial frame of {len(frame)} bytes (frames are {size})", file=err)
+            break
+        connection.send(MessageType.FRAME, frame)
+        in_flight += 1
+        if in_flight >= _FRAME_WINDOW:
+            take_reply()
+    while in_flight:
+        take_reply()
+    return status
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="keyrgbctl",
+        description="Send lighting commands to the running KeyRGB tray.",
+        epilog=(
+            "commands: brightness N; color R,G,B|#RRGGBB; effect NAME; key NAME|ROW,COL COLOR; state; watch. "
+            "Exit status: 1 when the tray rejected a command, 2 for usage errors, 3 when the tray is not reachable."
+        ),
+    )
+    parser.add_argument("commands", nargs="*", help="Commands, separated by ';' (read from stdin when omitted).")
+    parser.add_argument("--frames", action="store_true", help="Stream raw RGB per-key frames from stdin.")
+    parser.add_argument("--socket", type=Path, default=None, help="Control socket path (default: the tray's).")
+    args = parser.parse_args(argv)
+
+    requests: list[ControlRequest] = []
+    if args.frames:
+        if args.commands:
+            parser.error("--frames reads frames from stdin and takes no commands")
+    else:
+        try:
+            requests = parse_batch(" ".join(args.commands) if args.commands else sys.stdin.read())
+        except (ControlProtocolError, OSError) as exc:
+            print(f"keyrgbctl: {exc}", file=sys.stderr)
+            return _EXIT_USAGE
+
+    watching = bool(requests) and requests[-1].kind is MessageType.SUBSCRIBE
+    try:
+        connection = ControlConnection.connect(args.socket, timeout_s=None if watching else 5.0)
+    except OSError as exc:
+        path = args.socket or control_wire.control_socket_path()
+        print(f"keyrgbctl: the tray is not reachable at {path}: {exc}", file=sys.stderr)
+        return _EXIT_UNREACHABLE
+
+    with connection:
+        try:
+            if args.frames:
+                return stream_frames(connection, sys.stdin.buffer, err=sys.stderr)
+            return run_batch(connection, requests, out=sys.stdout, err=sys.stderr)
+        except KeyboardInterrupt:
+            return 0 if watching else 130
+        except (ControlProtocolError, OSError) as exc:
+            print(f"keyrgbctl: {exc}", file=sys.stderr)
+            return _EXIT_UNREACHABLE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
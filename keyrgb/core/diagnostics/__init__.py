@@ -9,6 +9,7 @@ from . import (
     formatting as diagnostics_formatting,
     io as diagnostics_io,
     model as diagnostics_model,
+    perf as diagnostics_perf,
     snapshots as diagnostics_snapshots,
     usb as diagnostics_usb,
 )
@@ -145,13 +146,25 @@ def main() -> None:
         action="store_true",
         help="Skip USB enumeration (avoids pyusb scans).",
     )
+    parser.add_argument(
+        "--perf",
+        action="store_true",
+        help="Include frame timing and USB throughput metrics exported by the running tray.",
+    )
     args = parser.parse_args()
 
     diag = collect_diagnostics(include_usb=not bool(args.no_usb))
+    perf = diagnostics_perf.perf_snapshot() if args.perf else None
     if args.text:
-        print(format_diagnostics_text(diag))
+        text = format_diagnostics_text(diag)
+        if perf is not None:
+            text = f"{text}\n{diagnostics_perf.format_perf_text(perf)}"
+        print(text)
     else:
-        print(json.dumps(diag.to_dict(), indent=2, sort_keys=True))
+        payload = diag.to_dict()
+        if perf is not None:
+            payload["perf"] = perf
+        print(json.dumps(payload, indent=2, sort_keys=True))
 
 
 if __name__ == "__main__":
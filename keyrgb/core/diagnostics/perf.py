@@ -0,0 +1,59 @@
+"""Performance section for ``keyrgb-diagnostics --perf``.
+
+The rendering process (normally the tray) exports its metrics registry to
+``runtime_dir()/perf.json`` every few seconds while effects run; this module
+reads that snapshot and summarizes it.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+from keyrgb.core.runtime.metrics import perf_snapshot_path, read_exported_snapshot, summary_lines
+
+
+def _process_running(pid: object) -> bool:
+    return isinstance(pid, int) and pid > 0 and os.path.exists(f"/proc/{pid}")
+
+
+def perf_snapshot(path: Path | None = None) -> dict[str, object]:
+    """Return the last exported metrics snapshot plus a short summary."""
+
+    target = perf_snapshot_path() if path is None else path
+    exported = read_exported_snapshot(target)
+    if exported is None:
+        return {"available": False, "path": str(target)}
+
+    metrics = exported.get("metrics")
+    metrics = metrics if isinstance(metrics, Mapping) else {}
+    written_at = exported.get("written_at")
+    age_s = round(time.time() - float(written_at), 1) if isinstance(written_at, (int, float)) else None
+    pid = exported.get("pid")
+    return {
+        "available": True,
+        "path": str(target),
+        "pid": pid,
+        "process_running": _process_running(pid),
+        "age_s": age_s,
+        "summary": summary_lines(metrics),
+        "metrics": dict(metrics),
+    }
+
+
+def format_perf_text(snapshot: Mapping[str, object]) -> str:
+    lines = ["Performance:"]
+    if not snapshot.get("available"):
+        lines.append(f"  no metrics exported yet ({snapshot.get('path')}); run an effect in the tray first")
+        return "\n".join(lines)
+
+    state = "running" if snapshot.get("process_running") else "exited"
+    lines.append(f"  source: pid {snapshot.get('pid')} ({state}), exported {snapshot.get('age_s')} s ago")
+    summary = snapshot.get("summary")
+    if isinstance(summary, list) and summary:
+        lines.extend(f"  {line}" for line in summary)
+    else:
+        lines.append("  no frames recorded")
+    return "\n".join(lines)
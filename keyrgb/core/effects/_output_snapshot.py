@@ -0,0 +1,122 @@
+"""The binary format of the instant-on output snapshot (``last_output.bin``).
+
+A fixed header (magic, version, kind, brightness, hardware fingerprint digest,
+backend name length, payload length) is followed by the backend name and the
+payload: three bytes for a uniform color, one five-byte record per key for a
+per-key frame, or the raw hardware effect payload.
+"""
+
+from __future__ import annotations
+
+import enum
+import struct
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+_MAGIC = b"KRGB"
+_FORMAT_VERSION = 1
+# magic, version, kind, brightness, reserved, fingerprint digest, backend name length, payload length
+_HEADER = struct.Struct("<4sBBBB32sHI")
+_KEY_RECORD = struct.Struct("<BBBBB")
+
+Color = tuple[int, int, int]
+
+
+class OutputKind(enum.IntEnum):
+    UNIFORM = 1
+    PER_KEY = 2
+    HARDWARE_EFFECT = 3
+
+
+def _u8(value: object) -> int | None:
+    try:
+        number = int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return number if 0 <= number <= 255 else None
+
+
+def color_bytes(color: object) -> bytes | None:
+    try:
+        channels = [_u8(channel) for channel in color]  # type: ignore[attr-defined]
+    except TypeError:
+        return None
+    if len(channels) != 3 or any(channel is None for channel in channels):
+        return None
+    return bytes(channels)  # type: ignore[arg-type]
+
+
+def per_key_bytes(color_map: Mapping[tuple[int, int], Color]) -> bytes | None:
+    records: list[bytes] = []
+    for key, color in color_map.items():
+        try:
+            row, col = (_u8(part) for part in key)
+        except (TypeError, ValueError):
+            return None
+        rgb = color_bytes(color)
+        if row is None or col is None or rgb is None:
+            return None
+        records.append(_KEY_RECORD.pack(row, col, *rgb))
+    return b"".join(sorted(records)) if records else None
+
+
+def effect_bytes(effect_data: object) -> bytes | None:
+    if isinstance(effect_data, (bytes, bytearray)):
+        return bytes(effect_data)
+    if not isinstance(effect_data, (list, tuple)):
+        return None
+    values = [_u8(value) for value in effect_data]
+    if not values or any(value is None for value in values):
+        return None
+    return bytes(values)  # type: ignore[arg-type]
+
+
+@dataclass(frozen=True)
+class OutputSnapshot:
+    """The last output the tray committed to one keyboard."""
+
+    backend: str
+    fingerprint: bytes
+    kind: OutputKind
+    brightness: int
+    payload: bytes
+
+    def encode(self) -> bytes:
+        name = self.backend.encode("utf-8")
+        header = _HEADER.pack(
+            _MAGIC,
+            _FORMAT_VERSION,
+            int(self.kind),
+            max(0, min(255, int(self.brightness))),
+            0,
+            self.fingerprint,
+            len(name),
+            len(self.payload),
+        )
+        return header + name + self.payload
+
+    @classmethod
+    def decode(cls, data: bytes) -> OutputSnapshot | None:
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, kind, brightness, _reserved, fingerprint, name_len, payload_len = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _FORMAT_VERSION or len(data) != _HEADER.size + name_len + payload_len:
+            return None
+        try:
+            output_kind = OutputKind(kind)
+            backend = data[_HEADER.size : _HEADER.size + name_len].decode("utf-8")
+        except (UnicodeDecodeError, ValueError):
+            return None
+        payload = data[_HEADER.size + name_len :]
+        if output_kind is OutputKind.UNIFORM and len(payload) != 3:
+            return None
+        if output_kind is OutputKind.PER_KEY and (not payload or len(payload) % _KEY_RECORD.size):
+            return None
+        return cls(backend, fingerprint, output_kind, brightness, payload)
+
+    @property
+    def color(self) -> Color:
+        return (self.payload[0], self.payload[1], self.payload[2])
+
+    def per_key_colors(self) -> dict[tuple[int, int], Color]:
+        return {(row, col): (r, g, b) for row, col, r, g, b in _KEY_RECORD.iter_unpack(self.payload)}
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 import colorsys
+from functools import lru_cache
+from typing import Final
+
+# Hue steps in the cached ramp: 256 per colour-wheel sector, so neighbouring
+# entries differ by at most one step in a single channel.
+HUE_LUT_SIZE: Final[int] = 1536
 
 
 def hsv_to_rgb(h: float, s: float, v: float) -> tuple[int, int, int]:
@@ -8,3 +14,60 @@ def hsv_to_rgb(h: float, s: float, v: float) -> tuple[int, int, int]:
 
     r, g, b = colorsys.hsv_to_rgb(float(h), float(s), float(v))
     return (int(r * 255), int(g * 255), int(b * 255))
+
+
+def pack_rgb(rgb: tuple[int, int, int]) -> int:
+    return (int(rgb[0]) << 16) | (int(rgb[1]) << 8) | int(rgb[2])
+
+
+def unpack_rgb(packed: int) -> tuple[int, int, int]:
+    return ((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF)
+
+
+@lru_cache(maxsize=1)
+def hue_ramp() -> tuple[int, ...]:
+    """Packed ``0xRRGGBB`` full-saturation, full-value colours for each hue step."""
+
+    return tuple(pack_rgb(hsv_to_rgb(index / HUE_LUT_SIZE, 1.0, 1.0)) for index in range(HUE_LUT_SIZE))
+
+
+@lru_cache(maxsize=8)
+def scaled_hue_ramp(level: int) -> tuple[int, ...]:
+    """``hue_ramp()`` with every channel scaled by ``level / 255`` (rounded).
+
+    Callers quantise their brightness factor to ``0..255`` so the cache only
+    ever holds the handful of levels that are actually in use.
+    """
+
+    factor = max(0, min(255, int(level))) / 255.0
+    table = [min(255, round(value * factor)) for value in range(256)]
+    return tuple(
+        (table[(packed >> 16) & 0xFF] << 16) | (table[(packed >> 8) & 0xFF] << 8) | table[packed & 0xFF]
+        for packed in hue_ramp()
+    )
+
+
+def hue_index(h: float) -> int:
+    """Ramp index for hue ``h`` (0-1, wraps)."""
+
+    return int((float(h) % 1.0) * HUE_LUT_SIZE) % HUE_LUT_SIZE
+
+
+def hue_rgb(h: float, *, saturation: float = 1.0, level: int = 255) -> tuple[int, int, int]:
+    """Table-driven ``hsv_to_rgb(h, saturation, level / 255)`` for the hue-cycling effects.
+
+    Lower saturation blends the ramp colour towards white (as ``colorsys`` does
+    at full value) before the brightness level is applied.
+    """
+
+    ramp = hue_ramp() if level >= 255 else scaled_hue_ramp(level)
+    red, green, blue = unpack_rgb(ramp[hue_index(h)])
+    s = max(0.0, min(1.0, float(saturation)))
+    if s >= 1.0:
+        return (red, green, blue)
+    top = max(0, min(255, int(level)))
+    return (
+        round(top - (top - red) * s),
+        round(top - (top - green) * s),
+        round(top - (top - blue) * s),
+    )
@@ -40,6 +40,8 @@ class EngineSupportContract(Protocol):
 
     def _ensure_device_available(self) -> bool: ...
 
+    def wake_render_loop(self) -> None: ...
+
     def get_backend_effects(self) -> dict[str, Callable[..., object]]: ...
 
     def get_backend_colors(self) -> dict[str, object]: ...
@@ -69,6 +71,7 @@ _REQUIRED_ENGINE_SUPPORT_MEMBERS = (
     "_permission_error_cb",
     "stop",
     "_ensure_device_available",
+    "wake_render_loop",
     "get_backend_effects",
     "get_backend_colors",
 )
@@ -44,6 +44,7 @@ class _EngineBrightness:
     brightness: int
     stop: Callable[[], None]
     _ensure_device_available: Callable[[], bool]
+    wake_render_loop: Callable[[], None]
     current_color: Color
     per_key_colors: PerKeyColorMap | None
 
@@ -228,6 +229,7 @@ class _EngineBrightness:
                 pass  # keep fallback value from default arg
 
             self.brightness = int(target)
+            self.wake_render_loop()
 
             if _debug_brightness_enabled():
                 logger.info(
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
-from threading import Event, RLock, Thread
+from threading import RLock, Thread
 from typing import Protocol, TypeVar, cast
 
 from keyrgb.core.backends.base import BackendCapabilities, normalize_backend_capabilities
+from keyrgb.core.utils.linux.wake_event import WakeEvent
 
 from ..device import (
     Color,
@@ -15,6 +16,8 @@ from ..device import (
     PerKeyColorMap,
     acquire_keyboard,
 )
+from ..frame_diff import invalidate_engine_frame_diff
+from ..frame_output import stop_engine_frame_writer
 from ..matrix_layout import (
     EffectGridGeometry,
     effect_geometry_from_dimensions,
@@ -137,6 +140,7 @@ class _EngineCore:
     """Core engine lifecycle and device acquisition."""
 
     def __init__(self, *, backend: _EffectsBackendProtocol | None = None) -> None:
+        self.render_wake_event = WakeEvent()
         self.backend = backend
         self._backend_capabilities_changed: Callable[[BackendCapabilities], None] | None = None
         self._permission_error_cb: Callable[[Exception], None] | None = None
@@ -149,7 +153,7 @@ class _EngineCore:
         self._ensure_device_available()
         self.running = False
         self.thread: Thread | None = None
-        self.stop_event = Event()
+        self.stop_event = WakeEvent()
         self._thread_generation = 0
 
         self.current_effect: str | None = None
@@ -178,17 +182,37 @@ class _EngineCore:
         self._brightness_fade_token: int = 0
         self._brightness_fade_lock = RLock()
 
+    def wake_render_loop(self) -> None:
+        """Wake an idle-parked reactive loop after a change to what it renders."""
+
+        self.render_wake_event.set()
+
     def _ensure_device_available(self) -> bool:
         """Best-effort attempt to connect to the keyboard device."""
 
         self._refresh_backend_capabilities()
-        if self.device_available and not isinstance(self.kb, NullKeyboard):
-            return True
+        # Reacquire under kb_lock so concurrent recovery paths open the device once.
+        with self.kb_lock:
+            if self.device_available and not isinstance(self.kb, NullKeyboard):
+                return True
+
+            kb, available = acquire_keyboard(kb_lock=self.kb_lock, logger=logger, backend=self.backend)
+            self.kb = kb
+            self.device_available = bool(available)
+            self.wake_render_loop()
+            return self.device_available
 
-        kb, available = acquire_keyboard(kb_lock=self.kb_lock, logger=logger, backend=self.backend)
-        self.kb = kb
-        self.device_available = bool(available)
-        return self.device_available
+    def reopen_device(self, *, stale_kb: object | None = None) -> bool:
+        """Drop a stale device handle and connect again; ``True`` when a device is available.
+
+        ``stale_kb`` is only dropped while still current, so a retry keeps a handle
+        another thread already reopened. Without it the current handle is dropped.
+        """
+
+        with self.kb_lock:
+            if stale_kb is None or self.kb is stale_kb:
+                self.mark_device_unavailable()
+            return self._ensure_device_available()
 
     def set_backend(self, backend: _EffectsBackendProtocol | None) -> None:
         """Update the selected backend and force the next reacquire through it."""
@@ -248,6 +272,8 @@ class _EngineCore:
 
         # Best-effort close of the old device.
         self._last_reactive_per_key_frame_signature = None
+        invalidate_engine_frame_diff(self)
+        self.wake_render_loop()
         close_fn = getattr(old_kb, "close", None)
         if callable(close_fn):
             try:
@@ -288,12 +314,14 @@ class _EngineCore:
         self._last_rendered_brightness = None
         self._last_hw_mode_brightness = None
         self._last_reactive_per_key_frame_signature = None
+        invalidate_engine_frame_diff(self)
         self._reactive_state = ReactiveRenderState()
         # Idle-restore may queue damp timers before start_effect(); stop() would
         # otherwise wipe them and race the first render frames after long idle.
         apply_queued_reactive_restore_seed(self)
 
         if not self.running and not self.thread:
+            stop_engine_frame_writer(self)
             self.current_effect = None
             self.stop_event.clear()
             return
@@ -313,6 +341,9 @@ class _EngineCore:
                 # to resume beside a replacement when hardware I/O unblocks.
                 return
 
+        # The effect thread has exited; drop its last queued frame and wait
+        # for an in-flight write so nothing reaches the device after stop().
+        stop_engine_frame_writer(self)
         if self.thread is thread:
             self.thread = None
         self.stop_event.clear()
@@ -8,8 +8,9 @@ from typing import Final, Literal, cast
 from keyrgb.core.backends.base import BackendCapabilities
 from keyrgb.core.utils import exceptions as core_exceptions
 
-from .. import catalog as effects_catalog, hw_payloads as effects_hw_payloads
+from .. import catalog as effects_catalog, hw_payloads as effects_hw_payloads, instant_on
 from ..device import Color, KeyboardDeviceProtocol, PerKeyColorMap
+from ..frame_output import start_engine_frame_writer
 from . import _start_support, methods as engine_methods
 
 _SW_EFFECTS = effects_catalog.SW_EFFECTS
@@ -208,6 +209,7 @@ class _EngineStart:
         if from_sw_effect:
             pass
         elif needs_perkey_prime:
+            instant_on.record_per_key_output(self.per_key_colors, brightness=start_brightness)
             if self._prime_per_key_frame():
                 self._last_hw_mode_brightness = start_brightness
                 self._last_rendered_brightness = start_brightness
@@ -219,6 +221,7 @@ class _EngineStart:
             # mode command when the device was explicitly turned off.
             self._device_mode_off = False
         elif start_brightness > 1 or needs_mode_reassert:
+            instant_on.record_uniform_output(fade_to_color, brightness=start_brightness)
             self._fade_uniform_color(
                 from_color=prev_color,
                 to_color=fade_to_color,
@@ -277,6 +280,7 @@ class _EngineStart:
                     self.running = False
 
         self.running = True
+        start_engine_frame_writer(self)
         thread_ref = _ManagedEffectThread(engine=self, target=_run_target_best_effort)
         self.thread = thread_ref
         thread_ref.start()
@@ -290,6 +294,7 @@ class _EngineStart:
             logger.warning("Hardware effect not supported by backend: %s", effect_name)
             with self.kb_lock:
                 self.kb.set_color(tuple(self.current_color), brightness=int(self.brightness))
+            instant_on.record_uniform_output(self.current_color, brightness=int(self.brightness))
             # set_color re-enables user mode on the controller.
             self._device_mode_off = False
             return
@@ -310,6 +315,7 @@ class _EngineStart:
 
         with self.kb_lock:
             self.kb.set_effect(effect_data)
+        instant_on.record_hardware_effect_output(effect_data, brightness=int(self.brightness))
         # Programming a hardware effect takes the controller out of its
         # explicit off mode.
         self._device_mode_off = False
@@ -0,0 +1,181 @@
+"""Flat RGB frame storage for the effect pipeline.
+
+A ``FrameBuffer`` stores one frame for an effect grid in a single ``bytearray``
+laid out row-major as ``R, G, B`` triplets (a 6x21 frame is 378 bytes). It
+implements the ``Mapping[(row, col), (r, g, b)]`` surface that backends and
+helpers already consume, so it can be handed to ``set_key_colors()`` as-is,
+while backends that recognise it can read whole rows through zero-copy
+``memoryview`` slices instead of walking per-key tuples.
+
+Every cell of the grid always exists: ``clear()`` and ``del`` reset cells to
+black rather than removing them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Final
+
+from keyrgb.core.effects.matrix_layout import EffectGridGeometry, all_keys_for_dimensions
+
+Color = tuple[int, int, int]
+Key = tuple[int, int]
+
+BYTES_PER_CELL: Final[int] = 3
+
+
+def _clamp_channel(value: object) -> int:
+    channel = int(value)  # type: ignore[call-overload]
+    if channel <= 0:
+        return 0
+    if channel >= 255:
+        return 255
+    return channel
+
+
+class FrameBuffer(MutableMapping[Key, Color]):
+    """One RGB frame backed by a flat ``bytearray``."""
+
+    __slots__ = ("_cols", "_data", "_row_stride", "_rows", "_view")
+
+    def __init__(self, rows: int, cols: int) -> None:
+        row_count = int(rows)
+        col_count = int(cols)
+        if row_count <= 0 or col_count <= 0:
+            raise ValueError("frame dimensions must be positive")
+        self._rows = row_count
+        self._cols = col_count
+        self._row_stride = col_count * BYTES_PER_CELL
+        self._data = bytearray(row_count * self._row_stride)
+        self._view = memoryview(self._data)
+
+    @classmethod
+    def for_geometry(cls, geometry: EffectGridGeometry) -> FrameBuffer:
+        return cls(int(geometry.rows), int(geometry.cols))
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    @property
+    def data(self) -> bytearray:
+        """Mutable row-major ``R, G, B`` storage for the whole frame."""
+
+        return self._data
+
+    def matches(self, rows: int, cols: int) -> bool:
+        return self._rows == int(rows) and self._cols == int(cols)
+
+    def row_view(self, row: int) -> memoryview:
+        """Return a zero-copy ``R, G, B`` view of one row (``cols * 3`` bytes)."""
+
+        row_idx = int(row)
+        if row_idx < 0 or row_idx >= self._rows:
+            raise IndexError(f"row {row_idx} outside frame with {self._rows} rows")
+        start = row_idx * self._row_stride
+        return self._view[start : start + self._row_stride]
+
+    def _offset(self, key: object) -> int:
+        if not isinstance(key, tuple) or len(key) != 2:
+            raise KeyError(key)
+        row, col = key
+        try:
+            row_idx = int(row)
+            col_idx = int(col)
+        except (TypeError, ValueError):
+            raise KeyError(key) from None
+        if row_idx < 0 or row_idx >= self._rows or col_idx < 0 or col_idx >= self._cols:
+            raise KeyError(key)
+        return (row_idx * self._cols + col_idx) * BYTES_PER_CELL
+
+    def __getitem__(self, key: Key) -> Color:
+        offset = self._offset(key)
+        data = self._data
+        return (data[offset], data[offset + 1], data[offset + 2])
+
+    def __setitem__(self, key: Key, value: Color) -> None:
+        offset = self._offset(key)
+        red, green, blue = value
+        self._data[offset : offset + BYTES_PER_CELL] = bytes(
+            (_clamp_channel(red), _clamp_channel(green), _clamp_channel(blue))
+        )
+
+    def __delitem__(self, key: Key) -> None:
+        offset = self._offset(key)
+        self._data[offset : offset + BYTES_PER_CELL] = b"\x00\x00\x00"
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self._offset(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(all_keys_for_dimensions(self._rows, self._cols))
+
+    def __len__(self) -> int:
+        return self._rows * self._cols
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrameBuffer):
+            return self.matches(other._rows, other._cols) and self._data == other._data
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"FrameBuffer(rows={self._rows}, cols={self._cols})"
+
+    def clear(self) -> None:
+        """Reset every cell to black; the grid keeps its size."""
+
+        self._data[:] = bytes(len(self._data))
+
+    def fill(self, color: Color) -> None:
+        red, green, blue = color
+        cell = bytes((_clamp_channel(red), _clamp_channel(green), _clamp_channel(blue)))
+        self._data[:] = cell * (self._rows * self._cols)
+
+    def copy_from(self, source: Mapping[Key, Color]) -> None:
+        """Replace this frame with ``source``; cells it does not cover become black."""
+
+        if isinstance(source, FrameBuffer) and source.matches(self._rows, self._cols):
+            self._data[:] = source._data
+            return
+        self.clear()
+        for key, color in source.items():
+            if key in self:
+                self[key] = color
+
+    def update(self, other=(), /, **kwds) -> None:
+        if isinstance(other, FrameBuffer) and not kwds and other.matches(self._rows, self._cols):
+            self._data[:] = other._data
+            return
+        super().update(other, **kwds)
+
+    def copy(self) -> FrameBuffer:
+        out = FrameBuffer(self._rows, self._cols)
+        out._data[:] = self._data
+        return out
+
+    def scaled_into(self, dest: FrameBuffer, factor: float) -> FrameBuffer:
+        """Write this frame scaled by ``factor`` (rounded per channel) into ``dest``."""
+
+        if not dest.matches(self._rows, self._cols):
+            raise ValueError("destination frame has different dimensions")
+        f = max(0.0, float(factor))
+        table = bytes(min(255, round(value * f)) for value in range(256))
+        dest._data[:] = self._data.translate(table)
+        return dest
+
+    def average_rgb(self) -> Color:
+        data = self._data
+        count = self._rows * self._cols
+        return (
+            int(sum(data[0::BYTES_PER_CELL]) / count),
+            int(sum(data[1::BYTES_PER_CELL]) / count),
+            int(sum(data[2::BYTES_PER_CELL]) / count),
+        )
@@ -0,0 +1,191 @@
+"""Per-device diffing between rendered frames and ``set_key_colors()``.
+
+The render paths keep one ``PerKeyFrameDiff`` per engine. It remembers the
+last frame that was committed to the current device and turns the next frame
+into the smallest write the device's declared granularity allows (see
+``keyrgb.core.backends.policies.write_granularity``):
+
+- ``frame``: the whole frame, or nothing when it is unchanged.
+- ``row``: every cell of each row that changed.
+- ``key``: only the cells that changed.
+
+Anything that may have repainted the hardware behind the renderer's back
+(mode re-init, uniform writes, device changes, stop/resume) must call
+``invalidate()`` so the next frame is written in full.
+
+Set ``KEYRGB_DISABLE_FRAME_DIFF=1`` to always write full frames.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping
+from typing import Protocol
+
+from keyrgb.core.backends.policies.write_granularity import (
+    WRITE_GRANULARITY_FRAME,
+    WRITE_GRANULARITY_KEY,
+    normalize_write_granularity,
+    per_key_write_granularity,
+)
+from keyrgb.core.effects.frame_buffer import BYTES_PER_CELL, FrameBuffer
+
+DISABLE_FRAME_DIFF_ENV = "KEYRGB_DISABLE_FRAME_DIFF"
+ENGINE_FRAME_DIFF_ATTR = "_per_key_frame_diff"
+
+Color = tuple[int, int, int]
+Key = tuple[int, int]
+
+
+class _KeyColorWriter(Protocol):
+    def set_key_colors(self, color_map: object, *, brightness: int, enable_user_mode: bool = True) -> object: ...
+
+
+def frame_diff_enabled() -> bool:
+    return os.environ.get(DISABLE_FRAME_DIFF_ENV) != "1"
+
+
+def _changed_packed_keys(previous: FrameBuffer, current: FrameBuffer) -> list[Key]:
+    changed: list[Key] = []
+    cols = current.cols
+    for row in range(current.rows):
+        before = previous.row_view(row)
+        after = current.row_view(row)
+        if before == after:
+            continue
+        for col in range(cols):
+            start = col * BYTES_PER_CELL
+            if before[start : start + BYTES_PER_CELL] != after[start : start + BYTES_PER_CELL]:
+                changed.append((row, col))
+    return changed
+
+
+def _changed_keys(previous: Mapping[Key, Color], current: Mapping[Key, Color]) -> list[Key]:
+    if (
+        isinstance(previous, FrameBuffer)
+        and isinstance(current, FrameBuffer)
+        and previous.matches(current.rows, current.cols)
+    ):
+        return _changed_packed_keys(previous, current)
+    changed = [key for key, color in current.items() if previous.get(key) != tuple(color)]
+    # Cells that dropped out of the map count as changed for their row.
+    changed.extend(key for key in previous if key not in current)
+    return changed
+
+
+def _snapshot(color_map: Mapping[Key, Color]) -> Mapping[Key, Color]:
+    if isinstance(color_map, FrameBuffer):
+        return color_map.copy()
+    return {key: (int(color[0]), int(color[1]), int(color[2])) for key, color in color_map.items()}
+
+
+class PerKeyFrameDiff:
+    """Last committed per-key frame for one device plus the diff against the next one."""
+
+    __slots__ = ("_brightness", "_device_token", "_last")
+
+    def __init__(self) -> None:
+        self._last: Mapping[Key, Color] | None = None
+        self._device_token: int | None = None
+        self._brightness: int | None = None
+
+    def invalidate(self) -> None:
+        """Forget the committed frame so the next write covers every cell."""
+
+        self._last = None
+        self._device_token = None
+        self._brightness = None
+
+    def pending(
+        self,
+        color_map: Mapping[Key, Color],
+        *,
+        device: object,
+        brightness: int,
+        granularity: str,
+    ) -> Mapping[Key, Color] | None:
+        """Return the map to hand ``set_key_colors()``, or ``None`` when nothing needs writing."""
+
+        last = self._last
+        if (
+            last is None
+            or not frame_diff_enabled()
+            or self._device_token != id(device)
+            or self._brightness != int(brightness)
+        ):
+            return color_map
+
+        mode = normalize_write_granularity(granularity)
+        if mode == WRITE_GRANULARITY_FRAME:
+            return None if last == color_map else color_map
+
+        changed = _changed_keys(last, color_map)
+        if not changed:
+            return None
+        if mode == WRITE_GRANULARITY_KEY:
+            return {key: color_map[key] for key in changed if key in color_map}
+        rows = {row for row, _col in changed}
+        return {key: color for key, color in color_map.items() if key[0] in rows}
+
+    def commit(self, color_map: Mapping[Key, Color], *, device: object, brightness: int) -> None:
+        """Record ``color_map`` as what ``device`` now shows."""
+
+        last = self._last
+        if isinstance(last, FrameBuffer) and isinstance(color_map, FrameBuffer):
+            if last.matches(color_map.rows, color_map.cols):
+                last.copy_from(color_map)
+            else:
+                self._last = color_map.copy()
+        else:
+            self._last = _snapshot(color_map)
+        self._device_token = id(device)
+        self._brightness = int(brightness)
+
+    def write(self, device: _KeyColorWriter, color_map: Mapping[Key, Color], *, brightness: int) -> None:
+        """Send the part of ``color_map`` that ``device`` does not show yet, then commit it.
+
+        Errors propagate uncommitted; the caller decides whether to ``invalidate()``.
+        """
+
+        pending = self.pending(
+            color_map,
+            device=device,
+            brightness=brightness,
+            granularity=per_key_write_granularity(device),
+        )
+        if pending is None:
+            return
+        device.set_key_colors(pending, brightness=int(brightness), enable_user_mode=False)
+        self.commit(color_map, device=device, brightness=brightness)
+
+
+def engine_frame_diff(engine: object) -> PerKeyFrameDiff:
+    """Return the engine-owned frame diff, creating it on first use."""
+
+    try:
+        engine_state = object.__getattribute__(engine, "__dict__")
+    except (AttributeError, TypeError):
+        return PerKeyFrameDiff()
+
+    if not isinstance(engine_state, dict):
+        return PerKeyFrameDiff()
+    existing = engine_state.get(ENGINE_FRAME_DIFF_ATTR)
+    if isinstance(existing, PerKeyFrameDiff):
+        return existing
+    created = PerKeyFrameDiff()
+    engine_state[ENGINE_FRAME_DIFF_ATTR] = created
+    return created
+
+
+def invalidate_engine_frame_diff(engine: object) -> None:
+    """Force the next per-key frame on ``engine`` to be written in full."""
+
+    try:
+        engine_state = object.__getattribute__(engine, "__dict__")
+    except (AttributeError, TypeError):
+        return
+    if not isinstance(engine_state, dict):
+        return
+    existing = engine_state.get(ENGINE_FRAME_DIFF_ATTR)
+    if isinstance(existing, PerKeyFrameDiff):
+        existing.invalidate()
@@ -0,0 +1,270 @@
+"""Asynchronous per-engine frame output with latest-frame-wins coalescing.
+
+Software and reactive effect loops used to call ``set_key_colors()`` inline,
+so a slow USB/HID write stretched every frame and the animation stuttered in
+step with the device. While an effect runs, the engine now owns one
+``AsyncFrameWriter``: the loop publishes each rendered frame into a
+single-slot mailbox and a writer thread drains it. When the device falls
+behind, the pending frame is replaced by the newer one and counted as dropped,
+so the keyboard always shows the most recent frame rather than a growing
+backlog.
+
+Errors raised by a write are handed back to the effect thread on its next
+``publish()``, which keeps the existing effect-thread handling (permission
+prompts, disconnect recovery, logging) in charge.
+
+Set ``KEYRGB_SYNC_FRAME_WRITES=1`` to write frames inline on the effect thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from keyrgb.core.effects.frame_buffer import FrameBuffer
+from keyrgb.core.runtime.metrics import FRAMES_DROPPED, FRAMES_WRITTEN, note_render_call, timed_frame_write
+
+logger = logging.getLogger(__name__)
+
+SYNC_FRAME_WRITES_ENV = "KEYRGB_SYNC_FRAME_WRITES"
+ENGINE_FRAME_WRITER_ATTR = "_frame_writer"
+_FRAME_WRITE_ERRORS = (AttributeError, LookupError, OSError, RuntimeError, TypeError, ValueError)
+
+Color = tuple[int, int, int]
+Key = tuple[int, int]
+FrameWrite = Callable[[Mapping[Key, Color]], None]
+
+
+def async_frame_writes_enabled() -> bool:
+    return os.environ.get(SYNC_FRAME_WRITES_ENV) != "1"
+
+
+@dataclass(frozen=True)
+class FrameOutputStats:
+    """Cumulative frame counters for one engine."""
+
+    written: int = 0
+    dropped: int = 0
+
+
+def _snapshot_into(spare: Mapping[Key, Color] | None, color_map: Mapping[Key, Color]) -> Mapping[Key, Color]:
+    # Effects reuse their frame buffers, so the mailbox keeps its own copy.
+    # Recycle the previously written buffer to avoid an allocation per frame.
+    if isinstance(color_map, FrameBuffer):
+        if isinstance(spare, FrameBuffer) and spare.matches(color_map.rows, color_map.cols):
+            spare.copy_from(color_map)
+            return spare
+        return color_map.copy()
+    return dict(color_map)
+
+
+class AsyncFrameWriter:
+    """Single-slot frame mailbox drained by a daemon writer thread."""
+
+    __slots__ = (
+        "_cond",
+        "_dropped",
+        "_error",
+        "_name",
+        "_pending",
+        "_pending_write",
+        "_spare",
+        "_stopping",
+        "_thread",
+        "_written",
+    )
+
+    def __init__(self, *, name: str = "keyrgb-frame-writer") -> None:
+        self._name = str(name)
+        self._cond = threading.Condition()
+        self._pending: Mapping[Key, Color] | None = None
+        self._pending_write: FrameWrite | None = None
+        self._spare: Mapping[Key, Color] | None = None
+        self._error: BaseException | None = None
+        self._stopping = True
+        self._thread: threading.Thread | None = None
+        self._written = 0
+        self._dropped = 0
+
+    @property
+    def running(self) -> bool:
+        with self._cond:
+            return not self._stopping and self._thread is not None and self._thread.is_alive()
+
+    def is_writer_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def stats(self) -> FrameOutputStats:
+        with self._cond:
+            return FrameOutputStats(written=self._written, dropped=self._dropped)
+
+    def start(self) -> None:
+        """Start (or keep) the writer thread and accept new frames."""
+
+        with self._cond:
+            self._stopping = False
+            self._error = None
+            thread = self._thread
+            if thread is not None and thread.is_alive():
+                # A previous stop() timed out while a write was blocked; the
+                # same thread picks up again instead of racing a second one.
+                return
+            thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread = thread
+        thread.start()
+
+    def stop(self, *, timeout: float = 2.0) -> bool:
+        """Discard the pending frame and wait for an in-flight write to finish.
+
+        Returns ``False`` when the writer is still blocked in a write after
+        ``timeout`` seconds.
+        """
+
+        with self._cond:
+            self._stopping = True
+            if self._pending is not None:
+                self._dropped += 1
+                FRAMES_DROPPED.add()
+            self._pending = None
+            self._pending_write = None
+            self._error = None
+            thread = self._thread
+            self._cond.notify_all()
+
+        if thread is None or thread is threading.current_thread():
+            return True
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            logger.warning("Frame writer thread did not stop within timeout")
+            return False
+        with self._cond:
+            if self._thread is thread:
+                self._thread = None
+        return True
+
+    def publish(self, write: FrameWrite, color_map: Mapping[Key, Color]) -> bool:
+        """Queue ``color_map`` for ``write`` on the writer thread.
+
+        Returns ``False`` when the writer is not running; the caller should
+        then write inline. Re-raises the error of a failed earlier write.
+        """
+
+        with self._cond:
+            error = self._error
+            if error is not None:
+                self._error = None
+                raise error
+            if self._stopping or self._thread is None or not self._thread.is_alive():
+                return False
+            if self._pending is not None:
+                self._dropped += 1
+                FRAMES_DROPPED.add()
+                self._pending = _snapshot_into(self._pending, color_map)
+            else:
+                spare, self._spare = self._spare, None
+                self._pending = _snapshot_into(spare, color_map)
+            self._pending_write = write
+            self._cond.notify()
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                frame = self._pending
+                write = self._pending_write
+                self._pending = None
+                self._pending_write = None
+
+            if frame is None or write is None:
+                continue
+            try:
+                write(frame)
+            except _FRAME_WRITE_ERRORS as exc:
+                with self._cond:
+                    if not self._stopping:
+                        self._error = exc
+                continue
+
+            with self._cond:
+                self._written += 1
+                FRAMES_WRITTEN.add()
+                if self._spare is None:
+                    self._spare = frame
+
+
+def _engine_state(engine: object) -> dict[str, object] | None:
+    try:
+        engine_state = object.__getattribute__(engine, "__dict__")
+    except (AttributeError, TypeError):
+        return None
+    return engine_state if isinstance(engine_state, dict) else None
+
+
+def engine_frame_writer(engine: object) -> AsyncFrameWriter | None:
+    """Return the engine's frame writer when one has been started."""
+
+    engine_state = _engine_state(engine)
+    if engine_state is None:
+        return None
+    existing = engine_state.get(ENGINE_FRAME_WRITER_ATTR)
+    return existing if isinstance(existing, AsyncFrameWriter) else None
+
+
+def start_engine_frame_writer(engine: object) -> AsyncFrameWriter | None:
+    """Start the engine-owned writer, creating it on first use."""
+
+    if not async_frame_writes_enabled():
+        return None
+    engine_state = _engine_state(engine)
+    if engine_state is None:
+        return None
+    writer = engine_state.get(ENGINE_FRAME_WRITER_ATTR)
+    if not isinstance(writer, AsyncFrameWriter):
+        writer = AsyncFrameWriter()
+        engine_state[ENGINE_FRAME_WRITER_ATTR] = writer
+    writer.start()
+    return writer
+
+
+def stop_engine_frame_writer(engine: object, *, timeout: float = 2.0) -> bool:
+    """Stop the engine's writer so no frame reaches the device afterwards."""
+
+    writer = engine_frame_writer(engine)
+    if writer is None:
+        return True
+    return writer.stop(timeout=timeout)
+
+
+def publish_engine_frame(engine: object, write: FrameWrite, color_map: Mapping[Key, Color]) -> bool:
+    """Hand ``color_map`` to the engine's writer; ``False`` means write inline."""
+
+    writer = engine_frame_writer(engine)
+    if writer is None or writer.is_writer_thread():
+        return False
+    return writer.publish(write, color_map)
+
+
+def render_engine_frame(engine: object, write: FrameWrite, color_map: Mapping[Key, Color]) -> None:
+    """Publish ``color_map`` to the engine's writer, or write it inline when none runs.
+
+    Either way the device write is timed as one frame.
+    """
+
+    def _timed_write(frame: Mapping[Key, Color]) -> None:
+        timed_frame_write(lambda: write(frame))
+
+    note_render_call()
+    if not publish_engine_frame(engine, _timed_write, color_map):
+        _timed_write(color_map)
+
+
+def engine_frame_output_stats(engine: object) -> FrameOutputStats | None:
+    writer = engine_frame_writer(engine)
+    return None if writer is None else writer.stats()
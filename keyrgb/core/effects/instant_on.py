@@ -0,0 +1,257 @@
+"""Instant-on: replay the last committed output as soon as the tray opens the device.
+
+A cold start reads the config and profiles, selects a backend and starts the
+effect engine before anything is painted. While it runs, the tray records the
+output it commits to the keyboard in ``last_output.bin`` in the user state dir:
+
+- static per-key frames and uniform colors as the lighting controller writes them;
+- hardware effect payloads built by the engine (integer sequences only);
+- the base frame a software effect starts from;
+- the committed brightness, updated when the user changes it.
+
+The file is a fixed binary header (magic, version, kind, brightness, backend
+name, hardware fingerprint) followed by the payload; ``_output_snapshot`` owns
+that format. It is written off the calling thread, coalesced, and at most once
+per ``_WRITE_DELAY_S``. On the next start, right after the engine opens the device and before the rest of the tray
+starts, ``replay_output_snapshot()`` writes that output if the backend and
+fingerprint still match. Then the normal startup takes over and repaints from
+the config. Transient states (idle dimming, power-off) are not recorded, so the
+replay always shows the last lit output. ``KEYRGB_DISABLE_INSTANT_ON=1`` turns
+off both recording and replay.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import replace
+from pathlib import Path
+
+from ._output_snapshot import Color, OutputKind, OutputSnapshot, color_bytes, effect_bytes, per_key_bytes
+
+logger = logging.getLogger(__name__)
+
+DISABLE_INSTANT_ON_ENV = "KEYRGB_DISABLE_INSTANT_ON"
+INSTANT_ON_STATE_FILENAME = "last_output.bin"
+
+_WRITE_DELAY_S = 0.5
+_REPLAY_ERRORS = (AttributeError, LookupError, OSError, RuntimeError, TypeError, ValueError)
+
+
+def instant_on_enabled() -> bool:
+    return str(os.environ.get(DISABLE_INSTANT_ON_ENV, "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def _instant_on_path() -> Path:
+    from keyrgb.core.config.paths import state_dir
+
+    return state_dir() / INSTANT_ON_STATE_FILENAME
+
+
+def _fingerprint_digest(fingerprint: str | bytes | None) -> bytes:
+    if isinstance(fingerprint, bytes):
+        return fingerprint
+    if fingerprint is None:
+        from keyrgb.core.backends.probe_cache import hardware_fingerprint
+
+        fingerprint = hardware_fingerprint()
+    return bytes.fromhex(fingerprint)
+
+
+def load_output_snapshot(*, path: Path | None = None) -> OutputSnapshot | None:
+    snapshot_path = _instant_on_path() if path is None else Path(path)
+    try:
+        data = snapshot_path.read_bytes()
+    except OSError:
+        return None
+    return OutputSnapshot.decode(data)
+
+
+class OutputRecorder:
+    """Keep the latest committed output and write it to disk off the caller's thread."""
+
+    def __init__(self, *, backend: str, fingerprint: bytes, path: Path) -> None:
+        self._backend = backend
+        self._fingerprint = fingerprint
+        self._path = path
+        self._lock = threading.Lock()
+        # Held across a whole flush so close() returns only once the file matches the snapshot.
+        self._write_lock = threading.Lock()
+        self._snapshot: OutputSnapshot | None = None
+        self._dirty = False
+        self._timer: threading.Timer | None = None
+
+    @property
+    def snapshot(self) -> OutputSnapshot | None:
+        return self._snapshot
+
+    def record(self, kind: OutputKind, payload: bytes | None, brightness: int) -> None:
+        if int(brightness) <= 0:
+            return
+        if payload is None:
+            # Output this format cannot hold; replaying an older one would be wrong.
+            self.forget()
+            return
+        self._set(OutputSnapshot(self._backend, self._fingerprint, kind, int(brightness), payload))
+
+    def record_brightness(self, brightness: int) -> None:
+        snapshot = self._snapshot
+        if snapshot is not None and int(brightness) > 0:
+            self._set(replace(snapshot, brightness=int(brightness)))
+
+    def forget(self) -> None:
+        self._set(None)
+
+    def _set(self, snapshot: OutputSnapshot | None) -> None:
+        with self._lock:
+            if snapshot == self._snapshot and (snapshot is not None or self._dirty):
+                return
+            self._snapshot = snapshot
+            self._dirty = True
+        self._schedule()
+
+    def _schedule(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                return
+            timer = threading.Timer(_WRITE_DELAY_S, self.flush)
+            timer.daemon = True
+            self._timer = timer
+        timer.start()
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                self._timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                snapshot = self._snapshot
+            try:
+                if snapshot is None:
+                    self._path.unlink(missing_ok=True)
+                    return
+                tmp_path = self._path.with_name(f".{self._path.name}.tmp")
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_bytes(snapshot.encode())
+                os.replace(tmp_path, self._path)
+            except OSError as exc:
+                logger.debug("Could not persist instant-on snapshot to %s: %s", self._path, exc)
+
+    def close(self) -> None:
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        self.flush()
+
+
+_recorder_lock = threading.Lock()
+_recorder: OutputRecorder | None = None
+
+
+def start_output_recording(
+    backend_name: str, *, fingerprint: str | bytes | None = None, path: Path | None = None
+) -> OutputRecorder | None:
+    """Record committed output for ``backend_name`` (the tray calls this); ``None`` when disabled."""
+
+    global _recorder
+    if not instant_on_enabled():
+        return None
+    recorder = OutputRecorder(
+        backend=str(backend_name),
+        fingerprint=_fingerprint_digest(fingerprint),
+        path=_instant_on_path() if path is None else Path(path),
+    )
+    with _recorder_lock:
+        previous, _recorder = _recorder, recorder
+    if previous is not None:
+        previous.close()
+    return recorder
+
+
+def stop_output_recording() -> None:
+    global _recorder
+    with _recorder_lock:
+        recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.close()
+
+
+def record_uniform_output(color: Iterable[int], *, brightness: int) -> None:
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record(OutputKind.UNIFORM, color_bytes(color), brightness)
+
+
+def record_per_key_output(color_map: Mapping[tuple[int, int], Color] | None, *, brightness: int) -> None:
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record(OutputKind.PER_KEY, None if not color_map else per_key_bytes(color_map), brightness)
+
+
+def record_hardware_effect_output(effect_data: object, *, brightness: int) -> None:
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record(OutputKind.HARDWARE_EFFECT, effect_bytes(effect_data), brightness)
+
+
+def record_output_brightness(brightness: int) -> None:
+    recorder = _recorder
+    if recorder is not None:
+        recorder.record_brightness(brightness)
+
+
+def current_output_snapshot() -> OutputSnapshot | None:
+    """The output the running tray last committed, without touching the disk."""
+
+    recorder = _recorder
+    return None if recorder is None else recorder.snapshot
+
+
+def write_output_snapshot(
+    kb: object, kb_lock: threading.RLock, snapshot: OutputSnapshot, *, brightness: int | None = None
+) -> None:
+    """Write ``snapshot`` to ``kb`` at ``brightness`` (default: its own); device errors propagate."""
+
+    level = snapshot.brightness if brightness is None else int(brightness)
+    with kb_lock:
+        if snapshot.kind is OutputKind.UNIFORM:
+            kb.set_color(snapshot.color, brightness=level)  # type: ignore[attr-defined]
+        elif snapshot.kind is OutputKind.PER_KEY:
+            kb.set_key_colors(  # type: ignore[attr-defined]
+                snapshot.per_key_colors(), brightness=level, enable_user_mode=True
+            )
+        else:
+            kb.set_effect(list(snapshot.payload))  # type: ignore[attr-defined]
+            kb.set_brightness(level)  # type: ignore[attr-defined]
+
+
+def replay_output_snapshot(
+    kb: object,
+    kb_lock: threading.RLock,
+    *,
+    backend_name: str,
+    fingerprint: str | bytes | None = None,
+    path: Path | None = None,
+) -> OutputSnapshot | None:
+    """Write the stored output to ``kb`` if it was recorded for this backend and hardware.
+
+    Returns the replayed snapshot, or ``None`` when nothing matched or the write failed.
+    """
+
+    if not instant_on_enabled():
+        return None
+    snapshot = load_output_snapshot(path=path)
+    if snapshot is None or snapshot.backend != backend_name:
+        return None
+    if snapshot.fingerprint != _fingerprint_digest(fingerprint):
+        return None
+    try:
+        write_output_snapshot(kb, kb_lock, snapshot)
+    except _REPLAY_ERRORS as exc:  # @quality-exception exception-transparency: instant-on is an optional head start on a hardware write boundary; the normal startup apply follows and reports device errors itself
+        logger.debug("Instant-on replay failed: %s", exc)
+        return None
+    return snapshot
@@ -66,47 +66,3 @@ SPECIAL_KEY_NAMES: dict[str, str] = {
     "BACK": "back",
     "FORWARD": "forward",
 }
-
-
-def keyboard_letter_keys(evdev: object) -> set[int]:
-    ecodes = getattr(evdev, "ecodes")  # noqa: B009 – object-typed arg; getattr bypasses mypy attr-defined
-    return {
-        ecodes.KEY_A,
-        ecodes.KEY_B,
-        ecodes.KEY_C,
-        ecodes.KEY_D,
-        ecodes.KEY_E,
-        ecodes.KEY_F,
-        ecodes.KEY_G,
-        ecodes.KEY_H,
-        ecodes.KEY_I,
-        ecodes.KEY_J,
-        ecodes.KEY_K,
-        ecodes.KEY_L,
-        ecodes.KEY_M,
-        ecodes.KEY_N,
-        ecodes.KEY_O,
-        ecodes.KEY_P,
-        ecodes.KEY_Q,
-        ecodes.KEY_R,
-        ecodes.KEY_S,
-        ecodes.KEY_T,
-        ecodes.KEY_U,
-        ecodes.KEY_V,
-        ecodes.KEY_W,
-        ecodes.KEY_X,
-        ecodes.KEY_Y,
-        ecodes.KEY_Z,
-    }
-
-
-def keyboard_control_keys(evdev: object) -> set[int]:
-    ecodes = getattr(evdev, "ecodes")  # noqa: B009 – object-typed arg; getattr bypasses mypy attr-defined
-    return {
-        ecodes.KEY_SPACE,
-        ecodes.KEY_ENTER,
-        ecodes.KEY_TAB,
-        ecodes.KEY_BACKSPACE,
-        ecodes.KEY_LEFTSHIFT,
-        ecodes.KEY_RIGHTSHIFT,
-    }
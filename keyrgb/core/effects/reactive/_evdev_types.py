@@ -0,0 +1,40 @@
+"""Structural types for the python-evdev objects reactive input handles."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Protocol, TypeAlias
+
+
+class EvdevInputEventProtocol(Protocol):
+    type: object
+    value: object
+    code: object
+
+
+class EvdevKeyboardDeviceProtocol(Protocol):
+    path: str
+
+    def fileno(self) -> int: ...
+
+    def close(self) -> None: ...
+
+    def capabilities(self, verbose: bool = False) -> Mapping[object, Sequence[object]]: ...
+
+    def read(self) -> Iterable[EvdevInputEventProtocol]: ...
+
+
+class EvdevEcodesProtocol(Protocol):
+    EV_KEY: int
+    KEY: Mapping[int, str]
+
+
+class EvdevModuleProtocol(Protocol):
+    ecodes: EvdevEcodesProtocol
+    InputDevice: Callable[[str], EvdevKeyboardDeviceProtocol]
+
+    def list_devices(self) -> Sequence[str]: ...
+
+
+EvdevKeyboardDevice: TypeAlias = EvdevKeyboardDeviceProtocol
+EvdevKeyboardDevices: TypeAlias = list[EvdevKeyboardDeviceProtocol]
@@ -8,9 +8,15 @@ from typing import TYPE_CHECKING, Protocol
 
 from keyrgb.core.backends.base import supports_per_key_output
 from keyrgb.core.effects.matrix_layout import geometry_for_engine
+from keyrgb.core.runtime.metrics import begin_frame
 
-from .input import EvdevKeyboardDevices
-from .utils import frame_elapsed_dt_s, log_frame_overrun_if_slow, remaining_frame_delay_s
+from ._evdev_types import EvdevKeyboardDevices
+from ._fade_pulses import render_per_key_pulses, render_uniform_pulse
+from ._frame_wake import FrameWaker
+from ._idle_park import IdleParkGate, finish_frame
+from ._keycode_table import keycode_cell_table
+from ._runtime_inputs import poll_pressed_cells
+from .utils import frame_elapsed_dt_s
 
 if TYPE_CHECKING:
     from keyrgb.core.effects.engine import EffectsEngine
@@ -192,9 +198,12 @@ def run_reactive_fade_loop(engine: EffectsEngine, *, api: _ReactiveFadeApiProtoc
         synthetic_fallback_enabled=api.reactive_synthetic_fallback_enabled,
     )
     slot_keymap = api.load_slot_keymap(loader=api.load_active_profile_slot_keymap)
+    cell_table = keycode_cell_table(slot_keymap)
 
     pulses: list[_PulseProtocol] = []
     last_frame_s: float | None = None
+    waker = FrameWaker(engine.stop_event, getattr(engine, "render_wake_event", None))
+    idle_gate = IdleParkGate()
     try:
         if engine.stop_event.is_set():
             return
@@ -203,6 +212,7 @@ def run_reactive_fade_loop(engine: EffectsEngine, *, api: _ReactiveFadeApiProtoc
             # animation speed stays constant in wall-clock time; sleep only the
             # remaining frame budget so render work doesn't stretch the period.
             frame_start_s = time.monotonic()
+            begin_frame()
             real_dt = frame_elapsed_dt_s(
                 now_s=frame_start_s,
                 last_frame_s=last_frame_s,
@@ -222,15 +232,20 @@ def run_reactive_fade_loop(engine: EffectsEngine, *, api: _ReactiveFadeApiProtoc
             react_color = api.get_engine_reactive_color(engine)
             manual = api.get_engine_manual_reactive_color(engine)
 
-            pressed_slot_ids = press.poll_slot_ids(dt=real_dt)
-            if pressed_slot_ids:
+            pressed_cells = poll_pressed_cells(
+                press,
+                dt=real_dt,
+                slot_keymap=slot_keymap,
+                cell_table=cell_table,
+                mapped_slot_cells=api.mapped_slot_cells,
+            )
+            if pressed_cells:
                 trail_pct = _engine_int_attr_or_fallback(
                     engine, "reactive_trail_percent", missing_default=40, error_default=40
                 )
                 trail_scale = max(0.02, min(8.0, ((int(trail_pct) or 40) / 50.0) ** 2))
                 ttl = (_BASE_PULSE_TTL_S / p) * trail_scale
-                for pressed_slot_id in pressed_slot_ids:
-                    mapped_cells = api.mapped_slot_cells(slot_keymap, pressed_slot_id)
+                for mapped_cells in pressed_cells:
                     if mapped_cells:
                         for row, col in mapped_cells:
                             pulses.append(api._Pulse(row=int(row), col=int(col), age_s=0.0, ttl_s=ttl))
@@ -261,80 +276,41 @@ def run_reactive_fade_loop(engine: EffectsEngine, *, api: _ReactiveFadeApiProtoc
             if eff_hw <= 0:
                 api._set_reactive_active_pulse_mix(engine, target=0.0)
                 api.render(engine, color_map=base)
-                log_frame_overrun_if_slow(
-                    logger=logger, frame_start_s=frame_start_s, nominal_dt_s=nominal_dt, effect_name="fade"
+            elif not _has_per_key_writer(engine):
+                render_uniform_pulse(
+                    engine,
+                    api=api,
+                    overlay=overlay,
+                    base=base,
+                    base_unscaled=base_unscaled,
+                    react_color=react_color,
+                    manual=manual,
+                    per_key_backdrop_active=per_key_backdrop_active,
                 )
-                engine.stop_event.wait(remaining_frame_delay_s(frame_start_s=frame_start_s, nominal_dt_s=nominal_dt))
-                continue
-
-            pulse_scale = api.pulse_brightness_scale_factor(engine)
-
-            if not _has_per_key_writer(engine):
-                w_global = 0.0
-                if overlay:
-                    try:
-                        w_global = max(float(value) for value in overlay.values())
-                    except (TypeError, ValueError):
-                        w_global = 0.0
-
-                try:
-                    base_rgb = next(iter(base.values()))
-                except StopIteration:
-                    base_rgb = (0, 0, 0)
-                try:
-                    base_rgb_unscaled = next(iter(base_unscaled.values()))
-                except StopIteration:
-                    base_rgb_unscaled = base_rgb
-
-                if manual is not None:
-                    pulse_rgb = react_color
-                elif per_key_backdrop_active:
-                    pulse_rgb = api._brightness_boost_pulse(base_rgb=base_rgb_unscaled)
-                else:
-                    pulse_rgb = api._pick_contrasting_highlight(
-                        base_rgb=base_rgb_unscaled,
-                        preferred_rgb=react_color,
-                    )
-
-                if pulse_scale < 0.999:
-                    pulse_rgb = api.scale(pulse_rgb, pulse_scale)
-
-                rgb = api.mix(base_rgb, pulse_rgb, t=min(1.0, w_global))
-                api._render_uniform_fallback(engine, rgb=rgb)
-                log_frame_overrun_if_slow(
-                    logger=logger, frame_start_s=frame_start_s, nominal_dt_s=nominal_dt, effect_name="fade"
+            else:
+                render_per_key_pulses(
+                    engine,
+                    api=api,
+                    overlay=overlay,
+                    base=base,
+                    base_unscaled=base_unscaled,
+                    react_color=react_color,
+                    manual=manual,
+                    per_key_backdrop_active=per_key_backdrop_active,
                 )
-                engine.stop_event.wait(remaining_frame_delay_s(frame_start_s=frame_start_s, nominal_dt_s=nominal_dt))
-                continue
-
-            color_map = api.get_engine_color_map_buffer(engine, "_reactive_fade_frame_map")
-            color_map.clear()
-            for key, base_rgb in base.items():
-                base_rgb_unscaled = base_unscaled.get(key, base_rgb)
-                weight = overlay.get(key, 0.0)
-                if manual is not None:
-                    pulse_rgb = react_color
-                    if pulse_scale < 0.999:
-                        pulse_rgb = api.scale(pulse_rgb, pulse_scale)
-                    color_map[key] = api.mix(base_rgb, pulse_rgb, t=min(1.0, weight))
-                elif per_key_backdrop_active:
-                    # Apply pulse_scale to the mix weight so the brightness slider
-                    # remains effective regardless of the auto-contrast highlight color.
-                    pulse_rgb = api._brightness_boost_pulse(base_rgb=base_rgb_unscaled)
-                    color_map[key] = api.mix(base_rgb, pulse_rgb, t=min(1.0, weight * pulse_scale))
-                else:
-                    pulse_rgb = api._pick_contrasting_highlight(
-                        base_rgb=base_rgb_unscaled,
-                        preferred_rgb=react_color,
-                    )
-                    if pulse_scale < 0.999:
-                        pulse_rgb = api.scale(pulse_rgb, pulse_scale)
-                    color_map[key] = api.mix(base_rgb, pulse_rgb, t=min(1.0, weight))
-
-            api.render(engine, color_map=color_map)
-            log_frame_overrun_if_slow(
-                logger=logger, frame_start_s=frame_start_s, nominal_dt_s=nominal_dt, effect_name="fade"
-            )
-            engine.stop_event.wait(remaining_frame_delay_s(frame_start_s=frame_start_s, nominal_dt_s=nominal_dt))
+
+            devices = getattr(press, "devices", None)
+            if finish_frame(
+                engine,
+                gate=idle_gate,
+                waker=waker,
+                frame_start_s=frame_start_s,
+                nominal_dt_s=nominal_dt,
+                effect_name="fade",
+                animating=bool(pulses) or not devices,
+                devices=devices,
+            ):
+                last_frame_s = None
     finally:
+        waker.close()
         press.close()
@@ -0,0 +1,109 @@
+"""Colour blending for the reactive fade loop's rendered frames."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from keyrgb.core.effects.engine import EffectsEngine
+
+Color = tuple[int, int, int]
+Key = tuple[int, int]
+ColorMap = dict[Key, Color]
+FadeOverlay = dict[Key, float]
+
+
+class _FadePulseApiProtocol(Protocol):
+    def pulse_brightness_scale_factor(self, engine: EffectsEngine) -> float: ...
+
+    def scale(self, rgb: Color, s: float) -> Color: ...
+
+    def _brightness_boost_pulse(self, *, base_rgb: Color) -> Color: ...
+
+    def _pick_contrasting_highlight(self, *, base_rgb: Color, preferred_rgb: Color) -> Color: ...
+
+    def mix(self, a: Color, b: Color, t: float) -> Color: ...
+
+    def _render_uniform_fallback(self, engine: EffectsEngine, *, rgb: Color) -> None: ...
+
+    def get_engine_color_map_buffer(self, engine: EffectsEngine, attr_name: str) -> ColorMap: ...
+
+    def render(self, engine: EffectsEngine, *, color_map: ColorMap) -> None: ...
+
+
+def render_uniform_pulse(
+    engine: EffectsEngine,
+    *,
+    api: _FadePulseApiProtocol,
+    overlay: FadeOverlay,
+    base: ColorMap,
+    base_unscaled: ColorMap,
+    react_color: Color,
+    manual: Color | None,
+    per_key_backdrop_active: bool,
+) -> None:
+    """Blend the strongest pulse into one colour for backends without per-key output."""
+
+    w_global = 0.0
+    if overlay:
+        try:
+            w_global = max(float(value) for value in overlay.values())
+        except (TypeError, ValueError):
+            w_global = 0.0
+
+    base_rgb = next(iter(base.values()), (0, 0, 0))
+    base_rgb_unscaled = next(iter(base_unscaled.values()), base_rgb)
+
+    if manual is not None:
+        pulse_rgb = react_color
+    elif per_key_backdrop_active:
+        pulse_rgb = api._brightness_boost_pulse(base_rgb=base_rgb_unscaled)
+    else:
+        pulse_rgb = api._pick_contrasting_highlight(base_rgb=base_rgb_unscaled, preferred_rgb=react_color)
+
+    pulse_scale = api.pulse_brightness_scale_factor(engine)
+    if pulse_scale < 0.999:
+        pulse_rgb = api.scale(pulse_rgb, pulse_scale)
+
+    api._render_uniform_fallback(engine, rgb=api.mix(base_rgb, pulse_rgb, t=min(1.0, w_global)))
+
+
+def render_per_key_pulses(
+    engine: EffectsEngine,
+    *,
+    api: _FadePulseApiProtocol,
+    overlay: FadeOverlay,
+    base: ColorMap,
+    base_unscaled: ColorMap,
+    react_color: Color,
+    manual: Color | None,
+    per_key_backdrop_active: bool,
+) -> None:
+    """Blend each key's pulse weight into its backdrop colour and render the frame."""
+
+    pulse_scale = api.pulse_brightness_scale_factor(engine)
+    color_map = api.get_engine_color_map_buffer(engine, "_reactive_fade_frame_map")
+    color_map.clear()
+    for key, base_rgb in base.items():
+        base_rgb_unscaled = base_unscaled.get(key, base_rgb)
+        weight = overlay.get(key, 0.0)
+        if manual is not None:
+            pulse_rgb = react_color
+            if pulse_scale < 0.999:
+                pulse_rgb = api.scale(pulse_rgb, pulse_scale)
+            color_map[key] = api.mix(base_rgb, pulse_rgb, t=min(1.0, weight))
+        elif per_key_backdrop_active:
+            # Apply pulse_scale to the mix weight so the brightness slider
+            # remains effective regardless of the auto-contrast highlight color.
+            pulse_rgb = api._brightness_boost_pulse(base_rgb=base_rgb_unscaled)
+            color_map[key] = api.mix(base_rgb, pulse_rgb, t=min(1.0, weight * pulse_scale))
+        else:
+            pulse_rgb = api._pick_contrasting_highlight(
+                base_rgb=base_rgb_unscaled,
+                preferred_rgb=react_color,
+            )
+            if pulse_scale < 0.999:
+                pulse_rgb = api.scale(pulse_rgb, pulse_scale)
+            color_map[key] = api.mix(base_rgb, pulse_rgb, t=min(1.0, weight))
+
+    api.render(engine, color_map=color_map)
@@ -0,0 +1,178 @@
+"""Frame waits for the reactive loops that end early on input or stop.
+
+Between frames the loops block on one ``epoll`` set holding the evdev keyboard
+fds and the engine stop event's eventfd, with the frame deadline as the
+timeout. A keydown therefore starts the next frame immediately instead of
+waiting out the rest of the frame budget. Without epoll, an eventfd-backed
+stop event, or with ``KEYRGB_DISABLE_INPUT_WAKE=1``, the wait falls back to
+``stop_event.wait(timeout)``.
+
+An optional change event (the engine's ``render_wake_event``) joins the same
+set. It lets ``park()`` block with no deadline at all while the loop is idle
+and still pick up config and brightness changes at once.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+from collections.abc import Sequence
+from typing import Protocol
+
+from keyrgb.core.runtime.metrics import IDLE_PARKS, INPUT_WAKEUPS
+
+
+class _StopEventProtocol(Protocol):
+    def wait(self, timeout: float | None = None) -> bool: ...
+
+
+class _ChangeEventProtocol(Protocol):
+    def clear(self) -> None: ...
+
+
+def input_wake_enabled() -> bool:
+    return str(os.environ.get("KEYRGB_DISABLE_INPUT_WAKE", "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def _stop_wake_fd(stop_event: object) -> int | None:
+    wake_fd = getattr(stop_event, "wake_fd", None)
+    if not callable(wake_fd):
+        return None
+    fd = wake_fd()
+    return fd if isinstance(fd, int) and fd >= 0 else None
+
+
+def _device_keys(devices: Sequence[object] | None) -> tuple[tuple[int, int], ...]:
+    # Devices are dropped and reopened at runtime and a reopened device can
+    # reuse a closed fd number, so registrations are keyed by object and fd.
+    keys: list[tuple[int, int]] = []
+    for dev in devices or ():
+        fileno = getattr(dev, "fileno", None)
+        if not callable(fileno):
+            continue
+        try:
+            fd = int(fileno())
+        except (OSError, TypeError, ValueError):
+            continue
+        if fd >= 0:
+            keys.append((id(dev), fd))
+    return tuple(keys)
+
+
+class FrameWaker:
+    """Wait for the frame deadline, a readable input device, or stop, whichever comes first."""
+
+    __slots__ = ("_change_event", "_change_fd", "_device_keys", "_epoll", "_stop_event", "_stop_fd")
+
+    def __init__(self, stop_event: _StopEventProtocol, change_event: _ChangeEventProtocol | None = None) -> None:
+        self._stop_event = stop_event
+        self._change_event = change_event
+        self._epoll: select.epoll | None = None
+        self._stop_fd: int | None = None
+        self._change_fd: int | None = None
+        self._device_keys: tuple[tuple[int, int], ...] = ()
+
+        stop_fd = _stop_wake_fd(stop_event) if input_wake_enabled() else None
+        if stop_fd is None or not hasattr(select, "epoll"):
+            return
+        try:
+            epoll = select.epoll()
+            epoll.register(stop_fd, select.EPOLLIN)
+        except OSError:
+            return
+        self._epoll = epoll
+        self._stop_fd = stop_fd
+
+        change_fd = _stop_wake_fd(change_event) if change_event is not None else None
+        if change_fd is None or change_fd == stop_fd:
+            return
+        try:
+            epoll.register(change_fd, select.EPOLLIN)
+        except OSError:
+            return
+        self._change_fd = change_fd
+
+    @property
+    def uses_epoll(self) -> bool:
+        return self._epoll is not None
+
+    @property
+    def can_park(self) -> bool:
+        """Whether ``park()`` can block without a deadline and still see render input changes."""
+
+        return self._epoll is not None and self._change_fd is not None
+
+    def _sync_devices(self, devices: Sequence[object] | None) -> None:
+        epoll = self._epoll
+        if epoll is None:
+            return
+        keys = _device_keys(devices)
+        if keys == self._device_keys:
+            return
+        for _dev_id, fd in self._device_keys:
+            try:
+                epoll.unregister(fd)
+            except (OSError, ValueError):
+                pass
+        registered: list[tuple[int, int]] = []
+        for key in keys:
+            try:
+                epoll.register(key[1], select.EPOLLIN)
+            except (OSError, ValueError):
+                continue
+            registered.append(key)
+        self._device_keys = tuple(registered)
+
+    def wait(self, timeout_s: float, *, devices: Sequence[object] | None = None) -> None:
+        """Block up to ``timeout_s``; input from ``devices`` or a stop request ends the wait early."""
+
+        epoll = self._epoll
+        if epoll is None:
+            self._stop_event.wait(timeout_s)
+            return
+        self._sync_devices(devices)
+        if self._handle_events(epoll.poll(max(0.0, float(timeout_s)))):
+            INPUT_WAKEUPS.add()
+
+    def park(self, *, devices: Sequence[object] | None = None) -> bool:
+        """Block until input from ``devices``, a render input change, or stop.
+
+        Returns ``False`` without waiting when parking is unavailable; callers
+        then keep their timed frame wait.
+        """
+
+        epoll = self._epoll
+        if epoll is None or self._change_fd is None:
+            return False
+        self._sync_devices(devices)
+        IDLE_PARKS.add()
+        self._handle_events(epoll.poll())
+        return True
+
+    def _handle_events(self, events: list[tuple[int, int]]) -> bool:
+        # Clear the change event after waking, before the next frame reads the
+        # engine, so a change made while that frame renders wakes the next wait.
+        input_ready = False
+        for fd, _mask in events:
+            if fd == self._change_fd:
+                change_event = self._change_event
+                if change_event is not None:
+                    change_event.clear()
+            elif fd != self._stop_fd:
+                input_ready = True
+        return input_ready
+
+    def close(self) -> None:
+        epoll, self._epoll = self._epoll, None
+        self._device_keys = ()
+        self._change_fd = None
+        if epoll is not None:
+            epoll.close()
+
+
+def wake_render_loop(engine: object) -> None:
+    """Wake an idle-parked loop on ``engine`` after writing render state it reads."""
+
+    wake = getattr(engine, "wake_render_loop", None)
+    if callable(wake):
+        wake()
@@ -0,0 +1,137 @@
+"""Zero-traffic idle state for the reactive loops.
+
+Once the last pulse has decayed, the pulse mix tail has run out, no brightness
+transition or post-restore damp is in flight and the rendered hardware
+brightness has held for a few frames, every further frame would repeat the
+previous one. The loops then park in ``FrameWaker.park()`` with no timeout and
+resume on the next keydown, engine render input change (see
+``render_wake_event``) or stop. ``KEYRGB_DISABLE_REACTIVE_IDLE_PARK=1`` keeps
+the fixed frame rate.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from . import _render_brightness_support as _support
+from ._frame_wake import FrameWaker
+from ._render_post_restore import post_restore_visual_damp
+from .utils import log_frame_overrun_if_slow, remaining_frame_delay_s
+
+if TYPE_CHECKING:
+    from keyrgb.core.effects.engine import EffectsEngine
+
+logger = logging.getLogger(__name__)
+
+# Consecutive static frames, at an unchanged rendered brightness, before
+# parking. The brightness step guard moves at most 8 levels per frame, so an
+# unchanged value across frames means any ramp has finished.
+_SETTLE_FRAMES = 3
+
+
+def idle_park_enabled() -> bool:
+    return str(os.environ.get("KEYRGB_DISABLE_REACTIVE_IDLE_PARK", "")).strip().lower() not in {
+        "1",
+        "true",
+        "yes",
+        "on",
+    }
+
+
+def _render_state_static(engine: EffectsEngine) -> bool:
+    pulse_mix = _support.coerce_float(
+        _support.read_engine_attr(
+            engine,
+            "_reactive_active_pulse_mix",
+            missing_default=0.0,
+            error_default=None,
+            logger=logger,
+        ),
+        default=None,
+    )
+    if pulse_mix is None or pulse_mix > 0.0:
+        return False
+
+    transition_started_at = _support.read_engine_attr(
+        engine,
+        "_reactive_transition_started_at",
+        missing_default=None,
+        error_default=0.0,
+        logger=logger,
+    )
+    if transition_started_at is not None:
+        return False
+
+    _damp, damp_remaining_s = post_restore_visual_damp(engine)
+    return damp_remaining_s <= 0.0
+
+
+class IdleParkGate:
+    """Track whether a reactive loop has settled into a static frame."""
+
+    __slots__ = ("_enabled", "_last_brightness", "_settled_frames")
+
+    def __init__(self) -> None:
+        self._enabled = idle_park_enabled()
+        self._last_brightness: int | None = None
+        self._settled_frames = 0
+
+    def settled(self, engine: EffectsEngine, *, animating: bool) -> bool:
+        """Record one rendered frame; return ``True`` once further frames would be identical."""
+
+        if not self._enabled or animating or not _render_state_static(engine):
+            self._settled_frames = 0
+            return False
+
+        brightness = engine._last_rendered_brightness
+        if brightness != self._last_brightness:
+            self._last_brightness = brightness
+            self._settled_frames = 0
+        self._settled_frames += 1
+        return self._settled_frames >= _SETTLE_FRAMES
+
+
+def park_when_idle(
+    engine: EffectsEngine,
+    *,
+    gate: IdleParkGate,
+    waker: FrameWaker,
+    animating: bool,
+    devices: Sequence[object] | None = None,
+) -> bool:
+    """Park until input, a render input change or stop once ``gate`` has settled.
+
+    Returns ``False`` when the loop should keep its timed frame wait instead.
+    """
+
+    if not waker.can_park or not gate.settled(engine, animating=animating):
+        return False
+    return waker.park(devices=devices)
+
+
+def finish_frame(
+    engine: EffectsEngine,
+    *,
+    gate: IdleParkGate,
+    waker: FrameWaker,
+    frame_start_s: float,
+    nominal_dt_s: float,
+    effect_name: str,
+    animating: bool,
+    devices: Sequence[object] | None = None,
+) -> bool:
+    """Log an overrun, then park or sleep out the rest of the frame budget.
+
+    Returns ``True`` when the loop parked, so it can restart its frame clock.
+    """
+
+    log_frame_overrun_if_slow(
+        logger=logger, frame_start_s=frame_start_s, nominal_dt_s=nominal_dt_s, effect_name=effect_name
+    )
+    if park_when_idle(engine, gate=gate, waker=waker, animating=animating, devices=devices):
+        return True
+    waker.wait(remaining_frame_delay_s(frame_start_s=frame_start_s, nominal_dt_s=nominal_dt_s), devices=devices)
+    return False
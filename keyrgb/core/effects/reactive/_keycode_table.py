@@ -0,0 +1,117 @@
+"""Compiled evdev keycode → matrix cell table for reactive input.
+
+Mapping a keydown used to run ``ecodes.KEY`` lookup, key-name munging, slot-id
+translation and a keymap lookup per event. The table does all of that once per
+slot keymap and physical layout, so a burst of keycodes maps to cells with list
+indexing. Entries are ``None`` for keys without a slot (the press is ignored)
+and ``()`` for known slots the keymap does not place (the loops pick a random
+cell, as for any unmapped press).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TypeAlias
+
+from . import _input_mapping
+
+Key: TypeAlias = tuple[int, int]
+KeyCells: TypeAlias = tuple[Key, ...]
+SlotKeyMap = Mapping[str, Sequence[Key]]
+
+# KEY_CNT in <linux/input-event-codes.h>.
+KEY_CODE_COUNT = 0x300
+
+
+def evdev_key_names() -> Mapping[int, object]:
+    try:
+        import evdev
+    except ImportError:
+        return {}
+    try:
+        return dict(evdev.ecodes.KEY)
+    except (AttributeError, TypeError, ValueError):
+        return {}
+
+
+def slot_id_for_evdev_key_name(name: object, *, physical_layout: str = "auto") -> str | None:
+    """Translate an ``ecodes.KEY`` entry, which may list several aliases, into a slot id."""
+
+    aliases = name if isinstance(name, (list, tuple)) else (name,)
+    for alias in aliases:
+        key_id = _input_mapping.evdev_key_name_to_key_id(str(alias) if alias else "")
+        if key_id:
+            return _input_mapping.key_id_to_slot_id(key_id, physical_layout=physical_layout)
+    return None
+
+
+class KeycodeCellTable:
+    """Keycode-indexed cells for one slot keymap and physical layout."""
+
+    __slots__ = ("_cells",)
+
+    def __init__(self, cells: list[KeyCells | None]) -> None:
+        self._cells = cells
+
+    def cells_for_code(self, code: int) -> KeyCells | None:
+        if 0 <= code < len(self._cells):
+            return self._cells[code]
+        return None
+
+    def cells_for_codes(self, codes: Iterable[int]) -> list[KeyCells]:
+        """Return the cells of every mapped keycode, in press order."""
+
+        table = self._cells
+        limit = len(table)
+        out: list[KeyCells] = []
+        for code in codes:
+            if 0 <= code < limit:
+                cells = table[code]
+                if cells is not None:
+                    out.append(cells)
+        return out
+
+
+def compile_keycode_cell_table(
+    slot_keymap: SlotKeyMap,
+    *,
+    physical_layout: str = "auto",
+    key_names: Mapping[int, object] | None = None,
+) -> KeycodeCellTable:
+    names = evdev_key_names() if key_names is None else key_names
+    cells: list[KeyCells | None] = [None] * KEY_CODE_COUNT
+    for code, name in names.items():
+        try:
+            index = int(code)
+        except (TypeError, ValueError):
+            continue
+        if not 0 <= index < KEY_CODE_COUNT:
+            continue
+        slot_id = slot_id_for_evdev_key_name(name, physical_layout=physical_layout)
+        if slot_id:
+            cells[index] = tuple(slot_keymap.get(slot_id.lower(), ()))
+    return KeycodeCellTable(cells)
+
+
+_cached_table: tuple[object, KeycodeCellTable] | None = None
+
+
+def _table_cache_key(slot_keymap: SlotKeyMap, physical_layout: str) -> object:
+    return (
+        physical_layout,
+        tuple(sorted((str(slot_id), tuple(cells)) for slot_id, cells in slot_keymap.items())),
+    )
+
+
+def keycode_cell_table(slot_keymap: SlotKeyMap, *, physical_layout: str = "auto") -> KeycodeCellTable:
+    """Return the compiled table, rebuilding it only when the keymap or layout changed."""
+
+    global _cached_table
+
+    cache_key = _table_cache_key(slot_keymap, physical_layout)
+    cached = _cached_table
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+    table = compile_keycode_cell_table(slot_keymap, physical_layout=physical_layout)
+    _cached_table = (cache_key, table)
+    return table
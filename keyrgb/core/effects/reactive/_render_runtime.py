@@ -5,6 +5,7 @@ from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING
 
 from keyrgb.core.backends.policies.per_key_mode import per_key_mode_requires_frame_reassert
+from keyrgb.core.effects.frame_diff import engine_frame_diff, invalidate_engine_frame_diff
 from keyrgb.core.effects.perkey_animation import enable_user_mode_once
 from keyrgb.core.effects.software_targets import (
     average_color_map as average_color_map_impl,
@@ -139,9 +140,14 @@ def render_per_key_frame(
             if need_mode_init:
                 apply_hw_brightness(engine, brightness_hw, force_reinit=reassert_every_frame)
 
+            frame_diff = engine_frame_diff(engine)
+            if need_mode_init or _last_reactive_per_key_frame_signature_or_none(engine) is None:
+                # A dropped signature means someone asked for a full rewrite.
+                frame_diff.invalidate()
             try:
-                engine.kb.set_key_colors(rendered_color_map, brightness=int(brightness_hw), enable_user_mode=False)
+                frame_diff.write(engine.kb, rendered_color_map, brightness=int(brightness_hw))
             except _REACTIVE_RENDER_RUNTIME_ERRORS as exc:
+                frame_diff.invalidate()
                 if is_device_disconnected(exc):
                     try:
                         engine.mark_device_unavailable()
@@ -202,6 +208,7 @@ def render_uniform_frame(
         if need_mode_init:
             apply_hw_brightness(engine, brightness_hw)
 
+        invalidate_engine_frame_diff(engine)
         engine.kb.set_color((r, g, b), brightness=int(brightness_hw))
 
         if not need_mode_init:
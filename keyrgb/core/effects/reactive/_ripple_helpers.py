@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 from collections.abc import Sequence
 
-from keyrgb.core.effects.colors import hsv_to_rgb
+from keyrgb.core.effects.colors import hue_rgb
 from keyrgb.core.effects.matrix_layout import EffectGridGeometry, geometry_for_engine
 from keyrgb.core.effects.reactive.utils import (
     _pick_contrasting_highlight,
@@ -142,20 +142,26 @@ def build_ripple_color_map_into(
 ) -> dict[Key, Color]:
     dest.clear()
     saturation = max(0.0, min(1.0, float(auto_pulse_saturation)))
+    # Rainbow pulses read the brightness-scaled hue ramp directly instead of
+    # converting and then scaling every overlaid key.
+    pulse_level = 255 if pulse_scale >= 0.999 else round(max(0.0, float(pulse_scale)) * 255)
     for key, base_rgb in base.items():
         base_rgb_unscaled = base_unscaled.get(key, base_rgb)
         if key in overlay:
             w, hue = overlay[key]
-            if manual is not None:
-                pulse_rgb = manual
-            else:
-                pulse_rgb = hsv_to_rgb(hue / 360.0, saturation, 1.0)
             if per_key_backdrop_active and manual is None:
-                pulse_rgb = _pick_contrasting_highlight(base_rgb=base_rgb_unscaled, preferred_rgb=pulse_rgb)
+                pulse_rgb = _pick_contrasting_highlight(
+                    base_rgb=base_rgb_unscaled,
+                    preferred_rgb=hue_rgb(hue / 360.0, saturation=saturation),
+                )
                 dest[key] = mix(base_rgb, pulse_rgb, t=min(1.0, w * pulse_scale))
             else:
-                if pulse_scale < 0.999:
-                    pulse_rgb = scale(pulse_rgb, pulse_scale)
+                if manual is None:
+                    pulse_rgb = hue_rgb(hue / 360.0, saturation=saturation, level=pulse_level)
+                elif pulse_scale < 0.999:
+                    pulse_rgb = scale(manual, pulse_scale)
+                else:
+                    pulse_rgb = manual
                 dest[key] = mix(base_rgb, pulse_rgb, t=min(1.0, w))
         else:
             dest[key] = base_rgb
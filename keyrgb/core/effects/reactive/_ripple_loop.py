@@ -9,9 +9,14 @@ from typing import TYPE_CHECKING, Protocol
 
 from keyrgb.core.backends.base import supports_per_key_output
 from keyrgb.core.effects.matrix_layout import geometry_for_engine
+from keyrgb.core.runtime.metrics import begin_frame
 
-from .input import EvdevKeyboardDevices
-from .utils import frame_elapsed_dt_s, log_frame_overrun_if_slow, remaining_frame_delay_s
+from ._evdev_types import EvdevKeyboardDevices
+from ._frame_wake import FrameWaker
+from ._idle_park import IdleParkGate, finish_frame
+from ._keycode_table import keycode_cell_table
+from ._runtime_inputs import poll_pressed_cells
+from .utils import frame_elapsed_dt_s
 
 if TYPE_CHECKING:
     from keyrgb.core.effects.engine import EffectsEngine
@@ -233,11 +238,14 @@ def run_reactive_ripple_loop(engine: EffectsEngine, *, api: _ReactiveRippleApiPr
         synthetic_fallback_enabled=api.reactive_synthetic_fallback_enabled,
     )
     slot_keymap = api.load_slot_keymap(loader=api.load_active_profile_slot_keymap)
+    cell_table = keycode_cell_table(slot_keymap)
 
     pulses: list[_RainbowPulseProtocol] = []
     global_hue = 0.0
     last_frame_s: float | None = None
 
+    waker = FrameWaker(engine.stop_event, getattr(engine, "render_wake_event", None))
+    idle_gate = IdleParkGate()
     try:
         if engine.stop_event.is_set():
             return
@@ -246,6 +254,7 @@ def run_reactive_ripple_loop(engine: EffectsEngine, *, api: _ReactiveRippleApiPr
             # animation speed stays constant in wall-clock time; sleep only the
             # remaining frame budget so render work doesn't stretch the period.
             frame_start_s = time.monotonic()
+            begin_frame()
             real_dt = frame_elapsed_dt_s(
                 now_s=frame_start_s,
                 last_frame_s=last_frame_s,
@@ -272,17 +281,31 @@ def run_reactive_ripple_loop(engine: EffectsEngine, *, api: _ReactiveRippleApiPr
             if eff_hw <= 0:
                 api._set_reactive_active_pulse_mix(engine, target=0.0)
                 api.render(engine, color_map=base)
-                log_frame_overrun_if_slow(
-                    logger=logger, frame_start_s=frame_start_s, nominal_dt_s=nominal_dt, effect_name="ripple"
-                )
-                engine.stop_event.wait(remaining_frame_delay_s(frame_start_s=frame_start_s, nominal_dt_s=nominal_dt))
+                # Presses are not read while the pulses are dark, so waking on
+                # input here would spin on the still-readable device fds. The
+                # dark frame is static, so park for render input changes only.
+                if finish_frame(
+                    engine,
+                    gate=idle_gate,
+                    waker=waker,
+                    frame_start_s=frame_start_s,
+                    nominal_dt_s=nominal_dt,
+                    effect_name="ripple",
+                    animating=False,
+                ):
+                    last_frame_s = None
                 continue
 
-            pressed_slot_ids = press.poll_slot_ids(dt=real_dt)
-            if pressed_slot_ids:
+            pressed_cells = poll_pressed_cells(
+                press,
+                dt=real_dt,
+                slot_keymap=slot_keymap,
+                cell_table=cell_table,
+                mapped_slot_cells=api.mapped_slot_cells,
+            )
+            if pressed_cells:
                 ttl = _BASE_PULSE_TTL_S / p
-                for pressed_slot_id in pressed_slot_ids:
-                    mapped_cells = api.mapped_slot_cells(slot_keymap, pressed_slot_id)
+                for mapped_cells in pressed_cells:
                     if mapped_cells:
                         for row, col in mapped_cells:
                             pulses.append(
@@ -353,33 +376,36 @@ def run_reactive_ripple_loop(engine: EffectsEngine, *, api: _ReactiveRippleApiPr
 
                 rgb = api.mix(base_rgb, pulse_rgb, t=min(1.0, best_weight))
                 api._render_uniform_fallback(engine, rgb=rgb)
-                # Advance hue at a fixed rate so the rainbow cycles consistently
-                # regardless of typing speed (not pace-coupled). Time-based so the
-                # cycle speed is independent of the achieved frame rate.
-                global_hue = (global_hue + _HUE_ADVANCE_DEG_PER_S * real_dt) % 360.0
-                log_frame_overrun_if_slow(
-                    logger=logger, frame_start_s=frame_start_s, nominal_dt_s=nominal_dt, effect_name="ripple"
+            else:
+                color_map = api.get_engine_color_map_buffer(engine, "_reactive_ripple_frame_map")
+                api.build_ripple_color_map_into(
+                    color_map,
+                    base=base,
+                    base_unscaled=base_unscaled,
+                    overlay=overlay,
+                    per_key_backdrop_active=per_key_backdrop_active,
+                    manual=manual,
+                    pulse_scale=pulse_scale,
+                    auto_pulse_saturation=auto_pulse_saturation,
                 )
-                engine.stop_event.wait(remaining_frame_delay_s(frame_start_s=frame_start_s, nominal_dt_s=nominal_dt))
-                continue
-
-            color_map = api.get_engine_color_map_buffer(engine, "_reactive_ripple_frame_map")
-            api.build_ripple_color_map_into(
-                color_map,
-                base=base,
-                base_unscaled=base_unscaled,
-                overlay=overlay,
-                per_key_backdrop_active=per_key_backdrop_active,
-                manual=manual,
-                pulse_scale=pulse_scale,
-                auto_pulse_saturation=auto_pulse_saturation,
-            )
+                api.render(engine, color_map=color_map)
 
-            api.render(engine, color_map=color_map)
+            # Advance hue at a fixed rate so the rainbow cycles consistently
+            # regardless of typing speed (not pace-coupled). Time-based so the
+            # cycle speed is independent of the achieved frame rate.
             global_hue = (global_hue + _HUE_ADVANCE_DEG_PER_S * real_dt) % 360.0
-            log_frame_overrun_if_slow(
-                logger=logger, frame_start_s=frame_start_s, nominal_dt_s=nominal_dt, effect_name="ripple"
-            )
-            engine.stop_event.wait(remaining_frame_delay_s(frame_start_s=frame_start_s, nominal_dt_s=nominal_dt))
+            devices = getattr(press, "devices", None)
+            if finish_frame(
+                engine,
+                gate=idle_gate,
+                waker=waker,
+                frame_start_s=frame_start_s,
+                nominal_dt_s=nominal_dt,
+                effect_name="ripple",
+                animating=bool(pulses) or not devices,
+                devices=devices,
+            ):
+                last_frame_s = None
     finally:
+        waker.close()
         press.close()
@@ -3,7 +3,8 @@ from __future__ import annotations
 from collections.abc import Callable, Mapping, Sequence
 from typing import TYPE_CHECKING, Protocol
 
-from .input import EvdevKeyboardDevices
+from ._evdev_types import EvdevKeyboardDevices
+from ._keycode_table import KeycodeCellTable
 from .render import pace
 
 if TYPE_CHECKING:
@@ -17,6 +18,10 @@ class _PressSourceProtocol(Protocol):
     spawn_interval_s: float
 
 
+class _SlotPressSourceProtocol(Protocol):
+    def poll_slot_ids(self, *, dt: float) -> list[str]: ...
+
+
 class _PressSourceFactoryProtocol(Protocol):
     def __call__(
         self,
@@ -55,3 +60,23 @@ def mapped_slot_cells(
     if not pressed_slot_id:
         return ()
     return slot_keymap.get(str(pressed_slot_id).lower(), ())
+
+
+def poll_pressed_cells(
+    press: _SlotPressSourceProtocol,
+    *,
+    dt: float,
+    slot_keymap: SlotKeyMap,
+    cell_table: KeycodeCellTable,
+    mapped_slot_cells: Callable[[SlotKeyMap, object], Sequence[Key]],
+) -> list[Sequence[Key]]:
+    """Return the cells of each press; empty for an unmapped or synthetic press.
+
+    Press sources with ``poll_keypress_cells`` map raw keycodes through the
+    compiled table. Others still report slot ids resolved via the keymap.
+    """
+
+    poll_cells = getattr(press, "poll_keypress_cells", None)
+    if callable(poll_cells):
+        return poll_cells(dt=dt, cell_table=cell_table)
+    return [mapped_slot_cells(slot_keymap, slot_id) for slot_id in press.poll_slot_ids(dt=dt)]
@@ -2,50 +2,21 @@ from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Callable, Iterable, Mapping, Sequence
-from pathlib import Path
-from typing import Protocol, TypeAlias, cast
-
-from keyrgb.core.effects.reactive._evdev_specs import keyboard_control_keys, keyboard_letter_keys
+from typing import cast
+
+from keyrgb.core.runtime.input_hub import running_input_hub
+from keyrgb.core.utils.linux.evdev_reader import (
+    device_fd,
+    looks_like_keyboard,
+    raw_evdev_enabled,
+    read_udev_input_properties,
+    thread_keydown_reader,
+)
 from keyrgb.core.utils.logging_utils import log_throttled
 
 from . import _input_mapping
-from ._input_mapping import KeyCells
-
-
-class EvdevInputEventProtocol(Protocol):
-    type: object
-    value: object
-    code: object
-
-
-class EvdevKeyboardDeviceProtocol(Protocol):
-    path: str
-
-    def fileno(self) -> int: ...
-
-    def close(self) -> None: ...
-
-    def capabilities(self, verbose: bool = False) -> Mapping[object, Sequence[object]]: ...
-
-    def read(self) -> Iterable[EvdevInputEventProtocol]: ...
-
-
-class _EvdevEcodesProtocol(Protocol):
-    EV_KEY: int
-    KEY: Mapping[int, str]
-
-
-class _EvdevModuleProtocol(Protocol):
-    ecodes: _EvdevEcodesProtocol
-    InputDevice: Callable[[str], EvdevKeyboardDeviceProtocol]
-
-    def list_devices(self) -> Sequence[str]: ...
-
-
-EvdevKeyboardDevice: TypeAlias = EvdevKeyboardDeviceProtocol
-EvdevKeyboardDevices: TypeAlias = list[EvdevKeyboardDeviceProtocol]
-
+from ._evdev_types import EvdevKeyboardDevice, EvdevKeyboardDevices, EvdevModuleProtocol
+from ._keycode_table import KeyCells, slot_id_for_evdev_key_name
 
 logger = logging.getLogger(__name__)
 
@@ -96,46 +67,13 @@ def _drop_evdev_device(devices: EvdevKeyboardDevices, dev: EvdevKeyboardDevice)
     )
 
 
-def _read_udev_input_properties(device_path: str) -> dict[str, str]:
-    try:
-        stat_result = os.stat(device_path)
-        major_num = os.major(stat_result.st_rdev)
-        minor_num = os.minor(stat_result.st_rdev)
-        data_path = Path(f"/run/udev/data/c{major_num}:{minor_num}")
-        if not data_path.is_file():
-            return {}
-        props: dict[str, str] = {}
-        for line in data_path.read_text(encoding="utf-8", errors="replace").splitlines():
-            if not line.startswith("E:"):
-                continue
-            key, sep, value = line[2:].partition("=")
-            if sep:
-                props[key] = value.strip()
-        return props
-    except (OSError, ValueError):
-        return {}
-
-
 def _udev_device_is_keyboard(device_path: str) -> bool | None:
-    props = _read_udev_input_properties(device_path)
+    props = read_udev_input_properties(device_path)
     if not props:
         return None
     return props.get("ID_INPUT_KEYBOARD") == "1"
 
 
-def _evdev_device_looks_like_keyboard(dev: EvdevKeyboardDevice, evdev: _EvdevModuleProtocol) -> bool:
-    try:
-        caps = dev.capabilities(verbose=False)
-        key_codes = set(caps.get(evdev.ecodes.EV_KEY, []) or [])
-    except (AttributeError, OSError, TypeError, ValueError):
-        return False
-
-    letter_keys = keyboard_letter_keys(evdev)
-    control_keys = keyboard_control_keys(evdev)
-
-    return len(key_codes & letter_keys) >= 8 and len(key_codes & control_keys) >= 3
-
-
 def evdev_key_name_to_key_id(name: str) -> str | None:
     """Translate evdev key names into legacy calibrated key_id strings.
 
@@ -163,11 +101,21 @@ def try_open_evdev_keyboards() -> EvdevKeyboardDevices | None:
     }:
         return None
 
+    # In the tray the input hub owns the keyboards; subscribe instead of
+    # opening and classifying a second set of fds.
+    hub = running_input_hub()
+    if hub is not None:
+        if not hub.has_keyboards:
+            return None
+        subscription = hub.subscribe_keypresses()
+        if subscription is not None:
+            return [cast(EvdevKeyboardDevice, subscription)]
+
     try:
         import evdev
     except ImportError:
         return None
-    evdev_module = cast(_EvdevModuleProtocol, evdev)
+    evdev_module = cast(EvdevModuleProtocol, evdev)
 
     try:
         device_paths = list(evdev_module.list_devices())
@@ -195,7 +143,7 @@ def try_open_evdev_keyboards() -> EvdevKeyboardDevices | None:
             )
             continue
 
-        if keyboard_tag is True or _evdev_device_looks_like_keyboard(dev, evdev_module):
+        if keyboard_tag is True or looks_like_keyboard(dev):
             out.append(dev)
             if _reactive_input_debug_enabled():
                 logger.info(
@@ -268,28 +216,15 @@ def load_active_profile_slot_keymap() -> dict[str, KeyCells]:
         return {}
 
 
-def poll_keypress_slot_ids(devices: EvdevKeyboardDevices | None) -> list[str]:
-    """Return every mapped slot id pressed since the last poll.
-
-    A single evdev batch can contain several keydown events (fast typing); the
-    singular wrapper historically returned only the first one and dropped the
-    rest. Collecting all of them lets the effect loops spawn one pulse per
-    physical press, which keeps burst typing visually responsive.
-    """
-    if not devices:
-        return []
-
+def _read_keydown_codes(
+    devices: EvdevKeyboardDevices,
+    evdev_module: EvdevModuleProtocol,
+) -> list[tuple[EvdevKeyboardDevice, int]]:
     try:
         import select
     except ImportError:
         return []
 
-    try:
-        import evdev
-    except ImportError:
-        return []
-    evdev_module = cast(_EvdevModuleProtocol, evdev)
-
     try:
         r, _, _ = select.select(devices, [], [], 0)
     except (OSError, TypeError, ValueError) as exc:
@@ -304,9 +239,17 @@ def poll_keypress_slot_ids(devices: EvdevKeyboardDevices | None) -> list[str]:
     if not r:
         return []
 
-    slot_ids: list[str] = []
+    presses: list[tuple[EvdevKeyboardDevice, int]] = []
+    reader = thread_keydown_reader() if raw_evdev_enabled() else None
+    codes: list[int] = []
     for dev in list(r):
         try:
+            fd = device_fd(dev) if reader is not None else None
+            if reader is not None and fd is not None:
+                codes.clear()
+                reader.read_keydown_codes(fd, codes)
+                presses.extend((dev, code) for code in codes)
+                continue
             for event in dev.read():
                 if getattr(event, "type", None) != evdev_module.ecodes.EV_KEY:
                     continue
@@ -315,20 +258,7 @@ def poll_keypress_slot_ids(devices: EvdevKeyboardDevices | None) -> list[str]:
                 code = getattr(event, "code", None)
                 if code is None:
                     continue
-                name = evdev_module.ecodes.KEY.get(int(code))
-                slot_id = evdev_key_name_to_slot_id(str(name) if name else "")
-                if _reactive_input_debug_enabled():
-                    logger.info(
-                        "reactive_input: key_press path=%s device=%r code=%s key=%s slot=%s mapped=%s",
-                        getattr(dev, "path", "<unknown>"),
-                        _device_debug_name(dev),
-                        code,
-                        name,
-                        slot_id,
-                        bool(slot_id),
-                    )
-                if slot_id:
-                    slot_ids.append(slot_id)
+                presses.append((dev, int(code)))
         except (AttributeError, OSError, RuntimeError, TypeError, ValueError) as exc:
             dev_name = getattr(dev, "path", "<unknown>")
             _log_reactive_input_exception(
@@ -339,6 +269,69 @@ def poll_keypress_slot_ids(devices: EvdevKeyboardDevices | None) -> list[str]:
             _drop_evdev_device(devices, dev)
             continue
 
+    return presses
+
+
+def poll_keypress_codes(devices: EvdevKeyboardDevices | None) -> list[int]:
+    """Return the keycode of every keydown since the last poll.
+
+    Pair with ``_keycode_table.keycode_cell_table`` to map a burst of presses
+    to matrix cells without per-event name translation.
+    """
+    if not devices:
+        return []
+
+    try:
+        import evdev
+    except ImportError:
+        return []
+
+    presses = _read_keydown_codes(devices, cast(EvdevModuleProtocol, evdev))
+    if _reactive_input_debug_enabled():
+        for dev, code in presses:
+            logger.info(
+                "reactive_input: key_press path=%s device=%r code=%s",
+                getattr(dev, "path", "<unknown>"),
+                _device_debug_name(dev),
+                code,
+            )
+    return [code for _dev, code in presses]
+
+
+def poll_keypress_slot_ids(devices: EvdevKeyboardDevices | None) -> list[str]:
+    """Return every mapped slot id pressed since the last poll.
+
+    A single evdev batch can contain several keydown events (fast typing); the
+    singular wrapper historically returned only the first one and dropped the
+    rest. Collecting all of them lets the effect loops spawn one pulse per
+    physical press, which keeps burst typing visually responsive.
+    """
+    if not devices:
+        return []
+
+    try:
+        import evdev
+    except ImportError:
+        return []
+    evdev_module = cast(EvdevModuleProtocol, evdev)
+
+    slot_ids: list[str] = []
+    for dev, code in _read_keydown_codes(devices, evdev_module):
+        name = evdev_module.ecodes.KEY.get(code)
+        slot_id = slot_id_for_evdev_key_name(name)
+        if _reactive_input_debug_enabled():
+            logger.info(
+                "reactive_input: key_press path=%s device=%r code=%s key=%s slot=%s mapped=%s",
+                getattr(dev, "path", "<unknown>"),
+                _device_debug_name(dev),
+                code,
+                name,
+                slot_id,
+                bool(slot_id),
+            )
+        if slot_id:
+            slot_ids.append(slot_id)
+
     return slot_ids
 
 
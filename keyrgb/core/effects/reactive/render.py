@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import time as _time
+from collections.abc import Mapping
 from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from keyrgb.core.backends.base import supports_per_key_output
+from keyrgb.core.effects.frame_output import render_engine_frame
 from keyrgb.core.effects.matrix_layout import geometry_for_engine
 from keyrgb.core.effects.perkey_animation import build_full_color_grid
 
@@ -321,6 +323,10 @@ def base_color_map(engine: EffectsEngine) -> dict[Key, Color]:
 
 
 def render(engine: EffectsEngine, *, color_map: dict[Key, Color]) -> None:
+    render_engine_frame(engine, lambda frame: _render_now(engine, color_map=frame), color_map)
+
+
+def _render_now(engine: EffectsEngine, *, color_map: Mapping[Key, Color]) -> None:
     if has_per_key(engine) and render_per_key_frame(
         engine,
         color_map=color_map,
@@ -8,11 +8,15 @@ from typing import Any
 
 from keyrgb.core.effects.colors import hsv_to_rgb
 from keyrgb.core.effects.reactive.input import (
-    EvdevKeyboardDevices,
     close_evdev_keyboards,
+    poll_keypress_codes,
     poll_keypress_slot_ids,
     try_open_evdev_keyboards,
 )
+from keyrgb.core.runtime.metrics import FRAME_OVERRUNS
+
+from ._evdev_types import EvdevKeyboardDevices
+from ._keycode_table import KeyCells, KeycodeCellTable
 
 # Type alias
 Color = tuple[int, int, int]
@@ -124,7 +128,23 @@ class _PressSource:
         slot_ids = poll_keypress_slot_ids(self.devices)
         if slot_ids:
             return slot_ids
+        return [""] if self._idle_tick(dt) else []
+
+    def poll_keypress_cells(self, *, dt: float, cell_table: KeycodeCellTable) -> list[KeyCells]:
+        """Return the matrix cells of every press since the last poll.
 
+        Same contract as ``poll_slot_ids`` with presses already mapped through
+        ``cell_table``; an empty tuple marks an unmapped or synthetic press.
+        """
+        codes = poll_keypress_codes(self.devices)
+        if codes:
+            pressed = cell_table.cells_for_codes(codes)
+            if pressed:
+                return pressed
+        return [()] if self._idle_tick(dt) else []
+
+    def _idle_tick(self, dt: float) -> bool:
+        """Advance reopen and synthetic timers; return whether a synthetic press is due."""
         if not self.devices:
             self.reopen_acc_s += float(dt)
             if self.reopen_acc_s >= float(self.reopen_interval_s):
@@ -138,9 +158,9 @@ class _PressSource:
             self.spawn_acc += float(dt)
             if self.spawn_acc >= float(self.spawn_interval_s):
                 self.spawn_acc = 0.0
-                return [""]
+                return True
 
-        return []
+        return False
 
     def poll_slot_id(self, *, dt: float) -> str | None:
         """Return a slot id (string) when pressed.
@@ -250,6 +270,7 @@ def log_frame_overrun_if_slow(
     budget_s = max(float(nominal_dt_s), avg) * float(threshold_factor)
     if work_s <= budget_s:
         return
+    FRAME_OVERRUNS.add()
     log_throttled(
         logger,
         f"effects.reactive.frame_overrun.{effect_name}",
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, MutableMapping
 from typing import TYPE_CHECKING
 
+from keyrgb.core.effects.frame_buffer import FrameBuffer
 from keyrgb.core.effects.matrix_layout import EffectGridGeometry, all_keys_for, geometry_for_engine
 
 if TYPE_CHECKING:
@@ -34,21 +36,61 @@ def get_engine_color_map_buffer(engine: EffectsEngine, attr_name: str) -> dict[K
     return created
 
 
+def get_engine_frame_buffer(engine: EffectsEngine, attr_name: str) -> FrameBuffer:
+    """Return the engine-owned frame buffer for ``attr_name``, sized to its geometry.
+
+    The buffer is reused across frames and only reallocated when the engine's
+    effect geometry changes.
+    """
+
+    geometry = geometry_for_engine(engine)
+    try:
+        engine_state = object.__getattribute__(engine, "__dict__")
+    except (AttributeError, TypeError):
+        engine_state = None
+
+    if isinstance(engine_state, dict):
+        existing = engine_state.get(attr_name)
+        if isinstance(existing, FrameBuffer) and existing.matches(geometry.rows, geometry.cols):
+            return existing
+
+        created = FrameBuffer.for_geometry(geometry)
+        engine_state[attr_name] = created
+        return created
+
+    created = FrameBuffer.for_geometry(geometry)
+    try:
+        setattr(engine, attr_name, created)
+    except (AttributeError, TypeError):
+        pass
+    return created
+
+
 def fill_uniform_color_map(
-    dest: dict[Key, Color],
+    dest: MutableMapping[Key, Color],
     *,
     color: Color,
     geometry: EffectGridGeometry | None = None,
     engine: object | None = None,
-) -> dict[Key, Color]:
+) -> MutableMapping[Key, Color]:
     active_geometry = geometry if geometry is not None else geometry_for_engine(engine)
+    if isinstance(dest, FrameBuffer) and dest.matches(active_geometry.rows, active_geometry.cols):
+        dest.fill(color)
+        return dest
     dest.clear()
     for key in all_keys_for(active_geometry):
         dest[key] = color
     return dest
 
 
-def scale_color_map_into(dest: dict[Key, Color], *, source: dict[Key, Color], factor: float) -> dict[Key, Color]:
+def scale_color_map_into(
+    dest: MutableMapping[Key, Color],
+    *,
+    source: Mapping[Key, Color],
+    factor: float,
+) -> MutableMapping[Key, Color]:
+    if isinstance(dest, FrameBuffer) and isinstance(source, FrameBuffer) and dest.matches(source.rows, source.cols):
+        return source.scaled_into(dest, factor)
     dest.clear()
     f = float(factor)
     for key, rgb in source.items():
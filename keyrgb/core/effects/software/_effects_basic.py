@@ -5,11 +5,13 @@ import random
 import time
 from typing import TYPE_CHECKING
 
-from keyrgb.core.effects.colors import hsv_to_rgb
+from keyrgb.core.effects.colors import hue_rgb
 from keyrgb.core.effects.matrix_layout import geometry_for_engine
+from keyrgb.core.runtime.metrics import begin_frame
 
-from ._buffers import fill_uniform_color_map, get_engine_color_map_buffer, scale_color_map_into
-from .base import Color, Key, animation_step_s, base_color_map, frame_dt_s, mix, pace, render as base_render
+from ._buffers import fill_uniform_color_map, get_engine_frame_buffer
+from .base import animation_step_s, base_color_map, frame_dt_s, pace, render as base_render
+from .kernels import blend_kernel, fire_kernel, hue_field_kernel, scale_kernel
 
 if TYPE_CHECKING:
     from keyrgb.core.effects.engine import EffectsEngine
@@ -18,20 +20,21 @@ if TYPE_CHECKING:
 def run_breathing(engine: EffectsEngine, *, render_fn=base_render) -> None:
     """Breathing (SW): smooth breathing that respects per-key when available."""
 
-    base = base_color_map(engine)
-    color_map = get_engine_color_map_buffer(engine, "_sw_breathing_frame_map")
+    base = get_engine_frame_buffer(engine, "_sw_breathing_base_map")
+    base.copy_from(base_color_map(engine))
+    kernel = scale_kernel(base, frame=get_engine_frame_buffer(engine, "_sw_breathing_frame_map"))
     phase = 0.0
     nominal_dt = frame_dt_s()
     p = pace(engine)
 
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         step_s = animation_step_s(engine, "_sw_breathing_tick", nominal_s=nominal_dt)
         breath = (math.sin(phase) + 1.0) / 2.0
         breath = breath * breath * (3.0 - 2.0 * breath)
         breath = 0.12 + breath * 0.88
 
-        scale_color_map_into(color_map, source=base, factor=breath)
-        render_fn(engine, color_map=color_map)
+        render_fn(engine, color_map=kernel.compute_frame(breath))
 
         phase += (step_s / nominal_dt) * (0.08 * p)
         engine.stop_event.wait(nominal_dt)
@@ -40,54 +43,17 @@ def run_breathing(engine: EffectsEngine, *, render_fn=base_render) -> None:
 def run_fire(engine: EffectsEngine, *, render_fn=base_render) -> None:
     """Fire (SW): higher-FPS, smoother flames; overlays onto per-key base when present."""
 
-    base = base_color_map(engine)
-    color_map = get_engine_color_map_buffer(engine, "_sw_fire_frame_map")
     nominal_dt = frame_dt_s()
-    p = pace(engine)
-    geometry = geometry_for_engine(engine)
-    num_rows = int(geometry.rows)
-    num_cols = int(geometry.cols)
-
-    heat = [[0.0 for _ in range(num_cols)] for _ in range(num_rows)]
-
-    def heat_to_rgb(h: float) -> Color:
-        hh = max(0.0, min(1.0, float(h)))
-        if hh < 0.5:
-            t = hh / 0.5
-            return (int(255 * t), int(80 * t), 0)
-        t = (hh - 0.5) / 0.5
-        return (255, int(80 + (175 * t)), int(0 + (20 * t)))
+    kernel = fire_kernel(
+        base_color_map(engine),
+        frame=get_engine_frame_buffer(engine, "_sw_fire_frame_map"),
+        pace=pace(engine),
+    )
 
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         step_s = animation_step_s(engine, "_sw_fire_tick", nominal_s=nominal_dt)
-        step_ratio = step_s / nominal_dt
-        cooling = 0.06 * p * step_ratio
-        for r in range(num_rows):
-            for c in range(num_cols):
-                heat[r][c] = max(0.0, heat[r][c] - cooling)
-
-        sparks = max(1, round((2 * p) * step_ratio))
-        for _ in range(sparks):
-            c = random.randrange(num_cols)
-            r = random.randrange(min(2, num_rows))
-            heat[r][c] = min(1.0, heat[r][c] + random.uniform(0.45, 0.9))
-
-        for r in range(1, num_rows):
-            for c in range(num_cols):
-                below = heat[r - 1][c]
-                below_l = heat[r - 1][c - 1] if c > 0 else below
-                below_r = heat[r - 1][c + 1] if c + 1 < num_cols else below
-                heat[r][c] = (below + below_l + below_r) / 3.0
-
-        color_map.clear()
-        for r in range(num_rows):
-            for c in range(num_cols):
-                h = heat[r][c]
-                fire_rgb = heat_to_rgb(h)
-                base_rgb = base.get((r, c), (255, 0, 0))
-                color_map[(r, c)] = mix(base_rgb, fire_rgb, t=min(1.0, h * 0.95))
-
-        render_fn(engine, color_map=color_map)
+        render_fn(engine, color_map=kernel.compute_frame(step_s / nominal_dt))
         engine.stop_event.wait(nominal_dt)
 
 
@@ -97,18 +63,20 @@ def run_random(engine: EffectsEngine, *, render_fn=base_render) -> None:
     nominal_dt = frame_dt_s()
     p = pace(engine)
     base = base_color_map(engine)
-    color_map = get_engine_color_map_buffer(engine, "_sw_random_frame_map")
-    prev = get_engine_color_map_buffer(engine, "_sw_random_prev_map")
-    target = get_engine_color_map_buffer(engine, "_sw_random_target_map")
+    color_map = get_engine_frame_buffer(engine, "_sw_random_frame_map")
+    prev = get_engine_frame_buffer(engine, "_sw_random_prev_map")
+    target = get_engine_frame_buffer(engine, "_sw_random_target_map")
 
     prev.clear()
     prev.update(base)
     target.clear()
     target.update(base)
+    kernel = blend_kernel(prev, target, frame=color_map)
     t = 1.0
     next_change_s = 0.0
 
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         now = time.monotonic()
         step_s = animation_step_s(engine, "_sw_random_tick", nominal_s=nominal_dt, now_s=now)
         if now >= next_change_s:
@@ -128,10 +96,7 @@ def run_random(engine: EffectsEngine, *, render_fn=base_render) -> None:
             next_change_s = now + (0.75 / p)
 
         t = min(1.0, t + step_s * (1.8 * p))
-        color_map.clear()
-        for k in target:
-            color_map[k] = mix(prev[k], target[k], t)
-        render_fn(engine, color_map=color_map)
+        render_fn(engine, color_map=kernel.compute_frame(t))
 
         engine.stop_event.wait(nominal_dt)
 
@@ -147,24 +112,20 @@ def run_rainbow_wave(engine: EffectsEngine, *, render_fn=base_render) -> None:
 
     col_den = float(max(1, num_cols - 1))
     row_den = float(max(1, num_rows - 1))
-    pos: dict[Key, float] = {}
+    pos: list[float] = []
     for r in range(num_rows):
         for c in range(num_cols):
-            pos[(r, c)] = (float(c) / col_den) + (0.18 * (float(r) / row_den))
+            pos.append((float(c) / col_den) + (0.18 * (float(r) / row_den)))
 
     hue = 0.0
-    color_map = get_engine_color_map_buffer(engine, "_sw_rainbow_wave_frame_map")
+    kernel = hue_field_kernel(pos, frame=get_engine_frame_buffer(engine, "_sw_rainbow_wave_frame_map"))
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         # Use constant step so USB write-time jitter is not amplified into
         # visible hue variation at high speeds (matches v0.18.1 behaviour).
         hue = (hue + (nominal_dt * (0.165 * p))) % 1.0
 
-        color_map.clear()
-        for k, position in pos.items():
-            h = (hue + position) % 1.0
-            color_map[k] = hsv_to_rgb(h, 1.0, 1.0)
-
-        render_fn(engine, color_map=color_map)
+        render_fn(engine, color_map=kernel.compute_frame(hue))
         engine.stop_event.wait(nominal_dt)
 
 
@@ -179,7 +140,7 @@ def run_rainbow_swirl(engine: EffectsEngine, *, render_fn=base_render) -> None:
 
     cr = (num_rows - 1) / 2.0
     cc = (num_cols - 1) / 2.0
-    coords: dict[Key, tuple[float, float]] = {}
+    coords: list[tuple[float, float]] = []
     max_r = 0.0
     for r in range(num_rows):
         for c in range(num_cols):
@@ -187,23 +148,20 @@ def run_rainbow_swirl(engine: EffectsEngine, *, render_fn=base_render) -> None:
             dx = float(c) - cc
             ang = (math.atan2(dy, dx) / (2.0 * math.pi)) % 1.0
             rad = math.hypot(dx, dy)
-            coords[(r, c)] = (ang, rad)
+            coords.append((ang, rad))
             max_r = max(max_r, rad)
 
     max_r = max(1e-6, max_r)
+    offsets = [ang + 0.25 * (rad / max_r) for ang, rad in coords]
     hue = 0.0
-    color_map = get_engine_color_map_buffer(engine, "_sw_rainbow_swirl_frame_map")
+    kernel = hue_field_kernel(offsets, frame=get_engine_frame_buffer(engine, "_sw_rainbow_swirl_frame_map"))
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         # Use constant step so USB write-time jitter is not amplified into
         # visible hue variation at high speeds (matches v0.18.1 behaviour).
         hue = (hue + (nominal_dt * (0.115 * p))) % 1.0
 
-        color_map.clear()
-        for k, (ang, rad) in coords.items():
-            h = (hue + ang + 0.25 * (rad / max_r)) % 1.0
-            color_map[k] = hsv_to_rgb(h, 1.0, 1.0)
-
-        render_fn(engine, color_map=color_map)
+        render_fn(engine, color_map=kernel.compute_frame(hue))
         engine.stop_event.wait(nominal_dt)
 
 
@@ -213,13 +171,14 @@ def run_spectrum_cycle(engine: EffectsEngine, *, render_fn=base_render) -> None:
     nominal_dt = frame_dt_s()
     p = pace(engine)
     hue = 0.0
-    color_map = get_engine_color_map_buffer(engine, "_sw_spectrum_cycle_frame_map")
+    color_map = get_engine_frame_buffer(engine, "_sw_spectrum_cycle_frame_map")
 
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         # Use constant step so USB write-time jitter is not amplified into
         # visible hue variation at high speeds (matches v0.18.1 behaviour).
         hue = (hue + (nominal_dt * (0.22 * p))) % 1.0
-        rgb = hsv_to_rgb(hue, 1.0, 1.0)
+        rgb = hue_rgb(hue)
         fill_uniform_color_map(color_map, color=rgb, engine=engine)
         render_fn(engine, color_map=color_map)
         engine.stop_event.wait(nominal_dt)
@@ -231,9 +190,10 @@ def run_color_cycle(engine: EffectsEngine, *, render_fn=base_render) -> None:
     nominal_dt = frame_dt_s()
     p = pace(engine)
     phase = 0.0
-    color_map = get_engine_color_map_buffer(engine, "_sw_color_cycle_frame_map")
+    color_map = get_engine_frame_buffer(engine, "_sw_color_cycle_frame_map")
 
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         r = (math.sin(phase) + 1.0) / 2.0
         g = (math.sin(phase + (2.0 * math.pi / 3.0)) + 1.0) / 2.0
         b = (math.sin(phase + (4.0 * math.pi / 3.0)) + 1.0) / 2.0
@@ -8,9 +8,10 @@ from typing import TYPE_CHECKING
 from keyrgb.core.effects.colors import hsv_to_rgb
 from keyrgb.core.effects.matrix_layout import geometry_for_engine
 from keyrgb.core.effects.transitions import scaled_color_map_nonzero
+from keyrgb.core.runtime.metrics import begin_frame
 
 from . import base as _base
-from ._buffers import fill_uniform_color_map, get_engine_color_map_buffer
+from ._buffers import fill_uniform_color_map, get_engine_frame_buffer
 
 if TYPE_CHECKING:
     from keyrgb.core.effects.engine import EffectsEngine
@@ -33,7 +34,7 @@ def run_twinkle(engine: EffectsEngine, *, render_fn=_base.render) -> None:
     base = _base.base_color_map(engine)
     nominal_dt = _base.frame_dt_s()
     p = _base.pace(engine)
-    color_map = get_engine_color_map_buffer(engine, "_sw_twinkle_frame_map")
+    color_map = get_engine_frame_buffer(engine, "_sw_twinkle_frame_map")
 
     twinkles: list[_Twinkle] = []
     acc = 0.0
@@ -43,6 +44,7 @@ def run_twinkle(engine: EffectsEngine, *, render_fn=_base.render) -> None:
     num_cols = int(geometry.cols)
 
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         step_s = _base.animation_step_s(engine, "_sw_twinkle_tick", nominal_s=nominal_dt)
         acc += step_s * p
         while acc >= 0.12:
@@ -119,9 +121,10 @@ def run_strobe(engine: EffectsEngine, *, render_fn=_base.render) -> None:
     elapsed = 0.0
     # Start "on" so selecting the effect doesn't immediately blank the keyboard.
     on = True
-    color_map = get_engine_color_map_buffer(engine, "_sw_strobe_frame_map")
+    color_map = get_engine_frame_buffer(engine, "_sw_strobe_frame_map")
 
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         step_s = _base.animation_step_s(engine, "_sw_strobe_tick", nominal_s=nominal_dt)
         elapsed += step_s
         if elapsed >= half_period_s:
@@ -158,11 +161,12 @@ def run_chase(engine: EffectsEngine, *, render_fn=_base.render) -> None:
 
     pos = 0.0
     width = 1.6
-    color_map = get_engine_color_map_buffer(engine, "_sw_chase_frame_map")
+    color_map = get_engine_frame_buffer(engine, "_sw_chase_frame_map")
     geometry = geometry_for_engine(engine)
     num_cols = int(geometry.cols)
 
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         step_s = _base.animation_step_s(engine, "_sw_chase_tick", nominal_s=nominal_dt)
         pos = (pos + step_s * (3.2 * p)) % float(max(1, num_cols))
 
@@ -202,7 +206,7 @@ def run_rain(engine: EffectsEngine, *, render_fn=_base.render) -> None:
     base = _base.base_color_map(engine)
     nominal_dt = _base.frame_dt_s()
     p = _base.pace(engine)
-    color_map = get_engine_color_map_buffer(engine, "_sw_rain_frame_map")
+    color_map = get_engine_frame_buffer(engine, "_sw_rain_frame_map")
 
     droplets: list[_RainDrop] = []
 
@@ -216,6 +220,7 @@ def run_rain(engine: EffectsEngine, *, render_fn=_base.render) -> None:
     num_cols = int(geometry.cols)
 
     while engine.running and not engine.stop_event.is_set():
+        begin_frame()
         step_s = _base.animation_step_s(engine, "_sw_rain_tick", nominal_s=nominal_dt)
         acc += step_s * p
         if acc >= 0.18:
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING, SupportsIndex, SupportsInt, cast
 from keyrgb.core.backends.base import supports_per_key_output
 from keyrgb.core.backends.policies.per_key_mode import per_key_mode_requires_frame_reassert
 from keyrgb.core.effects.device import optional_output_transaction
+from keyrgb.core.effects.frame_diff import engine_frame_diff, invalidate_engine_frame_diff
+from keyrgb.core.effects.frame_output import render_engine_frame
 from keyrgb.core.effects.matrix_layout import geometry_for_engine
 from keyrgb.core.effects.perkey_animation import build_full_color_grid, enable_user_mode_once
 from keyrgb.core.effects.software_targets import average_color_map, render_secondary_uniform_rgb
@@ -208,8 +210,16 @@ def scale(rgb: Color, s: float) -> Color:
 
 
 def render(engine: EffectsEngine, *, color_map: Mapping[Key, Color]) -> None:
-    """Render per-key when available, otherwise fall back to uniform."""
+    """Render per-key when available, otherwise fall back to uniform.
 
+    While the engine's frame writer runs, the frame is handed to it and the
+    device write happens on the writer thread (latest frame wins).
+    """
+
+    render_engine_frame(engine, lambda frame: _render_now(engine, color_map=frame), color_map)
+
+
+def _render_now(engine: EffectsEngine, *, color_map: Mapping[Key, Color]) -> None:
     if has_per_key(engine):
         try:
             with engine.kb_lock, optional_output_transaction(engine.kb):
@@ -227,13 +237,13 @@ def render(engine: EffectsEngine, *, color_map: Mapping[Key, Color]) -> None:
                     )
                     engine._last_hw_mode_brightness = brightness_hw
 
+                frame_diff = engine_frame_diff(engine)
+                if need_mode_init:
+                    frame_diff.invalidate()
                 try:
-                    engine.kb.set_key_colors(
-                        color_map,
-                        brightness=brightness_hw,
-                        enable_user_mode=False,
-                    )
+                    frame_diff.write(engine.kb, color_map, brightness=brightness_hw)
                 except _SOFTWARE_RENDER_RUNTIME_ERRORS as exc:
+                    frame_diff.invalidate()
                     # On USB disconnect, attempting a fallback uniform write can trigger
                     # a libusb crash on some systems. Mark the device unavailable and
                     # stop issuing I/O until the engine re-acquires it.
@@ -283,6 +293,7 @@ def render(engine: EffectsEngine, *, color_map: Mapping[Key, Color]) -> None:
         rgb = average_color_map(color_map)
 
     r, g, b = avoid_full_black(rgb=rgb, target_rgb=rgb, brightness=int(engine.brightness))
+    invalidate_engine_frame_diff(engine)
     with engine.kb_lock, optional_output_transaction(engine.kb):
         enable_user_mode_once(kb=engine.kb, kb_lock=engine.kb_lock, brightness=int(engine.brightness))
         engine.kb.set_color((r, g, b), brightness=int(engine.brightness))
@@ -0,0 +1,206 @@
+"""Whole-frame compute kernels for the CPU-heavy software effects.
+
+Each kernel owns its per-effect precomputation plus the output ``FrameBuffer``
+and exposes ``compute_frame(t)``; effect loops call it once per tick. When
+NumPy is importable the NumPy kernels in ``_numpy`` compute the frame
+as array operations; otherwise the per-cell Python kernels below run the
+original loop code. Both produce identical frames.
+
+Set ``KEYRGB_DISABLE_NUMPY_KERNELS=1`` to force the pure-Python kernels.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from types import ModuleType
+from typing import Protocol
+
+from keyrgb.core.effects.colors import HUE_LUT_SIZE, hue_ramp
+from keyrgb.core.effects.frame_buffer import FrameBuffer
+
+from ..base import Color, Key, clamp01, mix
+
+DISABLE_NUMPY_KERNELS_ENV = "KEYRGB_DISABLE_NUMPY_KERNELS"
+
+FIRE_BASE_DEFAULT: Color = (255, 0, 0)
+
+
+class FrameKernel(Protocol):
+    frame: FrameBuffer
+
+    def compute_frame(self, t: float) -> FrameBuffer: ...
+
+
+@lru_cache(maxsize=1)
+def _import_numpy() -> ModuleType | None:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def numpy_or_none() -> ModuleType | None:
+    """Return the NumPy module when vectorized kernels are enabled and importable."""
+
+    if os.environ.get(DISABLE_NUMPY_KERNELS_ENV) == "1":
+        return None
+    return _import_numpy()
+
+
+def fire_heat_to_rgb(h: float) -> Color:
+    hh = max(0.0, min(1.0, float(h)))
+    if hh < 0.5:
+        t = hh / 0.5
+        return (int(255 * t), int(80 * t), 0)
+    t = (hh - 0.5) / 0.5
+    return (255, int(80 + (175 * t)), int(0 + (20 * t)))
+
+
+def fire_spark_points(*, num_rows: int, num_cols: int, sparks: int) -> list[tuple[int, int, float]]:
+    """Pick ``sparks`` random ``(row, col, heat)`` points in the bottom rows.
+
+    Shared by both fire kernels so they consume the RNG in the same order.
+    """
+
+    points: list[tuple[int, int, float]] = []
+    for _ in range(sparks):
+        c = random.randrange(num_cols)
+        r = random.randrange(min(2, num_rows))
+        points.append((r, c, random.uniform(0.45, 0.9)))
+    return points
+
+
+class PyHueFieldKernel:
+    """Full-saturation hue per cell: ``hue(cell) = (t + offset[cell]) % 1``, read from ``hue_ramp()``."""
+
+    def __init__(self, offsets: Sequence[float], *, frame: FrameBuffer) -> None:
+        if len(offsets) != len(frame):
+            raise ValueError("hue offsets must cover every frame cell")
+        self.frame = frame
+        self._offsets = tuple(float(offset) for offset in offsets)
+        self._ramp = hue_ramp()
+
+    def compute_frame(self, t: float) -> FrameBuffer:
+        data = self.frame.data
+        ramp = self._ramp
+        hue = float(t)
+        offset = 0
+        for position in self._offsets:
+            packed = ramp[int(((hue + position) % 1.0) * HUE_LUT_SIZE) % HUE_LUT_SIZE]
+            data[offset] = packed >> 16
+            data[offset + 1] = (packed >> 8) & 0xFF
+            data[offset + 2] = packed & 0xFF
+            offset += 3
+        return self.frame
+
+
+class ScaleKernel:
+    """``base`` scaled by ``t`` per channel; a byte-table translate in both modes."""
+
+    def __init__(self, base: FrameBuffer, *, frame: FrameBuffer) -> None:
+        self.frame = frame
+        self._base = base
+
+    def compute_frame(self, t: float) -> FrameBuffer:
+        return self._base.scaled_into(self.frame, t)
+
+
+class PyBlendKernel:
+    """Per-channel cross-fade ``mix(prev, target, t)`` of two live frames."""
+
+    def __init__(self, prev: FrameBuffer, target: FrameBuffer, *, frame: FrameBuffer) -> None:
+        self.frame = frame
+        self._prev = prev
+        self._target = target
+
+    def compute_frame(self, t: float) -> FrameBuffer:
+        tt = clamp01(t)
+        prev = self._prev.data
+        target = self._target.data
+        data = self.frame.data
+        for offset in range(len(data)):
+            a = prev[offset]
+            data[offset] = round(a + (target[offset] - a) * tt)
+        return self.frame
+
+
+class PyFireKernel:
+    """Heat-diffusion fire blended over a base map; ``t`` is the frame step ratio."""
+
+    def __init__(self, base: Mapping[Key, Color], *, frame: FrameBuffer, pace: float) -> None:
+        self.frame = frame
+        self._pace = float(pace)
+        self._rows = frame.rows
+        self._cols = frame.cols
+        self._base = [base.get(key, FIRE_BASE_DEFAULT) for key in frame]
+        self._heat = [[0.0 for _ in range(self._cols)] for _ in range(self._rows)]
+
+    def compute_frame(self, t: float) -> FrameBuffer:
+        num_rows = self._rows
+        num_cols = self._cols
+        heat = self._heat
+        step_ratio = float(t)
+
+        cooling = 0.06 * self._pace * step_ratio
+        for r in range(num_rows):
+            for c in range(num_cols):
+                heat[r][c] = max(0.0, heat[r][c] - cooling)
+
+        sparks = max(1, round((2 * self._pace) * step_ratio))
+        for r, c, amount in fire_spark_points(num_rows=num_rows, num_cols=num_cols, sparks=sparks):
+            heat[r][c] = min(1.0, heat[r][c] + amount)
+
+        for r in range(1, num_rows):
+            for c in range(num_cols):
+                below = heat[r - 1][c]
+                below_l = heat[r - 1][c - 1] if c > 0 else below
+                below_r = heat[r - 1][c + 1] if c + 1 < num_cols else below
+                heat[r][c] = (below + below_l + below_r) / 3.0
+
+        data = self.frame.data
+        offset = 0
+        base = self._base
+        for r in range(num_rows):
+            for c in range(num_cols):
+                h = heat[r][c]
+                red, green, blue = mix(base[offset // 3], fire_heat_to_rgb(h), t=min(1.0, h * 0.95))
+                data[offset] = red
+                data[offset + 1] = green
+                data[offset + 2] = blue
+                offset += 3
+        return self.frame
+
+
+def hue_field_kernel(offsets: Sequence[float], *, frame: FrameBuffer) -> FrameKernel:
+    np = numpy_or_none()
+    if np is None:
+        return PyHueFieldKernel(offsets, frame=frame)
+    from ._numpy import NumpyHueFieldKernel
+
+    return NumpyHueFieldKernel(np, offsets, frame=frame)
+
+
+def scale_kernel(base: FrameBuffer, *, frame: FrameBuffer) -> FrameKernel:
+    return ScaleKernel(base, frame=frame)
+
+
+def blend_kernel(prev: FrameBuffer, target: FrameBuffer, *, frame: FrameBuffer) -> FrameKernel:
+    np = numpy_or_none()
+    if np is None:
+        return PyBlendKernel(prev, target, frame=frame)
+    from ._numpy import NumpyBlendKernel
+
+    return NumpyBlendKernel(np, prev, target, frame=frame)
+
+
+def fire_kernel(base: Mapping[Key, Color], *, frame: FrameBuffer, pace: float) -> FrameKernel:
+    np = numpy_or_none()
+    if np is None:
+        return PyFireKernel(base, frame=frame, pace=pace)
+    from ._numpy import NumpyFireKernel
+
+    return NumpyFireKernel(np, base, frame=frame, pace=pace)
@@ -0,0 +1,118 @@
+"""NumPy implementations of the software effect kernels.
+
+Only imported after ``numpy_or_none()`` found NumPy. Every kernel
+writes into a writable ``uint8`` view over its ``FrameBuffer`` storage and
+mirrors the float arithmetic of the Python kernels operation for operation,
+so both paths produce byte-identical frames.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+from keyrgb.core.effects.colors import HUE_LUT_SIZE, hue_ramp
+from keyrgb.core.effects.frame_buffer import FrameBuffer
+
+from ..base import Color, Key, clamp01
+from . import FIRE_BASE_DEFAULT, fire_spark_points
+
+if TYPE_CHECKING:
+    import numpy
+    from numpy.typing import NDArray
+
+    ByteArray = NDArray[numpy.uint8]
+
+
+def _frame_view(np: ModuleType, frame: FrameBuffer) -> ByteArray:
+    return np.frombuffer(frame.data, dtype=np.uint8).reshape(frame.rows * frame.cols, 3)
+
+
+def hue_ramp_array(np: ModuleType) -> ByteArray:
+    """``colors.hue_ramp()`` unpacked into a ``(HUE_LUT_SIZE, 3)`` ``uint8`` table."""
+
+    packed = np.asarray(hue_ramp(), dtype=np.uint32)
+    return np.stack(((packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF), axis=1).astype(np.uint8)
+
+
+class NumpyHueFieldKernel:
+    def __init__(self, np: ModuleType, offsets: Sequence[float], *, frame: FrameBuffer) -> None:
+        if len(offsets) != len(frame):
+            raise ValueError("hue offsets must cover every frame cell")
+        self.frame = frame
+        self._np = np
+        self._offsets = np.asarray(offsets, dtype=np.float64)
+        self._ramp = hue_ramp_array(np)
+        self._out = _frame_view(np, frame)
+
+    def compute_frame(self, t: float) -> FrameBuffer:
+        np = self._np
+        index = (np.mod(float(t) + self._offsets, 1.0) * HUE_LUT_SIZE).astype(np.intp) % HUE_LUT_SIZE
+        np.take(self._ramp, index, axis=0, out=self._out)
+        return self.frame
+
+
+class NumpyBlendKernel:
+    def __init__(self, np: ModuleType, prev: FrameBuffer, target: FrameBuffer, *, frame: FrameBuffer) -> None:
+        self.frame = frame
+        self._np = np
+        self._prev = _frame_view(np, prev)
+        self._target = _frame_view(np, target)
+        self._out = _frame_view(np, frame)
+
+    def compute_frame(self, t: float) -> FrameBuffer:
+        np = self._np
+        prev = self._prev.astype(np.float64)
+        delta = self._target.astype(np.float64) - prev
+        self._out[:] = np.rint(prev + delta * clamp01(t))
+        return self.frame
+
+
+class NumpyFireKernel:
+    def __init__(self, np: ModuleType, base: Mapping[Key, Color], *, frame: FrameBuffer, pace: float) -> None:
+        self.frame = frame
+        self._np = np
+        self._pace = float(pace)
+        self._rows = frame.rows
+        self._cols = frame.cols
+        self._base = np.asarray([base.get(key, FIRE_BASE_DEFAULT) for key in frame], dtype=np.float64)
+        self._heat = np.zeros((self._rows, self._cols), dtype=np.float64)
+        self._out = _frame_view(np, frame)
+
+    def _diffuse(self) -> None:
+        heat = self._heat
+        for r in range(1, self._rows):
+            below = heat[r - 1]
+            below_l = below.copy()
+            below_l[1:] = below[:-1]
+            below_r = below.copy()
+            below_r[:-1] = below[1:]
+            heat[r] = (below + below_l + below_r) / 3.0
+
+    def compute_frame(self, t: float) -> FrameBuffer:
+        np = self._np
+        step_ratio = float(t)
+
+        cooling = 0.06 * self._pace * step_ratio
+        np.maximum(self._heat - cooling, 0.0, out=self._heat)
+
+        sparks = max(1, round((2 * self._pace) * step_ratio))
+        heat = self._heat
+        for r, c, amount in fire_spark_points(num_rows=self._rows, num_cols=self._cols, sparks=sparks):
+            heat[r, c] = min(1.0, float(heat[r, c]) + amount)
+        self._diffuse()
+
+        heat = heat.reshape(-1)
+        hh = np.clip(heat, 0.0, 1.0)
+        low = hh < 0.5
+        t_low = hh / 0.5
+        t_high = (hh - 0.5) / 0.5
+        fire = np.empty((heat.shape[0], 3), dtype=np.float64)
+        fire[:, 0] = np.where(low, np.trunc(255 * t_low), 255.0)
+        fire[:, 1] = np.where(low, np.trunc(80 * t_low), np.trunc(80 + (175 * t_high)))
+        fire[:, 2] = np.where(low, 0.0, np.trunc(0 + (20 * t_high)))
+
+        weight = np.clip(np.minimum(heat * 0.95, 1.0), 0.0, 1.0)[:, None]
+        self._out[:] = np.rint(self._base + (fire - self._base) * weight)
+        return self.frame
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import Protocol, TypeVar, cast
 
 from keyrgb.core.backends.base import supports_per_key_output
+from keyrgb.core.effects.frame_buffer import FrameBuffer
 from keyrgb.core.effects.transitions import avoid_full_black
 from keyrgb.core.utils.exceptions import is_permission_denied
 from keyrgb.core.utils.logging_utils import log_throttled
@@ -111,6 +112,8 @@ def software_render_targets(engine: object) -> list[SoftwareRenderTarget]:
 def average_color_map(color_map: Mapping[KeyT, Color]) -> Color:
     if not color_map:
         return (0, 0, 0)
+    if isinstance(color_map, FrameBuffer):
+        return color_map.average_rgb()
 
     red = sum(color[0] for color in color_map.values())
     green = sum(color[1] for color in color_map.values())
@@ -10,6 +10,8 @@ import logging
 import time
 from typing import TYPE_CHECKING, Protocol
 
+from keyrgb.core.runtime.uevent_monitor import running_uevent_monitor
+
 from ._manager_helpers import is_power_event_forced_off
 from ._manager_source_iteration import PowerSourceIterationPlan, stabilize_power_source_state
 
@@ -46,6 +48,18 @@ def _manager_module():
     return manager_module
 
 
+def _wait_for_next_poll(poll_interval_s: float, *, sleep_fn=None) -> None:
+    """Sleep until the next power-source poll, waking early on a power-supply uevent."""
+
+    if sleep_fn is None:
+        monitor = running_uevent_monitor()
+        if monitor is not None:
+            monitor.wait_for_power_supply_change(poll_interval_s)
+            return
+        sleep_fn = _manager_module().time.sleep
+    sleep_fn(poll_interval_s)
+
+
 def run_battery_saver_iteration(
     manager: BatterySaverManager,
     policy,
@@ -59,13 +73,12 @@ def run_battery_saver_iteration(
 ) -> bool:
     sync_lid_fn()
 
-    sleep = sleep_fn or _manager_module().time.sleep
     if manager._lid_closed and manager._flag("power_off_on_lid_close", True):
-        sleep(poll_interval_s)
+        _wait_for_next_poll(poll_interval_s, sleep_fn=sleep_fn)
         return True
 
     if keyboard_is_power_event_forced_off_fn():
-        sleep(poll_interval_s)
+        _wait_for_next_poll(poll_interval_s, sleep_fn=sleep_fn)
         return True
 
     plan = classify_fn(policy)
@@ -122,7 +135,7 @@ def execute_battery_saver_iteration_plan(
     activate_perkey_profile_fn,
 ) -> bool:
     if plan.should_sleep:
-        _manager_module().time.sleep(poll_interval_s)
+        _wait_for_next_poll(poll_interval_s)
         return True
 
     _manager_module().apply_power_source_actions(
@@ -143,6 +156,9 @@ def battery_saver_loop(
 ) -> None:
     """Poll AC online state and apply a simple dim/restore policy.
 
+    With the uevent monitor running, AC reads come from its cache and each
+    wait ends as soon as a power-supply uevent arrives.
+
     Requirements:
     - no root required
     - debounce rapid toggling
@@ -161,7 +177,7 @@ def battery_saver_loop(
         if did_sleep:
             continue
 
-        _manager_module().time.sleep(poll_interval_s)
+        _wait_for_next_poll(poll_interval_s)
 
 
 def stabilize_on_ac_state(manager: BatterySaverManager, raw_on_ac: bool | None) -> bool | None:
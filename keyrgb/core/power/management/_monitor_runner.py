@@ -157,7 +157,7 @@ def run_monitor_loop(
     """Run the primary login1 monitor with ACPI fallback."""
 
     try:
-        logger.info("Power monitoring started using dbus-monitor")
+        logger.info("Power monitoring started using logind PrepareForSleep")
 
         monitor_prepare_for_sleep_fn(
             is_running=lambda: manager.monitoring,
@@ -169,7 +169,7 @@ def run_monitor_loop(
         )
 
     except FileNotFoundError:
-        logger.warning("dbus-monitor not available, trying alternative method")
+        logger.warning("System bus and dbus-monitor not available, trying alternative method")
         monitor_acpi_events_fn()
     except monitor_errors:  # @quality-exception exception-transparency: login1 monitoring is an external runtime boundary and power monitoring must remain available on recoverable runtime failures
         logger.exception("Power monitoring error")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 # @quality-exception file-size-analysis: PowerManager public facade after battery-saver extract; remaining methods are thin event/monitor delegates
 import logging
+import os
 import threading
 import time
 from typing import TYPE_CHECKING
@@ -59,6 +60,8 @@ start_sysfs_lid_monitoring = _manager_runtime_deps.start_sysfs_lid_monitoring
 get_active_perkey_profile = perkey_profiles.get_active_profile
 list_perkey_profiles = perkey_profiles.list_profiles
 
+DISABLE_RESUME_FAST_PATH_ENV = "KEYRGB_DISABLE_RESUME_FAST_PATH"
+
 # Stable test/monkeypatch seam retained from the battery-saver extraction.
 _DEFAULT_POWER_SOURCE_POLL_INTERVAL_S = _battery_saver._DEFAULT_POWER_SOURCE_POLL_INTERVAL_S
 
@@ -85,6 +88,18 @@ def _active_tray_transition_revision(tray: object) -> int | None:
     return tray.active_runtime_transition_revision()  # type: ignore[attr-defined]
 
 
+def resume_fast_path_enabled() -> bool:
+    return str(os.environ.get(DISABLE_RESUME_FAST_PATH_ENV, "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def _tray_class_callable(tray: object, name: str):
+    """Bound ``name`` when the controller's class defines it; mocks and older facades get ``None``."""
+
+    if not callable(getattr(type(tray), name, None)):
+        return None
+    return getattr(tray, name)
+
+
 def _tray_callable(tray: object, name: str):
     try:
         instance_callback = vars(tray).get(name)
@@ -569,8 +584,16 @@ class PowerManager:
             dispatch_transition,
         )
 
+    def _arm_resume_restore(self) -> None:
+        arm = _tray_class_callable(self.kb_controller, "arm_resume_restore")
+        if arm is None or not resume_fast_path_enabled():
+            return
+        self._run_recoverable_runtime_boundary(arm, log_message="Arming the resume restore failed")
+
     def _on_suspend(self) -> None:
         """Called when system is about to suspend."""
+        # Resolve the resume restore while the keyboard still shows it; resume then only writes.
+        self._arm_resume_restore()
         self._run_received_power_event(
             lambda: self._dispatch_power_event_route(
                 flag_name="power_off_on_suspend",
@@ -583,14 +606,19 @@ class PowerManager:
 
     def _on_resume(self) -> None:
         """Called when system resumes from suspend."""
+        # Controllers with the pre-armed fast path retry the device reopen themselves instead of
+        # waiting out a fixed settle delay.
+        fast_path = (
+            resume_fast_path_enabled() and _tray_class_callable(self.kb_controller, "restore_after_resume") is not None
+        )
         self._run_received_power_event(
             lambda: self._dispatch_power_event_route(
                 flag_name="power_restore_on_resume",
                 log_message="System resumed - restoring keyboard backlight",
-                delay_s=0.5,
+                delay_s=0.0 if fast_path else 0.5,
                 policy_method=self._event_policy.handle_power_restore_event,
                 expected_action_type=RestoreFromEvent,
-                kb_method_name="restore",
+                kb_method_name="restore_after_resume" if fast_path else "restore",
             )
         )
 
@@ -1,11 +1,61 @@
+"""logind ``PrepareForSleep`` listener.
+
+The tray listens on the system bus itself (``keyrgb.core.utils.dbus``), so
+suspend and resume edges reach the callbacks straight from the socket read.
+If the bus cannot be reached natively, or with
+``KEYRGB_DISABLE_NATIVE_LOGIND=1``, it parses ``dbus-monitor --system`` output
+as before.
+"""
+
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 from collections.abc import Callable, Iterable, Iterator
 
+from keyrgb.core.utils.dbus.connection import BusConnection
+from keyrgb.core.utils.dbus.marshalling import SIGNAL, DBusMessage
+
 _logger = logging.getLogger(__name__)
 
+DISABLE_NATIVE_LOGIND_ENV = "KEYRGB_DISABLE_NATIVE_LOGIND"
+
+_LOGIN1_INTERFACE = "org.freedesktop.login1.Manager"
+_LOGIN1_PATH = "/org/freedesktop/login1"
+_PREPARE_FOR_SLEEP_MATCH = (
+    "type='signal',sender='org.freedesktop.login1',"
+    f"interface='{_LOGIN1_INTERFACE}',member='PrepareForSleep',path='{_LOGIN1_PATH}'"
+)
+
+
+def native_logind_enabled() -> bool:
+    return str(os.environ.get(DISABLE_NATIVE_LOGIND_ENV, "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def prepare_for_sleep_value(message: DBusMessage) -> bool | None:
+    """Return the ``PrepareForSleep`` argument, or ``None`` for any other message."""
+
+    if (
+        message.message_type != SIGNAL
+        or message.interface != _LOGIN1_INTERFACE
+        or message.member != "PrepareForSleep"
+        or message.signature != "b"
+    ):
+        return None
+    (start,) = message.unpack_body()
+    return bool(start)
+
+
+class _BusListenerHandle:
+    """Stands in for the ``dbus-monitor`` process in the manager's terminate hook."""
+
+    def __init__(self, connection: BusConnection) -> None:
+        self._connection = connection
+
+    def terminate(self) -> None:
+        self._connection.shutdown()
+
 
 def iter_prepare_for_sleep_events(lines: Iterable[str]) -> Iterator[bool]:
     """Parse `dbus-monitor` output for logind PrepareForSleep events.
@@ -41,7 +91,29 @@ def monitor_prepare_for_sleep(
     on_process_started: Callable[[object], None] | None = None,
     on_process_stopped: Callable[[object], None] | None = None,
 ) -> None:
-    """Run `dbus-monitor` for logind PrepareForSleep and invoke callbacks."""
+    """Listen for logind PrepareForSleep and invoke callbacks.
+
+    Uses a native system-bus connection when one can be opened and
+    ``dbus-monitor`` otherwise. The object passed to ``on_process_started``
+    has a ``terminate()`` that ends the listener either way.
+    """
+
+    if native_logind_enabled():
+        try:
+            connection = _open_prepare_for_sleep_bus()
+        except OSError as exc:
+            _logger.info("Cannot listen to logind on the system bus (%s); using dbus-monitor", exc)
+        else:
+            _listen_prepare_for_sleep(
+                connection,
+                is_running=is_running,
+                on_suspend=on_suspend,
+                on_resume=on_resume,
+                on_started=on_started,
+                on_process_started=on_process_started,
+                on_process_stopped=on_process_stopped,
+            )
+            return
 
     cmd = [
         "dbus-monitor",
@@ -91,6 +163,49 @@ def monitor_prepare_for_sleep(
             on_process_stopped(process)
 
 
+def _open_prepare_for_sleep_bus() -> BusConnection:
+    connection = BusConnection.connect_system_bus()
+    try:
+        connection.add_match(_PREPARE_FOR_SLEEP_MATCH)
+    except OSError:
+        connection.close()
+        raise
+    return connection
+
+
+def _listen_prepare_for_sleep(
+    connection: BusConnection,
+    *,
+    is_running: Callable[[], bool],
+    on_suspend: Callable[[], None],
+    on_resume: Callable[[], None],
+    on_started: Callable[[], None] | None,
+    on_process_started: Callable[[object], None] | None,
+    on_process_stopped: Callable[[object], None] | None,
+) -> None:
+    handle = _BusListenerHandle(connection)
+    try:
+        if on_process_started is not None:
+            on_process_started(handle)
+        if on_started is not None:
+            on_started()
+
+        if not is_running():
+            return
+        for message in connection.messages():
+            if not is_running():
+                break
+            suspending = prepare_for_sleep_value(message)
+            if suspending is True:
+                on_suspend()
+            elif suspending is False:
+                on_resume()
+    finally:
+        connection.close()
+        if on_process_stopped is not None:
+            on_process_stopped(handle)
+
+
 def _terminate_process(process: subprocess.Popen) -> None:
     """Best-effort termination and cleanup of a Popen subprocess."""
     terminate = getattr(process, "terminate", None)
@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 from pathlib import Path
 
+from keyrgb.core.runtime.uevent_monitor import running_uevent_monitor
+
 _POWER_SUPPLY_ENUMERATION_EXCEPTIONS = (OSError,)
 _POWER_SUPPLY_TEXT_READ_EXCEPTIONS = (OSError, UnicodeError)
 
@@ -40,6 +42,37 @@ def iter_ac_online_files(power_supply_root: Path) -> list[Path]:
 
 
 def read_on_ac_power(*, power_supply_root: Path | None = None) -> bool | None:
+    """Return whether mains power is online, ``None`` when unknown.
+
+    While the tray's uevent monitor runs, this is its cached AC state and no
+    sysfs file is read.
+    """
+
+    if power_supply_root is None and "KEYRGB_SYSFS_POWER_SUPPLY_ROOT" not in os.environ:
+        monitor = running_uevent_monitor()
+        cached = None if monitor is None else monitor.on_ac_power
+        if cached is not None:
+            return cached
+    return read_on_ac_power_from_sysfs(power_supply_root=power_supply_root)
+
+
+def read_mains_online_from_sysfs(*, power_supply_root: Path | None = None) -> dict[str, bool | None]:
+    """Map each mains supply name to its ``online`` state, ``None`` when unreadable."""
+
+    if power_supply_root is None:
+        power_supply_root = Path(os.environ.get("KEYRGB_SYSFS_POWER_SUPPLY_ROOT", "/sys/class/power_supply"))
+
+    states: dict[str, bool | None] = {}
+    for online_path in iter_ac_online_files(power_supply_root):
+        try:
+            raw = online_path.read_text(errors="ignore").strip()
+        except _POWER_SUPPLY_TEXT_READ_EXCEPTIONS:
+            raw = ""
+        states[online_path.parent.name] = raw == "1" if raw in ("1", "0") else None
+    return states
+
+
+def read_on_ac_power_from_sysfs(*, power_supply_root: Path | None = None) -> bool | None:
     if power_supply_root is None:
         power_supply_root = Path(os.environ.get("KEYRGB_SYSFS_POWER_SUPPLY_ROOT", "/sys/class/power_supply"))
 
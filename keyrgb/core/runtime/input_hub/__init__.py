@@ -0,0 +1,25 @@
+"""Shared evdev input hub for the tray process; see ``hub`` for the design."""
+
+from __future__ import annotations
+
+from ._epoll_loop import MODIFIER_KEY_CODES
+from ._subscription import KeypressSubscription
+from .hub import (
+    DISABLE_INPUT_HUB_ENV,
+    InputHub,
+    input_hub_enabled,
+    running_input_hub,
+    start_input_hub,
+    stop_input_hub,
+)
+
+__all__ = [
+    "DISABLE_INPUT_HUB_ENV",
+    "MODIFIER_KEY_CODES",
+    "InputHub",
+    "KeypressSubscription",
+    "input_hub_enabled",
+    "running_input_hub",
+    "start_input_hub",
+    "stop_input_hub",
+]
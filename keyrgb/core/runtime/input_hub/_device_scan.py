@@ -0,0 +1,171 @@
+"""Open, classify and drop the input hub's evdev devices."""
+
+from __future__ import annotations
+
+import logging
+import select
+import threading
+import warnings
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Protocol, cast
+
+from keyrgb.core.utils.linux.evdev_reader import device_fd
+
+logger = logging.getLogger("keyrgb.core.runtime.input_hub")
+
+_RECOVERABLE_DEVICE_EXCEPTIONS = (AttributeError, OSError, RuntimeError, TypeError, ValueError)
+
+
+class _InputEventProtocol(Protocol):
+    type: int
+    code: int
+    value: int
+
+
+class InputDeviceProtocol(Protocol):
+    def fileno(self) -> int: ...
+    def read(self) -> Iterable[_InputEventProtocol]: ...
+    def capabilities(self, verbose: bool = False) -> Mapping[object, Sequence[object]]: ...
+    def close(self) -> None: ...
+
+
+def _is_user_input(props: Mapping[str, str]) -> bool:
+    return (
+        props.get("ID_INPUT_KEYBOARD") == "1"
+        or props.get("ID_INPUT_MOUSE") == "1"
+        or props.get("ID_INPUT_TOUCHPAD") == "1"
+    )
+
+
+def default_list_devices() -> Sequence[str]:
+    import evdev
+
+    return list(evdev.list_devices())
+
+
+def default_open_device(path: str) -> InputDeviceProtocol:
+    import evdev
+
+    return cast(InputDeviceProtocol, evdev.InputDevice(path))
+
+
+def _close_device(dev: InputDeviceProtocol) -> None:
+    try:
+        # evdev 1.9.3 calls asyncio.get_event_loop() from its synchronous
+        # close path; see InputIdleTracker.close.
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore",
+                message="There is no current event loop",
+                category=DeprecationWarning,
+                module=r"evdev\.eventio_async",
+            )
+            dev.close()
+    except _RECOVERABLE_DEVICE_EXCEPTIONS:
+        pass
+
+
+@dataclass
+class HubDevice:
+    path: str
+    handle: InputDeviceProtocol
+    fd: int
+    user_input: bool
+    keyboard: bool
+    reactive: bool
+
+    @property
+    def activity_only(self) -> bool:
+        """Whether the device only feeds ``last_activity_at`` (mice, touchpads)."""
+
+        return not (self.keyboard or self.reactive)
+
+
+class _DeviceScanMixin:
+    """Track ``/dev/input`` nodes: classify new ones, register them, drop stale ones."""
+
+    _list_devices_fn: Callable[[], Sequence[str]]
+    _open_device_fn: Callable[[str], InputDeviceProtocol]
+    _read_properties_fn: Callable[[str], Mapping[str, str]]
+    _looks_like_keyboard_fn: Callable[[InputDeviceProtocol], bool]
+    _lock: threading.Lock
+    _epoll: select.epoll | None
+    _devices: dict[int, HubDevice]
+    _fds_by_path: dict[str, int]
+    _ignored_paths: set[str]
+    _disarmed_fds: set[int]
+    input_device_count: int
+    keyboard_count: int
+
+    def _rescan(self) -> None:
+        try:
+            paths = {str(path) for path in self._list_devices_fn()}
+        except (ImportError, *_RECOVERABLE_DEVICE_EXCEPTIONS) as exc:
+            logger.debug("Input hub could not list evdev devices: %s", exc)
+            return
+        for path, fd in list(self._fds_by_path.items()):
+            if path not in paths:
+                self._drop(self._devices[fd])
+        self._ignored_paths &= paths
+        for path in sorted(paths - self._fds_by_path.keys() - self._ignored_paths):
+            self._open(path)
+        self._update_counts()
+
+    def _open(self, path: str) -> None:
+        props = self._read_properties_fn(path)
+        if props and not _is_user_input(props):
+            self._ignored_paths.add(path)
+            return
+        try:
+            handle = self._open_device_fn(path)
+        except _RECOVERABLE_DEVICE_EXCEPTIONS:
+            # Often permissions udev has not applied yet; IN_ATTRIB retries.
+            return
+        fd = device_fd(handle)
+        keyboard = props.get("ID_INPUT_KEYBOARD") == "1"
+        # Without a udev record, fall back to the reactive capability check;
+        # such devices feed keypresses but, as before, not idle activity.
+        reactive = keyboard if props else self._looks_like_keyboard_fn(handle)
+        if fd is None or not (props or reactive):
+            _close_device(handle)
+            return
+        epoll = self._epoll
+        if epoll is None:
+            _close_device(handle)
+            return
+        device = HubDevice(
+            path=path,
+            handle=handle,
+            fd=fd,
+            user_input=bool(props),
+            keyboard=keyboard,
+            reactive=reactive,
+        )
+        with self._lock:
+            try:
+                epoll.register(fd, select.EPOLLIN | (select.EPOLLONESHOT if device.activity_only else 0))
+            except OSError:
+                _close_device(handle)
+                return
+            self._devices[fd] = device
+        self._fds_by_path[path] = fd
+
+    def _drop(self, device: HubDevice) -> None:
+        # Under the lock so rearm_activity_devices() never touches a closed fd.
+        with self._lock:
+            self._devices.pop(device.fd, None)
+            self._disarmed_fds.discard(device.fd)
+            if self._epoll is not None:
+                try:
+                    self._epoll.unregister(device.fd)
+                except (OSError, ValueError):
+                    pass
+        if self._fds_by_path.get(device.path) == device.fd:
+            del self._fds_by_path[device.path]
+        _close_device(device.handle)
+
+    def _update_counts(self) -> None:
+        devices = tuple(self._devices.values())
+        self.input_device_count = sum(1 for device in devices if device.user_input)
+        self.keyboard_count = sum(1 for device in devices if device.reactive)
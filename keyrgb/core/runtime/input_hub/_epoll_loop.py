@@ -0,0 +1,145 @@
+"""The input hub thread: epoll every device fd and fan the events out."""
+
+from __future__ import annotations
+
+import logging
+import select
+import threading
+from collections.abc import Callable
+
+from keyrgb.core.utils.linux.evdev_reader import EV_KEY, INPUT_EVENT, KEY_DOWN, KeydownReader
+from keyrgb.core.utils.linux.inotify import DirectoryWatch
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+
+from ._device_scan import _RECOVERABLE_DEVICE_EXCEPTIONS, HubDevice
+from ._subscription import KeypressSubscription
+
+logger = logging.getLogger("keyrgb.core.runtime.input_hub")
+
+# A touchpad gesture on the affected KDE/Tongfang setup emits synthetic
+# KEY_LEFTMETA through the physical AT keyboard fd, so device classification
+# alone cannot distinguish it from typing. Only a non-modifier keydown counts
+# as keyboard activity for waking keyboard lighting.
+MODIFIER_KEY_CODES = frozenset(
+    {
+        29,  # KEY_LEFTCTRL
+        42,  # KEY_LEFTSHIFT
+        54,  # KEY_RIGHTSHIFT
+        56,  # KEY_LEFTALT
+        97,  # KEY_RIGHTCTRL
+        100,  # KEY_RIGHTALT
+        125,  # KEY_LEFTMETA
+        126,  # KEY_RIGHTMETA
+    }
+)
+
+# Without inotify, rescan /dev/input on the interval the idle tracker used.
+_RESCAN_INTERVAL_S = 30.0
+# Stop polling interval when eventfd is unavailable for the stop event.
+_STOP_POLL_INTERVAL_S = 0.5
+
+
+class _EpollLoopMixin:
+    """Wait on the device, hotplug and stop fds; record activity and publish keydowns."""
+
+    _monotonic_fn: Callable[[], float]
+    _lock: threading.Lock
+    _stop_event: WakeEvent
+    _epoll: select.epoll | None
+    _watch: DirectoryWatch | None
+    _devices: dict[int, HubDevice]
+    _disarmed_fds: set[int]
+    _subscribers: tuple[KeypressSubscription, ...]
+    _reader: KeydownReader | None
+    _codes: list[int]
+    last_activity_at: float
+    last_keyboard_activity_at: float
+    _rescan: Callable[[], None]
+    _drop: Callable[[HubDevice], None]
+    _update_counts: Callable[[], None]
+
+    def rearm_activity_devices(self) -> None:
+        """Re-arm the one-shot mice and touchpads that fired; the idle poller calls this after reading."""
+
+        with self._lock:
+            epoll = self._epoll
+            fds, self._disarmed_fds = self._disarmed_fds, set()
+            if epoll is None:
+                return
+            for fd in fds:
+                if fd not in self._devices:
+                    continue
+                try:
+                    epoll.modify(fd, select.EPOLLIN | select.EPOLLONESHOT)
+                except (OSError, ValueError):
+                    pass
+
+    def _run(self) -> None:
+        epoll = self._epoll
+        if epoll is None:
+            return
+        stop_fd = self._stop_event.wake_fd()
+        next_rescan_at = float(self._monotonic_fn()) + _RESCAN_INTERVAL_S
+        while not self._stop_event.is_set():
+            timeout: float | None = None
+            if self._watch is None:
+                timeout = max(0.0, next_rescan_at - float(self._monotonic_fn()))
+            if stop_fd is None:
+                timeout = _STOP_POLL_INTERVAL_S if timeout is None else min(timeout, _STOP_POLL_INTERVAL_S)
+            try:
+                events = epoll.poll(timeout)
+            except OSError as exc:
+                logger.warning("Input hub wait failed; stopping the hub: %s", exc)
+                return
+
+            now = float(self._monotonic_fn())
+            rescan = self._watch is None and now >= next_rescan_at
+            for fd, _mask in events:
+                if fd == stop_fd:
+                    continue
+                if self._watch is not None and fd == self._watch.fileno():
+                    rescan = self._watch.read_events() or rescan
+                    continue
+                self._drain(fd, now)
+            if self._watch is not None and self._watch.lost:
+                epoll.unregister(self._watch.fileno())
+                self._watch.close()
+                self._watch = None
+            if rescan:
+                self._rescan()
+                next_rescan_at = now + _RESCAN_INTERVAL_S
+
+    def _drain(self, fd: int, now: float) -> None:
+        device = self._devices.get(fd)
+        if device is None:
+            return
+        codes = self._codes
+        codes.clear()
+        try:
+            if self._reader is not None:
+                self._reader.read_keydown_codes(fd, codes)
+            else:
+                for event in device.handle.read():
+                    if event.type == EV_KEY and event.value == KEY_DOWN:
+                        codes.append(int(event.code))
+        except _RECOVERABLE_DEVICE_EXCEPTIONS as exc:
+            logger.debug("Input hub dropping %s after a read failure: %s", device.path, exc)
+            self._drop(device)
+            self._update_counts()
+            return
+
+        if device.user_input:
+            self.last_activity_at = now
+        if device.activity_only:
+            with self._lock:
+                self._disarmed_fds.add(fd)
+            return
+        if not codes:
+            return
+        if device.keyboard and any(code not in MODIFIER_KEY_CODES for code in codes):
+            self.last_keyboard_activity_at = now
+        subscribers = self._subscribers
+        if device.reactive and subscribers:
+            payload = b"".join(INPUT_EVENT.pack(0, 0, EV_KEY, code, KEY_DOWN) for code in codes)
+            for subscription in subscribers:
+                subscription.publish(payload)
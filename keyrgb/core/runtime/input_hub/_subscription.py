@@ -0,0 +1,86 @@
+"""Keypress subscriptions handed out by the input hub."""
+
+from __future__ import annotations
+
+import os
+import select
+import threading
+from typing import NamedTuple, Protocol
+
+from keyrgb.core.utils.linux.evdev_reader import INPUT_EVENT
+
+# Pipe writes up to PIPE_BUF are atomic, so a record is never split.
+_PUBLISH_CHUNK = (getattr(select, "PIPE_BUF", 512) // INPUT_EVENT.size) * INPUT_EVENT.size
+
+
+class _KeyEvent(NamedTuple):
+    type: int
+    code: int
+    value: int
+
+
+class _SubscriptionOwnerProtocol(Protocol):
+    def unsubscribe(self, subscription: KeypressSubscription) -> None: ...
+
+
+class KeypressSubscription:
+    """Keydowns from the hub's keyboards, readable like one evdev keyboard.
+
+    ``fileno()`` is the read end of a non-blocking pipe carrying ``struct
+    input_event`` keydown records, so ``select``/``epoll`` and
+    ``KeydownReader`` treat the subscription as a device; ``read()`` is the
+    python-evdev style fallback. Records are dropped while the pipe is full,
+    as the kernel drops events for an evdev client that falls behind.
+    """
+
+    path = "keyrgb-input-hub"
+    name = "KeyRGB input hub"
+
+    def __init__(self, hub: _SubscriptionOwnerProtocol, read_fd: int, write_fd: int) -> None:
+        self._hub = hub
+        self._lock = threading.Lock()
+        self._read_fd = read_fd
+        self._write_fd = write_fd
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    def capabilities(self, verbose: bool = False) -> dict[object, list[object]]:
+        return {}
+
+    def read(self) -> list[_KeyEvent]:
+        events: list[_KeyEvent] = []
+        record_size = INPUT_EVENT.size
+        while True:
+            try:
+                data = os.read(self._read_fd, _PUBLISH_CHUNK)
+            except BlockingIOError:
+                break
+            usable = len(data) - (len(data) % record_size)
+            for _sec, _usec, ev_type, code, value in INPUT_EVENT.iter_unpack(data[:usable]):
+                events.append(_KeyEvent(ev_type, code, value))
+            if len(data) < _PUBLISH_CHUNK:
+                break
+        return events
+
+    def publish(self, payload: bytes) -> None:
+        with self._lock:
+            if self._write_fd < 0:
+                return
+            for offset in range(0, len(payload), _PUBLISH_CHUNK):
+                try:
+                    os.write(self._write_fd, payload[offset : offset + _PUBLISH_CHUNK])
+                except OSError:
+                    return
+
+    def close(self) -> None:
+        self._hub.unsubscribe(self)
+        with self._lock:
+            read_fd, write_fd = self._read_fd, self._write_fd
+            self._read_fd = self._write_fd = -1
+        for fd in (read_fd, write_fd):
+            if fd >= 0:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
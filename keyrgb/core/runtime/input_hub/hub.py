@@ -0,0 +1,222 @@
+"""Shared evdev input hub for the tray process.
+
+Reactive effects and the idle-power poller used to open and read their own
+sets of ``/dev/input`` devices, each classifying them from ``/run/udev/data``.
+``InputHub`` owns a single set of fds instead. Devices are classified once when
+they appear, hotplug is picked up through inotify on ``/dev/input``, and one
+thread epolls every fd and fans the events out:
+
+- idle activity timestamps: ``last_activity_at`` for any user input and
+  ``last_keyboard_activity_at`` for non-modifier keyboard keydowns, read by the
+  idle-power ``InputIdleTracker``;
+- keydown codes for reactive effects, written as ``struct input_event``
+  records into one pipe per ``KeypressSubscription`` so the effect loops read
+  and epoll a subscription exactly like an evdev keyboard fd.
+
+Keyboards stay armed in epoll all the time. Mice and touchpads only feed the
+idle timestamp, which the idle poller reads every few seconds, so they are
+registered ``EPOLLONESHOT``: the first event after a re-arm is drained and
+recorded, and the device stays quiet until the idle poll calls
+``rearm_activity_devices()``. Pointer motion therefore wakes the hub at most
+once per idle poll instead of once per event batch.
+
+The tray starts the hub with its pollers. Other processes, and the tray when
+``KEYRGB_DISABLE_INPUT_HUB=1``, never start one and keep opening devices
+directly.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import select
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+
+from keyrgb.core.utils.linux import evdev_reader
+from keyrgb.core.utils.linux.inotify import IN_ATTRIB, IN_CREATE, IN_DELETE, DirectoryWatch
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+
+from ._device_scan import HubDevice, InputDeviceProtocol, _DeviceScanMixin, default_list_devices, default_open_device
+from ._epoll_loop import _EpollLoopMixin
+from ._subscription import KeypressSubscription
+
+logger = logging.getLogger("keyrgb.core.runtime.input_hub")
+
+DISABLE_INPUT_HUB_ENV = "KEYRGB_DISABLE_INPUT_HUB"
+INPUT_DIR = "/dev/input"
+
+_HOTPLUG_EVENTS = IN_CREATE | IN_DELETE | IN_ATTRIB
+
+
+def input_hub_enabled() -> bool:
+    return str(os.environ.get(DISABLE_INPUT_HUB_ENV, "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+class InputHub(_EpollLoopMixin, _DeviceScanMixin):
+    """Own the tray's evdev fds and fan their events out to subscribers."""
+
+    def __init__(
+        self,
+        *,
+        input_dir: str = INPUT_DIR,
+        list_devices_fn: Callable[[], Sequence[str]] = default_list_devices,
+        open_device_fn: Callable[[str], InputDeviceProtocol] = default_open_device,
+        read_properties_fn: Callable[[str], Mapping[str, str]] = evdev_reader.read_udev_input_properties,
+        looks_like_keyboard_fn: Callable[[InputDeviceProtocol], bool] = evdev_reader.looks_like_keyboard,
+        monotonic_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._input_dir = input_dir
+        self._list_devices_fn = list_devices_fn
+        self._open_device_fn = open_device_fn
+        self._read_properties_fn = read_properties_fn
+        self._looks_like_keyboard_fn = looks_like_keyboard_fn
+        self._monotonic_fn = monotonic_fn
+
+        self._lock = threading.Lock()
+        self._stop_event = WakeEvent()
+        self._thread: threading.Thread | None = None
+        self._epoll: select.epoll | None = None
+        self._watch: DirectoryWatch | None = None
+        self._devices: dict[int, HubDevice] = {}
+        self._fds_by_path: dict[str, int] = {}
+        self._ignored_paths: set[str] = set()
+        # One-shot activity devices that fired since the last re-arm.
+        self._disarmed_fds: set[int] = set()
+        self._subscribers: tuple[KeypressSubscription, ...] = ()
+        self._reader = evdev_reader.KeydownReader() if evdev_reader.raw_evdev_enabled() else None
+        self._codes: list[int] = []
+
+        self.input_device_count = 0
+        self.keyboard_count = 0
+        self.last_activity_at = float(monotonic_fn())
+        self.last_keyboard_activity_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive() and not self._stop_event.is_set()
+
+    @property
+    def has_input_devices(self) -> bool:
+        """Whether any keyboard, mouse or touchpad feeds the activity timestamps."""
+
+        return self.input_device_count > 0
+
+    @property
+    def has_keyboards(self) -> bool:
+        """Whether any keyboard feeds keypress subscriptions."""
+
+        return self.keyboard_count > 0
+
+    def start(self) -> bool:
+        """Open the devices and start the hub thread; ``False`` when epoll is unavailable."""
+
+        if self._thread is not None:
+            return self.running
+        try:
+            self._epoll = select.epoll()
+        except (AttributeError, OSError):
+            return False
+        self._watch = DirectoryWatch.open(self._input_dir, None, mask=_HOTPLUG_EVENTS)
+        if self._watch is not None:
+            self._epoll.register(self._watch.fileno(), select.EPOLLIN)
+        stop_fd = self._stop_event.wake_fd()
+        if stop_fd is not None:
+            self._epoll.register(stop_fd, select.EPOLLIN)
+        self._rescan()
+        self._thread = threading.Thread(target=self._run, name="keyrgb-input-hub", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, *, timeout_s: float = 2.0) -> bool:
+        """Stop the thread and close every device; return whether the thread exited.
+
+        Subscriptions stay open, they just stop receiving keydowns; their
+        owners close them.
+        """
+
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=max(0.0, float(timeout_s)))
+            if thread.is_alive():
+                return False
+        with self._lock:
+            self._subscribers = ()
+        for device in list(self._devices.values()):
+            self._drop(device)
+        self._update_counts()
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
+        if self._epoll is not None:
+            self._epoll.close()
+            self._epoll = None
+        return True
+
+    def subscribe_keypresses(self) -> KeypressSubscription | None:
+        """Return a new keypress subscription, or ``None`` if the hub is not running."""
+
+        if not self.running:
+            return None
+        try:
+            read_fd, write_fd = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (AttributeError, OSError):
+            return None
+        subscription = KeypressSubscription(self, read_fd, write_fd)
+        with self._lock:
+            self._subscribers = (*self._subscribers, subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: KeypressSubscription) -> None:
+        with self._lock:
+            self._subscribers = tuple(sub for sub in self._subscribers if sub is not subscription)
+
+
+_hub_lock = threading.Lock()
+_hub: InputHub | None = None
+
+
+def start_input_hub() -> InputHub | None:
+    """Start the process-wide hub (the tray calls this); ``None`` when disabled or unavailable."""
+
+    global _hub
+    if not input_hub_enabled():
+        return None
+    try:
+        import evdev  # noqa: F401 - the hub opens devices through python-evdev
+    except ImportError:
+        return None
+    with _hub_lock:
+        if _hub is not None and _hub.running:
+            return _hub
+        hub = InputHub()
+        if not hub.start():
+            return None
+        _hub = hub
+        logger.info(
+            "Input hub started: %d input device(s), %d keyboard(s)",
+            hub.input_device_count,
+            hub.keyboard_count,
+        )
+        return hub
+
+
+def stop_input_hub(*, timeout_s: float = 2.0) -> bool:
+    """Stop the process-wide hub, if any; return whether its thread exited."""
+
+    global _hub
+    with _hub_lock:
+        hub, _hub = _hub, None
+    if hub is None:
+        return True
+    return hub.stop(timeout_s=timeout_s)
+
+
+def running_input_hub() -> InputHub | None:
+    """Return the process-wide hub while it runs, else ``None``."""
+
+    hub = _hub
+    return hub if hub is not None and hub.running else None
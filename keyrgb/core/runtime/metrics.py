@@ -0,0 +1,328 @@
+"""In-process performance metrics for the lighting pipeline.
+
+A small registry of counters and fixed-bucket histograms fed from the hot
+paths that decide the achieved frame rate:
+
+- ``effects.frame_interval_ms``: start-to-start time between rendered frames.
+- ``effects.compute_ms``: effect-loop work from the start of a frame until it
+  is handed to ``render()``.
+- ``render.write_ms`` / ``render.reports_per_frame``: time spent pushing one
+  frame to the device and the HID/USB reports the writing thread sent for it.
+- ``hid.report_ms``, ``hid.reports``, ``hid.errors``: per-report transport
+  cost, fed by each backend's ``_send``/``_write_row``.
+- ``effects.frame_overruns``: reactive frames that blew their frame budget.
+- ``frames.written`` / ``frames.dropped``: the async frame writer mailbox.
+- ``tray.wakeups`` / ``tray.poller_callback_ms``: how often the tray poller
+  reactor wakes and how long each poller callback runs.
+
+Updates are plain integer adds without a lock. Under the GIL a concurrent
+update can at worst be lost, which is fine for statistics and keeps the
+cost to a few hundred nanoseconds per sample.
+
+The tray's poller reactor periodically exports a snapshot to
+``runtime_dir()/perf.json`` so ``keyrgb-diagnostics --perf`` can read it; the
+render paths never do file I/O themselves.
+Set ``KEYRGB_DISABLE_PERF_METRICS=1`` to turn recording off.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+DISABLE_PERF_METRICS_ENV = "KEYRGB_DISABLE_PERF_METRICS"
+PERF_SNAPSHOT_FILENAME = "perf.json"
+EXPORT_INTERVAL_S = 5.0
+
+MS_BUCKETS: tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 33.0, 66.0, 133.0, 266.0)
+COUNT_BUCKETS: tuple[float, ...] = (0, 1, 2, 4, 8, 12, 16, 32, 64, 128)
+
+# Gaps longer than this are pauses (effect switch, idle), not frames.
+_MAX_FRAME_INTERVAL_MS = 1000.0
+
+_T = TypeVar("_T")
+
+
+class Counter:
+    __slots__ = ("name", "value")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.value = 0
+
+    def add(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Histogram:
+    """Fixed upper-bound buckets plus one overflow bucket."""
+
+    __slots__ = ("bounds", "count", "counts", "name", "total")
+
+    def __init__(self, name: str, bounds: tuple[float, ...]) -> None:
+        self.name = name
+        self.bounds = tuple(sorted(float(bound) for bound in bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float | None:
+        """Return the upper bound of the bucket holding quantile ``q`` (the last bound when it overflowed)."""
+
+        if self.count <= 0:
+            return None
+        rank = max(1.0, float(q) * self.count)
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                break
+        return self.bounds[min(index, len(self.bounds) - 1)]
+
+    def snapshot(self) -> dict[str, object]:
+        count = self.count
+        return {
+            "count": count,
+            "mean": (self.total / count) if count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "bounds": list(self.bounds),
+            "buckets": list(self.counts),
+        }
+
+
+class MetricsRegistry:
+    def __init__(self, *, enabled: bool | None = None) -> None:
+        self.enabled = os.environ.get(DISABLE_PERF_METRICS_ENV) != "1" if enabled is None else bool(enabled)
+        self.started_s = time.monotonic()
+        self._lock = threading.Lock()
+        self._counters: dict[str, Counter] = {}
+        self._histograms: dict[str, Histogram] = {}
+
+    def counter(self, name: str) -> Counter:
+        with self._lock:
+            return self._counters.setdefault(name, Counter(name))
+
+    def histogram(self, name: str, bounds: tuple[float, ...] = MS_BUCKETS) -> Histogram:
+        with self._lock:
+            return self._histograms.setdefault(name, Histogram(name, bounds))
+
+    def reset(self) -> None:
+        with self._lock:
+            for counter in self._counters.values():
+                counter.value = 0
+            for histogram in self._histograms.values():
+                histogram.counts = [0] * len(histogram.counts)
+                histogram.count = 0
+                histogram.total = 0.0
+            self.started_s = time.monotonic()
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            counters = {name: counter.value for name, counter in sorted(self._counters.items())}
+            histograms = {name: hist.snapshot() for name, hist in sorted(self._histograms.items())}
+        return {
+            "uptime_s": round(time.monotonic() - self.started_s, 3),
+            "counters": counters,
+            "histograms": histograms,
+        }
+
+
+REGISTRY = MetricsRegistry()
+
+_FRAME_INTERVAL_MS = REGISTRY.histogram("effects.frame_interval_ms")
+_COMPUTE_MS = REGISTRY.histogram("effects.compute_ms")
+_WRITE_MS = REGISTRY.histogram("render.write_ms")
+_REPORTS_PER_FRAME = REGISTRY.histogram("render.reports_per_frame", COUNT_BUCKETS)
+_HID_REPORT_MS = REGISTRY.histogram("hid.report_ms")
+_HID_REPORTS = REGISTRY.counter("hid.reports")
+_HID_ERRORS = REGISTRY.counter("hid.errors")
+FRAME_OVERRUNS = REGISTRY.counter("effects.frame_overruns")
+FRAMES_WRITTEN = REGISTRY.counter("frames.written")
+FRAMES_DROPPED = REGISTRY.counter("frames.dropped")
+INPUT_WAKEUPS = REGISTRY.counter("reactive.input_wakeups")
+IDLE_PARKS = REGISTRY.counter("reactive.idle_parks")
+TRAY_WAKEUPS = REGISTRY.counter("tray.wakeups")
+TRAY_CALLBACK_MS = REGISTRY.histogram("tray.poller_callback_ms")
+
+_frame_state = threading.local()
+_last_export_s = 0.0
+
+
+def begin_frame() -> None:
+    """Mark the start of an effect-loop frame on the calling thread."""
+
+    if REGISTRY.enabled:
+        _frame_state.begin_s = time.perf_counter()
+
+
+def note_render_call() -> None:
+    """Record frame interval and compute time for a frame handed to ``render()``."""
+
+    if not REGISTRY.enabled:
+        return
+    now = time.perf_counter()
+    previous = getattr(_frame_state, "render_s", None)
+    _frame_state.render_s = now
+    if previous is not None:
+        interval_ms = (now - previous) * 1000.0
+        if interval_ms <= _MAX_FRAME_INTERVAL_MS:
+            _FRAME_INTERVAL_MS.observe(interval_ms)
+    begin = getattr(_frame_state, "begin_s", None)
+    if begin is not None:
+        _frame_state.begin_s = None
+        _COMPUTE_MS.observe((now - begin) * 1000.0)
+
+
+def _thread_reports() -> int:
+    return getattr(_frame_state, "reports", 0)
+
+
+def timed_frame_write(write: Callable[[], _T]) -> _T:
+    """Run one frame's device write and record its duration and report count.
+
+    Reports are counted per thread, so writes other engines or the tray make
+    meanwhile do not land in this frame's figure.
+    """
+
+    if not REGISTRY.enabled:
+        return write()
+    reports_before = _thread_reports()
+    started = time.perf_counter()
+    try:
+        return write()
+    finally:
+        _WRITE_MS.observe((time.perf_counter() - started) * 1000.0)
+        _REPORTS_PER_FRAME.observe(_thread_reports() - reports_before)
+
+
+def record_hid_report(elapsed_s: float) -> None:
+    if REGISTRY.enabled:
+        _HID_REPORTS.add()
+        _HID_REPORT_MS.observe(elapsed_s * 1000.0)
+        _frame_state.reports = _thread_reports() + 1
+
+
+def record_hid_error() -> None:
+    if REGISTRY.enabled:
+        _HID_ERRORS.add()
+
+
+def timed_hid_report(send: Callable[[bytes], _T], report: bytes) -> _T:
+    """Send one HID/USB report through ``send`` and record its cost.
+
+    An exception or a ``-1`` result (the hidapi failure value) counts as an error.
+    """
+
+    started = time.perf_counter()
+    sent = False
+    try:
+        result = send(report)
+        sent = not (isinstance(result, int) and result < 0)
+    finally:
+        if sent:
+            record_hid_report(time.perf_counter() - started)
+        else:
+            record_hid_error()
+    return result
+
+
+def perf_snapshot_path() -> Path:
+    from keyrgb.core.config.paths import runtime_dir
+
+    return runtime_dir() / PERF_SNAPSHOT_FILENAME
+
+
+def export_snapshot(path: Path | None = None) -> None:
+    target = perf_snapshot_path() if path is None else path
+    payload = {"pid": os.getpid(), "written_at": time.time(), "metrics": REGISTRY.snapshot()}
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, target)
+    except OSError as exc:
+        logger.debug("Could not export perf metrics to %s: %s", target, exc)
+
+
+def maybe_export_snapshot() -> None:
+    global _last_export_s
+
+    now = time.monotonic()
+    if now - _last_export_s < EXPORT_INTERVAL_S:
+        return
+    _last_export_s = now
+    export_snapshot()
+
+
+def read_exported_snapshot(path: Path | None = None) -> dict[str, object] | None:
+    target = perf_snapshot_path() if path is None else path
+    try:
+        payload = json.loads(target.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _hist(snapshot: Mapping[str, object], name: str) -> Mapping[str, object]:
+    histograms = snapshot.get("histograms")
+    value = histograms.get(name) if isinstance(histograms, Mapping) else None
+    return value if isinstance(value, Mapping) and value.get("count") else {}
+
+
+def _ms(value: object) -> str:
+    return f"{float(value):g} ms" if isinstance(value, (int, float)) else "n/a"
+
+
+def _int(value: object) -> int:
+    return int(value) if isinstance(value, (int, float)) else 0
+
+
+def summary_lines(snapshot: Mapping[str, object]) -> list[str]:
+    """Return short human-readable lines describing ``REGISTRY.snapshot()`` output."""
+
+    lines: list[str] = []
+    interval = _hist(snapshot, "effects.frame_interval_ms")
+    compute = _hist(snapshot, "effects.compute_ms")
+    write = _hist(snapshot, "render.write_ms")
+    reports = _hist(snapshot, "render.reports_per_frame")
+    hid = _hist(snapshot, "hid.report_ms")
+    raw_counters = snapshot.get("counters")
+    counters: Mapping[str, object] = raw_counters if isinstance(raw_counters, Mapping) else {}
+
+    mean_interval = interval.get("mean")
+    if isinstance(mean_interval, (int, float)) and mean_interval > 0:
+        lines.append(f"Frame rate: {1000.0 / float(mean_interval):.1f} fps")
+    if compute:
+        lines.append(f"Compute: p50 {_ms(compute.get('p50'))} · p90 {_ms(compute.get('p90'))}")
+    if write:
+        lines.append(f"Device write: p50 {_ms(write.get('p50'))} · p90 {_ms(write.get('p90'))}")
+    if reports:
+        lines.append(f"Reports/frame: p50 {reports.get('p50'):g} · p90 {reports.get('p90'):g}")
+    if hid:
+        errors = _int(counters.get("hid.errors"))
+        lines.append(f"HID report: p50 {_ms(hid.get('p50'))} · {_int(hid.get('count')):,} sent · {errors} errors")
+    dropped = _int(counters.get("frames.dropped"))
+    written = _int(counters.get("frames.written"))
+    if written or dropped:
+        lines.append(f"Frames: {written:,} written · {dropped:,} dropped")
+    compute_p50 = compute.get("p50")
+    write_p50 = write.get("p50")
+    if isinstance(compute_p50, (int, float)) and isinstance(write_p50, (int, float)):
+        lines.append(f"Limited by: {'device writes' if write_p50 > compute_p50 else 'effect compute'}")
+    return lines
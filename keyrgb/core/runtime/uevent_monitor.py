@@ -0,0 +1,316 @@
+"""Kernel uevent monitor for the tray process.
+
+Power-source changes used to be noticed by reading ``/sys/class/power_supply``
+every half second. ``UeventMonitor`` listens on a netlink uevent socket
+instead and turns the kernel's messages into typed events:
+
+- ``PowerSupplyEvent`` for ``power_supply`` changes, which also keep a cached
+  AC state that ``read_on_ac_power()`` returns without touching sysfs;
+- ``UsbDeviceEvent`` for ``usb`` and ``hidraw`` nodes of ITE controllers
+  (the vendor every USB backend targets) appearing or going away, which the
+  hardware poller uses to reacquire the keyboard.
+
+Subscribers are called on the monitor thread and must return quickly. The
+power-source loop waits on ``wait_for_power_supply_change()`` so it runs as
+soon as the AC state flips. The tray starts the monitor with its pollers;
+without netlink, or with ``KEYRGB_DISABLE_UEVENT_MONITOR=1``, everything reads
+sysfs as before.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import select
+import socket
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from keyrgb.core.utils.linux.uevent import Uevent, open_uevent_socket, read_uevents
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+
+logger = logging.getLogger(__name__)
+
+DISABLE_UEVENT_MONITOR_ENV = "KEYRGB_DISABLE_UEVENT_MONITOR"
+ITE_VENDOR_ID = 0x048D
+
+# Stop polling interval when eventfd is unavailable for the stop event.
+_STOP_POLL_INTERVAL_S = 0.5
+# ``.../0003:048D:6004.0005/hidraw/hidraw3``: bus, vendor and product of the HID device.
+_HIDRAW_PARENT = re.compile(r"/[0-9A-Fa-f]{4}:([0-9A-Fa-f]{4}):([0-9A-Fa-f]{4})\.[0-9A-Fa-f]+/hidraw/")
+_SUBSCRIBER_EXCEPTIONS = (AttributeError, LookupError, OSError, RuntimeError, TypeError, ValueError)
+
+
+@dataclass(frozen=True)
+class PowerSupplyEvent:
+    action: str
+    name: str
+    supply_type: str
+    online: bool | None
+
+
+@dataclass(frozen=True)
+class UsbDeviceEvent:
+    action: str
+    subsystem: str
+    vendor_id: int
+    product_id: int
+    devname: str | None
+
+
+DeviceEvent = PowerSupplyEvent | UsbDeviceEvent
+
+
+def uevent_monitor_enabled() -> bool:
+    return str(os.environ.get(DISABLE_UEVENT_MONITOR_ENV, "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def _usb_ids(event: Uevent) -> tuple[int, int] | None:
+    if event.subsystem == "usb":
+        if event.env.get("DEVTYPE") != "usb_device":
+            return None
+        # PRODUCT is "vendor/product/bcdDevice" in unpadded hex.
+        parts = event.env.get("PRODUCT", "").split("/")
+        if len(parts) < 2:
+            return None
+        try:
+            return int(parts[0], 16), int(parts[1], 16)
+        except ValueError:
+            return None
+    match = _HIDRAW_PARENT.search(event.devpath)
+    if match is None:
+        return None
+    return int(match.group(1), 16), int(match.group(2), 16)
+
+
+def classify_uevent(event: Uevent, *, vendor_ids: frozenset[int] = frozenset({ITE_VENDOR_ID})) -> DeviceEvent | None:
+    """Map a raw uevent to the typed event KeyRGB cares about, or ``None``."""
+
+    if event.subsystem == "power_supply":
+        online = event.env.get("POWER_SUPPLY_ONLINE")
+        return PowerSupplyEvent(
+            action=event.action,
+            name=event.env.get("POWER_SUPPLY_NAME", event.devpath.rsplit("/", 1)[-1]),
+            supply_type=event.env.get("POWER_SUPPLY_TYPE", ""),
+            online=None if online not in ("0", "1") else online == "1",
+        )
+    if event.subsystem in ("usb", "hidraw"):
+        ids = _usb_ids(event)
+        if ids is None or ids[0] not in vendor_ids:
+            return None
+        devname = event.env.get("DEVNAME")
+        return UsbDeviceEvent(
+            action=event.action,
+            subsystem=event.subsystem,
+            vendor_id=ids[0],
+            product_id=ids[1],
+            devname=None if not devname else "/dev/" + devname.lstrip("/"),
+        )
+    return None
+
+
+def _default_read_mains_online() -> dict[str, bool | None]:
+    from keyrgb.core.power.monitoring.power_supply_sysfs import read_mains_online_from_sysfs
+
+    return read_mains_online_from_sysfs()
+
+
+class UeventMonitor:
+    """Read kernel uevents on one thread and fan typed events out to subscribers."""
+
+    def __init__(
+        self,
+        *,
+        open_socket_fn: Callable[[], socket.socket | None] = open_uevent_socket,
+        read_mains_online_fn: Callable[[], Mapping[str, bool | None]] = _default_read_mains_online,
+    ) -> None:
+        self._open_socket_fn = open_socket_fn
+        self._read_mains_online_fn = read_mains_online_fn
+        self._stop_event = WakeEvent()
+        self._thread: threading.Thread | None = None
+        self._sock: socket.socket | None = None
+        self._lock = threading.Lock()
+        self._subscribers: tuple[Callable[[DeviceEvent], None], ...] = ()
+        self._power_changed = threading.Condition()
+        self._power_generation = 0
+        self._mains_online: dict[str, bool | None] = {}
+
+    @property
+    def running(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive() and not self._stop_event.is_set()
+
+    @property
+    def on_ac_power(self) -> bool | None:
+        """AC state across every mains supply; ``None`` while any of them is unknown.
+
+        Each supply starts from the sysfs reading taken at start/resync and
+        follows its own uevents after that. One online supply is enough.
+        """
+
+        states = self._mains_online.values()
+        if any(states):
+            return True
+        if not states or None in states:
+            return None
+        return False
+
+    def start(self) -> bool:
+        """Open the netlink socket and start the thread; ``False`` when netlink is unavailable."""
+
+        if self._thread is not None:
+            return self.running
+        self._sock = self._open_socket_fn()
+        if self._sock is None:
+            return False
+        self._resync_power_supply()
+        self._thread = threading.Thread(target=self._run, name="keyrgb-uevents", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self, *, timeout_s: float = 2.0) -> bool:
+        """Stop the thread and close the socket; return whether the thread exited."""
+
+        self._stop_event.set()
+        with self._power_changed:
+            self._power_changed.notify_all()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=max(0.0, float(timeout_s)))
+            if thread.is_alive():
+                return False
+        with self._lock:
+            self._subscribers = ()
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        return True
+
+    def subscribe(self, callback: Callable[[DeviceEvent], None]) -> Callable[[], None]:
+        """Call ``callback`` with every typed event; return a function that unsubscribes it."""
+
+        with self._lock:
+            self._subscribers = (*self._subscribers, callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._subscribers = tuple(sub for sub in self._subscribers if sub is not callback)
+
+        return unsubscribe
+
+    def wait_for_power_supply_change(self, timeout_s: float) -> bool:
+        """Block up to ``timeout_s`` for the next power-supply uevent; return whether one arrived."""
+
+        with self._power_changed:
+            generation = self._power_generation
+            return (
+                self._power_changed.wait_for(
+                    lambda: self._power_generation != generation or self._stop_event.is_set(),
+                    timeout=max(0.0, float(timeout_s)),
+                )
+                and not self._stop_event.is_set()
+            )
+
+    def _run(self) -> None:
+        sock = self._sock
+        if sock is None:
+            return
+        poller = select.poll()
+        poller.register(sock.fileno(), select.POLLIN)
+        stop_fd = self._stop_event.wake_fd()
+        if stop_fd is not None:
+            poller.register(stop_fd, select.POLLIN)
+        timeout_ms = None if stop_fd is not None else int(_STOP_POLL_INTERVAL_S * 1000)
+        events: list[Uevent] = []
+        while not self._stop_event.is_set():
+            try:
+                ready = poller.poll(timeout_ms)
+            except OSError as exc:
+                logger.warning("Uevent monitor wait failed; stopping it: %s", exc)
+                return
+            if not ready or self._stop_event.is_set():
+                continue
+            events.clear()
+            try:
+                complete = read_uevents(sock, events)
+            except OSError as exc:
+                logger.warning("Uevent monitor read failed; stopping it: %s", exc)
+                return
+            if not complete:
+                logger.debug("Uevent queue overflowed; re-reading the power supply state")
+                self._resync_power_supply()
+            for event in events:
+                typed = classify_uevent(event)
+                if typed is not None:
+                    self._dispatch(typed)
+
+    def _resync_power_supply(self) -> None:
+        self._mains_online = dict(self._read_mains_online_fn())
+        self._notify_power_change()
+
+    def _dispatch(self, event: DeviceEvent) -> None:
+        if isinstance(event, PowerSupplyEvent):
+            if event.action == "remove":
+                self._mains_online = {name: online for name, online in self._mains_online.items() if name != event.name}
+            elif event.supply_type.lower() == "mains" and event.online is not None:
+                self._mains_online = {**self._mains_online, event.name: event.online}
+            self._notify_power_change()
+        elif isinstance(event, UsbDeviceEvent) and event.action in ("add", "remove"):
+            logger.info(
+                "Keyboard controller %04x:%04x %s (%s)",
+                event.vendor_id,
+                event.product_id,
+                "attached" if event.action == "add" else "removed",
+                event.devname or event.subsystem,
+            )
+        for callback in self._subscribers:
+            try:
+                callback(event)
+            except _SUBSCRIBER_EXCEPTIONS:  # @quality-exception exception-transparency: subscribers run on the shared monitor thread; one subscriber's recoverable failure is logged so the others still get the event, while unexpected defects propagate
+                logger.exception("Uevent subscriber failed for %r", event)
+
+    def _notify_power_change(self) -> None:
+        with self._power_changed:
+            self._power_generation += 1
+            self._power_changed.notify_all()
+
+
+_monitor_lock = threading.Lock()
+_monitor: UeventMonitor | None = None
+
+
+def start_uevent_monitor() -> UeventMonitor | None:
+    """Start the process-wide monitor (the tray calls this); ``None`` when disabled or unavailable."""
+
+    global _monitor
+    if not uevent_monitor_enabled():
+        return None
+    with _monitor_lock:
+        if _monitor is not None and _monitor.running:
+            return _monitor
+        monitor = UeventMonitor()
+        if not monitor.start():
+            return None
+        _monitor = monitor
+        logger.info("Uevent monitor started (on AC: %s)", monitor.on_ac_power)
+        return monitor
+
+
+def stop_uevent_monitor(*, timeout_s: float = 2.0) -> bool:
+    """Stop the process-wide monitor, if any; return whether its thread exited."""
+
+    global _monitor
+    with _monitor_lock:
+        monitor, _monitor = _monitor, None
+    if monitor is None:
+        return True
+    return monitor.stop(timeout_s=timeout_s)
+
+
+def running_uevent_monitor() -> UeventMonitor | None:
+    """Return the process-wide monitor while it runs, else ``None``."""
+
+    monitor = _monitor
+    return monitor if monitor is not None and monitor.running else None
@@ -0,0 +1,238 @@
+"""Length-prefixed messages for the tray's local control socket.
+
+The tray listens on ``control.sock`` in its runtime dir
+(``$XDG_RUNTIME_DIR/keyrgb``). Every message, in either direction, is a
+five-byte header (payload length as a little-endian u32, then a
+``MessageType``) followed by the payload:
+
+- ``SET_COLOR``: three bytes, r g b;
+- ``SET_BRIGHTNESS``: one byte;
+- ``SET_EFFECT``: the effect name, UTF-8;
+- ``SET_KEYS``: five-byte (row, col, r, g, b) records merged into the shown per-key colors;
+- ``FRAME``: ``rows * cols * 3`` RGB bytes, row-major, replacing the shown per-key colors;
+- ``QUERY`` and ``SUBSCRIBE``: empty.
+
+``SET_KEYS`` and ``FRAME`` output is transient: it is shown but not saved.
+
+The tray answers every request in order: ``OK``, ``ERROR`` with a UTF-8
+reason, or for ``QUERY`` and ``SUBSCRIBE`` a ``STATE`` holding a UTF-8 JSON
+object. A subscribed connection also gets a ``STATE`` each time the state
+changes; those arrive between replies, never in place of one.
+
+``ControlConnection`` is the client end. Requests can be pipelined: send a
+batch, then read one reply per request.
+"""
+
+from __future__ import annotations
+
+import enum
+import json
+import socket
+import struct
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import final
+
+CONTROL_SOCKET_FILENAME = "control.sock"
+
+_HEADER = struct.Struct("<IB")
+_KEY_RECORD = struct.Struct("<BBBBB")
+# A full frame for the largest supported matrix is a few hundred bytes.
+MAX_PAYLOAD_BYTES = 1 << 16
+
+Color = tuple[int, int, int]
+
+
+class MessageType(enum.IntEnum):
+    SET_COLOR = 1
+    SET_BRIGHTNESS = 2
+    SET_EFFECT = 3
+    SET_KEYS = 4
+    FRAME = 5
+    QUERY = 6
+    SUBSCRIBE = 7
+    OK = 64
+    ERROR = 65
+    STATE = 66
+
+
+class ControlProtocolError(ValueError):
+    """A message is malformed, too large, or of an unknown type."""
+
+
+class ControlCommandError(RuntimeError):
+    """The tray answered a request with ``ERROR``."""
+
+
+def control_socket_path() -> Path:
+    from keyrgb.core.config.paths import runtime_dir
+
+    return runtime_dir() / CONTROL_SOCKET_FILENAME
+
+
+def encode_message(kind: MessageType, payload: bytes = b"") -> bytes:
+    if len(payload) > MAX_PAYLOAD_BYTES:
+        raise ControlProtocolError(f"payload of {len(payload)} bytes exceeds {MAX_PAYLOAD_BYTES}")
+    return _HEADER.pack(len(payload), int(kind)) + payload
+
+
+def take_messages(buffer: bytearray) -> list[tuple[MessageType, bytes]]:
+    """Remove and return every complete message at the start of ``buffer``."""
+
+    messages: list[tuple[MessageType, bytes]] = []
+    offset = 0
+    while len(buffer) - offset >= _HEADER.size:
+        length, kind = _HEADER.unpack_from(buffer, offset)
+        if length > MAX_PAYLOAD_BYTES:
+            raise ControlProtocolError(f"payload of {length} bytes exceeds {MAX_PAYLOAD_BYTES}")
+        end = offset + _HEADER.size + length
+        if len(buffer) < end:
+            break
+        try:
+            message_type = MessageType(kind)
+        except ValueError:
+            raise ControlProtocolError(f"unknown message type {kind}") from None
+        messages.append((message_type, bytes(buffer[offset + _HEADER.size : end])))
+        offset = end
+    del buffer[:offset]
+    return messages
+
+
+def _channel(value: object) -> int:
+    number = int(value)  # type: ignore[call-overload]
+    if not 0 <= number <= 255:
+        raise ControlProtocolError(f"{number} is not a byte value")
+    return number
+
+
+def color_payload(color: Iterable[int]) -> bytes:
+    channels = [_channel(channel) for channel in color]
+    if len(channels) != 3:
+        raise ControlProtocolError("a color has three channels")
+    return bytes(channels)
+
+
+def decode_color(payload: bytes) -> Color:
+    if len(payload) != 3:
+        raise ControlProtocolError("SET_COLOR takes three bytes")
+    return (payload[0], payload[1], payload[2])
+
+
+def decode_brightness(payload: bytes) -> int:
+    if len(payload) != 1:
+        raise ControlProtocolError("SET_BRIGHTNESS takes one byte")
+    return payload[0]
+
+
+def decode_text(payload: bytes) -> str:
+    try:
+        return payload.decode("utf-8")
+    except UnicodeDecodeError:
+        raise ControlProtocolError("text payloads are UTF-8") from None
+
+
+def key_records_payload(colors: Mapping[tuple[int, int], Iterable[int]]) -> bytes:
+    return b"".join(
+        _KEY_RECORD.pack(_channel(row), _channel(col), *color_payload(color)) for (row, col), color in colors.items()
+    )
+
+
+def decode_key_records(payload: bytes) -> dict[tuple[int, int], Color]:
+    if not payload or len(payload) % _KEY_RECORD.size:
+        raise ControlProtocolError(f"SET_KEYS takes one or more {_KEY_RECORD.size}-byte records")
+    return {(row, col): (r, g, b) for row, col, r, g, b in _KEY_RECORD.iter_unpack(payload)}
+
+
+def decode_frame(payload: bytes, *, rows: int, cols: int) -> dict[tuple[int, int], Color]:
+    if len(payload) != rows * cols * 3:
+        raise ControlProtocolError(f"FRAME takes {rows * cols * 3} bytes ({rows}x{cols} RGB)")
+    return {
+        divmod(index, cols): (payload[offset], payload[offset + 1], payload[offset + 2])
+        for index, offset in enumerate(range(0, len(payload), 3))
+    }
+
+
+def state_payload(state: Mapping[str, object]) -> bytes:
+    return json.dumps(state, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def decode_state(payload: bytes) -> dict[str, object]:
+    try:
+        state = json.loads(decode_text(payload))
+    except json.JSONDecodeError:
+        raise ControlProtocolError("STATE is a JSON object") from None
+    if not isinstance(state, dict):
+        raise ControlProtocolError("STATE is a JSON object")
+    return state
+
+
+def state_geometry(state: Mapping[str, object]) -> tuple[int, int]:
+    """The ``(rows, cols)`` a ``FRAME`` must cover, from a decoded ``STATE``."""
+
+    rows, cols = state.get("rows"), state.get("cols")
+    if type(rows) is not int or type(cols) is not int or rows <= 0 or cols <= 0:
+        raise ControlProtocolError(f"STATE has no usable keyboard size (rows={rows!r}, cols={cols!r})")
+    return rows, cols
+
+
+@final
+class ControlConnection:
+    """Client connection to the tray's control socket.
+
+    Keep subscriptions on a connection of their own: ``reply()`` takes the next
+    message, and on a subscribed connection that may be a state notification.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._buffer = bytearray()
+        self._received: list[tuple[MessageType, bytes]] = []
+
+    @classmethod
+    def connect(cls, path: Path | None = None, *, timeout_s: float | None = 5.0) -> ControlConnection:
+        """Connect to the running tray; ``OSError`` when it is not listening."""
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM | socket.SOCK_CLOEXEC)
+        try:
+            sock.settimeout(timeout_s)
+            sock.connect(str(control_socket_path() if path is None else path))
+        except OSError:
+            sock.close()
+            raise
+        return cls(sock)
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def __enter__(self) -> ControlConnection:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def send(self, kind: MessageType, payload: bytes = b"") -> None:
+        self._sock.sendall(encode_message(kind, payload))
+
+    def send_many(self, messages: Iterable[tuple[MessageType, bytes]]) -> None:
+        self._sock.sendall(b"".join(encode_message(kind, payload) for kind, payload in messages))
+
+    def receive(self) -> tuple[MessageType, bytes]:
+        while not self._received:
+            data = self._sock.recv(65536)
+            if not data:
+                raise ConnectionResetError("the tray closed the control connection")
+            self._buffer += data
+            self._received.extend(take_messages(self._buffer))
+        return self._received.pop(0)
+
+    def reply(self) -> bytes:
+        """Return the payload of the next reply; ``ControlCommandError`` for ``ERROR``."""
+
+        kind, payload = self.receive()
+        if kind is MessageType.ERROR:
+            raise ControlCommandError(decode_text(payload))
+        return payload
+
+    def request(self, kind: MessageType, payload: bytes = b"") -> bytes:
+        self.send(kind, payload)
+        return self.reply()
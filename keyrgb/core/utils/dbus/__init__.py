@@ -0,0 +1 @@
+"""Minimal system-bus D-Bus client; import the required leaf module directly."""
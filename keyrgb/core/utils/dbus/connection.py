@@ -0,0 +1,192 @@
+"""Minimal D-Bus client over the bus's Unix socket.
+
+Only what KeyRGB needs to listen for system-bus signals without dbus-python or
+a ``dbus-monitor`` child process: SASL ``EXTERNAL`` authentication, ``Hello``
+and ``AddMatch`` calls, and a blocking stream of incoming messages.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+from collections import deque
+from collections.abc import Iterator
+from urllib.parse import unquote
+
+from .marshalling import (
+    ERROR,
+    FIXED_HEADER_BYTES,
+    METHOD_CALL,
+    METHOD_RETURN,
+    DBusError,
+    DBusMessage,
+    decode_message,
+    encode_message,
+    message_length,
+)
+
+SYSTEM_BUS_ADDRESS_ENV = "DBUS_SYSTEM_BUS_ADDRESS"
+DEFAULT_SYSTEM_BUS_ADDRESS = "unix:path=/var/run/dbus/system_bus_socket"
+
+# The spec's limit; anything larger means the stream is out of sync.
+_MAX_MESSAGE_BYTES = 1 << 27
+_RECV_SIZE = 4096
+
+_BUS_NAME = "org.freedesktop.DBus"
+_BUS_PATH = "/org/freedesktop/DBus"
+
+
+def _unix_socket_target(address: str) -> str | None:
+    transport, _, params = address.strip().partition(":")
+    if transport != "unix":
+        return None
+    for param in params.split(","):
+        key, _, value = param.partition("=")
+        if key == "path":
+            return unquote(value)
+        if key == "abstract":
+            return "\0" + unquote(value)
+    return None
+
+
+class BusConnection:
+    """An authenticated connection to a message bus.
+
+    ``connect_system_bus()`` authenticates and says ``Hello`` under a timeout;
+    ``messages()`` then blocks until the next message. ``shutdown()`` may be
+    called from another thread to end a blocked ``messages()`` loop.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._buffer = bytearray()
+        self._pending: deque[DBusMessage] = deque()
+        self._serial = 0
+        self._shut_down = False
+        self.unique_name: str | None = None
+
+    @classmethod
+    def connect_system_bus(cls, address: str | None = None, *, timeout_s: float = 5.0) -> BusConnection:
+        """Connect to the first usable Unix socket in the system bus address."""
+
+        address = address or os.environ.get(SYSTEM_BUS_ADDRESS_ENV) or DEFAULT_SYSTEM_BUS_ADDRESS
+        last_error: OSError = DBusError(f"no usable unix socket in bus address {address!r}")
+        for entry in address.split(";"):
+            target = _unix_socket_target(entry)
+            if target is None:
+                continue
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(float(timeout_s))
+            connection = cls(sock)
+            try:
+                sock.connect(target)
+                connection._authenticate()
+                hello = connection.call(_BUS_NAME, _BUS_PATH, _BUS_NAME, "Hello").unpack_body()
+            except OSError as exc:
+                sock.close()
+                last_error = exc
+                continue
+            connection.unique_name = str(hello[0]) if hello else None
+            return connection
+        raise last_error
+
+    def add_match(self, rule: str) -> None:
+        self.call(_BUS_NAME, _BUS_PATH, _BUS_NAME, "AddMatch", "s", rule)
+
+    def call(
+        self,
+        destination: str,
+        path: str,
+        interface: str,
+        member: str,
+        signature: str = "",
+        *values: object,
+    ) -> DBusMessage:
+        """Send a method call and wait for its reply, queueing anything that arrives first."""
+
+        self._serial += 1
+        serial = self._serial
+        self._sock.sendall(
+            encode_message(
+                METHOD_CALL,
+                serial,
+                path=path,
+                interface=interface,
+                member=member,
+                destination=destination,
+                signature=signature,
+                values=values,
+            )
+        )
+        while True:
+            message = self._read_message()
+            if message is None:
+                raise DBusError(f"bus closed the connection before replying to {member}")
+            if message.reply_serial != serial or message.message_type not in (METHOD_RETURN, ERROR):
+                self._pending.append(message)
+                continue
+            if message.message_type == ERROR:
+                raise DBusError(f"{member} failed: {message.error_name}")
+            return message
+
+    def messages(self) -> Iterator[DBusMessage]:
+        """Yield incoming messages until the bus or ``shutdown()`` closes the stream."""
+
+        self._sock.settimeout(None)
+        while True:
+            if self._pending:
+                yield self._pending.popleft()
+                continue
+            try:
+                message = self._read_message()
+            except OSError:
+                if self._shut_down:
+                    return
+                raise
+            if message is None:
+                return
+            yield message
+
+    def shutdown(self) -> None:
+        self._shut_down = True
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self._shut_down = True
+        self._sock.close()
+
+    def _recv_into_buffer(self) -> bool:
+        chunk = self._sock.recv(_RECV_SIZE)
+        if not chunk:
+            return False
+        self._buffer += chunk
+        return True
+
+    def _authenticate(self) -> None:
+        uid_hex = str(os.getuid()).encode("ascii").hex().encode("ascii")
+        self._sock.sendall(b"\0AUTH EXTERNAL " + uid_hex + b"\r\n")
+        while b"\r\n" not in self._buffer:
+            if not self._recv_into_buffer():
+                raise DBusError("bus closed the connection during authentication")
+        line, _, rest = bytes(self._buffer).partition(b"\r\n")
+        self._buffer[:] = rest
+        if not line.startswith(b"OK "):
+            raise DBusError(f"bus rejected EXTERNAL authentication: {line.decode('ascii', 'replace')}")
+        self._sock.sendall(b"BEGIN\r\n")
+
+    def _read_message(self) -> DBusMessage | None:
+        while len(self._buffer) < FIXED_HEADER_BYTES:
+            if not self._recv_into_buffer():
+                return None
+        length = message_length(bytes(self._buffer[:FIXED_HEADER_BYTES]))
+        if length > _MAX_MESSAGE_BYTES:
+            raise DBusError(f"D-Bus message of {length} bytes exceeds the protocol limit")
+        while len(self._buffer) < length:
+            if not self._recv_into_buffer():
+                return None
+        data = bytes(self._buffer[:length])
+        del self._buffer[:length]
+        return decode_message(data)
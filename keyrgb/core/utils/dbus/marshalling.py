@@ -0,0 +1,246 @@
+"""D-Bus message marshalling for basic types.
+
+Encodes method calls and decodes message header fields and bodies made of
+basic types. Containers (arrays, structs, variants) are not supported in
+bodies; messages that carry them still decode, only ``unpack_body()`` raises.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+
+METHOD_CALL = 1
+METHOD_RETURN = 2
+ERROR = 3
+SIGNAL = 4
+
+_FIELD_PATH = 1
+_FIELD_INTERFACE = 2
+_FIELD_MEMBER = 3
+_FIELD_ERROR_NAME = 4
+_FIELD_REPLY_SERIAL = 5
+_FIELD_DESTINATION = 6
+_FIELD_SENDER = 7
+_FIELD_SIGNATURE = 8
+_FIELD_SIGNATURES = {
+    _FIELD_PATH: "o",
+    _FIELD_INTERFACE: "s",
+    _FIELD_MEMBER: "s",
+    _FIELD_ERROR_NAME: "s",
+    _FIELD_REPLY_SERIAL: "u",
+    _FIELD_DESTINATION: "s",
+    _FIELD_SENDER: "s",
+    _FIELD_SIGNATURE: "g",
+}
+
+FIXED_HEADER_BYTES = 16
+
+
+class DBusError(OSError):
+    """The bus rejected authentication, answered a call with an error, or sent an unreadable message."""
+
+
+@dataclass(frozen=True)
+class DBusMessage:
+    message_type: int
+    serial: int
+    path: str | None = None
+    interface: str | None = None
+    member: str | None = None
+    error_name: str | None = None
+    reply_serial: int | None = None
+    destination: str | None = None
+    sender: str | None = None
+    signature: str = ""
+    body: bytes = b""
+    big_endian: bool = False
+
+    def unpack_body(self) -> tuple[object, ...]:
+        """Decode the body; only basic-type signatures are supported."""
+
+        reader = _Reader(self.body, big_endian=self.big_endian)
+        return tuple(reader.value(code) for code in self.signature)
+
+
+def _int_value(code: str, value: object) -> int:
+    if not isinstance(value, int):
+        raise TypeError(f"D-Bus type code {code!r} needs an int, not {type(value).__name__}")
+    return int(value)
+
+
+class _Writer:
+    __slots__ = ("data",)
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def align(self, n: int) -> None:
+        self.data.extend(b"\0" * (-len(self.data) % n))
+
+    def value(self, code: str, value: object) -> None:
+        if code in "so":
+            raw = str(value).encode("utf-8")
+            self.align(4)
+            self.data += struct.pack("<I", len(raw)) + raw + b"\0"
+        elif code == "g":
+            raw = str(value).encode("ascii")
+            self.data += bytes((len(raw),)) + raw + b"\0"
+        elif code in "ub":
+            self.align(4)
+            self.data += struct.pack("<I", _int_value(code, value))
+        elif code == "i":
+            self.align(4)
+            self.data += struct.pack("<i", _int_value(code, value))
+        elif code == "y":
+            self.data.append(_int_value(code, value))
+        else:
+            raise ValueError(f"unsupported D-Bus type code {code!r}")
+
+
+class _Reader:
+    __slots__ = ("_data", "_prefix", "offset")
+
+    def __init__(self, data: bytes, *, big_endian: bool, offset: int = 0) -> None:
+        self._data = data
+        self._prefix = ">" if big_endian else "<"
+        self.offset = offset
+
+    def align(self, n: int) -> None:
+        self.offset += -self.offset % n
+
+    def _unpack(self, fmt: str, size: int) -> int:
+        if self.offset + size > len(self._data):
+            raise DBusError("truncated D-Bus message")
+        (value,) = struct.unpack_from(self._prefix + fmt, self._data, self.offset)
+        self.offset += size
+        return int(value)
+
+    def _text(self, length: int) -> str:
+        end = self.offset + length
+        if end >= len(self._data):
+            raise DBusError("truncated D-Bus message")
+        raw = self._data[self.offset : end]
+        self.offset = end + 1
+        return raw.decode("utf-8", "replace")
+
+    def value(self, code: str) -> object:
+        if code in "so":
+            self.align(4)
+            return self._text(self._unpack("I", 4))
+        if code == "g":
+            return self._text(self._unpack("B", 1))
+        if code == "u":
+            self.align(4)
+            return self._unpack("I", 4)
+        if code == "i":
+            self.align(4)
+            return self._unpack("i", 4)
+        if code == "b":
+            self.align(4)
+            return self._unpack("I", 4) != 0
+        if code == "y":
+            return self._unpack("B", 1)
+        raise DBusError(f"unsupported D-Bus type code {code!r}")
+
+
+def encode_message(
+    message_type: int,
+    serial: int,
+    *,
+    path: str | None = None,
+    interface: str | None = None,
+    member: str | None = None,
+    error_name: str | None = None,
+    reply_serial: int | None = None,
+    destination: str | None = None,
+    sender: str | None = None,
+    signature: str = "",
+    values: tuple[object, ...] = (),
+) -> bytes:
+    """Marshal one little-endian message whose body holds ``values`` of basic types."""
+
+    if len(signature) != len(values):
+        raise ValueError("signature and values differ in length")
+    body = _Writer()
+    for code, value in zip(signature, values):
+        body.value(code, value)
+
+    fields = {
+        _FIELD_PATH: path,
+        _FIELD_INTERFACE: interface,
+        _FIELD_MEMBER: member,
+        _FIELD_ERROR_NAME: error_name,
+        _FIELD_REPLY_SERIAL: reply_serial,
+        _FIELD_DESTINATION: destination,
+        _FIELD_SENDER: sender,
+        _FIELD_SIGNATURE: signature or None,
+    }
+    header = _Writer()
+    header.data += struct.pack("<cBBBIII", b"l", message_type, 0, 1, len(body.data), serial, 0)
+    for field_code, value in fields.items():
+        if value is None:
+            continue
+        header.align(8)
+        header.data.append(field_code)
+        header.value("g", _FIELD_SIGNATURES[field_code])
+        header.value(_FIELD_SIGNATURES[field_code], value)
+    struct.pack_into("<I", header.data, 12, len(header.data) - FIXED_HEADER_BYTES)
+    header.align(8)
+    return bytes(header.data + body.data)
+
+
+def message_length(fixed_header: bytes) -> int:
+    """Total message size announced by the first 16 bytes of a message."""
+
+    if fixed_header[:1] not in (b"l", b"B"):
+        raise DBusError(f"bad D-Bus endianness marker {fixed_header[:1]!r}")
+    prefix = ">" if fixed_header[:1] == b"B" else "<"
+    body_length, _serial, fields_length = struct.unpack_from(prefix + "III", fixed_header, 4)
+    return FIXED_HEADER_BYTES + fields_length + (-fields_length % 8) + body_length
+
+
+def decode_message(data: bytes) -> DBusMessage:
+    """Decode one complete message (as sized by ``message_length``)."""
+
+    big_endian = data[:1] == b"B"
+    reader = _Reader(data, big_endian=big_endian, offset=1)
+    message_type = reader._unpack("B", 1)
+    reader.offset = 4
+    body_length = reader._unpack("I", 4)
+    serial = reader._unpack("I", 4)
+    fields_end = FIXED_HEADER_BYTES + reader._unpack("I", 4)
+
+    fields: dict[int, object] = {}
+    while reader.offset < fields_end:
+        reader.align(8)
+        code = reader._unpack("B", 1)
+        field_signature = str(reader.value("g"))
+        if len(field_signature) != 1:
+            raise DBusError(f"unsupported D-Bus header field signature {field_signature!r}")
+        fields[code] = reader.value(field_signature)
+    reader.offset = fields_end
+    reader.align(8)
+    body = data[reader.offset : reader.offset + body_length]
+    if len(body) != body_length:
+        raise DBusError("truncated D-Bus message")
+
+    def _str(code: int) -> str | None:
+        value = fields.get(code)
+        return None if value is None else str(value)
+
+    reply_serial = fields.get(_FIELD_REPLY_SERIAL)
+    return DBusMessage(
+        message_type=message_type,
+        serial=serial,
+        path=_str(_FIELD_PATH),
+        interface=_str(_FIELD_INTERFACE),
+        member=_str(_FIELD_MEMBER),
+        error_name=_str(_FIELD_ERROR_NAME),
+        reply_serial=reply_serial if isinstance(reply_serial, int) else None,
+        destination=_str(_FIELD_DESTINATION),
+        sender=_str(_FIELD_SENDER),
+        signature=_str(_FIELD_SIGNATURE) or "",
+        body=bytes(body),
+        big_endian=big_endian,
+    )
@@ -0,0 +1 @@
+"""Thin wrappers over Linux kernel interfaces; import the required leaf module directly."""
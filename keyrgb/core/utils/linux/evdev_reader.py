@@ -0,0 +1,130 @@
+"""Lean keydown reader over raw evdev file descriptors.
+
+python-evdev's ``InputDevice.read()`` builds one ``InputEvent`` object per
+record, SYN and MSC reports included. ``KeydownReader`` instead ``readv``s the
+fd into a reused buffer and decodes ``struct input_event`` records in place,
+keeping only ``EV_KEY`` presses (value 1). Devices without a usable fd, and
+every device when ``KEYRGB_DISABLE_RAW_EVDEV=1``, fall back to ``read()``.
+
+Device classification helpers live here too, so the input hub, reactive
+effects and idle tracking agree on what counts as a keyboard.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Protocol
+
+EV_KEY = 0x01
+KEY_DOWN = 1
+
+# struct input_event: struct timeval (two native longs), __u16 type, __u16 code,
+# __s32 value. 24 bytes on 64-bit, 16 on 32-bit, no padding either way.
+INPUT_EVENT = struct.Struct("@llHHi")
+_BUFFER_EVENTS = 64
+
+# Key codes from linux/input-event-codes.h: KEY_Q..KEY_P, KEY_A..KEY_L and
+# KEY_Z..KEY_M, then the typing keys every full keyboard reports.
+_LETTER_KEY_CODES = frozenset((*range(16, 26), *range(30, 39), *range(44, 51)))
+_TYPING_KEY_CODES = frozenset({14, 15, 28, 42, 54, 57})  # BACKSPACE TAB ENTER LSHIFT RSHIFT SPACE
+
+_thread_readers = threading.local()
+
+
+class EvdevCapabilitiesProtocol(Protocol):
+    def capabilities(self, verbose: bool = False) -> Mapping[object, Sequence[object]]: ...
+
+
+def raw_evdev_enabled() -> bool:
+    return str(os.environ.get("KEYRGB_DISABLE_RAW_EVDEV", "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def device_fd(dev: object) -> int | None:
+    fileno = getattr(dev, "fileno", None)
+    if not callable(fileno):
+        return None
+    try:
+        fd = fileno()
+    except (OSError, TypeError, ValueError):
+        return None
+    return fd if isinstance(fd, int) and fd >= 0 else None
+
+
+def read_udev_input_properties(device_path: str) -> dict[str, str]:
+    """Read the udev ``E:`` properties of an evdev node; empty when udev has no record."""
+
+    try:
+        stat_result = os.stat(device_path)
+        data_path = Path(f"/run/udev/data/c{os.major(stat_result.st_rdev)}:{os.minor(stat_result.st_rdev)}")
+        if not data_path.is_file():
+            return {}
+        props: dict[str, str] = {}
+        for line in data_path.read_text(encoding="utf-8", errors="replace").splitlines():
+            if not line.startswith("E:"):
+                continue
+            key, sep, value = line[2:].partition("=")
+            if sep:
+                props[key] = value.strip()
+        return props
+    except (OSError, UnicodeError, ValueError):
+        return {}
+
+
+def looks_like_keyboard(dev: EvdevCapabilitiesProtocol) -> bool:
+    """Classify a device udev has no record for from its ``EV_KEY`` capabilities."""
+
+    try:
+        key_codes = set(dev.capabilities(verbose=False).get(EV_KEY, []) or [])
+    except (AttributeError, OSError, TypeError, ValueError):
+        return False
+    return len(key_codes & _LETTER_KEY_CODES) >= 8 and len(key_codes & _TYPING_KEY_CODES) >= 3
+
+
+def thread_keydown_reader() -> KeydownReader:
+    """Return the calling thread's ``KeydownReader``, creating it on first use."""
+
+    reader: KeydownReader | None = getattr(_thread_readers, "reader", None)
+    if reader is None:
+        reader = KeydownReader()
+        _thread_readers.reader = reader
+    return reader
+
+
+class KeydownReader:
+    """Drain evdev fds and return their keydown codes, reusing one buffer.
+
+    Not thread-safe; give each reading thread its own reader.
+    """
+
+    __slots__ = ("_buffer", "_view")
+
+    def __init__(self, *, capacity_events: int = _BUFFER_EVENTS) -> None:
+        self._buffer = bytearray(INPUT_EVENT.size * max(1, int(capacity_events)))
+        self._view = memoryview(self._buffer)
+
+    def read_keydown_codes(self, fd: int, out: list[int]) -> None:
+        """Append the code of every pending keydown on ``fd`` to ``out``.
+
+        Expects a non-blocking fd, as python-evdev opens them. An fd with no
+        pending events adds nothing; other ``OSError``s (for example
+        ``ENODEV`` after unplug) propagate so callers can drop the device.
+        """
+
+        buffer = [self._buffer]
+        view = self._view
+        record_size = INPUT_EVENT.size
+        while True:
+            try:
+                nbytes = os.readv(fd, buffer)
+            except BlockingIOError:
+                return
+            usable = nbytes - (nbytes % record_size)
+            for _sec, _usec, ev_type, code, value in INPUT_EVENT.iter_unpack(view[:usable]):
+                if ev_type == EV_KEY and value == KEY_DOWN:
+                    out.append(code)
+            if nbytes < len(self._buffer):
+                return
@@ -0,0 +1,140 @@
+"""Minimal Linux inotify directory watch over ctypes.
+
+Only what KeyRGB needs to notice atomic file replacements and device nodes
+coming and going: one watch on a directory, optionally filtered to a set of
+file names. ``DirectoryWatch.open()`` returns
+``None`` when inotify is unavailable (non-Linux, seccomp, exhausted watches),
+so callers keep a polling fallback.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+from collections.abc import Iterable
+from functools import lru_cache
+
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+# ``close()`` + ``rename()`` is what ``os.replace`` writers produce; in-place
+# writers end with ``IN_CLOSE_WRITE`` on the file itself.
+REPLACE_EVENTS = IN_CLOSE_WRITE | IN_MOVED_TO
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 4096
+
+
+@lru_cache(maxsize=1)
+def _libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        init1 = libc.inotify_init1
+        add_watch = libc.inotify_add_watch
+    except (AttributeError, OSError):
+        return None
+    init1.argtypes = [ctypes.c_int]
+    init1.restype = ctypes.c_int
+    add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    add_watch.restype = ctypes.c_int
+    return libc
+
+
+class DirectoryWatch:
+    """One inotify watch on a directory, reporting events for selected names."""
+
+    __slots__ = ("_fd", "_lost", "_names")
+
+    def __init__(self, fd: int, names: Iterable[str] | None) -> None:
+        self._fd = fd
+        self._names = None if names is None else frozenset(os.fsencode(name) for name in names)
+        self._lost = False
+
+    @classmethod
+    def open(
+        cls, directory: str | os.PathLike[str], names: Iterable[str] | None, *, mask: int = REPLACE_EVENTS
+    ) -> DirectoryWatch | None:
+        """Watch ``directory`` for ``mask`` events on ``names`` (every name when ``None``).
+
+        Returns ``None`` if inotify is unavailable.
+        """
+
+        libc = _libc()
+        if libc is None:
+            return None
+        fd = int(libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC))
+        if fd < 0:
+            return None
+        watch_mask = int(mask) | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+        if int(libc.inotify_add_watch(fd, os.fsencode(directory), watch_mask)) < 0:
+            os.close(fd)
+            return None
+        return cls(fd, names)
+
+    @property
+    def lost(self) -> bool:
+        """True once the directory itself was removed or moved; the watch no longer reports anything."""
+
+        return self._lost
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def wait(self, timeout_s: float) -> bool:
+        """Block up to ``timeout_s`` for an event; return whether a watched name changed."""
+
+        if self._fd < 0:
+            return False
+        poller = select.poll()
+        poller.register(self._fd, select.POLLIN)
+        if not poller.poll(max(0, int(float(timeout_s) * 1000))):
+            return False
+        return self.read_events()
+
+    def read_events(self) -> bool:
+        """Drain pending events; a queue overflow counts as a change since events were lost."""
+
+        changed = False
+        while self._fd >= 0:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _wd, event_mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + name_len].rstrip(b"\0")
+                offset += name_len
+                if event_mask & IN_Q_OVERFLOW:
+                    changed = True
+                elif event_mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF):
+                    self._lost = True
+                    changed = True
+                elif self._names is None or name in self._names:
+                    changed = True
+        return changed
+
+    def close(self) -> None:
+        fd, self._fd = self._fd, -1
+        if fd >= 0:
+            os.close(fd)
@@ -0,0 +1,97 @@
+"""Kernel uevents from a ``NETLINK_KOBJECT_UEVENT`` socket.
+
+The kernel broadcasts one datagram per device ``add``/``remove``/``change``:
+an ``action@devpath`` header followed by NUL-separated ``KEY=value`` pairs.
+Only the kernel's multicast group is joined; udev's re-broadcasts (a binary
+``libudev`` header on another group) and datagrams not sent by the kernel are
+ignored. ``open_uevent_socket()`` returns ``None`` where netlink is
+unavailable, so callers keep their polling fallback.
+"""
+
+from __future__ import annotations
+
+import errno
+import socket
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+NETLINK_KOBJECT_UEVENT = 15
+_KERNEL_GROUP = 1
+# A uevent is at most a few KiB; hotplug bursts are absorbed by the receive buffer.
+_RECV_SIZE = 16384
+_RECV_BUFFER_BYTES = 1 << 20
+
+
+@dataclass(frozen=True)
+class Uevent:
+    action: str
+    devpath: str
+    subsystem: str
+    env: Mapping[str, str] = field(default_factory=dict)
+
+
+def parse_uevent(data: bytes) -> Uevent | None:
+    """Parse one kernel uevent datagram; ``None`` for udev or malformed messages."""
+
+    if data.startswith(b"libudev\0"):
+        return None
+    header, *pairs = data.split(b"\0")
+    action, at, devpath = header.decode("utf-8", "replace").partition("@")
+    if not at:
+        return None
+    env: dict[str, str] = {}
+    for pair in pairs:
+        key, sep, value = pair.partition(b"=")
+        if sep:
+            env[key.decode("ascii", "replace")] = value.decode("utf-8", "replace")
+    return Uevent(
+        action=env.get("ACTION", action),
+        devpath=env.get("DEVPATH", devpath),
+        subsystem=env.get("SUBSYSTEM", ""),
+        env=env,
+    )
+
+
+def open_uevent_socket() -> socket.socket | None:
+    """Open a non-blocking socket subscribed to kernel uevents, or ``None``."""
+
+    family = getattr(socket, "AF_NETLINK", None)
+    if family is None:
+        return None
+    try:
+        sock = socket.socket(family, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+    except OSError:
+        return None
+    try:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECV_BUFFER_BYTES)
+        except OSError:
+            pass
+        sock.bind((0, _KERNEL_GROUP))
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def read_uevents(sock: socket.socket, out: list[Uevent]) -> bool:
+    """Drain pending uevents into ``out``; return ``False`` if the kernel dropped some."""
+
+    complete = True
+    while True:
+        try:
+            data, address = sock.recvfrom(_RECV_SIZE)
+        except BlockingIOError:
+            return complete
+        except OSError as exc:
+            if exc.errno != errno.ENOBUFS:
+                raise
+            # The receive queue overflowed; the caller has to resync.
+            complete = False
+            continue
+        if not isinstance(address, tuple) or not address or address[0] != 0:
+            continue
+        event = parse_uevent(data)
+        if event is not None:
+            out.append(event)
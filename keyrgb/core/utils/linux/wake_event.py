@@ -0,0 +1,61 @@
+"""``threading.Event`` that can also wake an ``epoll``/``select`` waiter.
+
+``wake_fd()`` lazily creates a Linux eventfd that is readable while the event
+is set, so a loop blocked on device fds can include cancellation in the same
+wait. Events whose fd is never requested cost nothing extra.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+
+
+def _close_fd(fd: int) -> None:
+    try:
+        os.close(fd)
+    except OSError:
+        pass
+
+
+class WakeEvent(threading.Event):
+    """Event mirrored into an eventfd once someone asks for ``wake_fd()``."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._fd_lock = threading.Lock()
+        self._fd: int | None = None
+        self._fd_unavailable = not hasattr(os, "eventfd")
+
+    def wake_fd(self) -> int | None:
+        """Return an fd that polls readable while the event is set, or ``None`` without eventfd support."""
+
+        with self._fd_lock:
+            if self._fd is None and not self._fd_unavailable:
+                try:
+                    fd = os.eventfd(1 if self.is_set() else 0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+                except OSError:
+                    self._fd_unavailable = True
+                    return None
+                self._fd = fd
+                weakref.finalize(self, _close_fd, fd)
+            return self._fd
+
+    def set(self) -> None:
+        with self._fd_lock:
+            super().set()
+            if self._fd is not None:
+                try:
+                    os.eventfd_write(self._fd, 1)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        with self._fd_lock:
+            super().clear()
+            if self._fd is not None:
+                try:
+                    os.eventfd_read(self._fd)
+                except OSError:
+                    pass
@@ -10,7 +10,8 @@ from typing import TYPE_CHECKING, Protocol, cast, overload
 from keyrgb.tray.controllers.runtime_coordinator import TrayRuntimeCoordinator
 from keyrgb.tray.controllers.view_snapshots import refresh_tray_view_snapshots
 from keyrgb.tray.idle_power_state import ensure_tray_idle_power_state
-from keyrgb.tray.protocols import TrayIconState
+from keyrgb.tray.protocols import TrayControlState, TrayIconState
+from keyrgb.tray.startup.timeline import finish_startup_trace, mark_startup, startup_phase, startup_trace_active
 
 from ._application_state import TrayBootstrapState, TrayPreBootstrapState
 from .lifecycle import _AutostartEffectTray, _LifecyclePollingTray, _MonitoringPowerManager
@@ -52,6 +53,10 @@ class _PermissionIssueCallback(Protocol):
     def __call__(self, exc: Exception | None = None) -> None: ...
 
 
+class _ReplayLastOutput(Protocol):
+    def __call__(self, engine: object, *, config: Config, backend: object) -> bool: ...
+
+
 class _InstallPermissionCallback(Protocol):
     def __call__(self, engine: object, callback: _PermissionIssueCallback) -> None: ...
 
@@ -97,7 +102,9 @@ class _ItemFactory(Protocol):
 
 
 class _PystrayIcon(Protocol):
-    def run(self) -> None: ...
+    visible: bool
+
+    def run(self, setup: Callable[[_PystrayIcon], None] | None = None) -> None: ...
 
 
 class _PystrayIconFactory(Protocol):
@@ -141,6 +148,7 @@ class TrayInitBindings:
     select_backend_with_introspection: _SelectBackend
     select_device_discovery_snapshot: _SelectDiscoverySnapshot
     create_effects_engine: _CreateEffectsEngine
+    replay_last_output: _ReplayLastOutput
     load_ite_dimensions: _LoadIteDimensions
     install_permission_error_callback_best_effort: _InstallPermissionCallback
     configure_engine_software_targets: Callable[[_LifecyclePollingTray], None]
@@ -171,6 +179,7 @@ def build_tray_prebootstrap_state(tray: object) -> TrayPreBootstrapState:
         icon=None,
         is_off=False,
         tray_icon_state=TrayIconState(),
+        tray_control_state=TrayControlState(),
         tray_idle_power_state=idle_power_state,
         runtime_coordinator=TrayRuntimeCoordinator(),
         power_forced_off=idle_power_state.power_forced_off,
@@ -188,13 +197,20 @@ def build_tray_prebootstrap_state(tray: object) -> TrayPreBootstrapState:
 
 
 def build_tray_bootstrap_state(*, bindings: TrayInitBindings) -> TrayBootstrapState:
-    EffectsEngine, Config, PowerManager = bindings.load_tray_dependencies()
+    with startup_phase("tray dependencies"):
+        EffectsEngine, Config, PowerManager = bindings.load_tray_dependencies()
 
-    config = Config()
-    bindings.migrate_builtin_profile_brightness_best_effort(config)
+    with startup_phase("config load"):
+        config = Config()
+        bindings.migrate_builtin_profile_brightness_best_effort(config)
 
-    backend, backend_probe, backend_caps = bindings.select_backend_with_introspection()
-    engine = bindings.create_effects_engine(EffectsEngine, backend=backend)
+    with startup_phase("backend probe"):
+        backend, backend_probe, backend_caps = bindings.select_backend_with_introspection()
+    with startup_phase("device open"):
+        engine = bindings.create_effects_engine(EffectsEngine, backend=backend)
+    # Paint the last committed output before anything else runs; autostart repaints from the config.
+    with startup_phase("instant-on replay"):
+        bindings.replay_last_output(engine, config=config, backend=backend)
 
     geometry = getattr(engine, "effect_geometry", None)
     if geometry is not None:
@@ -202,6 +218,9 @@ def build_tray_bootstrap_state(*, bindings: TrayInitBindings) -> TrayBootstrapSt
     else:
         ite_rows, ite_cols = bindings.load_ite_dimensions()
 
+    with startup_phase("device discovery"):
+        device_discovery = bindings.select_device_discovery_snapshot()
+
     return TrayBootstrapState(
         config=config,
         engine=engine,
@@ -209,7 +228,7 @@ def build_tray_bootstrap_state(*, bindings: TrayInitBindings) -> TrayBootstrapSt
         backend=backend,
         backend_probe=backend_probe,
         backend_caps=backend_caps,
-        device_discovery=bindings.select_device_discovery_snapshot(),
+        device_discovery=device_discovery,
         selected_device_context=str(getattr(config, "tray_device_context", "keyboard") or "keyboard"),
         ite_rows=ite_rows,
         ite_cols=ite_cols,
@@ -235,17 +254,21 @@ def start_tray_runtime(
     bindings.install_permission_error_callback_best_effort(state.engine, notify_permission_issue)
     bindings.configure_engine_software_targets(runtime_tray)
 
-    power_manager = bindings.start_power_monitoring(
-        runtime_tray,
-        power_manager_cls=cast(_PowerManagerFactory, state.power_manager_factory),
-        config=state.config,
-    )
+    with startup_phase("power monitoring"):
+        power_manager = bindings.start_power_monitoring(
+            runtime_tray,
+            power_manager_cls=cast(_PowerManagerFactory, state.power_manager_factory),
+            config=state.config,
+        )
     runtime_tray.power_manager = power_manager
     # Start the configured effect before the config-poll thread can perform its
     # startup apply. The previous order allowed both paths to enter
     # start_effect() concurrently, leaving two reactive input listeners alive.
-    bindings.maybe_autostart_effect(cast(_AutostartEffectTray, tray))
-    bindings.start_all_polling(runtime_tray, ite_num_rows=state.ite_rows, ite_num_cols=state.ite_cols)
+    # This also restores the lighting before run() loads pystray and PIL.
+    with startup_phase("first frame"):
+        bindings.maybe_autostart_effect(cast(_AutostartEffectTray, tray))
+    with startup_phase("polling"):
+        bindings.start_all_polling(runtime_tray, ite_num_rows=state.ite_rows, ite_num_cols=state.ite_cols)
     return power_manager
 
 
@@ -262,19 +285,31 @@ def run_tray(
     if state is None:
         state = build_tray_run_state(tray)
 
-    pystray, item = bindings.get_pystray()
+    with startup_phase("ui imports"):
+        pystray, item = bindings.get_pystray()
 
     bindings.logger.info("Creating tray icon...")
-    icon = pystray.Icon(
-        "keyrgb",
-        bindings.create_icon_for_state(config=state.config, is_off=state.is_off, backend=state.backend),
-        "KeyRGB",
-        menu=bindings.build_menu(tray, pystray=pystray, item=item),
-    )
+    with startup_phase("icon and menu"):
+        icon = pystray.Icon(
+            "keyrgb",
+            bindings.create_icon_for_state(config=state.config, is_off=state.is_off, backend=state.backend),
+            "KeyRGB",
+            menu=bindings.build_menu(tray, pystray=pystray, item=item),
+        )
     tray.icon = icon
 
     bindings.logger.info("KeyRGB tray app started")
     bindings.logger.info("Current effect: %s", state.config.effect)
     bindings.logger.info("Speed: %s, Brightness: %s", state.config.speed, state.config.brightness)
     bindings.flush_pending_notifications(tray)
-    icon.run()
+    if startup_trace_active():
+        icon.run(setup=_show_icon_and_finish_startup_trace)
+    else:
+        icon.run()
+
+
+def _show_icon_and_finish_startup_trace(icon: _PystrayIcon) -> None:
+    # pystray's default setup only makes the icon visible; keep that.
+    icon.visible = True
+    mark_startup("icon shown")
+    finish_startup_trace()
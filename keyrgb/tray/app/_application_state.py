@@ -6,7 +6,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
-from keyrgb.tray.protocols import TrayIconState
+from keyrgb.tray.protocols import TrayControlState, TrayIconState
 
 if TYPE_CHECKING:
     from keyrgb.core.backends.base import BackendCapabilities
@@ -19,6 +19,7 @@ class _TrayPreBootstrapWritable(Protocol):
     icon: object | None
     is_off: bool
     tray_icon_state: TrayIconState
+    tray_control_state: TrayControlState
     tray_idle_power_state: TrayIdlePowerState
     runtime_coordinator: TrayRuntimeCoordinator
     _power_forced_off: bool
@@ -39,6 +40,7 @@ class TrayPreBootstrapState:
     icon: object | None
     is_off: bool
     tray_icon_state: TrayIconState
+    tray_control_state: TrayControlState
     tray_idle_power_state: TrayIdlePowerState
     runtime_coordinator: TrayRuntimeCoordinator
     power_forced_off: bool
@@ -57,6 +59,7 @@ class TrayPreBootstrapState:
         tray.icon = self.icon
         tray.is_off = self.is_off
         tray.tray_icon_state = self.tray_icon_state
+        tray.tray_control_state = self.tray_control_state
         tray.tray_idle_power_state = self.tray_idle_power_state
         tray.runtime_coordinator = self.runtime_coordinator
         owner = self.tray_idle_power_state
@@ -16,6 +16,7 @@ from keyrgb.tray.controllers.runtime_coordination import (
     run_tray_observation_if_current,
     run_tray_transition,
 )
+from keyrgb.tray.pollers.control import notify_state_changed as notify_control_state_changed
 
 
 def _application_module():
@@ -42,6 +43,7 @@ class KeyRGBTrayDelegateMixin:
         if defer_ui_refresh(self, icon=True, animate_icon=animate):
             return
         _application_module().update_tray_icon(self, animate=animate)
+        notify_control_state_changed(self)
 
     def _update_menu(self):
         if defer_ui_refresh(self, menu=True):
@@ -179,6 +181,12 @@ class KeyRGBTrayDelegateMixin:
     def restore(self):
         return run_tray_transition(self, lambda: _application_module().power_restore(self))
 
+    def arm_resume_restore(self) -> None:
+        run_tray_transition(self, lambda: _application_module().arm_resume_restore(self))
+
+    def restore_after_resume(self):
+        return run_tray_transition(self, lambda: _application_module().restore_after_resume(self))
+
     def apply_brightness_from_power_policy(self, brightness: int) -> None:
         """Best-effort brightness apply used by PowerManager battery-saver.
 
@@ -139,6 +139,14 @@ def power_turn_off(tray: object) -> None:
     _module("keyrgb.tray.controllers.lighting_controller").power_turn_off(tray)
 
 
+def arm_resume_restore(tray: object) -> None:
+    _module("keyrgb.tray.controllers.lighting_controller").arm_resume_restore(tray)
+
+
+def restore_after_resume(tray: object) -> None:
+    _module("keyrgb.tray.controllers.lighting_controller").restore_after_resume(tray)
+
+
 def start_current_effect(tray: object, **kwargs: object) -> bool:
     return bool(_module("keyrgb.tray.controllers.lighting_controller").start_current_effect(tray, **kwargs))
 
@@ -187,10 +195,15 @@ def start_power_monitoring(
 
 
 def update_tray_icon(tray: object, *, animate: bool = True) -> None:
+    # Before run() creates the icon there is nothing to redraw; skip importing the UI (and PIL) for it.
+    if not getattr(tray, "icon", None):
+        return
     _module("keyrgb.tray.ui.refresh").update_icon(tray, animate=animate)
 
 
 def update_tray_menu(tray: object) -> None:
+    if not getattr(tray, "icon", None):
+        return
     _module("keyrgb.tray.ui.refresh").update_menu(tray)
 
 
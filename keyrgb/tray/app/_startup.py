@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
 from typing import Protocol, TypeVar, cast, overload
 
 _STARTUP_MIGRATION_ERRORS = (AttributeError, ImportError, LookupError, OSError, RuntimeError, TypeError, ValueError)
 _STARTUP_CALLBACK_INSTALL_ERRORS = (AttributeError, RuntimeError)
 _STARTUP_ENGINE_SET_BACKEND_ERRORS = (TypeError, RuntimeError, ValueError)
+_STARTUP_INSTANT_ON_ERRORS = (AttributeError, ImportError, OSError, RuntimeError, TypeError, ValueError)
 _ResultT = TypeVar("_ResultT")
 _EngineT_co = TypeVar("_EngineT_co", covariant=True)
 _PermissionErrorCallback = Callable[[Exception | None], None]
@@ -23,6 +25,11 @@ class _NotificationDrainTray(Protocol):
     def _notify(self, title: str, message: str) -> None: ...
 
 
+class _ReplayTargetEngine(Protocol):
+    kb: object
+    kb_lock: threading.RLock
+
+
 class _PermissionErrorCallbackSink(Protocol):
     @property
     def _permission_error_cb(self) -> _PermissionErrorCallback | None: ...
@@ -80,6 +87,62 @@ def create_effects_engine(EffectsEngine: _EffectsEngineFactory[_EngineT_co], *,
         return engine
 
 
+def _configured_lighting_off(config: object) -> bool:
+    """True when the config's brightness is 0 or the current power source keeps lighting off."""
+
+    brightness_attr = "perkey_brightness" if getattr(config, "effect", None) == "perkey" else "brightness"
+    brightness = getattr(config, brightness_attr, None)
+    try:
+        if brightness is not None and int(brightness) <= 0:
+            return True
+    except (TypeError, ValueError):
+        return True
+    if not getattr(config, "power_management_enabled", True):
+        return False
+
+    from keyrgb.core.power.monitoring.power_supply_sysfs import read_on_ac_power
+
+    on_ac = read_on_ac_power()
+    if on_ac is None:
+        return False
+    return not getattr(config, "ac_lighting_enabled" if on_ac else "battery_lighting_enabled", True)
+
+
+def replay_last_output_best_effort(engine: object, *, config: object, backend: object) -> bool:
+    """Repaint the last committed output on the just-opened device, then record new output.
+
+    Only replays when the config autostarts lighting, so a tray that leaves the
+    keyboard alone at startup still does, and never while the configured
+    brightness or the power-source policy keeps the keyboard off.
+    """
+
+    def _replay() -> bool:
+        from keyrgb.core.backends.probe_cache import hardware_fingerprint
+        from keyrgb.core.effects import instant_on
+
+        backend_name = getattr(backend, "name", None)
+        if not isinstance(backend_name, str) or not instant_on.instant_on_enabled():
+            return False
+        fingerprint = hardware_fingerprint()
+        replayed = None
+        if (
+            getattr(config, "autostart", False)
+            and getattr(engine, "device_available", False)
+            and not _configured_lighting_off(config)
+        ):
+            target = cast(_ReplayTargetEngine, engine)
+            replayed = instant_on.replay_output_snapshot(
+                target.kb,
+                target.kb_lock,
+                backend_name=backend_name,
+                fingerprint=fingerprint,
+            )
+        instant_on.start_output_recording(backend_name, fingerprint=fingerprint)
+        return replayed is not None
+
+    return _run_best_effort(_replay, fallback=False, recoverable_errors=_STARTUP_INSTANT_ON_ERRORS)
+
+
 def install_permission_error_callback_best_effort(engine: object, callback: _PermissionErrorCallback) -> None:
     _run_best_effort(
         lambda: _install_permission_error_callback(cast(_PermissionErrorCallbackSink, engine), callback),
@@ -15,7 +15,7 @@ from keyrgb.core.backends.exceptions import BackendError, format_backend_error
 from keyrgb.core.utils.safe_attrs import safe_str_attr
 from keyrgb.tray.controllers import view_snapshots as tray_view_snapshots
 from keyrgb.tray.idle_power_state import ensure_tray_idle_power_state
-from keyrgb.tray.protocols import TrayIconState
+from keyrgb.tray.protocols import TrayControlState, TrayIconState
 
 from . import (
     _application_bindings as application_bindings,
@@ -41,6 +41,7 @@ select_device_discovery_snapshot = app_runtime_deps.select_device_discovery_snap
 load_ite_dimensions = app_runtime_deps.load_ite_dimensions
 build_permission_denied_message = tray_startup.build_permission_denied_message
 create_effects_engine = tray_startup.create_effects_engine
+replay_last_output_best_effort = tray_startup.replay_last_output_best_effort
 flush_pending_notifications = tray_startup.flush_pending_notifications
 install_permission_error_callback_best_effort = tray_startup.install_permission_error_callback_best_effort
 migrate_builtin_profile_brightness_best_effort = tray_startup.migrate_builtin_profile_brightness_best_effort
@@ -48,6 +49,8 @@ apply_brightness_from_power_policy = app_runtime_deps.apply_brightness_from_powe
 apply_power_source_perkey_profile_transition = app_runtime_deps.apply_power_source_perkey_profile_transition
 power_restore = app_runtime_deps.power_restore
 power_turn_off = app_runtime_deps.power_turn_off
+arm_resume_restore = app_runtime_deps.arm_resume_restore
+restore_after_resume = app_runtime_deps.restore_after_resume
 start_current_effect = app_runtime_deps.start_current_effect
 configure_engine_software_targets = app_runtime_deps.configure_engine_software_targets
 close_secondary_software_target_cache = app_runtime_deps.close_secondary_software_target_cache
@@ -75,6 +78,7 @@ def _init_bindings() -> application_bindings.TrayInitBindings:
         select_backend_with_introspection=select_backend_with_introspection,
         select_device_discovery_snapshot=select_device_discovery_snapshot,
         create_effects_engine=create_effects_engine,
+        replay_last_output=replay_last_output_best_effort,
         load_ite_dimensions=load_ite_dimensions,
         install_permission_error_callback_best_effort=install_permission_error_callback_best_effort,
         configure_engine_software_targets=configure_engine_software_targets,
@@ -113,6 +117,7 @@ class KeyRGBTray(KeyRGBTrayDelegateMixin):
     effective_secondary_routes: tuple[object, ...]
     selected_device_context: str
     tray_icon_state: TrayIconState
+    tray_control_state: TrayControlState
     runtime_coordinator: TrayRuntimeCoordinator
     _dim_sync_suppressed_logged: bool
     _event_last_at: dict[str, float]
@@ -8,15 +8,21 @@ if optional features fail.
 from __future__ import annotations
 
 import logging
-import threading
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast
 
+from keyrgb.core.effects.instant_on import stop_output_recording
+from keyrgb.core.runtime.input_hub import start_input_hub, stop_input_hub
+from keyrgb.core.runtime.uevent_monitor import start_uevent_monitor, stop_uevent_monitor
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+
 from ..controllers.runtime_coordination import run_tray_transition
-from ..pollers.config_polling import start_config_polling
-from ..pollers.hardware_polling import start_hardware_polling
-from ..pollers.icon_color_polling import start_icon_color_polling
-from ..pollers.idle_power import start_idle_power_polling
-from ..pollers.time_scheduler import start_time_scheduler_polling
+from ..pollers._reactor import PollerReactor, poller_reactor_enabled
+from ..pollers.config_polling import schedule_config_polling, start_config_polling
+from ..pollers.control import schedule_control_socket, start_control_socket
+from ..pollers.hardware_polling import schedule_hardware_polling, start_hardware_polling
+from ..pollers.icon_color_polling import schedule_icon_color_polling, start_icon_color_polling
+from ..pollers.idle_power import schedule_idle_power_polling, start_idle_power_polling
+from ..pollers.time_scheduler import schedule_time_scheduler_polling, start_time_scheduler_polling
 from ..protocols import ConfigPollingTrayProtocol, IdlePowerTrayProtocol, LightingTrayProtocol
 
 logger = logging.getLogger(__name__)
@@ -109,12 +115,39 @@ def _record_polling_thread(tray: object, thread: object | None) -> None:
 
 
 def start_all_polling(tray: _LifecyclePollingTray, *, ite_num_rows: int, ite_num_cols: int) -> None:
-    """Start all pollers used by the tray UI."""
+    """Start all pollers used by the tray UI.
+
+    The pollers share one reactor thread unless ``KEYRGB_DISABLE_POLLER_REACTOR``
+    asks for the previous one-thread-per-poller layout.
+    """
 
-    shutdown_event = threading.Event()
+    shutdown_event = WakeEvent()
     vars(tray)["_polling_shutdown_event"] = shutdown_event
     vars(tray)["_polling_threads"] = []
 
+    # Start the input hub first so the idle poller and reactive effects share
+    # its device fds from their first poll.
+    try:
+        start_input_hub()
+    except _SHUTDOWN_RECOVERABLE_ERRORS:
+        logger.debug("Failed to start the input hub; input readers open devices directly", exc_info=True)
+    # Power-source reads come from the uevent monitor's cache once it runs.
+    try:
+        start_uevent_monitor()
+    except _SHUTDOWN_RECOVERABLE_ERRORS:
+        logger.debug("Failed to start the uevent monitor; power state is read from sysfs", exc_info=True)
+
+    if poller_reactor_enabled():
+        reactor = PollerReactor(shutdown_event)
+        schedule_hardware_polling(reactor, tray)
+        schedule_config_polling(reactor, tray, ite_num_rows=ite_num_rows, ite_num_cols=ite_num_cols)
+        schedule_icon_color_polling(reactor, tray)
+        schedule_idle_power_polling(reactor, tray, ite_num_rows=ite_num_rows, ite_num_cols=ite_num_cols)
+        schedule_time_scheduler_polling(reactor, tray)
+        schedule_control_socket(reactor, tray, ite_num_rows=ite_num_rows, ite_num_cols=ite_num_cols)
+        _record_polling_thread(tray, reactor.start())
+        return
+
     _record_polling_thread(tray, start_hardware_polling(tray))
     _record_polling_thread(tray, start_config_polling(tray, ite_num_rows=ite_num_rows, ite_num_cols=ite_num_cols))
     _record_polling_thread(tray, start_icon_color_polling(tray))
@@ -123,6 +156,35 @@ def start_all_polling(tray: _LifecyclePollingTray, *, ite_num_rows: int, ite_num
         start_idle_power_polling(tray, ite_num_rows=ite_num_rows, ite_num_cols=ite_num_cols),
     )
     _record_polling_thread(tray, start_time_scheduler_polling(tray))
+    _record_polling_thread(tray, start_control_socket(tray, ite_num_rows=ite_num_rows, ite_num_cols=ite_num_cols))
+
+
+def _stop_input_hub_best_effort(timeout_s: float) -> bool:
+    try:
+        stopped = stop_input_hub(timeout_s=timeout_s)
+    except _SHUTDOWN_RECOVERABLE_ERRORS:
+        stopped = False
+        logger.debug("Failed to stop the input hub during shutdown", exc_info=True)
+    if not stopped:
+        logger.warning("Tray shutdown could not stop the input hub thread")
+    return stopped
+
+
+def _stop_uevent_monitor_best_effort(timeout_s: float) -> bool:
+    try:
+        stopped = stop_uevent_monitor(timeout_s=timeout_s)
+    except _SHUTDOWN_RECOVERABLE_ERRORS:
+        stopped = False
+        logger.debug("Failed to stop the uevent monitor during shutdown", exc_info=True)
+    if not stopped:
+        logger.warning("Tray shutdown could not stop the uevent monitor thread")
+    return stopped
+
+
+def _stop_shared_monitors_best_effort(timeout_s: float) -> bool:
+    input_hub_stopped = _stop_input_hub_best_effort(timeout_s)
+    uevent_monitor_stopped = _stop_uevent_monitor_best_effort(timeout_s)
+    return input_hub_stopped and uevent_monitor_stopped
 
 
 def stop_all_polling(tray: object, *, join_timeout_s: float = 2.0) -> bool:
@@ -135,7 +197,7 @@ def stop_all_polling(tray: object, *, join_timeout_s: float = 2.0) -> bool:
 
     threads = vars(tray).get("_polling_threads")
     if not isinstance(threads, list):
-        return True
+        return _stop_shared_monitors_best_effort(join_timeout_s)
     unquiesced_threads: list[object] = []
     for thread in tuple(threads):
         join = getattr(thread, "join", None)
@@ -161,12 +223,13 @@ def stop_all_polling(tray: object, *, join_timeout_s: float = 2.0) -> bool:
             logger.debug("Failed to verify tray polling thread shutdown", exc_info=True)
 
     threads[:] = unquiesced_threads
+    monitors_stopped = _stop_shared_monitors_best_effort(join_timeout_s)
     if unquiesced_threads:
         logger.warning(
             "Tray shutdown still has %d active or unverifiable polling worker(s)",
             len(unquiesced_threads),
         )
-    return not unquiesced_threads
+    return monitors_stopped and not unquiesced_threads
 
 
 def shutdown_tray_runtime_best_effort(tray: object) -> None:
@@ -216,6 +279,8 @@ def shutdown_tray_runtime_best_effort(tray: object) -> None:
             engine_quiesced = False
             logger.debug("Failed to close effects engine during shutdown", exc_info=True)
 
+    stop_output_recording()
+
     engine_thread = getattr(engine, "thread", None)
     thread_is_alive = getattr(engine_thread, "is_alive", None)
     if callable(thread_is_alive):
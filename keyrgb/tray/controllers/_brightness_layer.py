@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
+from keyrgb.core.effects import instant_on
 from keyrgb.core.utils.safe_attrs import safe_int_attr
 from keyrgb.tray.idle_power_state import set_last_brightness
 from keyrgb.tray.protocols import LightingTrayProtocol
@@ -34,6 +35,7 @@ def apply_layered_brightness_update(
 
     if base_brightness is not None and int(base_brightness) > 0:
         set_last_brightness(tray, int(base_brightness))
+        instant_on.record_output_brightness(int(base_brightness))
 
     try_log_event(
         tray,
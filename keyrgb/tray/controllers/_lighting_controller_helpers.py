@@ -69,8 +69,11 @@ def _set_engine_attr_best_effort(
     fallback: object = _ENGINE_FALLBACK_UNSET,
 ) -> None:
     engine = getattr(tray, "engine", None)
+    if engine is None:
+        return
     try:
         setattr(engine, attr, value)
+        engine.wake_render_loop()
         return
     except AttributeError:
         return
@@ -256,6 +259,7 @@ def sync_reactive_effect_brightness_state(
                         exc,
                     )
             if base_brightness is None:
+                tray.engine.wake_render_loop()
                 return
 
             try:
@@ -50,6 +50,7 @@ def on_speed_clicked_impl(
             # without restarting the loop (avoids flicker and state loss).
             try:
                 tray.engine.speed = speed
+                tray.engine.wake_render_loop()
             except _LOCAL_COMPATIBILITY_FALLBACK_EXCEPTIONS as exc:
                 log_boundary_exception(tray, "Failed to update engine speed in place: %s", exc)
                 start_current_effect(tray)
@@ -7,6 +7,7 @@ re-exports these apply functions so existing call sites stay stable.
 
 from __future__ import annotations
 
+from keyrgb.core.effects import instant_on
 from keyrgb.core.effects.perkey_animation import restore_hidden_per_key_rows_once
 from keyrgb.core.utils.safe_attrs import safe_int_attr
 from keyrgb.tray.idle_power_state import (
@@ -99,6 +100,7 @@ def apply_perkey_mode(
         )
     ):
         _clear_hidden_restore_hints()
+        instant_on.record_per_key_output(tray.config.per_key_colors, brightness=int(effective_brightness))
         tray.is_off = False
         return
 
@@ -125,6 +127,7 @@ def apply_perkey_mode(
             brightness=effective_brightness,
             enable_user_mode=should_reassert_user_mode,
         )
+    instant_on.record_per_key_output(tray.config.per_key_colors, brightness=int(effective_brightness))
 
     tray.is_off = False
 
@@ -206,5 +209,6 @@ def apply_uniform_none_mode(tray: LightingTrayProtocol, *, brightness_override:
 
     with tray.engine.kb_lock:
         tray.engine.kb.set_color(tray.config.color, brightness=effective_brightness)
+    instant_on.record_uniform_output(tray.config.color, brightness=int(effective_brightness))
 
     tray.is_off = False
@@ -118,7 +118,7 @@ def power_turn_off_impl(
     tray._refresh_ui(refresh_menu=False)
 
 
-def power_restore_impl(
+def prepare_power_restore(
     tray: LightingTrayProtocol,
     *,
     try_log_event: Callable[..., None],
@@ -126,8 +126,9 @@ def power_restore_impl(
     safe_str_attr_fn: Callable[..., str],
     is_software_effect_fn: Callable[[str], bool],
     is_reactive_effect_fn: Callable[[str], bool],
-    start_current_effect: Callable[..., object],
-) -> None:
+) -> bool:
+    """Run the power-restore guards and state resets; return whether lighting should come back."""
+
     resume_at = time.monotonic()
     _set_last_resume_at(tray, resume_at)
 
@@ -139,10 +140,10 @@ def power_restore_impl(
         is_reactive_effect_fn=is_reactive_effect_fn,
     )
     if policy_state.guard_state.user_forced_off:
-        return
+        return False
 
     if policy_state.guard_state.idle_forced_off is True:
-        return
+        return False
 
     if policy_state.should_log_power_restore:
         try_log_event(tray, "power", "restore")
@@ -151,10 +152,32 @@ def power_restore_impl(
 
     if not policy_state.should_restore:
         tray.is_off = True
-        return
+        return False
 
     tray.engine.current_color = (0, 0, 0)
     tray.is_off = False
+    return True
+
+
+def power_restore_impl(
+    tray: LightingTrayProtocol,
+    *,
+    try_log_event: Callable[..., None],
+    safe_int_attr_fn: Callable[..., int],
+    safe_str_attr_fn: Callable[..., str],
+    is_software_effect_fn: Callable[[str], bool],
+    is_reactive_effect_fn: Callable[[str], bool],
+    start_current_effect: Callable[..., object],
+) -> None:
+    if not prepare_power_restore(
+        tray,
+        try_log_event=try_log_event,
+        safe_int_attr_fn=safe_int_attr_fn,
+        safe_str_attr_fn=safe_str_attr_fn,
+        is_software_effect_fn=is_software_effect_fn,
+        is_reactive_effect_fn=is_reactive_effect_fn,
+    ):
+        return
 
     # Lid/suspend is a cold start even for loop/reactive effects. Restarting
     # in place at full brightness skips the enable_user_mode@1 prime and shows
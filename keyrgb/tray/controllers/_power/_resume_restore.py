@@ -0,0 +1,230 @@
+"""Pre-armed keyboard restore for resume from suspend.
+
+The generic power restore waits 0.5 s after logind reports the resume, then
+soft-starts the effect at brightness 1 and fades it in. A device handle that
+went stale across suspend is only replaced once the hardware poller notices.
+Together that brings the keyboard back seconds after the screen.
+
+At PrepareForSleep(true) the tray arms a ``ResumeRestorePlan`` from state it
+already holds:
+
+- the brightness the lighting policy resolves to;
+- the last committed output, taken from the instant-on recorder;
+- the effect it belongs to;
+- the backend the device is reopened through.
+
+On resume, ``restore_after_resume_impl()`` runs the usual restore guards, then:
+
+1. reopens the device, retrying within ``RESUME_REOPEN_WINDOW_S``;
+2. writes the armed output at full brightness;
+3. starts the effect.
+
+The time each step takes is logged against ``RESUME_RESTORE_BUDGET_S``. If the
+plan is missing or stale, or the first write fails, the generic soft-on fade
+runs instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol, cast
+
+from keyrgb.core.effects import instant_on
+from keyrgb.core.effects._output_snapshot import OutputSnapshot
+from keyrgb.core.utils.safe_attrs import safe_str_attr
+from keyrgb.tray.idle_power_state import ensure_tray_idle_power_state
+from keyrgb.tray.protocols import LightingTrayProtocol
+
+from ._lighting_power_state import prepare_power_restore
+from ._transition_constants import SOFT_ON_START_BRIGHTNESS, idle_fade_duration_s
+
+logger = logging.getLogger(__name__)
+
+RESUME_RESTORE_BUDGET_S = 0.25
+RESUME_REOPEN_WINDOW_S = 2.0
+_RESUME_REOPEN_RETRY_S = 0.02
+_RESUME_WRITE_ERRORS = (AttributeError, LookupError, OSError, RuntimeError, TypeError, ValueError)
+
+
+class _ResumeEngine(Protocol):
+    kb: object
+    kb_lock: threading.RLock
+
+    def reopen_device(self, *, stale_kb: object | None = None) -> bool: ...
+
+
+@dataclass(frozen=True)
+class ResumeRestorePlan:
+    """Everything the resume fast path needs, resolved before the system sleeps."""
+
+    effect: str
+    brightness: int
+    output: OutputSnapshot | None
+    backend: object | None
+
+
+@dataclass(frozen=True)
+class ResumeRestoreTiming:
+    reopen_ms: float
+    reopened: bool
+    first_write_ms: float | None
+    effect_running_ms: float
+    total_ms: float
+
+    @property
+    def over_budget(self) -> bool:
+        return self.total_ms > RESUME_RESTORE_BUDGET_S * 1000.0
+
+    def format(self) -> str:
+        first_write = "skipped" if self.first_write_ms is None else f"{self.first_write_ms:.1f} ms"
+        return (
+            f"device {'reopen' if self.reopened else 'reuse'} {self.reopen_ms:.1f} ms, "
+            f"first write {first_write}, effect running {self.effect_running_ms:.1f} ms, "
+            f"total {self.total_ms:.1f} ms (budget {RESUME_RESTORE_BUDGET_S * 1000.0:.0f} ms)"
+        )
+
+
+def arm_resume_restore_impl(
+    tray: LightingTrayProtocol,
+    *,
+    resolve_target_brightness_fn: Callable[[LightingTrayProtocol], int],
+) -> ResumeRestorePlan:
+    engine = tray.engine
+    brightness = int(resolve_target_brightness_fn(tray))
+    output = instant_on.current_output_snapshot() if brightness > 0 else None
+    plan = ResumeRestorePlan(
+        effect=safe_str_attr(tray.config, "effect", default="none") or "none",
+        brightness=brightness,
+        output=output,
+        backend=getattr(engine, "backend", None),
+    )
+    ensure_tray_idle_power_state(tray).resume_restore_plan = plan
+    return plan
+
+
+def _take_plan(tray: LightingTrayProtocol) -> ResumeRestorePlan | None:
+    # One plan per suspend: a lid-open or a second resume event must not replay it.
+    state = ensure_tray_idle_power_state(tray)
+    plan = state.resume_restore_plan
+    state.resume_restore_plan = None
+    return plan
+
+
+def _reopen_device(
+    engine: _ResumeEngine,
+    *,
+    deadline: float,
+    clock: Callable[[], float],
+    sleep_fn: Callable[[float], None],
+) -> bool:
+    # Through the engine's reopen, which serializes with the hardware poller's
+    # recovery; a handle the poller reopened meanwhile is kept.
+    stale_kb = engine.kb
+    while True:
+        if engine.reopen_device(stale_kb=stale_kb):
+            return True
+        if clock() + _RESUME_REOPEN_RETRY_S > deadline:
+            return False
+        sleep_fn(_RESUME_REOPEN_RETRY_S)
+
+
+def _write_armed_output(engine: _ResumeEngine, plan: ResumeRestorePlan) -> bool:
+    if plan.output is None:
+        return False
+    try:
+        instant_on.write_output_snapshot(
+            engine.kb,
+            engine.kb_lock,
+            plan.output,
+            brightness=plan.brightness,
+        )
+    except _RESUME_WRITE_ERRORS as exc:  # @quality-exception exception-transparency: the first write races device re-enumeration after resume; a failure means reopen and retry, and the generic restore still follows
+        logger.debug("Resume first write failed: %s", exc)
+        return False
+    return True
+
+
+def restore_after_resume_impl(
+    tray: LightingTrayProtocol,
+    *,
+    try_log_event: Callable[..., None],
+    safe_int_attr_fn: Callable[..., int],
+    safe_str_attr_fn: Callable[..., str],
+    is_software_effect_fn: Callable[[str], bool],
+    is_reactive_effect_fn: Callable[[str], bool],
+    start_current_effect: Callable[..., object],
+    clock: Callable[[], float] = time.monotonic,
+    sleep_fn: Callable[[float], None] = time.sleep,
+) -> ResumeRestoreTiming | None:
+    """Bring the keyboard back from suspend; returns the timing breakdown when it restored."""
+
+    plan = _take_plan(tray)
+    started = clock()
+    if not prepare_power_restore(
+        tray,
+        try_log_event=try_log_event,
+        safe_int_attr_fn=safe_int_attr_fn,
+        safe_str_attr_fn=safe_str_attr_fn,
+        is_software_effect_fn=is_software_effect_fn,
+        is_reactive_effect_fn=is_reactive_effect_fn,
+    ):
+        return None
+
+    engine = cast(_ResumeEngine, tray.engine)
+    effect = safe_str_attr_fn(tray.config, "effect", default="none") or "none"
+    if plan is not None and (plan.effect != effect or plan.backend is not getattr(engine, "backend", None)):
+        plan = None
+
+    deadline = started + RESUME_REOPEN_WINDOW_S
+    reopened = False
+    lit = False
+    first_write_ms: float | None = None
+    reopen_s = 0.0
+    available = bool(getattr(engine, "device_available", False))
+    write_failed = False
+    if plan is not None and plan.output is not None and available:
+        # Try the handle kept across suspend first; reopen only when it went stale.
+        write_at = clock()
+        lit = _write_armed_output(engine, plan)
+        first_write_ms = (clock() - write_at) * 1000.0
+        write_failed = not lit
+    if write_failed or not available:
+        reopen_at = clock()
+        available = _reopen_device(engine, deadline=deadline, clock=clock, sleep_fn=sleep_fn)
+        reopen_s = clock() - reopen_at
+        reopened = True
+        if available and plan is not None and plan.output is not None:
+            write_at = clock()
+            lit = _write_armed_output(engine, plan)
+            first_write_ms = (clock() - write_at) * 1000.0
+
+    effect_at = clock()
+    if lit:
+        # The armed output is already showing at full brightness; a soft-on would dip it back to 1.
+        start_current_effect(tray)
+    else:
+        start_current_effect(
+            tray,
+            brightness_override=SOFT_ON_START_BRIGHTNESS,
+            fade_in=True,
+            fade_in_duration_s=idle_fade_duration_s(tray.config),
+        )
+    finished = clock()
+    tray._refresh_ui(refresh_menu=False)
+
+    timing = ResumeRestoreTiming(
+        reopen_ms=reopen_s * 1000.0,
+        reopened=reopened,
+        first_write_ms=first_write_ms if lit else None,
+        effect_running_ms=(finished - effect_at) * 1000.0,
+        total_ms=(finished - started) * 1000.0,
+    )
+    if timing.over_budget:
+        logger.warning("Resume restore over budget: %s", timing.format())
+    else:
+        logger.info("Resume restore: %s", timing.format())
+    return timing
@@ -92,6 +92,7 @@ def set_engine_attr_best_effort(tray: _SoftwareTargetTrayProtocol, attr: str, va
 
     try:
         setattr(engine, attr, value)
+        engine.wake_render_loop()
     except AttributeError:
         return
     except _ENGINE_ATTR_WRITE_EXCEPTIONS as exc:
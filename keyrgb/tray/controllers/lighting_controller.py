@@ -3,7 +3,7 @@ from __future__ import annotations
 # @quality-exception file-size-analysis: thin public lighting-controller facade; mode/helpers already extracted to sibling modules
 import logging
 
-from keyrgb.core.effects import catalog as effects_catalog
+from keyrgb.core.effects import catalog as effects_catalog, instant_on
 from keyrgb.core.utils import exceptions as core_exceptions, safe_attrs
 from keyrgb.tray.controllers import (
     _lighting_controller_helpers as lighting_controller_helpers,
@@ -17,6 +17,7 @@ from keyrgb.tray.controllers import (
 from keyrgb.tray.controllers._power import (
     _lighting_power_policy as lighting_power_policy,
     _lighting_power_state as lighting_power_state,
+    _resume_restore as resume_restore,
 )
 from keyrgb.tray.protocols import LightingTrayProtocol
 
@@ -190,6 +191,7 @@ def start_current_effect(
                 fade_in_duration_s=fade_in_duration_s,
                 restore_secondary_targets=start_plan.restore_secondary_targets,
             )
+            instant_on.record_output_brightness(target_brightness)
             return True
 
         if start_plan.is_none_mode:
@@ -202,6 +204,7 @@ def start_current_effect(
                 fade_in_duration_s=fade_in_duration_s,
                 restore_secondary_targets=start_plan.restore_secondary_targets,
             )
+            instant_on.record_output_brightness(target_brightness)
             return True
 
         # Prepare per-key state in case the effect is a software effect that needs it.
@@ -267,6 +270,8 @@ def start_current_effect(
             restore_secondary_software_targets(tray)
         if start_plan.is_loop_effect and not start_plan.restore_secondary_targets or not start_plan.is_loop_effect:
             secondary_static_scene.apply_secondary_static_scene(tray)
+        # Fade-ins record their start level; the snapshot keeps the level they ramp to.
+        instant_on.record_output_brightness(target_brightness)
         return True
     except _START_CURRENT_EFFECT_RUNTIME_EXCEPTIONS as exc:  # @quality-exception exception-transparency: lighting startup crosses device I/O, backend callbacks, tray actions; must not fail tray runtime for recoverable failures
         lighting_start_effect_boundary.handle_start_current_effect_exception(
@@ -371,6 +376,29 @@ def power_restore(tray: LightingTrayProtocol) -> None:
     )
 
 
+def arm_resume_restore(tray: LightingTrayProtocol) -> None:
+    """Resolve the resume restore while the system prepares to sleep."""
+
+    resume_restore.arm_resume_restore_impl(
+        tray,
+        resolve_target_brightness_fn=lambda target: (
+            _resolve_start_current_effect_policy(target, brightness_override=None).target_brightness
+        ),
+    )
+
+
+def restore_after_resume(tray: LightingTrayProtocol) -> None:
+    resume_restore.restore_after_resume_impl(
+        tray,
+        try_log_event=lighting_controller_helpers.try_log_event,
+        safe_int_attr_fn=safe_attrs.safe_int_attr,
+        safe_str_attr_fn=safe_attrs.safe_str_attr,
+        is_software_effect_fn=lighting_controller_helpers.is_software_effect,
+        is_reactive_effect_fn=lighting_controller_helpers.is_reactive_effect,
+        start_current_effect=start_current_effect,
+    )
+
+
 def apply_brightness_from_power_policy(tray: LightingTrayProtocol, brightness: int) -> None:
     """Best-effort brightness apply used by PowerManager battery-saver."""
 
@@ -2,6 +2,10 @@
 
 This module owns the startup sequence (logging, diagnostics, single-instance)
 and then launches the `KeyRGBTray` application.
+
+The application and the runtime-log capture are imported on first use, so
+``--startup-trace`` can time the imports as their own phase and a plain start
+never loads the diagnostics package.
 """
 
 from __future__ import annotations
@@ -10,16 +14,17 @@ import logging
 import signal
 import sys
 from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
-from keyrgb.core.diagnostics.runtime_capture import capture_runtime_log_from_cli
-
-from .app.application import KeyRGBTray
-from .app.lifecycle import shutdown_tray_runtime_best_effort
 from .startup import (
     acquire_single_instance_or_exit,
     configure_logging,
     log_startup_diagnostics_if_debug,
 )
+from .startup.timeline import enable_startup_trace, finish_startup_trace, startup_phase, startup_trace_requested
+
+if TYPE_CHECKING:
+    from .app.application import KeyRGBTray
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,14 @@ _TRAY_ENTRYPOINT_RUNTIME_ERRORS = (
 )
 
 
+def capture_runtime_log_from_cli(argv: Sequence[str], *, prog: str) -> int | None:
+    if not argv:
+        return None
+    from keyrgb.core.diagnostics.runtime_capture import capture_runtime_log_from_cli as _capture
+
+    return _capture(argv, prog=prog)
+
+
 def _shutdown_engine_best_effort(app: object | None) -> None:
     """Stop runtime producers and release USB devices before process exit.
 
@@ -50,14 +63,16 @@ def _shutdown_engine_best_effort(app: object | None) -> None:
 
     if app is None:
         return
+    from .app.lifecycle import shutdown_tray_runtime_best_effort
+
     shutdown_tray_runtime_best_effort(app)
 
 
 def main(argv: Sequence[str] | None = None) -> None:
-    capture_exit_code = capture_runtime_log_from_cli(
-        tuple(sys.argv[1:] if argv is None else argv),
-        prog="keyrgb",
-    )
+    trace, args = startup_trace_requested(tuple(sys.argv[1:] if argv is None else argv))
+    if trace:
+        enable_startup_trace()
+    capture_exit_code = capture_runtime_log_from_cli(args, prog="keyrgb")
     if capture_exit_code is not None:
         if capture_exit_code != 0:
             raise SystemExit(capture_exit_code)
@@ -67,7 +82,8 @@ def main(argv: Sequence[str] | None = None) -> None:
     try:
         configure_logging()
         log_startup_diagnostics_if_debug()
-        acquire_single_instance_or_exit()
+        with startup_phase("single instance lock"):
+            acquire_single_instance_or_exit()
 
         # Ensure the engine is stopped and the USB device is released on
         # SIGTERM (desktop session logout / systemd stop) as well as Ctrl-C.
@@ -76,6 +92,9 @@ def main(argv: Sequence[str] | None = None) -> None:
 
         signal.signal(signal.SIGTERM, _signal_shutdown)
 
+        with startup_phase("imports"):
+            from .app.application import KeyRGBTray
+        # Restores the configured lighting; the pystray/PIL stack is only loaded by run().
         app = KeyRGBTray()
 
         app.run()
@@ -96,3 +115,5 @@ def main(argv: Sequence[str] | None = None) -> None:
         # teardown, racing with libusb device-handle cleanup and triggering
         # ``usbi_mutex_destroy`` / ``usbi_mutex_lock`` C-level assertions.
         _shutdown_engine_best_effort(app)
+        # Reports whatever was timed if startup ended before the icon was shown.
+        finish_startup_trace()
@@ -11,6 +11,10 @@ sibling modules and are re-exported so existing import paths stay stable:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from keyrgb.tray.controllers._power._resume_restore import ResumeRestorePlan
 
 
 @dataclass
@@ -59,6 +63,8 @@ class TrayIdlePowerState:
     hardware_toggle_restore_software_target: str = "keyboard"
     hardware_toggle_restore_hardware_effect: str = "none"
     hardware_toggle_restore_hardware_color: object = None
+    # Armed at PrepareForSleep(true) and taken by the first resume restore.
+    resume_restore_plan: ResumeRestorePlan | None = None
 
     def reset_dim_state(self) -> None:
         self.dim_temp_active = False
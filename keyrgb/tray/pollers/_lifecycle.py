@@ -42,3 +42,21 @@ def wait_for_shutdown(
         return bool(event.wait(max(0.0, float(timeout_s))))
     sleep_fn(float(timeout_s))
     return False
+
+
+def run_poll_steps(
+    tray: object,
+    step: Callable[[], float | None],
+    *,
+    sleep_fn: Callable[[float], None],
+) -> None:
+    """Drive a poller step on the calling thread until it ends or shutdown is requested.
+
+    ``step`` returns the delay until its next run, or ``None`` when it is done;
+    the tray's poller reactor drives the same steps as timers.
+    """
+
+    while not shutdown_requested(tray):
+        delay_s = step()
+        if delay_s is None or wait_for_shutdown(tray, delay_s, sleep_fn=sleep_fn):
+            return
@@ -0,0 +1,274 @@
+"""One event loop that runs every tray poller.
+
+The config, hardware, icon-color, idle-power and time-scheduler pollers used
+to own one thread each, each sleeping in its own ``wait_for_shutdown`` loop.
+``PollerReactor`` runs them all on a single thread instead. A poller registers
+either a timer callback that returns the delay until its next run (``None``
+ends it) or an fd callback. The thread waits in ``selectors`` for the earliest
+deadline, a ready fd, or the tray's shutdown event. Deadlines that fall within
+``_COALESCE_S`` of each other run in the same wakeup.
+
+Callbacks share the thread, so anything that can block (effect restarts and
+fades, ``engine.stop()`` joins, device I/O) must not run on it. Such timers are
+registered with ``blocking=True``, and one-off work goes through
+``run_blocking()``: both run on a single worker thread, and their results are
+posted back so rescheduling and replies still happen on the reactor thread.
+
+Every wakeup is counted as ``tray.wakeups`` and every callback's duration goes
+to ``tray.poller_callback_ms``. The pollers' own exception boundaries stay in
+place, and a callback that raises anyway is logged and dropped, as its thread
+would have died. ``KEYRGB_DISABLE_POLLER_REACTOR=1`` starts one thread per
+poller again.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import os
+import queue
+import selectors
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Protocol, TypeVar
+
+from keyrgb.core.runtime.metrics import REGISTRY, TRAY_CALLBACK_MS, TRAY_WAKEUPS, maybe_export_snapshot
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+
+logger = logging.getLogger(__name__)
+
+DISABLE_POLLER_REACTOR_ENV = "KEYRGB_DISABLE_POLLER_REACTOR"
+
+# Timers due this close together share one wakeup.
+_COALESCE_S = 0.02
+# Without an eventfd for the shutdown event, wake at least this often to check it.
+_SHUTDOWN_SLICE_S = 1.0
+# Without an eventfd for posted results, check for them this often while work is in flight.
+_POSTED_POLL_S = 0.05
+# How long the reactor waits for an in-flight blocking job when it exits.
+_WORKER_JOIN_S = 2.0
+
+TimerCallback = Callable[[], "float | None"]
+_T = TypeVar("_T")
+
+
+class _ShutdownEvent(Protocol):
+    def is_set(self) -> bool: ...
+
+
+def poller_reactor_enabled() -> bool:
+    return str(os.environ.get(DISABLE_POLLER_REACTOR_ENV, "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+@dataclass(order=True)
+class _Timer:
+    deadline: float
+    seq: int
+    name: str = field(compare=False)
+    callback: TimerCallback = field(compare=False)
+    blocking: bool = field(default=False, compare=False)
+
+
+class PollerReactor:
+    """Timers and fd callbacks for the tray pollers, run on one thread.
+
+    Register callbacks before ``start()`` or from a callback; the reactor
+    itself is not safe to mutate from other threads, which use
+    ``call_soon_threadsafe()`` instead.
+    """
+
+    def __init__(
+        self,
+        shutdown_event: _ShutdownEvent,
+        *,
+        monotonic_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._shutdown_event = shutdown_event
+        self._monotonic_fn = monotonic_fn
+        self._selector = selectors.DefaultSelector()
+        self._timers: list[_Timer] = []
+        self._seq = itertools.count()
+        self._exit_callbacks: list[Callable[[], None]] = []
+        self._shutdown_fd: int | None = None
+        wake_fd = getattr(shutdown_event, "wake_fd", None)
+        fd = wake_fd() if callable(wake_fd) else None
+        if isinstance(fd, int):
+            self._selector.register(fd, selectors.EVENT_READ, None)
+            self._shutdown_fd = fd
+
+        self._posted: deque[tuple[str, Callable[[], None]]] = deque()
+        self._posted_lock = threading.Lock()
+        self._posted_event = WakeEvent()
+        self._posted_fd = self._posted_event.wake_fd()
+        if self._posted_fd is not None:
+            self._selector.register(self._posted_fd, selectors.EVENT_READ, None)
+        self._in_flight = 0
+        self._jobs: queue.SimpleQueue[Callable[[], None] | None] = queue.SimpleQueue()
+        self._worker: threading.Thread | None = None
+
+    def call_later(self, delay_s: float, callback: TimerCallback, *, name: str, blocking: bool = False) -> None:
+        """Run ``callback`` after ``delay_s``, then again after each delay it returns.
+
+        ``blocking=True`` runs it on the worker thread instead of the reactor's.
+        """
+
+        deadline = float(self._monotonic_fn()) + max(0.0, float(delay_s))
+        heapq.heappush(self._timers, _Timer(deadline, next(self._seq), name, callback, blocking))
+
+    def call_soon_threadsafe(self, callback: Callable[[], None], *, name: str) -> None:
+        """Run ``callback`` on the reactor thread; safe to call from any thread."""
+
+        with self._posted_lock:
+            self._posted.append((name, callback))
+            self._posted_event.set()
+
+    def run_blocking(
+        self,
+        fn: Callable[[], _T],
+        *,
+        name: str,
+        then: Callable[[_T], None] | None = None,
+    ) -> None:
+        """Run ``fn`` on the worker thread, then ``then(result)`` back on the reactor thread.
+
+        Jobs run one at a time in submission order. ``then`` is skipped when
+        ``fn`` raises (it is logged like any callback) or the reactor has
+        already stopped.
+        """
+
+        self._in_flight += 1
+
+        def job() -> None:
+            results: list[_T] = []
+            self._run_callback(name, lambda: results.append(fn()))
+
+            def finish() -> None:
+                self._in_flight -= 1
+                if results and then is not None:
+                    then(results[0])
+
+            self.call_soon_threadsafe(finish, name=name)
+
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._work, name="keyrgb-poller-actions", daemon=True)
+            self._worker.start()
+        self._jobs.put(job)
+
+    def add_reader(self, fd: int, callback: Callable[[], None], *, name: str) -> None:
+        """Run ``callback`` whenever ``fd`` is readable."""
+
+        self._selector.register(fd, selectors.EVENT_READ, (name, callback))
+
+    def remove_reader(self, fd: int) -> None:
+        try:
+            self._selector.unregister(fd)
+        except (KeyError, ValueError):
+            pass
+
+    def at_exit(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` on the reactor thread once the loop stops."""
+
+        self._exit_callbacks.append(callback)
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.run, name="keyrgb-pollers", daemon=True)
+        thread.start()
+        return thread
+
+    def run(self) -> None:
+        try:
+            while not self._shutdown_event.is_set() and self._has_work():
+                ready = self._selector.select(self._next_timeout())
+                if REGISTRY.enabled:
+                    TRAY_WAKEUPS.add()
+                for key, _events in ready:
+                    if key.data is None or self._shutdown_event.is_set():
+                        continue
+                    name, callback = key.data
+                    ok, _result = self._run_callback(name, callback)
+                    if not ok:
+                        self.remove_reader(key.fd)
+                self._run_posted()
+                self._run_due_timers()
+                if REGISTRY.enabled:
+                    maybe_export_snapshot()
+        finally:
+            for callback in self._exit_callbacks:
+                self._run_callback("at_exit", callback)
+            self._stop_worker()
+            self._selector.close()
+
+    def _has_work(self) -> bool:
+        own_fds = sum(1 for fd in (self._shutdown_fd, self._posted_fd) if fd is not None)
+        reader_count = len(self._selector.get_map()) - own_fds
+        return bool(self._timers) or reader_count > 0 or self._in_flight > 0
+
+    def _next_timeout(self) -> float | None:
+        timeout: float | None = None
+        if self._timers:
+            timeout = max(0.0, self._timers[0].deadline - float(self._monotonic_fn()))
+        if self._shutdown_fd is None:
+            timeout = _SHUTDOWN_SLICE_S if timeout is None else min(timeout, _SHUTDOWN_SLICE_S)
+        if self._posted_fd is None and self._in_flight > 0:
+            timeout = _POSTED_POLL_S if timeout is None else min(timeout, _POSTED_POLL_S)
+        return timeout
+
+    def _run_posted(self) -> None:
+        with self._posted_lock:
+            posted = list(self._posted)
+            self._posted.clear()
+            self._posted_event.clear()
+        for name, callback in posted:
+            if self._shutdown_event.is_set():
+                return
+            self._run_callback(name, callback)
+
+    def _work(self) -> None:
+        while (job := self._jobs.get()) is not None:
+            job()
+
+    def _stop_worker(self) -> None:
+        worker = self._worker
+        if worker is None:
+            return
+        self._jobs.put(None)
+        worker.join(timeout=_WORKER_JOIN_S)
+        if worker.is_alive():
+            logger.warning("Tray poller worker did not finish its blocking job before shutdown")
+
+    def _run_due_timers(self) -> None:
+        horizon = float(self._monotonic_fn()) + _COALESCE_S
+        due: list[_Timer] = []
+        while self._timers and self._timers[0].deadline <= horizon:
+            due.append(heapq.heappop(self._timers))
+        for timer in due:
+            if self._shutdown_event.is_set():
+                return
+            if timer.blocking:
+                self.run_blocking(timer.callback, name=timer.name, then=self._rescheduler(timer))
+                continue
+            ok, delay = self._run_callback(timer.name, timer.callback)
+            if ok and delay is not None:
+                self.call_later(float(delay), timer.callback, name=timer.name)
+
+    def _rescheduler(self, timer: _Timer) -> Callable[[float | None], None]:
+        def reschedule(delay: float | None) -> None:
+            if delay is not None:
+                self.call_later(float(delay), timer.callback, name=timer.name, blocking=True)
+
+        return reschedule
+
+    def _run_callback(self, name: str, callback: Callable[[], _T]) -> tuple[bool, _T | None]:
+        started = time.perf_counter()
+        try:
+            return True, callback()
+        except Exception:  # @quality-exception exception-transparency: one poller's unexpected defect must not stop the others sharing the reactor thread; it is logged with its traceback and that poller is dropped, as its own thread would have died
+            logger.exception("Tray poller %r failed; it will not run again", name)
+            return False, None
+        finally:
+            if REGISTRY.enabled:
+                TRAY_CALLBACK_MS.observe((time.perf_counter() - started) * 1000.0)
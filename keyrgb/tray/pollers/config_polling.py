@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import hashlib
+import logging
+import os
 import threading
 import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 from keyrgb.core.effects.catalog import SW_EFFECTS_SET as SW_EFFECTS
 from keyrgb.core.utils.exceptions import is_device_disconnected
+from keyrgb.core.utils.linux.inotify import DirectoryWatch
 from keyrgb.tray.controllers.runtime_coordination import run_tray_transition
-from keyrgb.tray.protocols import ConfigPollingTrayProtocol
+from keyrgb.tray.protocols import ConfigPollingTrayProtocol, ensure_tray_control_state
 
 from . import _lifecycle as polling_lifecycle
+from ._reactor import PollerReactor
 from .config_polling_internal.core import (
     ConfigApplyState,
     apply_from_config_once as _apply_from_config_once_impl,
@@ -19,8 +25,33 @@ from .config_polling_internal.core import (
     state_for_log as _state_for_log_impl,
 )
 
+logger = logging.getLogger(__name__)
+
 _CONFIG_POLLING_THREAD_RUNTIME_EXCEPTIONS = (AttributeError, LookupError, OSError, RuntimeError, TypeError, ValueError)
 
+_POLL_INTERVAL_S = 0.1
+# With inotify the thread only wakes for config writes; this slice just bounds
+# how long shutdown waits (tray shutdown joins pollers for 2 s).
+_WATCH_SHUTDOWN_SLICE_S = 1.0
+
+
+def _config_watch_disabled() -> bool:
+    return os.environ.get("KEYRGB_DISABLE_CONFIG_WATCH", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _open_config_watcher(config_path: Path) -> DirectoryWatch | None:
+    """Watch the config dir for atomic replacements of the config file, or ``None`` to poll."""
+
+    if _config_watch_disabled():
+        return None
+    try:
+        watcher = DirectoryWatch.open(config_path.parent, (config_path.name,))
+    except OSError:
+        watcher = None
+    if watcher is None:
+        logger.debug("inotify unavailable for %s; polling config every %.1fs", config_path, _POLL_INTERVAL_S)
+    return watcher
+
 
 def _reload_and_apply_config_transition(
     tray: ConfigPollingTrayProtocol,
@@ -81,14 +112,21 @@ def _apply_from_config_once(
     )
 
 
-def start_config_polling(
+@dataclass(frozen=True)
+class _ConfigPoller:
+    """Startup apply and change checks shared by the thread and reactor pollers."""
+
+    config_path: Path
+    startup: Callable[[], None]
+    check_for_change: Callable[[], None]
+
+
+def _config_poller(
     tray: ConfigPollingTrayProtocol,
     *,
     ite_num_rows: int,
     ite_num_cols: int,
-) -> threading.Thread:
-    """Poll config file for external changes and apply them."""
-
+) -> _ConfigPoller:
     config_path = Path(tray.config.CONFIG_FILE)
     last_mtime = None
     last_digest: str | None = None
@@ -121,6 +159,9 @@ def start_config_polling(
             last_apply_warn_at=last_apply_warn_at,
         )
 
+    # The control socket applies its in-memory updates through this same diff.
+    ensure_tray_control_state(tray).config_apply = apply_from_config
+
     def reload_and_apply_config(
         *,
         cause: str,
@@ -146,7 +187,30 @@ def start_config_polling(
 
         return last_error_at
 
-    def poll_config():
+    def check_for_change() -> None:
+        nonlocal last_mtime
+        nonlocal last_digest
+
+        try:
+            mtime = config_path.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+
+        if mtime == last_mtime:
+            return
+        last_mtime = mtime
+        # Avoid noisy reload/apply cycles when the file is rewritten
+        # without any content change (e.g., redundant saves).
+        digest = _file_digest(config_path) if mtime is not None else None
+        if digest is not None and digest == last_digest:
+            return
+        last_digest = digest
+        reload_and_apply_config(
+            cause="mtime_change",
+            error_message="Error reloading config: %s",
+        )
+
+    def startup() -> None:
         nonlocal last_mtime
         nonlocal last_digest
 
@@ -166,30 +230,97 @@ def start_config_polling(
             throttle_s=30.0,
         )
 
-        while not polling_lifecycle.shutdown_requested(tray):
-            try:
-                mtime = config_path.stat().st_mtime
-            except FileNotFoundError:
-                mtime = None
-
-            if mtime != last_mtime:
-                last_mtime = mtime
-                # Avoid noisy reload/apply cycles when the file is rewritten
-                # without any content change (e.g., redundant saves).
-                digest = _file_digest(config_path) if mtime is not None else None
-                if digest is not None and digest == last_digest:
-                    if polling_lifecycle.wait_for_shutdown(tray, 0.1, sleep_fn=time.sleep):
+    return _ConfigPoller(config_path, startup, check_for_change)
+
+
+def start_config_polling(
+    tray: ConfigPollingTrayProtocol,
+    *,
+    ite_num_rows: int,
+    ite_num_cols: int,
+) -> threading.Thread:
+    """Watch the config file for external changes and apply them.
+
+    Uses inotify on the config directory when available and falls back to a
+    0.1 s mtime poll otherwise (or with ``KEYRGB_DISABLE_CONFIG_WATCH=1``).
+    """
+
+    poller = _config_poller(tray, ite_num_rows=ite_num_rows, ite_num_cols=ite_num_cols)
+
+    def poll_config():
+        poller.startup()
+
+        watcher = _open_config_watcher(poller.config_path)
+        check_now = True
+        try:
+            while not polling_lifecycle.shutdown_requested(tray):
+                if check_now:
+                    poller.check_for_change()
+
+                if watcher is None:
+                    if polling_lifecycle.wait_for_shutdown(tray, _POLL_INTERVAL_S, sleep_fn=time.sleep):
                         return
                     continue
-                last_digest = digest
-                reload_and_apply_config(
-                    cause="mtime_change",
-                    error_message="Error reloading config: %s",
-                )
 
-            if polling_lifecycle.wait_for_shutdown(tray, 0.1, sleep_fn=time.sleep):
-                return
+                check_now = watcher.wait(_WATCH_SHUTDOWN_SLICE_S)
+                if watcher.lost:
+                    # The config dir was removed or moved away; fall back to
+                    # the mtime poll, which notices it coming back.
+                    watcher.close()
+                    watcher = None
+                    check_now = True
+        finally:
+            if watcher is not None:
+                watcher.close()
 
     thread = threading.Thread(target=poll_config, daemon=True)
     thread.start()
     return thread
+
+
+def schedule_config_polling(
+    reactor: PollerReactor,
+    tray: ConfigPollingTrayProtocol,
+    *,
+    ite_num_rows: int,
+    ite_num_cols: int,
+) -> None:
+    """Run the config watcher on the tray's poller reactor.
+
+    The inotify fd becomes a reactor reader, so the reactor only wakes for
+    config writes; without inotify the 0.1 s mtime poll is a reactor timer.
+    Loading and applying the config can restart effects, so it runs on the
+    reactor's worker thread.
+    """
+
+    poller = _config_poller(tray, ite_num_rows=ite_num_rows, ite_num_cols=ite_num_cols)
+
+    def poll_mtime() -> float:
+        poller.check_for_change()
+        return _POLL_INTERVAL_S
+
+    def load_startup_config() -> None:
+        poller.startup()
+        poller.check_for_change()
+
+    def start_watching(_result: None) -> None:
+        watcher = _open_config_watcher(poller.config_path)
+        if watcher is None:
+            reactor.call_later(_POLL_INTERVAL_S, poll_mtime, name="config_mtime", blocking=True)
+            return
+        watch_fd = watcher.fileno()
+
+        def on_config_dir_event() -> None:
+            changed = watcher.read_events()
+            if watcher.lost:
+                # See start_config_polling: fall back to the mtime poll.
+                reactor.remove_reader(watch_fd)
+                watcher.close()
+                reactor.call_later(0.0, poll_mtime, name="config_mtime", blocking=True)
+            elif changed:
+                reactor.run_blocking(poller.check_for_change, name="config_apply")
+
+        reactor.add_reader(watch_fd, on_config_dir_event, name="config_watch")
+        reactor.at_exit(watcher.close)
+
+    reactor.run_blocking(load_startup_config, name="config_startup", then=start_watching)
@@ -75,6 +75,7 @@ def _sync_reactive_base_perkey_brightness(
         pass
     try:
         tray.engine.per_key_brightness = brightness_int
+        tray.engine.wake_render_loop()
     except _FAST_PATH_EXECUTION_EXCEPTIONS:
         pass
 
@@ -148,6 +149,7 @@ def apply_fast_path_change(
             tray.engine.reactive_brightness = int(current.reactive_brightness)
             tray.engine.reactive_trail_percent = int(current.reactive_trail_percent)
             tray.engine.reactive_visual_mode = str(current.reactive_visual_mode or "subtle")
+            tray.engine.wake_render_loop()
         except _FAST_PATH_EXECUTION_EXCEPTIONS:
             pass
         return True
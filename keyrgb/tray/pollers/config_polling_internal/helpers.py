@@ -112,10 +112,15 @@ def _set_engine_attr_best_effort(
     engine = getattr(tray, "engine", None)
     if engine is None:
         return
+
+    def _set() -> None:
+        setattr(engine, attr, value)
+        engine.wake_render_loop()
+
     try:
         _run_diagnostic_boundary(
             tray,
-            lambda: setattr(engine, attr, value),
+            _set,
             error_msg=error_msg,
             runtime_exceptions=_ENGINE_ATTR_SYNC_EXCEPTIONS,
         )
@@ -0,0 +1,23 @@
+"""Local control socket served on the tray's poller reactor."""
+
+from __future__ import annotations
+
+from keyrgb.tray.pollers.control.server import (
+    DISABLE_CONTROL_SOCKET_ENV,
+    ControlServer,
+    control_socket_enabled,
+    notify_state_changed,
+    open_control_listener,
+    schedule_control_socket,
+    start_control_socket,
+)
+
+__all__ = [
+    "DISABLE_CONTROL_SOCKET_ENV",
+    "ControlServer",
+    "control_socket_enabled",
+    "notify_state_changed",
+    "open_control_listener",
+    "schedule_control_socket",
+    "start_control_socket",
+]
@@ -0,0 +1,196 @@
+"""Control-socket commands: what each request does to the tray.
+
+Setters update ``tray.config`` in memory under ``Config.defer_persistence()``
+and run the config poller's own apply, so they take the same plan and fast
+paths a file change would. ``SET_KEYS`` and ``FRAME`` are transient output:
+the colors go straight to the engine (as the base of a running software
+effect, or written to the device) and neither ``tray.config`` nor config.json
+changes. Commands run on the reactor's worker; nothing here touches sockets.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+
+from keyrgb.core.effects.catalog import (
+    SW_EFFECTS_SET,
+    is_forced_hardware_effect,
+    normalize_effect_name,
+    strip_effect_namespace,
+)
+from keyrgb.core.effects.device import PerKeyColorMap
+from keyrgb.core.lighting_layers import render_effect_from_selected_effect
+from keyrgb.core.utils import control_wire
+from keyrgb.core.utils.control_wire import ControlProtocolError, MessageType
+from keyrgb.core.utils.safe_attrs import safe_bool_attr, safe_int_attr, safe_str_attr
+from keyrgb.tray.controllers.runtime_coordination import run_tray_transition
+from keyrgb.tray.protocols import ConfigPollingTrayProtocol, ensure_tray_control_state
+
+logger = logging.getLogger(__name__)
+
+CONTROL_APPLY_ERRORS = (AttributeError, LookupError, OSError, RuntimeError, TypeError, ValueError)
+SETTER_MESSAGES = frozenset({MessageType.SET_COLOR, MessageType.SET_BRIGHTNESS, MessageType.SET_EFFECT})
+
+ConfigUpdate = Callable[[object], None]
+Reply = tuple[MessageType, bytes]
+OK_REPLY: Reply = (MessageType.OK, b"")
+
+
+def control_state(tray: ConfigPollingTrayProtocol, *, rows: int, cols: int) -> dict[str, object]:
+    config = tray.config
+    try:
+        color = [int(channel) for channel in config.color]
+    except (AttributeError, TypeError, ValueError):
+        color = [0, 0, 0]
+    try:
+        per_key = bool(config.per_key_colors)
+    except (AttributeError, TypeError, ValueError):
+        per_key = False
+    return {
+        "effect": safe_str_attr(config, "effect", default="none") or "none",
+        "brightness": safe_int_attr(config, "brightness", default=0),
+        "color": color,
+        "per_key": per_key,
+        "off": safe_bool_attr(tray, "is_off"),
+        "rows": int(rows),
+        "cols": int(cols),
+    }
+
+
+def error_reply(kind: MessageType, exc: Exception) -> Reply:
+    if isinstance(exc, ControlProtocolError):
+        return MessageType.ERROR, str(exc).encode("utf-8")
+    logger.debug("Control command %s failed", kind.name, exc_info=exc)
+    return MessageType.ERROR, f"{type(exc).__name__}: {exc}".encode()
+
+
+def run_command(kind: MessageType, command: Callable[[], Reply]) -> Reply:
+    """Run ``command`` and turn a failure into the ``ERROR`` reply for its client."""
+
+    try:
+        return command()
+    except CONTROL_APPLY_ERRORS as exc:  # @quality-exception exception-transparency: a control command crosses config state and device I/O; the failure is reported to the client that sent it and the tray keeps serving
+        return error_reply(kind, exc)
+
+
+def _keeps_effect_for_per_key(effect: str) -> bool:
+    # Software effects draw over the per-key base; anything else would hide it.
+    return strip_effect_namespace(effect) in SW_EFFECTS_SET and not is_forced_hardware_effect(effect)
+
+
+def _set_color(color: tuple[int, int, int]) -> ConfigUpdate:
+    def update(config) -> None:
+        config.color = color
+        per_key_colors = config.per_key_colors
+        if render_effect_from_selected_effect(selected_effect=config.effect, per_key_colors=per_key_colors) == "perkey":
+            # A static per-key base would keep covering the uniform color.
+            config.per_key_colors = {}
+            config.effect = "none"
+
+    return update
+
+
+def _set_brightness(brightness: int) -> ConfigUpdate:
+    def update(config) -> None:
+        config.brightness = brightness
+
+    return update
+
+
+def _set_effect(effect: str) -> ConfigUpdate:
+    def update(config) -> None:
+        config.effect = effect
+
+    return update
+
+
+def update_for(kind: MessageType, payload: bytes) -> ConfigUpdate:
+    if kind is MessageType.SET_COLOR:
+        return _set_color(control_wire.decode_color(payload))
+    if kind is MessageType.SET_BRIGHTNESS:
+        return _set_brightness(control_wire.decode_brightness(payload))
+    if kind is MessageType.SET_EFFECT:
+        return _set_effect(normalize_effect_name(control_wire.decode_text(payload)))
+    raise ControlProtocolError(f"{kind.name} is not a request")
+
+
+def apply_update(tray: ConfigPollingTrayProtocol, update: ConfigUpdate) -> Reply:
+    apply_from_config = ensure_tray_control_state(tray).config_apply
+    if apply_from_config is None:
+        raise TypeError("the tray is not applying config changes yet")
+    config = tray.config
+
+    def apply_transition() -> None:
+        with config.defer_persistence():
+            update(config)
+            apply_from_config(cause="control_socket")
+
+    run_tray_transition(tray, apply_transition)
+    return OK_REPLY
+
+
+def transient_colors(
+    tray: ConfigPollingTrayProtocol,
+    kind: MessageType,
+    payload: bytes,
+    *,
+    rows: int,
+    cols: int,
+    shown: PerKeyColorMap | None,
+) -> PerKeyColorMap:
+    """Decode a ``SET_KEYS``/``FRAME`` payload into the full per-key output it asks for.
+
+    ``SET_KEYS`` merges into ``shown``, the transient output already on the
+    keyboard, or into the configured per-key colors when there is none.
+    """
+
+    if kind is MessageType.SET_KEYS:
+        colors = control_wire.decode_key_records(payload)
+    elif kind is MessageType.FRAME:
+        colors = control_wire.decode_frame(payload, rows=rows, cols=cols)
+    else:
+        raise ControlProtocolError(f"{kind.name} is not a request")
+    if safe_bool_attr(tray, "is_off"):
+        raise RuntimeError("the keyboard is off")
+    if kind is MessageType.SET_KEYS:
+        base = dict(tray.config.per_key_colors) if shown is None else shown
+        colors = {**base, **colors}
+    return colors
+
+
+def show_per_key(tray: ConfigPollingTrayProtocol, colors: PerKeyColorMap, *, first: bool) -> Reply:
+    """Show ``colors``; ``first`` marks the first transient output since config last drove the keyboard."""
+
+    config = tray.config
+    engine = tray.engine
+
+    def show() -> None:
+        if engine.running and _keeps_effect_for_per_key(safe_str_attr(config, "effect", default="none") or "none"):
+            # The running software effect renders the new base on its next frame.
+            engine.per_key_colors = colors
+            engine.wake_render_loop()
+            return
+        if first and engine.running:
+            engine.stop()
+        with engine.kb_lock:
+            engine.kb.set_key_colors(
+                colors,
+                brightness=safe_int_attr(config, "brightness", default=0),
+                enable_user_mode=first,
+            )
+
+    run_tray_transition(tray, show)
+    return OK_REPLY
+
+
+def persist_deferred_updates(tray: ConfigPollingTrayProtocol) -> bool:
+    config = tray.config
+    try:
+        written = bool(run_tray_transition(tray, config.persist_deferred_changes))
+    except CONTROL_APPLY_ERRORS as exc:  # @quality-exception exception-transparency: persisting control-socket updates is a background config write; it is retried on the next timer and the in-memory state stays applied
+        logger.debug("Persisting control socket updates failed: %s", exc)
+        written = False
+    if not written:
+        logger.warning("Could not write control socket updates to %s; retrying", config.CONFIG_FILE)
+    return written
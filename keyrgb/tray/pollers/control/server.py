@@ -0,0 +1,313 @@
+"""Local control socket: apply lighting changes without a config.json round-trip.
+
+GUI windows and scripts used to reach the tray only by writing config.json;
+the config poller noticed the write, reloaded the file and re-planned. The
+tray now also listens on a Unix socket in its runtime dir (protocol in
+``keyrgb.core.utils.control_wire``; what each command does in ``_commands``).
+
+This module is the socket side. Connections are served on the poller
+reactor's thread, and every command runs on its worker through
+``run_blocking()``, since a config apply or a per-key write can stop the
+effect and block on device I/O. Replies are sent back on the reactor thread
+in the order the commands arrived. Config updates reach config.json at most
+once per ``_PERSIST_DELAY_S`` afterwards, and on shutdown.
+
+Subscribed connections get the state each time the tray refreshes its icon.
+``KEYRGB_DISABLE_CONTROL_SOCKET=1`` leaves the socket closed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+from keyrgb.core.effects.device import PerKeyColorMap
+from keyrgb.core.utils import control_wire
+from keyrgb.core.utils.control_wire import ControlProtocolError, MessageType
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+from keyrgb.tray.protocols import ConfigPollingTrayProtocol, ensure_tray_control_state
+
+from .._reactor import PollerReactor
+from . import _commands
+
+logger = logging.getLogger(__name__)
+
+DISABLE_CONTROL_SOCKET_ENV = "KEYRGB_DISABLE_CONTROL_SOCKET"
+
+_PERSIST_DELAY_S = 1.0
+# Without an eventfd for state changes, check for them this often.
+_STATE_POLL_S = 0.25
+_RECV_SIZE = 65536
+_BACKLOG = 8
+
+
+def control_socket_enabled() -> bool:
+    return str(os.environ.get(DISABLE_CONTROL_SOCKET_ENV, "")).strip().lower() not in {"1", "true", "yes", "on"}
+
+
+def notify_state_changed(tray: object) -> None:
+    """Tell subscribers the tray state may have changed; safe from any thread."""
+
+    event = ensure_tray_control_state(tray).state_event
+    if event is not None:
+        event.set()
+
+
+@dataclass
+class _Client:
+    sock: socket.socket
+    fd: int
+    buffer: bytearray = field(default_factory=bytearray)
+    subscribed: bool = False
+
+
+class ControlServer:
+    """Serve control connections on a poller reactor; every method runs on its thread."""
+
+    def __init__(
+        self,
+        tray: ConfigPollingTrayProtocol,
+        listener: socket.socket,
+        *,
+        path: Path,
+        reactor: PollerReactor,
+        rows: int,
+        cols: int,
+    ) -> None:
+        self._tray = tray
+        self._listener = listener
+        self._path = path
+        self._reactor = reactor
+        self._rows = int(rows)
+        self._cols = int(cols)
+        self._clients: dict[int, _Client] = {}
+        self._state_event = WakeEvent()
+        self._published_state: bytes | None = None
+        # The last transient per-key output; None once a config apply may have repainted it.
+        self._transient_colors: PerKeyColorMap | None = None
+        self._persist_scheduled = False
+        self._closed = False
+
+    def start(self) -> None:
+        ensure_tray_control_state(self._tray).state_event = self._state_event
+        self._reactor.add_reader(self._listener.fileno(), self._accept, name="control_accept")
+        state_fd = self._state_event.wake_fd()
+        if state_fd is None:
+            self._reactor.call_later(_STATE_POLL_S, self._poll_state, name="control_state")
+        else:
+            self._reactor.add_reader(state_fd, self._publish_state, name="control_state")
+        self._reactor.at_exit(self.close)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        ensure_tray_control_state(self._tray).state_event = None
+        self._persist_now()
+        for client in tuple(self._clients.values()):
+            self._drop(client)
+        self._reactor.remove_reader(self._listener.fileno())
+        self._listener.close()
+        try:
+            self._path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def _accept(self) -> None:
+        try:
+            sock, _address = self._listener.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        sock.setblocking(False)
+        client = _Client(sock, sock.fileno())
+        self._clients[client.fd] = client
+        self._reactor.add_reader(client.fd, lambda: self._on_readable(client), name="control_client")
+
+    def _drop(self, client: _Client) -> None:
+        if self._clients.pop(client.fd, None) is not None:
+            self._reactor.remove_reader(client.fd)
+        client.sock.close()
+
+    def _send(self, client: _Client, kind: MessageType, payload: bytes = b"") -> bool:
+        message = control_wire.encode_message(kind, payload)
+        try:
+            sent = client.sock.send(message)
+        except OSError as exc:
+            sent = 0
+            logger.debug("Dropping control client: %s", exc)
+        if sent < len(message):
+            # The socket buffer is full: the peer stopped reading. Waiting for it
+            # would stall every poller on this thread, so it is dropped instead.
+            if sent:
+                logger.debug("Dropping control client that stopped reading")
+            self._drop(client)
+            return False
+        return True
+
+    def _on_readable(self, client: _Client) -> None:
+        try:
+            data = client.sock.recv(_RECV_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(client)
+            return
+        client.buffer += data
+        try:
+            messages = control_wire.take_messages(client.buffer)
+        except ControlProtocolError as exc:
+            self._send(client, MessageType.ERROR, str(exc).encode("utf-8"))
+            self._drop(client)
+            return
+        for kind, payload in messages:
+            self._dispatch(client, kind, payload)
+
+    def _dispatch(self, client: _Client, kind: MessageType, payload: bytes) -> None:
+        # Decoding and the transient-color bookkeeping happen here, in arrival
+        # order; the command itself runs on the worker and replies on this thread.
+        try:
+            command = self._prepare(client, kind, payload)
+        except _commands.CONTROL_APPLY_ERRORS as exc:  # @quality-exception exception-transparency: a malformed or refused command is reported to the client that sent it, in order with its other replies, and the tray keeps serving
+            command = partial(_commands.error_reply, kind, exc)
+        self._reactor.run_blocking(
+            lambda: _commands.run_command(kind, command),
+            name="control_command",
+            then=lambda reply: self._finish(client, kind, reply),
+        )
+
+    def _prepare(self, client: _Client, kind: MessageType, payload: bytes) -> Callable[[], _commands.Reply]:
+        tray = self._tray
+        if kind in (MessageType.QUERY, MessageType.SUBSCRIBE):
+            client.subscribed = client.subscribed or kind is MessageType.SUBSCRIBE
+            return lambda: (MessageType.STATE, self._state_payload())
+        if kind in _commands.SETTER_MESSAGES:
+            update = _commands.update_for(kind, payload)
+            return lambda: _commands.apply_update(tray, update)
+        first = self._transient_colors is None
+        colors = _commands.transient_colors(
+            tray, kind, payload, rows=self._rows, cols=self._cols, shown=self._transient_colors
+        )
+        self._transient_colors = colors
+        return lambda: _commands.show_per_key(tray, colors, first=first)
+
+    def _finish(self, client: _Client, kind: MessageType, reply: _commands.Reply) -> None:
+        ok = reply[0] is not MessageType.ERROR
+        if kind in _commands.SETTER_MESSAGES and ok:
+            # The apply may have repainted the keyboard over any transient output.
+            self._transient_colors = None
+            self._schedule_persist()
+            self._state_event.set()
+        elif kind in (MessageType.SET_KEYS, MessageType.FRAME) and not ok:
+            self._transient_colors = None
+        if self._clients.get(client.fd) is client:
+            self._send(client, *reply)
+
+    def _schedule_persist(self) -> None:
+        if self._persist_scheduled:
+            return
+        self._persist_scheduled = True
+        self._reactor.call_later(_PERSIST_DELAY_S, self._persist, name="control_persist")
+
+    def _persist(self) -> float | None:
+        if self._persist_now():
+            self._persist_scheduled = False
+            return None
+        return _PERSIST_DELAY_S
+
+    def _persist_now(self) -> bool:
+        return _commands.persist_deferred_updates(self._tray)
+
+    def _state_payload(self) -> bytes:
+        return control_wire.state_payload(_commands.control_state(self._tray, rows=self._rows, cols=self._cols))
+
+    def _publish_state(self) -> None:
+        self._state_event.clear()
+        # The tray refreshed after an apply that may have repainted the keyboard;
+        # the next transient write re-enters per-key mode and starts from config.
+        self._transient_colors = None
+        state = self._state_payload()
+        if state == self._published_state:
+            return
+        self._published_state = state
+        for client in tuple(self._clients.values()):
+            if client.subscribed:
+                self._send(client, MessageType.STATE, state)
+
+    def _poll_state(self) -> float:
+        if self._state_event.is_set():
+            self._publish_state()
+        return _STATE_POLL_S
+
+
+def open_control_listener(path: Path) -> socket.socket | None:
+    """Bind the control socket at ``path`` (owner-only), or ``None`` when that fails."""
+
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # The tray is single-instance, so a socket left here belongs to a tray that exited.
+        path.unlink(missing_ok=True)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM | socket.SOCK_CLOEXEC)
+    except OSError as exc:
+        logger.warning("Control socket unavailable at %s: %s", path, exc)
+        return None
+    try:
+        listener.bind(os.fspath(path))
+        os.chmod(path, 0o600)
+        listener.listen(_BACKLOG)
+        listener.setblocking(False)
+    except OSError as exc:
+        listener.close()
+        logger.warning("Control socket unavailable at %s: %s", path, exc)
+        return None
+    return listener
+
+
+def _open_control_server(
+    reactor: PollerReactor, tray: ConfigPollingTrayProtocol, *, rows: int, cols: int
+) -> ControlServer | None:
+    if not control_socket_enabled():
+        return None
+    path = control_wire.control_socket_path()
+    listener = open_control_listener(path)
+    if listener is None:
+        return None
+    server = ControlServer(tray, listener, path=path, reactor=reactor, rows=rows, cols=cols)
+    server.start()
+    return server
+
+
+def schedule_control_socket(
+    reactor: PollerReactor,
+    tray: ConfigPollingTrayProtocol,
+    *,
+    ite_num_rows: int,
+    ite_num_cols: int,
+) -> ControlServer | None:
+    """Serve the control socket on the tray's poller reactor."""
+
+    return _open_control_server(reactor, tray, rows=ite_num_rows, cols=ite_num_cols)
+
+
+def start_control_socket(
+    tray: ConfigPollingTrayProtocol,
+    *,
+    ite_num_rows: int,
+    ite_num_cols: int,
+) -> threading.Thread | None:
+    """Serve the control socket on its own reactor thread (pollers on separate threads)."""
+
+    event = vars(tray).get("_polling_shutdown_event")
+    if event is None:
+        return None
+    reactor = PollerReactor(event)
+    if _open_control_server(reactor, tray, rows=ite_num_rows, cols=ite_num_cols) is None:
+        return None
+    return reactor.start()
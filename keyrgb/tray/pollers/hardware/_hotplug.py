@@ -0,0 +1,90 @@
+"""Keyboard reacquire on controller hotplug uevents.
+
+The uevent monitor reports ITE ``usb``/``hidraw`` nodes as they appear or go
+away. A removal reopens the device at once so a handle to a vanished node is
+dropped (another controller on the same vendor keeps working); an arrival
+while the engine has no device reopens it and restarts the current effect.
+The kernel event can beat udev's permission rules, so a failed reopen after
+an arrival is retried a few times. Reopens run on the reactor's worker.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from keyrgb.core.runtime.uevent_monitor import DeviceEvent, UsbDeviceEvent, running_uevent_monitor
+from keyrgb.tray.idle_power_state import any_forced_off
+from keyrgb.tray.pollers._reactor import PollerReactor, TimerCallback
+from keyrgb.tray.protocols import IdlePowerTrayProtocol
+
+from . import _recovery
+
+_HARDWARE_POLL_RECOVERY_EXCEPTIONS = _recovery._HARDWARE_POLL_RECOVERY_EXCEPTIONS
+
+# Retry cadence for an arrival whose node is not openable yet.
+HOTPLUG_RETRY_DELAY_S = 0.5
+HOTPLUG_MAX_ATTEMPTS = 4
+
+
+def reacquire_after_hotplug(tray: IdlePowerTrayProtocol, event: UsbDeviceEvent) -> bool:
+    """Reopen the keyboard for a hotplug ``event``; return ``False`` when an arrival should be retried."""
+
+    engine = tray.engine
+    if event.action == "remove":
+        if engine.device_available:
+            try:
+                engine.reopen_device()
+            except _HARDWARE_POLL_RECOVERY_EXCEPTIONS:
+                engine.mark_device_unavailable()
+        return True
+
+    if engine.device_available:
+        return True
+    try:
+        if not engine.reopen_device():
+            return False
+    except _HARDWARE_POLL_RECOVERY_EXCEPTIONS:
+        return False
+    _recovery._log_polled_hardware_event(tray, "device_hotplug_reacquired", devname=event.devname)
+    start_current_effect = _recovery._resolve_tray_callback(tray, "_start_current_effect")
+    if callable(start_current_effect) and not tray.is_off and not any_forced_off(tray):
+        try:
+            start_current_effect()
+        except _HARDWARE_POLL_RECOVERY_EXCEPTIONS as exc:
+            _recovery._log_hardware_polling_error_best_effort(tray, exc)
+    _recovery._refresh_ui_without_icon_animation(tray)
+    return True
+
+
+def _hotplug_step(tray: IdlePowerTrayProtocol, event: UsbDeviceEvent) -> TimerCallback:
+    attempts = 0
+
+    def reacquire() -> float | None:
+        nonlocal attempts
+        attempts += 1
+        if reacquire_after_hotplug(tray, event) or attempts >= HOTPLUG_MAX_ATTEMPTS:
+            return None
+        return HOTPLUG_RETRY_DELAY_S
+
+    return reacquire
+
+
+def subscribe_hardware_hotplug(reactor: PollerReactor, tray: IdlePowerTrayProtocol) -> Callable[[], None] | None:
+    """Reacquire the keyboard on controller hotplug; ``None`` without a running uevent monitor."""
+
+    monitor = running_uevent_monitor()
+    if monitor is None:
+        return None
+
+    def on_event(event: DeviceEvent) -> None:
+        # Runs on the monitor thread; hand the event to the reactor.
+        if not isinstance(event, UsbDeviceEvent) or event.action not in ("add", "remove"):
+            return
+        reactor.call_soon_threadsafe(
+            lambda: reactor.call_later(0.0, _hotplug_step(tray, event), name="hardware_hotplug", blocking=True),
+            name="hardware_hotplug",
+        )
+
+    unsubscribe = monitor.subscribe(on_event)
+    reactor.at_exit(unsubscribe)
+    return unsubscribe
@@ -19,6 +19,7 @@ import time
 from collections.abc import Callable
 from typing import TypeVar
 
+from keyrgb.core.effects.frame_diff import invalidate_engine_frame_diff
 from keyrgb.tray.idle_power_state import (
     any_forced_off,
     clear_idle_power_state_field,
@@ -349,6 +350,7 @@ def _reassert_user_mode_while_running_best_effort(tray: IdlePowerTrayProtocol) -
             engine._last_reactive_per_key_frame_signature = None
         except _HARDWARE_POLL_RECOVERY_EXCEPTIONS:
             pass
+        invalidate_engine_frame_diff(engine)
     except _HARDWARE_POLL_RECOVERY_EXCEPTIONS:
         return False
     return True
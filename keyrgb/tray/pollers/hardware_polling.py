@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Callable
 
 from keyrgb.core.utils.exceptions import is_device_disconnected
 from keyrgb.tray.controllers.runtime_coordination import (
@@ -14,7 +15,7 @@ from keyrgb.tray.idle_power_state import (
     read_forced_off_flags,
     read_last_resume_at,
 )
-from keyrgb.tray.pollers.hardware import _controller_sleep, _recovery, _runtime_support
+from keyrgb.tray.pollers.hardware import _controller_sleep, _hotplug, _recovery, _runtime_support
 from keyrgb.tray.pollers.hardware._decisions import (
     REACTIVE_PULSE_POLL_DEFER_RETRY_S as _REACTIVE_PULSE_POLL_DEFER_RETRY_S,
     coerce_poll_int as _coerce_poll_int,
@@ -25,6 +26,7 @@ from keyrgb.tray.pollers.idle_power._constants import POST_RESUME_IDLE_ACTION_SU
 from keyrgb.tray.protocols import IdlePowerTrayProtocol
 
 from . import _lifecycle as polling_lifecycle
+from ._reactor import PollerReactor
 
 # Bind recovery helpers used by this module (and keep short local names).
 _BRIGHTNESS_COERCION_ERRORS = _recovery._BRIGHTNESS_COERCION_ERRORS
@@ -303,78 +305,86 @@ def _handle_hardware_polling_exception(tray: IdlePowerTrayProtocol, exc: Excepti
     return float(last_error_at)
 
 
-def start_hardware_polling(tray: IdlePowerTrayProtocol) -> threading.Thread:
-    """Poll keyboard hardware state to detect physical button changes."""
+def _hardware_poll_step(tray: IdlePowerTrayProtocol) -> Callable[[], float]:
+    last_brightness = None
+    last_off_state = None
+    last_error_at = 0.0
+    last_real_poll_at = time.monotonic()
+    poll_revision: int | None = None
 
-    def poll_hardware():
-        last_brightness = None
-        last_off_state = None
-        last_error_at = 0.0
-        last_real_poll_at = time.monotonic()
-        poll_revision: int | None = None
+    def _recover_polling_error(exc: Exception) -> None:
+        nonlocal last_error_at
+        outcome = run_tray_observation_if_current(
+            tray,
+            poll_revision,
+            lambda: _handle_hardware_polling_exception(
+                tray,
+                exc,
+                last_error_at=last_error_at,
+            ),
+        )
+        if outcome.accepted and outcome.value is not None:
+            last_error_at = outcome.value
+
+    def poll_hardware_once() -> float:
+        nonlocal last_brightness, last_off_state, last_real_poll_at, poll_revision
+        # While reactive pulses are mid-flight, the poll's synchronous USB
+        # reads would stall the render thread (visible ripple hitch). Defer
+        # on a short retry cadence, bounded by a staleness cap so hardware
+        # state detection cannot starve during continuous typing.
+        if _should_defer_poll_for_reactive_pulses(
+            reactive_pulse_mix=_reactive_pulse_mix_or_zero(tray),
+            now=time.monotonic(),
+            last_real_poll_at=last_real_poll_at,
+        ):
+            return _REACTIVE_PULSE_POLL_DEFER_RETRY_S
+
+        poll_revision = capture_transition_revision(tray)
 
-        def _recover_polling_error(exc: Exception) -> None:
-            nonlocal last_error_at
-            outcome = run_tray_observation_if_current(
+        def apply_current_observation(*args, revision=poll_revision, **kwargs):
+            return _apply_hardware_observation_if_current(
                 tray,
-                poll_revision,
-                lambda: _handle_hardware_polling_exception(
-                    tray,
-                    exc,
-                    last_error_at=last_error_at,
-                ),
+                revision,
+                *args,
+                **kwargs,
             )
-            if outcome.accepted and outcome.value is not None:
-                last_error_at = outcome.value
-
-        while not polling_lifecycle.shutdown_requested(tray):
-            # While reactive pulses are mid-flight, the poll's synchronous USB
-            # reads would stall the render thread (visible ripple hitch). Defer
-            # on a short retry cadence, bounded by a staleness cap so hardware
-            # state detection cannot starve during continuous typing.
-            if _should_defer_poll_for_reactive_pulses(
-                reactive_pulse_mix=_reactive_pulse_mix_or_zero(tray),
-                now=time.monotonic(),
-                last_real_poll_at=last_real_poll_at,
-            ):
-                if polling_lifecycle.wait_for_shutdown(
-                    tray,
-                    _REACTIVE_PULSE_POLL_DEFER_RETRY_S,
-                    sleep_fn=time.sleep,
-                ):
-                    return
-                continue
-
-            poll_revision = capture_transition_revision(tray)
-
-            def apply_current_observation(*args, revision=poll_revision, **kwargs):
-                return _apply_hardware_observation_if_current(
-                    tray,
-                    revision,
-                    *args,
-                    **kwargs,
-                )
-
-            polled_state = _run_recoverable_hardware_poll_boundary(
-                lambda lb=last_brightness, lo=last_off_state: _runtime_support.poll_hardware_once(
-                    tray,
-                    last_brightness=lb,
-                    last_off_state=lo,
-                    apply_polled_state_fn=apply_current_observation,
-                ),
-                on_recoverable=_recover_polling_error,
-            )
-            last_real_poll_at = time.monotonic()
-            if polled_state is not None:
-                last_brightness, last_off_state = polled_state
 
-            if polling_lifecycle.wait_for_shutdown(
+        def poll_current_state() -> tuple[int, bool] | None:
+            return _runtime_support.poll_hardware_once(
                 tray,
-                _hardware_poll_interval_s(tray, now=time.monotonic()),
-                sleep_fn=time.sleep,
-            ):
-                return
+                last_brightness=last_brightness,
+                last_off_state=last_off_state,
+                apply_polled_state_fn=apply_current_observation,
+            )
+
+        polled_state = _run_recoverable_hardware_poll_boundary(
+            poll_current_state,
+            on_recoverable=_recover_polling_error,
+        )
+        last_real_poll_at = time.monotonic()
+        if polled_state is not None:
+            last_brightness, last_off_state = polled_state
+
+        return _hardware_poll_interval_s(tray, now=time.monotonic())
+
+    return poll_hardware_once
+
+
+def start_hardware_polling(tray: IdlePowerTrayProtocol) -> threading.Thread:
+    """Poll keyboard hardware state to detect physical button changes."""
+
+    step = _hardware_poll_step(tray)
+
+    def poll_hardware():
+        polling_lifecycle.run_poll_steps(tray, step, sleep_fn=time.sleep)
 
     thread = threading.Thread(target=poll_hardware, daemon=True)
     thread.start()
     return thread
+
+
+def schedule_hardware_polling(reactor: PollerReactor, tray: IdlePowerTrayProtocol) -> None:
+    """Run the hardware poller on the tray's poller reactor, reacquiring on controller hotplug."""
+
+    reactor.call_later(0.0, _hardware_poll_step(tray), name="hardware", blocking=True)
+    _hotplug.subscribe_hardware_hotplug(reactor, tray)
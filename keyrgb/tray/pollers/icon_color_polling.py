@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Callable
 
 from keyrgb.core.effects.catalog import resolve_effect_name_for_backend
 from keyrgb.tray.idle_power_state import read_idle_power_state_float_field
 
 from . import _lifecycle as polling_lifecycle
+from ._reactor import PollerReactor
 
 _ANIMATED_ICON_EFFECTS = frozenset(
     {
@@ -26,6 +28,7 @@ _ANIMATED_ICON_EFFECTS = frozenset(
 # Icon poll crosses tray callbacks/backend state; no map LookupError expected.
 _ICON_POLL_RUNTIME_EXCEPTIONS = (AttributeError, OSError, RuntimeError, TypeError, ValueError)
 _ICON_RESUME_HOLDOFF_S = 1.0
+_ICON_POLL_INTERVAL_S = 0.8
 
 
 def _has_animated_icon_state(*, effect: str, config: object | None) -> bool:
@@ -113,39 +116,51 @@ def _resume_icon_holdoff_active(tray, *, now_monotonic: float) -> bool:
     return 0.0 <= elapsed < _ICON_RESUME_HOLDOFF_S
 
 
+def _icon_color_poll_step(tray) -> Callable[[], float | None]:
+    last_sig = None
+    last_error_at = 0.0
+
+    def poll_icon_color_once() -> float | None:
+        nonlocal last_sig, last_error_at
+        try:
+            now = time.monotonic()
+            sig = _compute_icon_sig(tray)
+            if _resume_icon_holdoff_active(tray, now_monotonic=now):
+                last_sig = sig
+                return _ICON_POLL_INTERVAL_S
+            if _should_update_icon(sig, last_sig):
+                try:
+                    tray._update_icon(animate=False)
+                except TypeError:
+                    tray._update_icon()
+                last_sig = sig
+        except _ICON_POLL_RUNTIME_EXCEPTIONS as exc:  # @quality-exception exception-transparency: tray icon polling crosses arbitrary tray callbacks, backend state, and logger boundaries and must remain non-fatal for tray stability
+            now = time.monotonic()
+            if now - last_error_at > 60:
+                last_error_at = now
+                try:
+                    tray._log_exception("Icon color polling error: %s", exc)
+                except (OSError, RuntimeError, ValueError):
+                    return None
+        return _ICON_POLL_INTERVAL_S
+
+    return poll_icon_color_once
+
+
 def start_icon_color_polling(tray) -> threading.Thread:
     """Update tray icon color periodically for dynamic effects."""
 
+    step = _icon_color_poll_step(tray)
+
     def poll_icon_color():
-        last_sig = None
-        last_error_at = 0.0
-        while not polling_lifecycle.shutdown_requested(tray):
-            try:
-                now = time.monotonic()
-                sig = _compute_icon_sig(tray)
-                if _resume_icon_holdoff_active(tray, now_monotonic=now):
-                    last_sig = sig
-                    if polling_lifecycle.wait_for_shutdown(tray, 0.8, sleep_fn=time.sleep):
-                        return
-                    continue
-                if _should_update_icon(sig, last_sig):
-                    try:
-                        tray._update_icon(animate=False)
-                    except TypeError:
-                        tray._update_icon()
-                    last_sig = sig
-            except _ICON_POLL_RUNTIME_EXCEPTIONS as exc:  # @quality-exception exception-transparency: tray icon polling crosses arbitrary tray callbacks, backend state, and logger boundaries and must remain non-fatal for tray stability
-                now = time.monotonic()
-                if now - last_error_at > 60:
-                    last_error_at = now
-                    try:
-                        tray._log_exception("Icon color polling error: %s", exc)
-                    except (OSError, RuntimeError, ValueError):
-                        return
-
-            if polling_lifecycle.wait_for_shutdown(tray, 0.8, sleep_fn=time.sleep):
-                return
+        polling_lifecycle.run_poll_steps(tray, step, sleep_fn=time.sleep)
 
     thread = threading.Thread(target=poll_icon_color, daemon=True)
     thread.start()
     return thread
+
+
+def schedule_icon_color_polling(reactor: PollerReactor, tray) -> None:
+    """Run the icon color poller on the tray's poller reactor."""
+
+    reactor.call_later(0.0, _icon_color_poll_step(tray), name="icon_color")
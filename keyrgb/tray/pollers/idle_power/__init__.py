@@ -1,3 +1,3 @@
-from .polling import start_idle_power_polling
+from .polling import schedule_idle_power_polling, start_idle_power_polling
 
-__all__ = ["start_idle_power_polling"]
+__all__ = ["schedule_idle_power_polling", "start_idle_power_polling"]
@@ -8,6 +8,7 @@ from collections.abc import Callable
 from typing import cast
 
 from keyrgb.core.effects.reactive import _reactive_transition_atomic, _render_brightness_support as _reactive_support
+from keyrgb.core.effects.reactive._frame_wake import wake_render_loop
 from keyrgb.core.utils.logging_utils import log_throttled
 from keyrgb.core.utils.safe_attrs import safe_int_attr, safe_str_attr
 from keyrgb.tray.idle_power_state import (
@@ -155,10 +156,10 @@ def _set_engine_hw_brightness_cap(engine: object, brightness: int | None) -> Non
     if brightness is None:
         _reactive_support.set_engine_attr(engine, "_hw_brightness_cap", None)
         _reactive_support.set_engine_attr(engine, "_dim_temp_active", False)
-        return
-
-    _reactive_support.set_engine_attr(engine, "_hw_brightness_cap", max(0, min(50, int(brightness))))
-    _reactive_support.set_engine_attr(engine, "_dim_temp_active", True)
+    else:
+        _reactive_support.set_engine_attr(engine, "_hw_brightness_cap", max(0, min(50, int(brightness))))
+        _reactive_support.set_engine_attr(engine, "_dim_temp_active", True)
+    wake_render_loop(engine)
 
 
 def _set_reactive_transition(
@@ -202,6 +203,7 @@ def _set_reactive_transition(
                 "_reactive_transition_duration_s",
                 max(0.0, float(duration_s)),
             )
+        wake_render_loop(engine)
     except (AttributeError, TypeError, ValueError):
         return
 
@@ -8,6 +8,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol, TypeAlias, cast
 
+from keyrgb.core.runtime.input_hub import MODIFIER_KEY_CODES, InputHub, running_input_hub
+from keyrgb.core.utils.linux.evdev_reader import KeydownReader, device_fd, raw_evdev_enabled
+
 
 class _InputDeviceProtocol(Protocol):
     path: str
@@ -27,24 +30,11 @@ _InputDevice: TypeAlias = _InputDeviceProtocol
 _RECOVERABLE_SYSFS_READ_EXCEPTIONS = (OSError, UnicodeError, ValueError, InterruptedError, BlockingIOError)
 _RECOVERABLE_DEVICE_EXCEPTIONS = (AttributeError, OSError, RuntimeError, TypeError, ValueError)
 
-# Linux input-event codes. A touchpad gesture on the affected KDE/Tongfang
-# setup emits synthetic KEY_LEFTMETA through the physical AT keyboard fd, so
-# device classification alone cannot distinguish it from typing. Require an
-# actual non-modifier key-down before waking keyboard lighting.
+# Linux input-event codes. Keyboard wake requires a non-modifier key-down; see
+# MODIFIER_KEY_CODES for why.
 _EV_KEY = 0x01
 _KEY_DOWN = 0x01
-_MODIFIER_KEY_CODES = frozenset(
-    {
-        29,  # KEY_LEFTCTRL
-        42,  # KEY_LEFTSHIFT
-        54,  # KEY_RIGHTSHIFT
-        56,  # KEY_LEFTALT
-        97,  # KEY_RIGHTCTRL
-        100,  # KEY_RIGHTALT
-        125,  # KEY_LEFTMETA
-        126,  # KEY_RIGHTMETA
-    }
-)
+_MODIFIER_KEY_CODES = MODIFIER_KEY_CODES
 
 
 def _is_keyboard_wake_key_down(event: object) -> bool:
@@ -60,6 +50,18 @@ def _is_keyboard_wake_key_down(event: object) -> bool:
     return event_type == _EV_KEY and value == _KEY_DOWN and code not in _MODIFIER_KEY_CODES
 
 
+def _drain_wake_key_down(dev: _InputDevice, reader: KeydownReader | None) -> bool:
+    """Drain ``dev`` and report whether it delivered a non-modifier key-down."""
+
+    fd = device_fd(dev) if reader is not None else None
+    if reader is not None and fd is not None:
+        codes: list[int] = []
+        reader.read_keydown_codes(fd, codes)
+        return any(code not in _MODIFIER_KEY_CODES for code in codes)
+    events = list(dev.read())
+    return any(_is_keyboard_wake_key_down(event) for event in events)
+
+
 def _read_udev_input_properties(device_path: str) -> dict[str, str]:
     """Read udev input-class properties for an evdev device."""
 
@@ -118,7 +120,11 @@ def _default_open_device(path: str) -> _InputDevice:
 
 @dataclass
 class InputIdleTracker:
-    """Track time since the last user input event across evdev devices."""
+    """Track time since the last user input event across evdev devices.
+
+    While the tray's input hub runs, its activity timestamps are used and the
+    tracker opens no devices of its own.
+    """
 
     monotonic_fn: Callable[[], float] = time.monotonic
     list_devices_fn: Callable[[], Sequence[str]] = _default_list_devices
@@ -127,11 +133,13 @@ class InputIdleTracker:
     is_keyboard_device_fn: Callable[[str], bool] = _is_keyboard_input_device
     select_fn: Callable[..., tuple[list, list, list]] = select.select
     refresh_interval_s: float = 30.0
+    input_hub_fn: Callable[[], InputHub | None] = running_input_hub
 
     devices: list[_InputDevice] | None = field(default=None, init=False)
     last_activity_at: float = field(default=0.0, init=False)
     last_keyboard_activity_at: float = field(default=0.0, init=False)
     last_refresh_at: float = field(default=0.0, init=False)
+    _keydown_reader: KeydownReader | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.last_activity_at = float(self.monotonic_fn())
@@ -178,9 +186,20 @@ class InputIdleTracker:
                 pass
         self.devices = None
 
+    def _reader(self) -> KeydownReader | None:
+        if not raw_evdev_enabled():
+            return None
+        if self._keydown_reader is None:
+            self._keydown_reader = KeydownReader()
+        return self._keydown_reader
+
     def seconds_since_activity(self) -> float | None:
         """Return seconds since the last input event, or None if monitoring failed."""
 
+        hub = self.input_hub_fn()
+        if hub is not None:
+            return self._seconds_since_hub_activity(hub)
+
         now = float(self.monotonic_fn())
         if self.devices is None or (now - self.last_refresh_at) >= self.refresh_interval_s:
             self._refresh_devices()
@@ -197,14 +216,13 @@ class InputIdleTracker:
                 # Drain the event queues of ready devices so we do not re-count
                 # the same events on the next poll.
                 keyboard_wake_key_down = False
+                reader = self._reader()
                 for dev in r:
                     try:
-                        events = list(dev.read())
+                        wake_key_down = _drain_wake_key_down(dev, reader)
                     except _RECOVERABLE_DEVICE_EXCEPTIONS:
                         continue
-                    if self.is_keyboard_device_fn(str(getattr(dev, "path", ""))) and any(
-                        _is_keyboard_wake_key_down(event) for event in events
-                    ):
+                    if wake_key_down and self.is_keyboard_device_fn(str(getattr(dev, "path", ""))):
                         keyboard_wake_key_down = True
                 if keyboard_wake_key_down:
                     self.last_keyboard_activity_at = float(now)
@@ -213,3 +231,13 @@ class InputIdleTracker:
             return None if not self.devices else self.seconds_since_activity()
 
         return float(self.monotonic_fn()) - self.last_activity_at
+
+    def _seconds_since_hub_activity(self, hub: InputHub) -> float | None:
+        if self.devices is not None:
+            self.close()
+        if not hub.has_input_devices:
+            return None
+        self.last_activity_at = max(self.last_activity_at, float(hub.last_activity_at))
+        self.last_keyboard_activity_at = max(self.last_keyboard_activity_at, float(hub.last_keyboard_activity_at))
+        hub.rearm_activity_devices()
+        return float(self.monotonic_fn()) - self.last_activity_at
@@ -12,11 +12,12 @@ from typing import TYPE_CHECKING
 from keyrgb.tray.controllers.runtime_coordination import run_tray_transition
 
 from .. import _lifecycle as polling_lifecycle
+from .._reactor import PollerReactor
 from ._polling_support import (
     call_best_effort as _call_best_effort_impl,
     effective_screen_dim_sync_enabled as _effective_screen_dim_sync_enabled_impl,
     ensure_idle_state as _ensure_idle_state_impl,
-    poll_idle_power_loop as _poll_idle_power_loop,
+    idle_power_poll_step as _idle_power_poll_step_impl,
     recover_idle_power_polling_error as _recover_idle_power_polling_error_impl,
     tray_log_event_or_none as _tray_log_event_or_none_impl,
     tray_log_exception_or_none as _tray_log_exception_or_none_impl,
@@ -320,6 +321,40 @@ def _should_log_idle_action(
     )
 
 
+def _idle_power_poll_step(
+    tray: IdlePowerTrayProtocol,
+    *,
+    idle_timeout_s: float,
+) -> tuple[Callable[[], float], Callable[[], None]]:
+    from ._runtime import IdlePollLoopState
+
+    return _idle_power_poll_step_impl(
+        tray,
+        idle_timeout_s=float(idle_timeout_s),
+        create_loop_state_fn=IdlePollLoopState,
+        get_session_id_fn=_get_session_id,
+        run_idle_power_iteration_fn=run_idle_power_iteration,
+        now_monotonic_fn=time.monotonic,
+        ensure_idle_state_fn=_ensure_idle_state,
+        read_dimmed_state_fn=_read_dimmed_state,
+        read_screen_off_state_drm_fn=_read_screen_off_state_drm,
+        debounce_dim_and_screen_off_fn=_debounce_dim_and_screen_off,
+        read_logind_idle_seconds_fn=_read_logind_idle_seconds,
+        read_desktop_dim_timeout_fn=_read_desktop_dim_timeout,
+        create_wayland_idle_tracker_fn=_create_wayland_idle_tracker,
+        read_wayland_idle_fn=_read_wayland_idle,
+        create_input_idle_tracker_fn=_create_input_idle_tracker,
+        read_input_idle_seconds_fn=_read_input_idle_seconds,
+        effective_screen_dim_sync_enabled_fn=_effective_screen_dim_sync_enabled,
+        compute_idle_action_fn=_compute_idle_action,
+        build_idle_action_key_fn=_build_idle_action_key,
+        should_log_idle_action_fn=_should_log_idle_action,
+        apply_idle_action_fn=_apply_idle_action,
+        call_best_effort_fn=_call_best_effort,
+        recover_idle_power_polling_error_fn=_recover_idle_power_polling_error,
+    )
+
+
 def start_idle_power_polling(
     tray: IdlePowerTrayProtocol,
     *,
@@ -332,46 +367,35 @@ def start_idle_power_polling(
     _ensure_idle_state(tray)
 
     def poll_idle_power() -> None:
-        from ._runtime import IdlePollLoopState
-
-        _poll_idle_power_loop(
-            tray,
-            idle_timeout_s=float(idle_timeout_s),
-            create_loop_state_fn=IdlePollLoopState,
-            get_session_id_fn=_get_session_id,
-            run_idle_power_iteration_fn=run_idle_power_iteration,
-            now_monotonic_fn=time.monotonic,
-            sleep_fn=lambda seconds: polling_lifecycle.wait_for_shutdown(
-                tray,
-                seconds,
-                sleep_fn=time.sleep,
-            ),
-            ensure_idle_state_fn=_ensure_idle_state,
-            read_dimmed_state_fn=_read_dimmed_state,
-            read_screen_off_state_drm_fn=_read_screen_off_state_drm,
-            debounce_dim_and_screen_off_fn=_debounce_dim_and_screen_off,
-            read_logind_idle_seconds_fn=_read_logind_idle_seconds,
-            read_desktop_dim_timeout_fn=_read_desktop_dim_timeout,
-            create_wayland_idle_tracker_fn=_create_wayland_idle_tracker,
-            read_wayland_idle_fn=_read_wayland_idle,
-            create_input_idle_tracker_fn=_create_input_idle_tracker,
-            read_input_idle_seconds_fn=_read_input_idle_seconds,
-            effective_screen_dim_sync_enabled_fn=_effective_screen_dim_sync_enabled,
-            compute_idle_action_fn=_compute_idle_action,
-            build_idle_action_key_fn=_build_idle_action_key,
-            should_log_idle_action_fn=_should_log_idle_action,
-            apply_idle_action_fn=_apply_idle_action,
-            call_best_effort_fn=_call_best_effort,
-            recover_idle_power_polling_error_fn=_recover_idle_power_polling_error,
-            shutdown_requested_fn=lambda: polling_lifecycle.shutdown_requested(tray),
-        )
+        step, close_trackers = _idle_power_poll_step(tray, idle_timeout_s=idle_timeout_s)
+        try:
+            polling_lifecycle.run_poll_steps(tray, step, sleep_fn=time.sleep)
+        finally:
+            close_trackers()
 
     thread = threading.Thread(target=poll_idle_power, daemon=True)
     thread.start()
     return thread
 
 
+def schedule_idle_power_polling(
+    reactor: PollerReactor,
+    tray: IdlePowerTrayProtocol,
+    *,
+    ite_num_rows: int,
+    ite_num_cols: int,
+    idle_timeout_s: float = 60.0,
+) -> None:
+    """Run the idle-power poller on the tray's poller reactor."""
+
+    _ensure_idle_state(tray)
+    step, close_trackers = _idle_power_poll_step(tray, idle_timeout_s=idle_timeout_s)
+    reactor.call_later(0.0, step, name="idle_power", blocking=True)
+    reactor.at_exit(close_trackers)
+
+
 __all__ = [
     "_compute_idle_action",
+    "schedule_idle_power_polling",
     "start_idle_power_polling",
 ]
@@ -25,6 +25,7 @@ from keyrgb.tray.controllers.runtime_coordination import (
 )
 from keyrgb.tray.idle_power_state import is_system_forced_off, is_user_forced_off
 from keyrgb.tray.pollers import _lifecycle as polling_lifecycle
+from keyrgb.tray.pollers._reactor import PollerReactor
 
 if TYPE_CHECKING:
     from keyrgb.tray.protocols import LightingTrayProtocol
@@ -34,6 +35,7 @@ logger = logging.getLogger(__name__)
 
 _BRIGHTNESS_COERCION_EXCEPTIONS = (TypeError, ValueError, OverflowError)
 _SCHEDULER_RUNTIME_EXCEPTIONS = (AttributeError, LookupError, OSError, RuntimeError, TypeError, ValueError)
+_SCHEDULER_INTERVAL_S = 60.0
 
 
 def _active_power_source_base_brightness(
@@ -159,21 +161,15 @@ def _run_scheduler_iteration(tray: LightingTrayProtocol) -> None:
     )
 
 
-def _scheduler_loop(
+def _scheduler_step(
     tray: LightingTrayProtocol,
     *,
-    sleep_fn: Callable[[float], object],
     now_fn: Callable[[], datetime],
-    shutdown_requested_fn: Callable[[], bool] = lambda: False,
-) -> None:
-    """Main scheduler polling loop.
-
-    Checks every 60 seconds whether the time-scheduler should apply
-    brightness overrides.
-    """
+) -> Callable[[], float]:
     last_applied_key: str | None = None
 
-    while not shutdown_requested_fn():
+    def run_scheduler_once() -> float:
+        nonlocal last_applied_key
         try:
             observation_revision = capture_transition_revision(tray)
             state = resolve_scheduler_brightness_state(
@@ -215,7 +211,26 @@ def _scheduler_loop(
         except _SCHEDULER_RUNTIME_EXCEPTIONS:
             logger.exception("Time-scheduler iteration error")
 
-        sleep_fn(60.0)
+        return _SCHEDULER_INTERVAL_S
+
+    return run_scheduler_once
+
+
+def _scheduler_loop(
+    tray: LightingTrayProtocol,
+    *,
+    sleep_fn: Callable[[float], object],
+    now_fn: Callable[[], datetime],
+    shutdown_requested_fn: Callable[[], bool] = lambda: False,
+) -> None:
+    """Main scheduler polling loop.
+
+    Checks every 60 seconds whether the time-scheduler should apply
+    brightness overrides.
+    """
+    step = _scheduler_step(tray, now_fn=now_fn)
+    while not shutdown_requested_fn():
+        sleep_fn(step())
 
 
 def start_time_scheduler_polling(tray: LightingTrayProtocol) -> threading.Thread:
@@ -236,3 +251,9 @@ def start_time_scheduler_polling(tray: LightingTrayProtocol) -> threading.Thread
     thread = threading.Thread(target=run_scheduler, daemon=True)
     thread.start()
     return thread
+
+
+def schedule_time_scheduler_polling(reactor: PollerReactor, tray: LightingTrayProtocol) -> None:
+    """Run the time-of-day brightness scheduler on the tray's poller reactor."""
+
+    reactor.call_later(0.0, _scheduler_step(tray, now_fn=datetime.now), name="time_scheduler", blocking=True)
@@ -10,12 +10,14 @@ the tray codebase. Using Protocols instead of untyped parameters enables:
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from keyrgb.core.config import Config
     from keyrgb.core.effects.engine import EffectsEngine
+    from keyrgb.core.utils.linux.wake_event import WakeEvent
     from keyrgb.tray.ui.icon import IconVisual
 
 
@@ -32,6 +34,21 @@ class TrayIconState:
     animating: bool = False
 
 
+# ---------------------------------------------------------------------------
+# Control socket state
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class TrayControlState:
+    """Typed state the control socket shares with the config poller and UI refresh."""
+
+    # The config poller's in-memory apply; set once config polling starts.
+    config_apply: Callable[..., None] | None = None
+    # Set by UI refreshes while a control server publishes state.
+    state_event: WakeEvent | None = None
+
+
 # ---------------------------------------------------------------------------
 # Protocol for objects that have a config attribute
 # ---------------------------------------------------------------------------
@@ -171,6 +188,20 @@ def ensure_tray_icon_state(tray: object) -> TrayIconState:
     return st
 
 
+def ensure_tray_control_state(tray: object) -> TrayControlState:
+    """Return the tray's control state, attaching a fresh one to objects created without it."""
+
+    st = getattr(tray, "tray_control_state", None)
+    if isinstance(st, TrayControlState):
+        return st
+    st = TrayControlState()
+    try:
+        setattr(tray, "tray_control_state", st)  # noqa: B010 – object-typed arg; setattr bypasses mypy attr-defined
+    except AttributeError:
+        pass
+    return st
+
+
 # ---------------------------------------------------------------------------
 # Minimal protocol for config polling / apply-from-config
 # ---------------------------------------------------------------------------
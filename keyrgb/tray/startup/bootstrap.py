@@ -3,14 +3,29 @@ from __future__ import annotations
 import logging
 import os
 import sys
-
-from keyrgb.core.diagnostics import collect_diagnostics, format_diagnostics_text
+from typing import TYPE_CHECKING
 
 from ..integrations import runtime
 
+if TYPE_CHECKING:
+    from keyrgb.core.diagnostics import Diagnostics
+
 logger = logging.getLogger(__name__)
 
 
+def collect_diagnostics(*, include_usb: bool) -> Diagnostics:
+    # Imported on demand: the diagnostics package pulls in every backend and is only used under KEYRGB_DEBUG.
+    from keyrgb.core.diagnostics import collect_diagnostics as _collect_diagnostics
+
+    return _collect_diagnostics(include_usb=include_usb)
+
+
+def format_diagnostics_text(diag: Diagnostics) -> str:
+    from keyrgb.core.diagnostics import format_diagnostics_text as _format_diagnostics_text
+
+    return _format_diagnostics_text(diag)
+
+
 def configure_logging() -> None:
     """Configure root logging for the tray app.
 
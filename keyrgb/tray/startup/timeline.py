@@ -0,0 +1,190 @@
+"""Per-phase startup timing for ``keyrgb --startup-trace``.
+
+The tray startup runs in a fixed order: imports, config load, backend probe,
+device open, the first frame (restoring the configured lighting), then the
+pystray/PIL stack and the icon. With ``--startup-trace`` (or
+``KEYRGB_STARTUP_TRACE=1``) each phase records its wall time. Once the icon is
+shown, the report is logged and written to ``startup-trace.json`` in the
+runtime dir. Without the flag, ``startup_phase()`` costs one ``None`` check.
+
+The first row, ``interpreter``, is the time from process start (from
+``/proc/self/stat``) to when tracing was enabled. It covers Python start-up
+and the entrypoint's own imports.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypedDict
+
+logger = logging.getLogger(__name__)
+
+STARTUP_TRACE_ENV = "KEYRGB_STARTUP_TRACE"
+STARTUP_TRACE_FLAG = "--startup-trace"
+STARTUP_TRACE_FILENAME = "startup-trace.json"
+
+
+@dataclass(frozen=True)
+class StartupPhase:
+    name: str
+    start_ms: float
+    duration_ms: float
+
+
+class StartupPhaseReport(TypedDict):
+    name: str
+    start_ms: float
+    duration_ms: float
+
+
+class StartupReport(TypedDict):
+    total_ms: float
+    phases: list[StartupPhaseReport]
+
+
+def _process_age_ms() -> float | None:
+    """Milliseconds since this process started, or ``None`` off Linux."""
+
+    try:
+        stat = Path("/proc/self/stat").read_text(encoding="ascii")
+        # Field 22 (starttime) in clock ticks since boot; skip past "(comm)" which may hold spaces.
+        start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+        ticks_per_s = os.sysconf("SC_CLK_TCK")
+        now_s = time.clock_gettime(time.CLOCK_BOOTTIME)
+    except (AttributeError, IndexError, OSError, ValueError):
+        return None
+    return max(0.0, (now_s - start_ticks / ticks_per_s) * 1000.0)
+
+
+class StartupTimeline:
+    """Collect named phases relative to the moment tracing started."""
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter, process_age_ms: float | None = None) -> None:
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._phases: list[StartupPhase] = []
+        if process_age_ms is not None:
+            self._phases.append(StartupPhase("interpreter", -float(process_age_ms), float(process_age_ms)))
+
+    def _elapsed_ms(self, at: float) -> float:
+        return (at - self._origin) * 1000.0
+
+    def _record(self, name: str, start: float, end: float) -> None:
+        with self._lock:
+            self._phases.append(StartupPhase(name, self._elapsed_ms(start), (end - start) * 1000.0))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self._record(name, start, self._clock())
+
+    def mark(self, name: str) -> None:
+        now = self._clock()
+        self._record(name, now, now)
+
+    @property
+    def phases(self) -> tuple[StartupPhase, ...]:
+        with self._lock:
+            return tuple(self._phases)
+
+    def report(self) -> StartupReport:
+        phases = self.phases
+        first = min((p.start_ms for p in phases), default=0.0)
+        last = max((p.start_ms + p.duration_ms for p in phases), default=0.0)
+        return {
+            "total_ms": round(last - first, 3),
+            "phases": [
+                {"name": p.name, "start_ms": round(p.start_ms, 3), "duration_ms": round(p.duration_ms, 3)}
+                for p in phases
+            ],
+        }
+
+    def format_report(self) -> str:
+        report = self.report()
+        lines = [f"Startup trace ({report['total_ms']:.1f} ms total):"]
+        for p in self.phases:
+            lines.append(f"  {p.start_ms:9.1f} ms  {p.duration_ms:8.1f} ms  {p.name}")
+        return "\n".join(lines)
+
+
+_timeline_lock = threading.Lock()
+_timeline: StartupTimeline | None = None
+
+
+def startup_trace_requested(argv: Sequence[str]) -> tuple[bool, tuple[str, ...]]:
+    """Return whether tracing was asked for and ``argv`` without the trace flag."""
+
+    rest = tuple(arg for arg in argv if arg != STARTUP_TRACE_FLAG)
+    from_env = str(os.environ.get(STARTUP_TRACE_ENV, "")).strip().lower() in {"1", "true", "yes", "on"}
+    return from_env or len(rest) != len(argv), rest
+
+
+def enable_startup_trace() -> StartupTimeline:
+    global _timeline
+    with _timeline_lock:
+        if _timeline is None:
+            _timeline = StartupTimeline(process_age_ms=_process_age_ms())
+        return _timeline
+
+
+def startup_trace_active() -> bool:
+    return _timeline is not None
+
+
+@contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    """Time the enclosed block as startup phase ``name`` while tracing."""
+
+    timeline = _timeline
+    if timeline is None:
+        yield
+        return
+    with timeline.phase(name):
+        yield
+
+
+def mark_startup(name: str) -> None:
+    timeline = _timeline
+    if timeline is not None:
+        timeline.mark(name)
+
+
+def _startup_trace_path() -> Path:
+    from keyrgb.core.config.paths import runtime_dir
+
+    return runtime_dir() / STARTUP_TRACE_FILENAME
+
+
+def finish_startup_trace(*, path: Path | None = None) -> StartupReport | None:
+    """Log and write the report, then stop tracing; ``None`` when tracing was off."""
+
+    global _timeline
+    with _timeline_lock:
+        timeline, _timeline = _timeline, None
+    if timeline is None:
+        return None
+    report = timeline.report()
+    logger.info("%s", timeline.format_report())
+    trace_path = _startup_trace_path() if path is None else Path(path)
+    tmp_path = trace_path.with_name(f".{trace_path.name}.tmp")
+    try:
+        trace_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        os.replace(tmp_path, trace_path)
+    except OSError as exc:
+        logger.warning("Could not write startup trace to %s: %s", trace_path, exc)
+    else:
+        logger.info("Startup trace written to %s", trace_path)
+    return report
@@ -124,6 +124,9 @@ def build_menu_items(
 
     hw_effect_names = effects_catalog.detected_backend_hw_effect_names(getattr(tray_state, "backend", None))
     hw_effects_label = menu_status.hardware_effects_menu_text(tray)
+    performance_menu = pystray.Menu(
+        *[item(line, lambda _icon, _item: None, enabled=False) for line in menu_status.performance_status_lines()]
+    )
 
     # HW effects lock when in SW mode; static hardware mode is a separate top-level action.
     hw_effects_menu = menu_effects.build_hw_effects_menu(
@@ -255,6 +258,7 @@ def build_menu_items(
         # power mode / settings (Support Tools lives under Settings → Version)
         *([item("Power Mode", power_menu)] if power_menu is not None else []),
         item("Settings", tray_state._on_power_settings_clicked),
+        item("Performance", performance_menu),
         pystray.Menu.SEPARATOR,
         # off/on / (active mode) / quit
         item(
@@ -291,3 +291,12 @@ def hardware_effects_menu_text(tray: object) -> str:
         return "Hardware Effects"
     noun = "mode" if count == 1 else "modes"
     return f"Hardware Effects ({count} {noun})"
+
+
+def performance_status_lines() -> list[str]:
+    """Return the tray "Performance" submenu lines from this process's metrics registry."""
+
+    from keyrgb.core.runtime.metrics import REGISTRY, summary_lines
+
+    lines = summary_lines(REGISTRY.snapshot())
+    return lines or ["No frames rendered yet"]
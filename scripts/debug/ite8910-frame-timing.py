@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Frame-rate harness for the ITE 8910 per-key write path (no hardware needed).
+
+Drives ``Ite8910KeyboardDevice`` through a fake hidraw transport that paces
+reports exactly like ``HidrawFeatureTransport`` and simulates the ioctl cost
+with a sleep, then prints the achieved frames per second for full, partial,
+and unchanged frames:
+
+    scripts/debug/ite8910-frame-timing.py --ioctl-us 400 --delay-ms 1
+
+Compare against the old per-report ``sleep()`` pacing with ``--legacy-pacing``
+and against writing every key of every frame with
+``KEYRGB_ITE8910_SKIP_UNCHANGED_KEYS=0``. Paste the output when reporting
+per-key smoothness on ITE 8910 laptops, together with the measured ioctl time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+
+def _repo_root() -> str:
+    this_file = os.path.abspath(__file__)
+    return os.path.dirname(os.path.dirname(os.path.dirname(this_file)))
+
+
+class FakeHidrawTransport:
+    """Counts feature reports and spends ``ioctl_s`` on each one."""
+
+    def __init__(self, *, ioctl_s: float, delay_s: float, legacy_pacing: bool) -> None:
+        from keyrgb.core.backends._report_pacing import HidReportPacer
+
+        self.reports = 0
+        self._ioctl_s = max(0.0, float(ioctl_s))
+        self._delay_s = max(0.0, float(delay_s))
+        self._legacy_pacing = bool(legacy_pacing)
+        self._pacer = HidReportPacer(delay_s=self._delay_s)
+
+    def send_feature_report(self, report: bytes) -> int:
+        if not self._legacy_pacing:
+            self._pacer.wait_for_slot()
+        if self._ioctl_s > 0.0:
+            time.sleep(self._ioctl_s)
+        self.reports += 1
+        if self._legacy_pacing and self._delay_s > 0.0:
+            time.sleep(self._delay_s)
+        return len(report)
+
+    def close(self) -> None:
+        return
+
+
+def _frames(
+    rows: int, cols: int, *, count: int, changed_keys: int
+) -> list[dict[tuple[int, int], tuple[int, int, int]]]:
+    keys = [(row, col) for row in range(rows) for col in range(cols)]
+    changed = keys[: max(0, min(len(keys), int(changed_keys)))]
+    frames = []
+    for index in range(count):
+        level = 40 + (index % 2) * 160
+        frame = dict.fromkeys(keys, (20, 20, 20))
+        for key in changed:
+            frame[key] = (level, 0, 255 - level)
+        frames.append(frame)
+    return frames
+
+
+def _run_case(label: str, *, changed_keys: int, args: argparse.Namespace) -> None:
+    from keyrgb.core.backends.ite8910_perkey import protocol
+    from keyrgb.core.backends.ite8910_perkey.device import Ite8910KeyboardDevice
+
+    transport = FakeHidrawTransport(
+        ioctl_s=args.ioctl_us / 1_000_000.0,
+        delay_s=args.delay_ms / 1000.0,
+        legacy_pacing=args.legacy_pacing,
+    )
+    kb = Ite8910KeyboardDevice(transport.send_feature_report, transport=transport)
+    frames = _frames(protocol.NUM_ROWS, protocol.NUM_COLS, count=args.frames, changed_keys=changed_keys)
+
+    # Prime the device with the static background so every case starts from
+    # the same acknowledged state.
+    kb.set_key_colors(_frames(protocol.NUM_ROWS, protocol.NUM_COLS, count=1, changed_keys=0)[0], brightness=25)
+    transport.reports = 0
+
+    start = time.perf_counter()
+    for frame in frames:
+        kb.set_key_colors(frame, brightness=25, enable_user_mode=False)
+    elapsed = time.perf_counter() - start
+
+    fps = len(frames) / elapsed if elapsed > 0 else float("inf")
+    per_frame = transport.reports / max(1, len(frames))
+    print(f"{label:<10} changed={changed_keys:>3}  reports/frame={per_frame:6.1f}  {fps:8.1f} fps")
+
+
+def _main() -> int:
+    repo_root = _repo_root()
+    if repo_root not in sys.path:
+        sys.path.insert(0, repo_root)
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--ioctl-us", type=float, default=400.0, help="simulated time per HID feature report")
+    parser.add_argument("--delay-ms", type=float, default=1.0, help="report pacing delay (KEYRGB_HID_REPORT_DELAY_MS)")
+    parser.add_argument("--partial-keys", type=int, default=12, help="keys that change per partial frame")
+    parser.add_argument("--legacy-pacing", action="store_true", help="sleep the full delay after every report")
+    args = parser.parse_args()
+
+    from keyrgb.core.backends.ite8910_perkey import protocol
+
+    pacing = "legacy sleep-after" if args.legacy_pacing else "start-to-start"
+    print(f"ITE 8910 fake hidraw: ioctl={args.ioctl_us:.0f}us delay={args.delay_ms:g}ms pacing={pacing}")
+    _run_case("full", changed_keys=protocol.NUM_ROWS * protocol.NUM_COLS, args=args)
+    _run_case("partial", changed_keys=args.partial_keys, args=args)
+    _run_case("unchanged", changed_keys=0, args=args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_main())
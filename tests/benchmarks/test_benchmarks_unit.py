@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmarks.cli import main, run_suite
+from benchmarks.compare import Threshold, compare_results, load_results, load_thresholds, metric_value
+
+
+def _case(*, p50: float = 0.1, reports: float = 6.0, bytes_per_frame: float = 96.0) -> dict[str, object]:
+    return {
+        "compute_ms": {"mean": p50, "p50": p50, "p90": p50, "max": p50},
+        "write_ms": {"mean": 0.2, "p50": 0.2, "p90": 0.2, "max": 0.2},
+        "bytes_per_frame": bytes_per_frame,
+        "reports_per_frame": reports,
+        "alloc_bytes_per_frame": 4096.0,
+    }
+
+
+def test_compare_flags_metrics_past_their_threshold_only() -> None:
+    thresholds = {
+        "compute_ms.p50": Threshold(relative=0.5, absolute=0.05),
+        "reports_per_frame": Threshold(relative=0.0, absolute=0.05),
+    }
+    baseline = {"cases": {"ite8910/rainbow_wave": _case(), "sysfs/fire": _case()}}
+    current = {
+        "cases": {
+            "ite8910/rainbow_wave": _case(p50=0.19, reports=7.0),
+            "sysfs/fire": _case(p50=0.25),
+            "ite8258/new_effect": _case(p50=9.0),
+        }
+    }
+
+    regressions = compare_results(baseline, current, thresholds)
+
+    assert [(r.case, r.metric) for r in regressions] == [
+        ("ite8910/rainbow_wave", "reports_per_frame"),
+        ("sysfs/fire", "compute_ms.p50"),
+    ]
+    assert regressions[1].limit == pytest.approx(0.2)
+    assert "0.1 -> 0.25" in regressions[1].describe()
+
+
+def test_metric_value_reads_dotted_paths_and_ignores_missing() -> None:
+    case = _case(p50=0.3)
+
+    assert metric_value(case, "compute_ms.p50") == pytest.approx(0.3)
+    assert metric_value(case, "bytes_per_frame") == pytest.approx(96.0)
+    assert metric_value(case, "compute_ms.p75") is None
+    assert metric_value(case, "bytes_per_frame.mean") is None
+
+
+def test_shipped_thresholds_give_counts_no_relative_slack() -> None:
+    thresholds = load_thresholds()
+
+    assert thresholds["bytes_per_frame"].relative == 0.0
+    assert thresholds["reports_per_frame"].relative == 0.0
+    assert {"compute_ms.p50", "write_ms.p50", "alloc_bytes_per_frame"} <= set(thresholds)
+
+
+@pytest.mark.parametrize("target", ["ite8291r3", "ite8910", "ite8258", "sysfs"])
+def test_suite_counts_are_deterministic_per_target(target: str) -> None:
+    effects = ["rainbow_wave", "reactive_ripple"]
+
+    first = run_suite(targets=[target], effects=effects, frames=8, warmup=1)
+    second = run_suite(targets=[target], effects=effects, frames=8, warmup=1)
+
+    assert sorted(first["cases"]) == [f"{target}/rainbow_wave", f"{target}/reactive_ripple"]
+    for name, case in first["cases"].items():
+        assert case["frames"] == 8
+        assert case["reports_per_frame"] > 0
+        assert case["bytes_per_frame"] == second["cases"][name]["bytes_per_frame"]
+        assert case["reports_per_frame"] == second["cases"][name]["reports_per_frame"]
+
+
+def test_cli_writes_results_and_fails_on_regression(tmp_path, capsys) -> None:
+    output = tmp_path / "bench.json"
+    thresholds = tmp_path / "thresholds.json"
+    # Counts only: timings over a handful of frames are too noisy to assert on.
+    thresholds.write_text(json.dumps({"metrics": {"reports_per_frame": {"absolute": 0.05}}}), encoding="utf-8")
+    args = ["--targets", "ite8910", "--effects", "rainbow_wave", "--frames", "4", "--warmup", "1"]
+    args += ["--thresholds", str(thresholds)]
+
+    assert main([*args, "--output", str(output)]) == 0
+    assert main([*args, "--compare", str(output)]) == 0
+
+    doctored = load_results(output)
+    doctored["cases"]["ite8910/rainbow_wave"]["reports_per_frame"] = 1.0
+    output.write_text(json.dumps(doctored), encoding="utf-8")
+
+    assert main([*args, "--compare", str(output)]) == 1
+    assert "ite8910/rainbow_wave: reports_per_frame" in capsys.readouterr().out
@@ -24,7 +24,7 @@ def test_build_system_doc_lists_every_named_profile() -> None:
     text = _BUILD_SYSTEM.read_text(encoding="utf-8")
     for name in PROFILES:
         assert f"`{name}`:" in text, f"build-system doc is missing profile {name}"
-    assert "steps `1` through `21`" in text
+    assert "steps `1` through `22`" in text
 
 
 def test_ci_doc_matches_current_ci_and_release_workflows() -> None:
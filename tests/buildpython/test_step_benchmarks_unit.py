@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from buildpython.steps import step_benchmarks
+from buildpython.utils.subproc import RunResult
+
+
+def _fake_run(calls: list[list[str]], *, exit_code: int = 0):
+    def _run(args, **_kwargs) -> RunResult:
+        calls.append(args)
+        output = args[args.index("--output") + 1]
+        with open(output, "w", encoding="utf-8") as handle:
+            handle.write('{"cases": {}}\n')
+        return RunResult(command_str=" ".join(args), stdout="ok\n", stderr="", exit_code=exit_code)
+
+    return _run
+
+
+def test_benchmarks_runner_records_baseline_then_compares(monkeypatch, tmp_path) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(step_benchmarks, "buildlog_dir", lambda: tmp_path)
+    monkeypatch.setattr(step_benchmarks, "python_exe", lambda: "python")
+    monkeypatch.setattr(step_benchmarks, "run", _fake_run(calls))
+
+    first = step_benchmarks.benchmarks_runner()
+    second = step_benchmarks.benchmarks_runner()
+
+    baseline = tmp_path / step_benchmarks.BASELINE_FILENAME
+    assert first.exit_code == 0
+    assert "Recorded benchmark baseline" in first.stdout
+    assert "--compare" not in calls[0]
+    assert calls[1][-2:] == ["--compare", str(baseline)]
+    assert second.stdout == "ok\n"
+
+
+def test_benchmarks_runner_does_not_record_a_failed_run(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(step_benchmarks, "buildlog_dir", lambda: tmp_path)
+    monkeypatch.setattr(step_benchmarks, "run", _fake_run([], exit_code=1))
+
+    result = step_benchmarks.benchmarks_runner()
+
+    assert result.exit_code == 1
+    assert not (tmp_path / step_benchmarks.BASELINE_FILENAME).exists()
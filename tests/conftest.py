@@ -32,12 +32,13 @@ if not _hardware_opted_in():
         tempfile.mkdtemp(prefix="keyrgb-test-config-"),
     )
     _xdg_root = Path(tempfile.mkdtemp(prefix="keyrgb-test-xdg-"))
-    for name, mode in (("config", 0o755), ("data", 0o755), ("cache", 0o755), ("runtime", 0o700)):
+    for name, mode in (("config", 0o755), ("data", 0o755), ("state", 0o755), ("cache", 0o755), ("runtime", 0o700)):
         path = _xdg_root / name
         path.mkdir(mode=mode, exist_ok=True)
         os.chmod(path, mode)
     os.environ.setdefault("XDG_CONFIG_HOME", str(_xdg_root / "config"))
     os.environ.setdefault("XDG_DATA_HOME", str(_xdg_root / "data"))
+    os.environ.setdefault("XDG_STATE_HOME", str(_xdg_root / "state"))
     os.environ.setdefault("XDG_CACHE_HOME", str(_xdg_root / "cache"))
     os.environ.setdefault("XDG_RUNTIME_DIR", str(_xdg_root / "runtime"))
 
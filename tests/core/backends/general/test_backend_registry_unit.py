@@ -4,6 +4,7 @@ from dataclasses import dataclass
 
 import pytest
 
+from keyrgb.core.backends._registry_specs import _spec_for_backend
 from keyrgb.core.backends.base import (
     BackendStability,
     ExperimentalEvidence,
@@ -19,7 +20,6 @@ from keyrgb.core.backends.policies.backend_selection import (
 from keyrgb.core.backends.registry import (
     BackendSpec,
     _probe_backend,
-    _spec_for_backend,
     build_backend_selection_report,
     iter_backends,
     select_backend,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import errno
 import logging
 from threading import RLock
 
@@ -153,6 +154,48 @@ def test_device_applies_report_delay_between_reports(monkeypatch) -> None:
     assert all(abs(s - 0.005) < 1e-9 for s in sleeps)
 
 
+def test_device_feeds_adaptive_pacing_with_round_trips_and_failures(tmp_path) -> None:
+    from keyrgb.core.backends._adaptive_pacing import AdaptiveReportPacing
+
+    sleeps: list[float] = []
+    pacing = AdaptiveReportPacing(
+        vendor_id=0x048D,
+        product_id=0x600B,
+        default_s=0.001,
+        floor_s=0.0001,
+        step_reports=13,
+        state_path=tmp_path / "hid_pacing.json",
+        sleep=sleeps.append,
+    )
+    rows: list[bytes] = []
+    device = Ite8291r3KeyboardDevice(
+        lambda _report: 0, lambda _length: bytes(8), rows.append, report_delay_s=0.005, report_pacing=pacing
+    )
+
+    device.set_color((0, 0, 0), brightness=25)
+
+    assert len(sleeps) == 13
+    assert sleeps[0] == 0.001
+    assert pacing.delay_s == pytest.approx(0.0008)
+
+    def unplugged_row(_payload: bytes) -> int:
+        raise OSError(errno.ENODEV, "No such device")
+
+    device._write_row_data = unplugged_row
+    with pytest.raises(OSError, match="No such device"):
+        device.set_color((0, 0, 0), brightness=25)
+    # A vanished device (unplug, suspend) is not a pacing failure.
+    assert pacing.delay_s == pytest.approx(0.0008)
+
+    def fail_row(_payload: bytes) -> int:
+        raise OSError("pipe error")
+
+    device._write_row_data = fail_row
+    with pytest.raises(OSError, match="pipe error"):
+        device.set_color((0, 0, 0), brightness=25)
+    assert pacing.delay_s == pytest.approx(0.0016)
+
+
 def test_coerce_helpers_reject_invalid_inputs() -> None:
     from keyrgb.core.backends.ite8291r3_perkey import device as device_mod
 
@@ -391,3 +434,23 @@ def test_report_delay_default_is_hardware_validated_025ms(monkeypatch) -> None:
     monkeypatch.delenv("KEYRGB_ITE8291R3_PERKEY_REPORT_DELAY_MS")
     monkeypatch.setenv("KEYRGB_HID_REPORT_DELAY_MS", "0")
     assert _report_delay_s_from_env() == 0.0
+
+
+def test_device_set_key_colors_packs_frame_buffer_rows_like_color_maps(monkeypatch) -> None:
+    from keyrgb.core.effects.frame_buffer import FrameBuffer
+
+    monkeypatch.setenv("KEYRGB_ITE8291R3_SKIP_UNCHANGED_ROWS", "0")
+    color_map = {(r, c): (r, c, 200 - c) for r in range(protocol.NUM_ROWS) for c in range(protocol.NUM_COLS)}
+    frame = FrameBuffer(protocol.NUM_ROWS, protocol.NUM_COLS)
+    frame.update(color_map)
+
+    from_map: list[bytes] = []
+    from_frame: list[bytes] = []
+    Ite8291r3KeyboardDevice(lambda _b: 0, lambda _n: bytes(8), from_map.append, report_delay_s=0.0).set_key_colors(
+        color_map, brightness=30, enable_user_mode=False
+    )
+    Ite8291r3KeyboardDevice(lambda _b: 0, lambda _n: bytes(8), from_frame.append, report_delay_s=0.0).set_key_colors(
+        frame, brightness=30, enable_user_mode=False
+    )
+
+    assert from_frame == from_map
@@ -370,3 +370,19 @@ def test_resolve_output_endpoint_sets_configuration_on_error() -> None:
 
     endpoint = usb._resolve_output_endpoint(_Dev(), _Core(), _Util(), interface_number=1)
     assert endpoint == 0x81
+
+
+def test_open_matching_transport_uses_a_probed_device_without_rescanning(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[str] = []
+    device = _FakeDevice(events, kernel_driver_active=False)
+    monkeypatch.setattr(usb, "_load_pyusb_modules", lambda: (_FakeCore(), _FakeUtil(events)))
+
+    def _no_scan(**_kwargs):
+        raise AssertionError("the probed device must be reused")
+
+    monkeypatch.setattr(usb, "find_matching_device", _no_scan)
+
+    transport, info = usb.open_matching_transport(device=device)
+
+    assert (info.bus, info.address) == (1, 2)
+    transport.close()
@@ -354,3 +354,63 @@ def test_backend_probe_reports_available_when_device_present(monkeypatch: pytest
     assert res.available is True
     assert res.identifiers["hidraw"] == "/dev/hidraw7"
     assert "hidraw device present" in (res.reason or "")
+
+
+def test_device_set_key_colors_sends_only_changed_keys_in_led_order() -> None:
+    sent: list[bytes] = []
+
+    def writer(report: bytes) -> int:
+        sent.append(bytes(report))
+        return len(report)
+
+    kb = Ite8910KeyboardDevice(writer)
+    kb.set_key_colors({(0, 0): (1, 2, 3), (5, 1): (4, 5, 6)}, brightness=25, enable_user_mode=False)
+    sent.clear()
+
+    kb.set_key_colors(
+        {(0, 0): (9, 9, 9), (5, 1): (4, 5, 6), (2, 10): (7, 7, 7)},
+        brightness=25,
+        enable_user_mode=False,
+    )
+
+    assert sent == [build_led_color_report(0x6A, (7, 7, 7)), build_led_color_report(0xA0, (9, 9, 9))]
+
+
+def test_device_resends_keys_after_reset_effect_or_failed_write(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[bytes] = []
+    fail = {"next": False}
+
+    def writer(report: bytes) -> int:
+        if fail["next"]:
+            fail["next"] = False
+            raise OSError("EPIPE")
+        sent.append(bytes(report))
+        return len(report)
+
+    frame = {(0, 0): (1, 2, 3)}
+    kb = Ite8910KeyboardDevice(writer)
+    kb.set_key_colors(frame, brightness=25, enable_user_mode=False)
+
+    kb.set_effect({"name": "wave"})
+    sent.clear()
+    kb.set_key_colors(frame, brightness=25, enable_user_mode=False)
+    assert sent == [build_led_color_report(0xA0, (1, 2, 3))]
+
+    fail["next"] = True
+    with pytest.raises(OSError):
+        kb.set_key_colors({(0, 0): (3, 3, 3)}, brightness=25, enable_user_mode=False)
+    sent.clear()
+    kb.set_key_colors(frame, brightness=25, enable_user_mode=False)
+    assert sent == [build_led_color_report(0xA0, (1, 2, 3))]
+
+    fail["next"] = True
+    with pytest.raises(OSError):
+        kb.set_led_color_by_id(0xA0, (3, 3, 3))
+    sent.clear()
+    kb.set_key_colors(frame, brightness=25, enable_user_mode=False)
+    assert sent == [build_led_color_report(0xA0, (1, 2, 3))]
+
+    monkeypatch.setenv("KEYRGB_ITE8910_SKIP_UNCHANGED_KEYS", "0")
+    sent.clear()
+    kb.set_key_colors(frame, brightness=25, enable_user_mode=False)
+    assert sent == [build_led_color_report(0xA0, (1, 2, 3))]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+from keyrgb.core.backends import _registry_specs, registry
+from keyrgb.core.backends._registry_specs import _invalidate_discovery_cache, discover_backend_registrations
+from keyrgb.core.backends.manifest import (
+    BACKEND_MANIFEST,
+    MachineHints,
+    entry_matches_machine,
+    keyboard_led_name,
+    manifest_entry_for_name,
+)
+from keyrgb.core.backends.sysfs.common import _is_candidate_led
+
+
+def test_manifest_mirrors_every_package_marker() -> None:
+    _invalidate_discovery_cache()
+    registrations = discover_backend_registrations()
+
+    assert sorted(entry.metadata.name for entry in BACKEND_MANIFEST) == sorted(
+        reg.metadata.name for reg in registrations
+    )
+    for reg in registrations:
+        entry = manifest_entry_for_name(reg.metadata.name)
+        assert entry is not None
+        assert entry.metadata == reg.metadata
+        assert reg.factory.__module__.startswith(entry.module_name + ".")
+
+
+def test_manifest_usb_hints_cover_the_protocol_ids() -> None:
+    for entry in BACKEND_MANIFEST:
+        if not entry.usb_ids:
+            continue
+        protocol = importlib.import_module(f"{entry.module_name}.protocol")
+        product_ids = getattr(protocol, "SUPPORTED_PRODUCT_IDS", None) or getattr(protocol, "PRODUCT_IDS", None)
+        if product_ids is None:
+            product_ids = (protocol.PRODUCT_ID,)
+        assert {(int(protocol.VENDOR_ID), int(pid)) for pid in product_ids} <= set(entry.usb_ids), entry.package
+        forced_env = getattr(protocol, "HIDRAW_PATH_ENV", None)
+        assert forced_env is None or forced_env in entry.force_envs, entry.package
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "rgb:kbd_backlight",
+        "tpacpi::kbd_backlight",
+        "ite_8291_lb:rgb",
+        "ite_8297:1",
+        "asus::keyboard",
+        "input3::capslock",
+        "platform::mute",
+        "phy0-led",
+    ],
+)
+def test_keyboard_led_hint_agrees_with_the_sysfs_backend(name: str) -> None:
+    assert keyboard_led_name(name) == _is_candidate_led(name)
+
+
+def test_hints_pick_only_the_backends_this_machine_could_use(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("shutil.which", lambda _name: None)
+    for env in ("KEYRGB_ASUSCTL_PATH", "KEYRGB_ITE8910_HIDRAW_PATH"):
+        monkeypatch.delenv(env, raising=False)
+    hints = MachineHints(usb_ids=frozenset({(0x048D, 0x8910), (0x046D, 0xC52B)}), led_names=("input3::capslock",))
+
+    matched = {entry.metadata.name for entry in BACKEND_MANIFEST if entry_matches_machine(entry, hints)}
+
+    assert "ite8910_perkey" in matched
+    assert "sysfs-leds" not in matched
+    assert "ite8291r3_perkey" not in matched
+    assert "asusctl-aura" not in matched
+
+
+def test_unknown_topology_or_forced_path_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    entry = manifest_entry_for_name("ite8258_zones_lenovo_legion")
+    assert entry is not None
+    empty = MachineHints(usb_ids=frozenset(), led_names=())
+
+    assert entry_matches_machine(entry, MachineHints(usb_ids=None, led_names=()))
+    assert not entry_matches_machine(entry, empty)
+    monkeypatch.setenv("KEYRGB_ITE8258_HIDRAW_PATH", "/dev/hidraw7")
+    assert entry_matches_machine(entry, empty)
+
+
+def test_machine_hints_read_usb_and_hidraw_ids_from_sysfs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("KEYRGB_DISABLE_USB_SCAN", raising=False)
+    monkeypatch.delenv("KEYRGB_SYSFS_LEDS_ROOT", raising=False)
+    usb = tmp_path / "bus/usb/devices/1-3"
+    usb.mkdir(parents=True)
+    (usb / "idVendor").write_text("048d\n", encoding="utf-8")
+    (usb / "idProduct").write_text("600b\n", encoding="utf-8")
+    hid = tmp_path / "class/hidraw/hidraw0/device"
+    hid.mkdir(parents=True)
+    (hid / "uevent").write_text("HID_ID=0003:0000048D:0000C195\n", encoding="utf-8")
+    (tmp_path / "class/leds/rgb:kbd_backlight").mkdir(parents=True)
+
+    hints = MachineHints.read(sysfs_root=tmp_path)
+
+    assert hints.usb_ids == frozenset({(0x048D, 0x600B), (0x048D, 0xC195)})
+    assert hints.led_names == ("rgb:kbd_backlight",)
+
+
+def test_requested_backend_is_kept_even_when_its_hints_miss(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("KEYRGB_BACKEND", raising=False)
+    monkeypatch.setattr(_registry_specs.MachineHints, "read", classmethod(lambda cls: cls(frozenset(), ())))
+    monkeypatch.setattr("shutil.which", lambda _name: None)
+
+    auto_names = [spec.name for spec in _registry_specs.machine_specs()]
+    requested_names = [spec.name for spec in _registry_specs.machine_specs("ite8910")]
+
+    assert "ite8910_perkey" not in auto_names
+    assert "ite8910_perkey" in requested_names
+    assert [backend.name for backend in registry.iter_backends(specs=_registry_specs.machine_specs("ite8910"))] == [
+        "ite8910_perkey"
+    ]
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from keyrgb.core.backends._registry_specs import _invalidate_discovery_cache
 from keyrgb.core.backends.base import BackendMetadata, BackendRegistration, BackendRole, BackendStability
 from keyrgb.core.backends.registry import (
-    _invalidate_discovery_cache,
     discover_backend_registrations,
     get_metadata_for_backend_name,
     iter_auxiliary_specs,
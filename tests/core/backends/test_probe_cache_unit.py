@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from keyrgb.core.backends import _registry_probe, probe_cache
+from keyrgb.core.backends.base import BackendStability, ProbeResult
+from keyrgb.core.backends.registry import BackendSpec, select_backend
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text + "\n", encoding="utf-8")
+
+
+def _fake_sysfs(root: Path, *, bcd: str = "0003") -> Path:
+    _write(root / "class/dmi/id/product_name", "Example Laptop")
+    usb = root / "bus/usb/devices/1-3"
+    _write(usb / "idVendor", "048d")
+    _write(usb / "idProduct", "ce00")
+    _write(usb / "bcdDevice", bcd)
+    _write(usb / "busnum", "1")
+    _write(usb / "devnum", "4")
+    _write(root / "bus/usb/devices/1-4/idVendor", "046d")
+    _write(root / "class/hidraw/hidraw2/device/uevent", "DRIVER=hid-generic\nHID_ID=0003:0000048D:0000CE00")
+    (root / "class/leds/input3::capslock").mkdir(parents=True)
+    return root
+
+
+def test_fingerprint_follows_the_controller_topology(tmp_path: Path) -> None:
+    first = probe_cache.hardware_fingerprint(sysfs_root=_fake_sysfs(tmp_path / "a"), experimental_enabled=False)
+    same = probe_cache.hardware_fingerprint(sysfs_root=_fake_sysfs(tmp_path / "b"), experimental_enabled=False)
+    other_firmware = probe_cache.hardware_fingerprint(
+        sysfs_root=_fake_sysfs(tmp_path / "c", bcd="0002"), experimental_enabled=False
+    )
+    kernel_led = _fake_sysfs(tmp_path / "d")
+    (kernel_led / "class/leds/rgb:kbd_backlight").mkdir()
+
+    assert first == same
+    assert first != other_firmware
+    assert first != probe_cache.hardware_fingerprint(sysfs_root=kernel_led, experimental_enabled=False)
+    assert first != probe_cache.hardware_fingerprint(sysfs_root=tmp_path / "a", experimental_enabled=True)
+
+
+def test_cache_round_trip_is_keyed_by_fingerprint(tmp_path: Path) -> None:
+    path = tmp_path / "backend_probe.json"
+
+    probe_cache.store_cached_backend("abc", "ite8291r3_perkey", path=path)
+
+    assert probe_cache.load_cached_backend("abc", path=path) == "ite8291r3_perkey"
+    assert probe_cache.load_cached_backend("def", path=path) is None
+    path.write_text("not json", encoding="utf-8")
+    assert probe_cache.load_cached_backend("abc", path=path) is None
+
+
+@dataclass
+class _CountingBackend:
+    name: str
+    priority: int
+    available: bool
+    probes: list[str] = field(default_factory=list)
+    stability: BackendStability = BackendStability.VALIDATED
+    experimental_evidence: None = None
+
+    def is_available(self) -> bool:
+        return self.available
+
+    def probe(self) -> ProbeResult:
+        self.probes.append(self.name)
+        return ProbeResult(available=self.available, reason="test", confidence=50)
+
+
+def _specs(backends: list[_CountingBackend]) -> list[BackendSpec]:
+    return [BackendSpec(name=b.name, priority=b.priority, factory=lambda b=b: b) for b in backends]
+
+
+def test_select_backend_probes_only_the_cached_winner(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("KEYRGB_STATE_DIR", str(tmp_path))
+    monkeypatch.delenv("KEYRGB_BACKEND", raising=False)
+    monkeypatch.setattr(_registry_probe, "hardware_fingerprint", lambda: "machine")
+    high = _CountingBackend("high", 100, available=True)
+    low = _CountingBackend("low", 10, available=True)
+
+    first = select_backend(specs=_specs([high, low]), use_probe_cache=True)
+    assert first is high
+    assert probe_cache.load_cached_backend("machine") == "high"
+
+    high.probes.clear()
+    low.probes.clear()
+    again = select_backend(specs=_specs([high, low]), use_probe_cache=True)
+
+    assert again is high
+    assert high.probes == ["high"]
+    assert low.probes == []
+
+
+def test_select_backend_reprobes_when_the_cached_winner_is_gone(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("KEYRGB_STATE_DIR", str(tmp_path))
+    monkeypatch.delenv("KEYRGB_BACKEND", raising=False)
+    monkeypatch.setattr(_registry_probe, "hardware_fingerprint", lambda: "machine")
+    probe_cache.store_cached_backend("machine", "high")
+    high = _CountingBackend("high", 100, available=False)
+    low = _CountingBackend("low", 10, available=True)
+
+    selected = select_backend(specs=_specs([high, low]), use_probe_cache=True)
+
+    assert selected is low
+    assert low.probes == ["low"]
+    assert probe_cache.load_cached_backend("machine") == "low"
+
+
+def test_disable_flag_skips_the_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("KEYRGB_STATE_DIR", str(tmp_path))
+    monkeypatch.setenv("KEYRGB_DISABLE_PROBE_CACHE", "1")
+    monkeypatch.delenv("KEYRGB_BACKEND", raising=False)
+    monkeypatch.setattr(_registry_probe, "hardware_fingerprint", lambda: "machine")
+
+    select_backend(specs=_specs([_CountingBackend("only", 1, available=True)]), use_probe_cache=True)
+
+    assert not (tmp_path / probe_cache.PROBE_CACHE_STATE_FILENAME).exists()
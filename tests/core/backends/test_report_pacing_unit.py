@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import json
+
+import pytest
+
+from keyrgb.core.backends._adaptive_pacing import ADAPTIVE_HID_PACING_ENV, AdaptiveReportPacing, adaptive_report_pacing
 from keyrgb.core.backends._report_pacing import (
+    HidReportPacer,
     backend_report_delay_env_key,
     hid_report_delay_s_from_env,
     sleep_after_hid_report,
@@ -43,3 +49,153 @@ def test_sleep_after_hid_report_allows_zero_to_disable(monkeypatch) -> None:
     sleep_after_hid_report(backend_name="ite8258_perkey_chassis")
 
     assert sleeps == []
+
+
+def test_hid_report_pacer_counts_transport_time_toward_the_gap() -> None:
+    now = [100.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(round(seconds, 6))
+        now[0] += seconds
+
+    pacer = HidReportPacer(delay_s=0.001, clock=lambda: now[0], sleep=sleep)
+
+    pacer.wait_for_slot()  # first report never waits
+    now[0] += 0.0004  # fast ioctl: only the remainder of the gap is slept
+    pacer.wait_for_slot()
+    now[0] += 0.002  # slow ioctl already covered the gap
+    pacer.wait_for_slot()
+
+    assert sleeps == [0.0006]
+
+
+def test_hid_report_pacer_reads_backend_delay_and_zero_disables(monkeypatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setenv("KEYRGB_ITE8910_PERKEY_REPORT_DELAY_MS", "0")
+
+    pacer = HidReportPacer(backend_name="ite8910_perkey", clock=lambda: 0.0, sleep=sleeps.append)
+    pacer.wait_for_slot()
+    pacer.wait_for_slot()
+
+    assert pacer.delay_s == 0.0
+    assert sleeps == []
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _adaptive(tmp_path, clock: _Clock, **kwargs) -> AdaptiveReportPacing:
+    return AdaptiveReportPacing(
+        vendor_id=0x048D,
+        product_id=0x600B,
+        default_s=0.001,
+        floor_s=0.0002,
+        step_reports=10,
+        state_path=tmp_path / "hid_pacing.json",
+        clock=clock,
+        sleep=clock.sleep,
+        **kwargs,
+    )
+
+
+def test_adaptive_pacing_steps_down_to_the_floor_while_reports_stay_healthy(tmp_path) -> None:
+    clock = _Clock()
+    pacing = _adaptive(tmp_path, clock)
+
+    for _ in range(10):
+        pacing.report_done(0.0003)
+    assert pacing.delay_s == 0.0008
+    assert clock.sleeps[0] == 0.001
+
+    for _ in range(500):
+        pacing.report_done(0.0003)
+    assert pacing.delay_s == 0.0002
+
+
+def test_adaptive_pacing_holds_when_round_trips_degrade(tmp_path) -> None:
+    clock = _Clock()
+    pacing = _adaptive(tmp_path, clock)
+    for _ in range(10):
+        pacing.report_done(0.0003)
+    for _ in range(40):
+        pacing.report_done(0.003)
+
+    assert pacing.delay_s == 0.0008
+
+
+def test_adaptive_pacing_backs_off_and_persists_the_learned_minimum(tmp_path) -> None:
+    clock = _Clock()
+    pacing = _adaptive(tmp_path, clock)
+    for _ in range(60):
+        pacing.report_done(0.0003)
+    failing_delay = pacing.delay_s
+
+    pacing.report_failed()
+    pacing.report_failed()
+
+    assert pacing.delay_s == failing_delay * 2.0
+    assert pacing.min_safe_s == failing_delay * 1.25
+    saved = json.loads((tmp_path / "hid_pacing.json").read_text(encoding="utf-8"))
+    assert saved["048d:600b"]["delay_ms"] == round(failing_delay * 2000.0, 4)
+
+    restored = _adaptive(tmp_path, _Clock())
+    assert restored.delay_s == pytest.approx(failing_delay * 2.0, rel=1e-3)
+    for _ in range(500):
+        restored.report_done(0.0003)
+    assert restored.delay_s >= failing_delay * 1.25
+
+
+def test_adaptive_pacing_treats_zero_brightness_right_after_a_write_as_a_glitch(tmp_path) -> None:
+    clock = _Clock()
+    pacing = _adaptive(tmp_path, clock)
+
+    pacing.observe_brightness_read(0)
+    assert pacing.delay_s == 0.001
+
+    pacing.observe_brightness_write(30)
+    pacing.observe_brightness_read(0)
+    assert pacing.delay_s == 0.002
+
+
+def test_adaptive_pacing_expects_zero_brightness_after_writing_zero(tmp_path) -> None:
+    clock = _Clock()
+    pacing = _adaptive(tmp_path, clock)
+
+    pacing.observe_brightness_write(30)
+    pacing.observe_brightness_write(0)
+    pacing.observe_brightness_read(0)
+
+    assert pacing.delay_s == 0.001
+
+
+def test_adaptive_pacing_is_off_when_the_delay_is_pinned_or_disabled(monkeypatch) -> None:
+    def _make():
+        return adaptive_report_pacing(
+            backend_name="ite8291r3_perkey", vendor_id=0x048D, product_id=0x600B, default_s=0.001, floor_s=0.0001
+        )
+
+    assert isinstance(_make(), AdaptiveReportPacing)
+    assert (
+        adaptive_report_pacing(
+            backend_name="ite8291r3_perkey", vendor_id=None, product_id=None, default_s=0.001, floor_s=0.0001
+        )
+        is None
+    )
+
+    monkeypatch.setenv("KEYRGB_ITE8291R3_PERKEY_REPORT_DELAY_MS", "0.5")
+    assert _make() is None
+
+    monkeypatch.delenv("KEYRGB_ITE8291R3_PERKEY_REPORT_DELAY_MS")
+    monkeypatch.setenv(ADAPTIVE_HID_PACING_ENV, "0")
+    assert _make() is None
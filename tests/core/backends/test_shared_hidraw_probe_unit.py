@@ -136,3 +136,27 @@ def test_open_matching_builds_transport(monkeypatch: pytest.MonkeyPatch) -> None
     assert match is info
     assert isinstance(transport, _FakeTransport)
     assert created == [(Path("/dev/hidraw9"), "ite8258_zones_lenovo_legion")]
+
+
+def test_open_matching_reuses_a_probed_match_while_its_devnode_exists(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    devnode = tmp_path / "hidraw4"
+    devnode.write_text("", encoding="utf-8")
+    probed = SimpleNamespace(devnode=devnode, vendor_id=0x048D, product_id=0xCE00)
+    rescanned = SimpleNamespace(devnode=Path("/dev/hidraw9"), vendor_id=0x048D, product_id=0xCE00)
+    monkeypatch.setattr(probe, "find_matching_ite8291_style_hidraw_device", lambda **_kwargs: rescanned)
+    monkeypatch.setattr(ite8291_hidraw, "HidrawFeatureOutputTransport", lambda devnode, *, backend_name: devnode)
+    kwargs = {
+        "product_ids": (0xCE00,),
+        "forced_path_env": "KEYRGB_ITE8291_HIDRAW_PATH",
+        "backend_name": "ite8291_perkey",
+        "vendor_id": 0x048D,
+        "missing_label": "ITE 8291",
+    }
+
+    assert probe.open_matching_ite8291_style_hidraw_transport(**kwargs, probed=probed) == (devnode, probed)
+
+    devnode.unlink()
+    assert probe.open_matching_ite8291_style_hidraw_transport(**kwargs, probed=probed)[1] is rescanned
@@ -702,6 +702,31 @@ def test_batch_update_persists_once(tmp_path, monkeypatch) -> None:
     assert reloaded.autostart is False
 
 
+def test_deferred_persistence_keeps_updates_in_memory_until_persisted(tmp_path, monkeypatch) -> None:
+    from keyrgb.core.config import Config, file_storage
+
+    monkeypatch.setenv("KEYRGB_CONFIG_DIR", str(tmp_path / "cfg"))
+    config = Config()
+
+    with config.defer_persistence():
+        config.brightness = 30
+        config.effect = "rainbow_wave"
+
+    assert config.brightness == 30
+    assert Config().effect != "rainbow_wave"
+
+    real_merge = file_storage.merge_config_settings_atomic
+    monkeypatch.setattr(file_storage, "merge_config_settings_atomic", lambda **_kwargs: None)
+    assert config.persist_deferred_changes() is False
+    assert config.effect == "rainbow_wave"
+
+    monkeypatch.setattr(file_storage, "merge_config_settings_atomic", real_merge)
+    assert config.persist_deferred_changes() is True
+    reloaded = Config()
+    assert reloaded.brightness == 30
+    assert reloaded.effect == "rainbow_wave"
+
+
 def test_batch_update_rolls_back_when_persistence_fails(tmp_path, monkeypatch) -> None:
     from keyrgb.core.config import Config, ConfigPersistenceError, file_storage
 
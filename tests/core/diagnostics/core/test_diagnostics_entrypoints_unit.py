@@ -147,6 +147,37 @@ def test_diagnostics_main_prints_json_by_default(
     assert payload["backends"]["selected"] == "ite8291r3_perkey"
 
 
+def test_diagnostics_main_appends_perf_section_from_exported_snapshot(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: RealPath,
+) -> None:
+    from keyrgb.core.diagnostics import perf as perf_mod
+    from keyrgb.core.runtime.metrics import MetricsRegistry, export_snapshot
+
+    registry = MetricsRegistry(enabled=True)
+    registry.histogram("effects.frame_interval_ms").observe(40.0)
+    monkeypatch.setattr("keyrgb.core.runtime.metrics.REGISTRY", registry)
+    export_snapshot(tmp_path / "perf.json")
+    monkeypatch.setenv("KEYRGB_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setattr(diagnostics_mod, "collect_diagnostics", lambda *, include_usb: _sample_diagnostics())
+    monkeypatch.setattr(diagnostics_mod, "format_diagnostics_text", lambda diag: "diagnostics text")
+
+    monkeypatch.setattr(sys, "argv", ["keyrgb-diagnostics", "--perf"])
+    diagnostics_mod.main()
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["perf"]["available"] is True
+    assert payload["perf"]["summary"] == ["Frame rate: 25.0 fps"]
+
+    monkeypatch.setattr(sys, "argv", ["keyrgb-diagnostics", "--text", "--perf"])
+    diagnostics_mod.main()
+    out = capsys.readouterr().out
+    assert out.startswith("diagnostics text\nPerformance:\n  source: pid ")
+    assert "  Frame rate: 25.0 fps" in out
+
+    assert "no metrics exported yet" in perf_mod.format_perf_text(perf_mod.perf_snapshot(tmp_path / "missing.json"))
+
+
 def test_diagnostics_module_trampoline_invokes_package_main(monkeypatch: pytest.MonkeyPatch) -> None:
     called: list[bool] = []
 
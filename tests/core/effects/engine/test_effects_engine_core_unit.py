@@ -161,6 +161,36 @@ def test_device_ensure_refreshes_dynamic_backend_capabilities() -> None:
     assert engine.backend_caps.color is True
 
 
+class _ClosableKeyboard:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_reopen_device_replaces_only_the_stale_handle(monkeypatch) -> None:
+    from keyrgb.core.effects.engine_support import core as engine_core
+
+    engine = EffectsEngine()
+    stale, reopened = _ClosableKeyboard(), _ClosableKeyboard()
+    engine.kb = stale  # type: ignore[assignment]
+    engine.device_available = True
+    opens: list[object] = []
+
+    def _acquire(**_kwargs):
+        opens.append(reopened)
+        return reopened, True
+
+    monkeypatch.setattr(engine_core, "acquire_keyboard", _acquire)
+
+    assert engine.reopen_device(stale_kb=stale) is True
+    assert stale.closed and engine.kb is reopened
+    # A retry after another thread already reopened keeps that handle.
+    assert engine.reopen_device(stale_kb=stale) is True
+    assert not reopened.closed and opens == [reopened]
+
+
 def test_get_backend_effects_propagates_unexpected_backend_failures() -> None:
     class DummyBackend(_HardwareEffectsBackend):
         def effects(self):
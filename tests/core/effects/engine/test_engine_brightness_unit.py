@@ -35,6 +35,7 @@ class _TestEngine(_EngineBrightness):
         self._brightness_value = 25
         self._fail_cache_write = False
         self.stop_calls = 0
+        self.render_wakes = 0
         self._brightness_fade_token = 0
         self._brightness_fade_lock = RLock()
 
@@ -54,6 +55,9 @@ class _TestEngine(_EngineBrightness):
     def _ensure_device_available(self) -> bool:
         return True
 
+    def wake_render_loop(self) -> None:
+        self.render_wakes += 1
+
 
 class _FailEnterLock:
     def __enter__(self) -> None:
@@ -366,6 +370,7 @@ def test_set_brightness_basic_writes_to_hardware() -> None:
     engine.set_brightness(30)
     assert engine._brightness_value == 30
     assert engine.kb.brightness_calls == [30]
+    assert engine.render_wakes == 1
 
 
 def test_set_brightness_apply_to_hardware_false_does_not_write_kb() -> None:
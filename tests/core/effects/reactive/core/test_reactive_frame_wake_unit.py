@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+
+from keyrgb.core.effects.reactive._frame_wake import FrameWaker
+from keyrgb.core.runtime.metrics import INPUT_WAKEUPS
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+
+
+class _PipeDevice:
+    def __init__(self) -> None:
+        self.read_fd, self.write_fd = os.pipe()
+
+    def fileno(self) -> int:
+        return self.read_fd
+
+    def press(self) -> None:
+        os.write(self.write_fd, b"k")
+
+    def drain(self) -> None:
+        os.read(self.read_fd, 64)
+
+    def close(self) -> None:
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+
+@pytest.fixture
+def waker():
+    event = WakeEvent()
+    frame_waker = FrameWaker(event)
+    if not frame_waker.uses_epoll:
+        pytest.skip("epoll/eventfd unavailable")
+    yield event, frame_waker
+    frame_waker.close()
+
+
+def test_input_ends_the_frame_wait_early(waker) -> None:
+    _event, frame_waker = waker
+    device = _PipeDevice()
+    try:
+        before = INPUT_WAKEUPS.value
+        threading.Timer(0.02, device.press).start()
+        started = time.monotonic()
+        frame_waker.wait(2.0, devices=[device])
+
+        assert time.monotonic() - started < 1.0
+        assert INPUT_WAKEUPS.value == before + 1
+    finally:
+        device.close()
+
+
+def test_stop_ends_the_frame_wait_early(waker) -> None:
+    event, frame_waker = waker
+    threading.Timer(0.02, event.set).start()
+    started = time.monotonic()
+    frame_waker.wait(2.0)
+
+    assert time.monotonic() - started < 1.0
+
+
+def test_unreadable_devices_wait_for_the_deadline(waker) -> None:
+    _event, frame_waker = waker
+    device = _PipeDevice()
+    try:
+        device.press()
+        device.drain()
+        started = time.monotonic()
+        frame_waker.wait(0.05, devices=[device])
+
+        assert time.monotonic() - started >= 0.04
+    finally:
+        device.close()
+
+
+def test_reopened_device_on_a_reused_fd_is_registered_again(waker) -> None:
+    _event, frame_waker = waker
+    first = _PipeDevice()
+    frame_waker.wait(0.0, devices=[first])
+    first.close()
+    second = _PipeDevice()
+    try:
+        second.press()
+        started = time.monotonic()
+        frame_waker.wait(2.0, devices=[second])
+
+        assert time.monotonic() - started < 1.0
+    finally:
+        second.close()
+
+
+def test_plain_stop_event_falls_back_to_event_wait() -> None:
+    calls: list[float] = []
+
+    class _StopEvent:
+        def wait(self, timeout: float | None = None) -> bool:
+            calls.append(float(timeout or 0.0))
+            return False
+
+    frame_waker = FrameWaker(_StopEvent())
+    frame_waker.wait(0.25, devices=[object()])
+
+    assert not frame_waker.uses_epoll
+    assert calls == [0.25]
+
+
+def test_disable_flag_falls_back_to_event_wait(monkeypatch) -> None:
+    monkeypatch.setenv("KEYRGB_DISABLE_INPUT_WAKE", "1")
+
+    assert not FrameWaker(WakeEvent()).uses_epoll
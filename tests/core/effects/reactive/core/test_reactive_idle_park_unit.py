@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from keyrgb.core.effects.reactive._frame_wake import FrameWaker
+from keyrgb.core.effects.reactive._idle_park import IdleParkGate, park_when_idle
+from keyrgb.core.effects.reactive._render_brightness_support import ReactiveRenderState
+from keyrgb.core.runtime.metrics import IDLE_PARKS
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+
+
+def _idle_engine(**overrides: object) -> SimpleNamespace:
+    engine = SimpleNamespace(_reactive_state=ReactiveRenderState(), _last_rendered_brightness=20)
+    for name, value in overrides.items():
+        setattr(engine._reactive_state, name, value)
+    return engine
+
+
+@pytest.fixture
+def parking_waker():
+    stop_event = WakeEvent()
+    change_event = WakeEvent()
+    waker = FrameWaker(stop_event, change_event)
+    if not waker.can_park:
+        pytest.skip("epoll/eventfd unavailable")
+    yield stop_event, change_event, waker
+    waker.close()
+
+
+def test_gate_settles_after_consecutive_static_frames() -> None:
+    gate = IdleParkGate()
+    engine = _idle_engine()
+
+    assert [gate.settled(engine, animating=False) for _ in range(3)] == [False, False, True]
+
+
+def test_gate_resets_while_animating_or_ramping() -> None:
+    gate = IdleParkGate()
+    engine = _idle_engine()
+    gate.settled(engine, animating=False)
+    gate.settled(engine, animating=False)
+
+    assert not gate.settled(engine, animating=True)
+    assert not gate.settled(engine, animating=False)
+
+    engine._last_rendered_brightness = 28
+    assert not gate.settled(engine, animating=False)
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        {"_reactive_active_pulse_mix": 0.2},
+        {"_reactive_transition_started_at": 1.0},
+    ],
+)
+def test_gate_stays_open_while_render_state_is_in_flight(state: dict[str, object]) -> None:
+    gate = IdleParkGate()
+    engine = _idle_engine(**state)
+
+    assert not any(gate.settled(engine, animating=False) for _ in range(5))
+
+
+def test_disable_flag_keeps_the_frame_rate(monkeypatch) -> None:
+    monkeypatch.setenv("KEYRGB_DISABLE_REACTIVE_IDLE_PARK", "1")
+    gate = IdleParkGate()
+    engine = _idle_engine()
+
+    assert not any(gate.settled(engine, animating=False) for _ in range(5))
+
+
+def test_park_blocks_until_render_inputs_change(parking_waker) -> None:
+    _stop_event, change_event, waker = parking_waker
+    before = IDLE_PARKS.value
+    threading.Timer(0.05, change_event.set).start()
+    started = time.monotonic()
+
+    assert waker.park()
+    assert 0.04 <= time.monotonic() - started < 1.0
+    assert not change_event.is_set()
+    assert IDLE_PARKS.value == before + 1
+
+
+def test_park_when_idle_parks_only_once_settled(parking_waker) -> None:
+    stop_event, _change_event, waker = parking_waker
+    gate = IdleParkGate()
+    engine = _idle_engine()
+    stop_event.set()
+
+    results = [park_when_idle(engine, gate=gate, waker=waker, animating=False) for _ in range(3)]
+
+    assert results == [False, False, True]
+
+
+def test_waker_without_change_event_cannot_park() -> None:
+    waker = FrameWaker(WakeEvent())
+    try:
+        assert not waker.can_park
+        assert not waker.park()
+    finally:
+        waker.close()
+
+
+def test_engine_setters_set_render_wake_event() -> None:
+    from keyrgb.core.effects.engine import EffectsEngine
+
+    engine = EffectsEngine(backend=None)
+    engine.render_wake_event.clear()
+    engine.reactive_color = (0, 255, 0)
+    assert not engine.render_wake_event.is_set()
+
+    engine.set_brightness(12, apply_to_hardware=False)
+    assert engine.render_wake_event.is_set()
+
+    engine.render_wake_event.clear()
+    engine.mark_device_unavailable()
+    assert engine.render_wake_event.is_set()
@@ -90,8 +90,8 @@ def test_try_open_evdev_keyboards_skips_non_keyboard_key_devices(monkeypatch) ->
     )
     monkeypatch.setattr(
         reactive_input,
-        "_evdev_device_looks_like_keyboard",
-        lambda dev, _evdev: dev.path == "/dev/input/event4",
+        "looks_like_keyboard",
+        lambda dev: dev.path == "/dev/input/event4",
     )
 
     devices = reactive_input.try_open_evdev_keyboards()
@@ -121,7 +121,7 @@ def test_try_open_evdev_keyboards_closes_unknown_non_keyboards(monkeypatch) -> N
 
     monkeypatch.setitem(sys.modules, "evdev", fake_evdev)
     monkeypatch.setattr(reactive_input, "_udev_device_is_keyboard", lambda _path: None)
-    monkeypatch.setattr(reactive_input, "_evdev_device_looks_like_keyboard", lambda _dev, _evdev: False)
+    monkeypatch.setattr(reactive_input, "looks_like_keyboard", lambda _dev: False)
 
     devices = reactive_input.try_open_evdev_keyboards()
 
@@ -260,68 +260,15 @@ def test_device_debug_name_and_close_helpers() -> None:
     reactive_input._drop_evdev_device(devices, _FakeDevice())
 
 
-def test_read_udev_input_properties_parses_props(tmp_path, monkeypatch) -> None:
-    assert reactive_input._read_udev_input_properties(str(tmp_path / "missing")) == {}
-
-    data_file = tmp_path / "c13:64"
-    data_file.write_text("E:ID_INPUT_KEYBOARD=1\nE:ID_INPUT_MOUSE=0\nX:ignored\nbad\n", encoding="utf-8")
-
-    class _Stat:
-        st_rdev = 123
-
-    real_stat = reactive_input.os.stat
-
-    def fake_stat(path, *args, **kwargs):
-        if str(path).endswith("event0"):
-            return _Stat()
-        return real_stat(path, *args, **kwargs)
-
-    monkeypatch.setattr(reactive_input.os, "stat", fake_stat)
-    monkeypatch.setattr(reactive_input.os, "major", lambda _r: 13)
-    monkeypatch.setattr(reactive_input.os, "minor", lambda _r: 64)
-
-    real_path_cls = reactive_input.Path
-
-    def fake_path(value):
-        if str(value).startswith("/run/udev/data/"):
-            return data_file
-        return real_path_cls(value)
-
-    monkeypatch.setattr(reactive_input, "Path", fake_path)
-    props = reactive_input._read_udev_input_properties(str(tmp_path / "event0"))
-    assert props == {"ID_INPUT_KEYBOARD": "1", "ID_INPUT_MOUSE": "0"}
-    assert reactive_input._udev_device_is_keyboard(str(tmp_path / "event0")) is True
-
-    monkeypatch.setattr(reactive_input, "_read_udev_input_properties", lambda _p: {})
+def test_udev_device_is_keyboard_reads_the_udev_tag(monkeypatch) -> None:
+    monkeypatch.setattr(reactive_input, "read_udev_input_properties", lambda _p: {"ID_INPUT_KEYBOARD": "1"})
+    assert reactive_input._udev_device_is_keyboard("/dev/x") is True
+    monkeypatch.setattr(reactive_input, "read_udev_input_properties", lambda _p: {})
     assert reactive_input._udev_device_is_keyboard("/dev/x") is None
-    monkeypatch.setattr(reactive_input, "_read_udev_input_properties", lambda _p: {"ID_INPUT_KEYBOARD": "0"})
+    monkeypatch.setattr(reactive_input, "read_udev_input_properties", lambda _p: {"ID_INPUT_KEYBOARD": "0"})
     assert reactive_input._udev_device_is_keyboard("/dev/x") is False
 
 
-def test_evdev_device_looks_like_keyboard_thresholds(monkeypatch) -> None:
-    letter = set(range(10, 30))
-    control = set(range(100, 110))
-    monkeypatch.setattr(reactive_input, "keyboard_letter_keys", lambda _e: letter)
-    monkeypatch.setattr(reactive_input, "keyboard_control_keys", lambda _e: control)
-    evdev = SimpleNamespace(ecodes=SimpleNamespace(EV_KEY=1))
-
-    class _Dev:
-        def __init__(self, keys):
-            self._keys = keys
-
-        def capabilities(self, verbose: bool = False):
-            return {1: list(self._keys)}
-
-    assert reactive_input._evdev_device_looks_like_keyboard(_Dev(letter | control), evdev) is True
-    assert reactive_input._evdev_device_looks_like_keyboard(_Dev(set(range(3))), evdev) is False
-
-    class _Bad:
-        def capabilities(self, verbose: bool = False):
-            raise OSError("nope")
-
-    assert reactive_input._evdev_device_looks_like_keyboard(_Bad(), evdev) is False
-
-
 def test_try_open_evdev_disabled_by_env(monkeypatch) -> None:
     monkeypatch.setenv("KEYRGB_DISABLE_EVDEV", "yes")
     assert reactive_input.try_open_evdev_keyboards() is None
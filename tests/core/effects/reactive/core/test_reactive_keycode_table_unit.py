@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import keyrgb.core.effects.reactive._keycode_table as keycode_table
+import keyrgb.core.effects.reactive.input as reactive_input
+from keyrgb.core.effects.reactive._keycode_table import compile_keycode_cell_table, keycode_cell_table
+from keyrgb.core.effects.reactive.utils import _PressSource
+from keyrgb.core.resources.layouts import slot_id_for_key_id
+
+_KEY_NAMES = {
+    1: "KEY_ESC",
+    30: "KEY_A",
+    48: "KEY_B",
+    113: ["KEY_MIN_INTERESTING", "KEY_MUTE"],
+    148: "KEY_PROG1",
+    999: "KEY_OUT",
+}
+_A_SLOT = str(slot_id_for_key_id("auto", "a") or "a")
+_ESC_SLOT = str(slot_id_for_key_id("auto", "esc") or "esc")
+
+
+def test_compiled_table_maps_keycodes_straight_to_cells() -> None:
+    table = compile_keycode_cell_table({_A_SLOT: ((2, 3), (2, 4))}, key_names=_KEY_NAMES)
+
+    assert table.cells_for_code(30) == ((2, 3), (2, 4))
+    # A known slot the keymap does not place: pulse at a random cell. Aliased
+    # names resolve through whichever alias has a slot.
+    assert table.cells_for_code(1) == ()
+    assert table.cells_for_code(113) == ()
+    # No slot at all, or out of range: the press is ignored.
+    assert table.cells_for_code(148) is None
+    assert table.cells_for_code(999) is None
+    assert table.cells_for_codes([30, 148, 1, 30, 5000]) == [((2, 3), (2, 4)), (), ((2, 3), (2, 4))]
+
+
+def test_compiled_table_matches_slot_id_polling(monkeypatch) -> None:
+    events = [SimpleNamespace(type=1, value=1, code=code) for code in (30, 1, 148, 113, 48)]
+
+    class _Device:
+        path = "/dev/input/event3"
+
+        def read(self):
+            return list(events)
+
+    monkeypatch.setitem(sys.modules, "evdev", SimpleNamespace(ecodes=SimpleNamespace(EV_KEY=1, KEY=_KEY_NAMES)))
+    monkeypatch.setitem(sys.modules, "select", SimpleNamespace(select=lambda r, _w, _e, _t: (list(r), [], [])))
+    keymap = {_A_SLOT: ((2, 3),), _ESC_SLOT: ((0, 0),)}
+    table = compile_keycode_cell_table(keymap, key_names=_KEY_NAMES)
+
+    by_slot = [tuple(keymap.get(slot_id, ())) for slot_id in reactive_input.poll_keypress_slot_ids([_Device()])]
+    by_code = table.cells_for_codes(reactive_input.poll_keypress_codes([_Device()]))
+
+    assert by_code == by_slot
+
+
+def test_cached_table_rebuilds_only_when_the_keymap_changes(monkeypatch) -> None:
+    builds: list[str] = []
+    monkeypatch.setattr(keycode_table, "_cached_table", None)
+    monkeypatch.setattr(keycode_table, "evdev_key_names", lambda: builds.append("build") or _KEY_NAMES)
+
+    first = keycode_cell_table({_A_SLOT: [(2, 3)]})
+    again = keycode_cell_table({_A_SLOT: ((2, 3),)})
+    changed = keycode_cell_table({_A_SLOT: ((4, 5),)})
+
+    assert again is first
+    assert changed is not first
+    assert changed.cells_for_code(30) == ((4, 5),)
+    assert len(builds) == 2
+
+
+def test_press_source_maps_polled_keycodes(monkeypatch) -> None:
+    monkeypatch.setattr("keyrgb.core.effects.reactive.utils.poll_keypress_codes", lambda _devices: [30, 148])
+    table = compile_keycode_cell_table({_A_SLOT: ((2, 3),)}, key_names=_KEY_NAMES)
+    press = _PressSource(devices=[object()], synthetic=False, spawn_interval_s=0.05)
+
+    assert press.poll_keypress_cells(dt=0.02, cell_table=table) == [((2, 3),)]
+
+
+def test_press_source_synthetic_presses_are_unmapped() -> None:
+    table = compile_keycode_cell_table({}, key_names={})
+    press = _PressSource(
+        devices=[],
+        synthetic=True,
+        allow_synthetic=True,
+        spawn_interval_s=0.05,
+        reopen_interval_s=999.0,
+    )
+
+    assert press.poll_keypress_cells(dt=0.02, cell_table=table) == []
+    assert press.poll_keypress_cells(dt=0.04, cell_table=table) == [()]
+
+
+def test_poll_keypress_codes_decodes_raw_fds(monkeypatch) -> None:
+    import os
+
+    from keyrgb.core.utils.linux.evdev_reader import EV_KEY, INPUT_EVENT
+
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+
+    class _PipeDevice:
+        path = "/dev/input/event3"
+
+        def fileno(self) -> int:
+            return read_fd
+
+        def read(self):
+            raise AssertionError("raw fd devices must not go through python-evdev read()")
+
+    monkeypatch.setitem(sys.modules, "evdev", SimpleNamespace(ecodes=SimpleNamespace(EV_KEY=1, KEY=_KEY_NAMES)))
+    try:
+        os.write(write_fd, INPUT_EVENT.pack(0, 0, EV_KEY, 30, 1) + INPUT_EVENT.pack(0, 0, 0, 0, 0))
+        os.write(write_fd, INPUT_EVENT.pack(0, 0, EV_KEY, 30, 0) + INPUT_EVENT.pack(0, 0, EV_KEY, 48, 1))
+
+        assert reactive_input.poll_keypress_codes([_PipeDevice()]) == [30, 48]
+        assert reactive_input.poll_keypress_codes([_PipeDevice()]) == []
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
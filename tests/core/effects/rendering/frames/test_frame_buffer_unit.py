@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+
+from keyrgb.core.backends.base import PackedRgbFrame, packed_frame_rows
+from keyrgb.core.effects.frame_buffer import FrameBuffer
+from keyrgb.core.effects.matrix_layout import EffectGridGeometry
+
+
+def test_frame_buffer_is_one_flat_buffer_sized_from_geometry() -> None:
+    frame = FrameBuffer.for_geometry(EffectGridGeometry(rows=6, cols=21))
+
+    assert len(frame.data) == 6 * 21 * 3
+    assert len(frame) == 126
+    assert frame[(5, 20)] == (0, 0, 0)
+
+
+def test_frame_buffer_behaves_like_a_color_map() -> None:
+    frame = FrameBuffer(2, 3)
+    frame[(1, 2)] = (10, 20, 30)
+
+    assert frame[(1, 2)] == (10, 20, 30)
+    assert list(frame)[:2] == [(0, 0), (0, 1)]
+    assert (1, 2) in frame
+    assert (2, 0) not in frame
+    assert "1,2" not in frame
+    assert dict(frame)[(1, 2)] == (10, 20, 30)
+    assert frame == {**{(r, c): (0, 0, 0) for r in range(2) for c in range(3)}, (1, 2): (10, 20, 30)}
+
+    with pytest.raises(KeyError):
+        _ = frame[(2, 0)]
+
+
+def test_frame_buffer_clamps_channels_and_clear_keeps_cells() -> None:
+    frame = FrameBuffer(1, 2)
+    frame[(0, 0)] = (300, -5, 128)
+
+    assert frame[(0, 0)] == (255, 0, 128)
+
+    frame.clear()
+    assert len(frame) == 2
+    assert frame[(0, 0)] == (0, 0, 0)
+
+
+def test_frame_buffer_row_view_is_zero_copy() -> None:
+    frame = FrameBuffer(2, 2)
+    row = frame.row_view(1)
+    frame[(1, 1)] = (7, 8, 9)
+
+    assert bytes(row) == bytes((0, 0, 0, 7, 8, 9))
+    with pytest.raises(IndexError):
+        frame.row_view(2)
+
+
+def test_frame_buffer_fill_copy_and_average() -> None:
+    frame = FrameBuffer(2, 2)
+    frame.fill((10, 20, 30))
+    frame[(0, 0)] = (50, 60, 70)
+
+    other = FrameBuffer(2, 2)
+    other.update(frame)
+
+    assert other == frame
+    assert other.copy() == frame
+    assert frame.average_rgb() == (20, 30, 40)
+
+
+def test_frame_buffer_copy_from_mapping_blanks_uncovered_cells() -> None:
+    frame = FrameBuffer(1, 2)
+    frame.fill((9, 9, 9))
+
+    frame.copy_from({(0, 1): (1, 2, 3), (5, 5): (4, 4, 4)})
+
+    assert frame[(0, 0)] == (0, 0, 0)
+    assert frame[(0, 1)] == (1, 2, 3)
+
+
+def test_frame_buffer_scaled_into_matches_per_key_rounding() -> None:
+    source = FrameBuffer(1, 2)
+    source[(0, 0)] = (255, 101, 3)
+    source[(0, 1)] = (1, 50, 200)
+    dest = FrameBuffer(1, 2)
+
+    source.scaled_into(dest, 0.5)
+
+    for key, rgb in source.items():
+        assert dest[key] == tuple(round(channel * 0.5) for channel in rgb)
+
+
+def test_packed_frame_rows_requires_matching_shape() -> None:
+    frame = FrameBuffer(2, 3)
+
+    assert isinstance(frame, PackedRgbFrame)
+    assert packed_frame_rows(frame, rows=2, cols=3) is not None
+    assert packed_frame_rows(frame, rows=6, cols=21) is None
+    assert packed_frame_rows({(0, 0): (1, 2, 3)}, rows=2, cols=3) is None
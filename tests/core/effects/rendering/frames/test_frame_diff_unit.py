@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from threading import RLock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from keyrgb.core.backends.policies.write_granularity import (
+    WRITE_GRANULARITY_ENV,
+    per_key_write_granularity,
+)
+from keyrgb.core.effects import frame_diff
+from keyrgb.core.effects.frame_buffer import FrameBuffer
+from keyrgb.core.effects.frame_diff import PerKeyFrameDiff, engine_frame_diff, invalidate_engine_frame_diff
+from keyrgb.core.effects.software import base as sw_base
+
+
+def _frame(fill: tuple[int, int, int] = (10, 20, 30)) -> FrameBuffer:
+    frame = FrameBuffer(3, 4)
+    frame.fill(fill)
+    return frame
+
+
+def test_first_frame_and_changed_frames_are_written_in_full_for_frame_devices() -> None:
+    diff = PerKeyFrameDiff()
+    device = object()
+    frame = _frame()
+
+    assert diff.pending(frame, device=device, brightness=25, granularity="frame") is frame
+    diff.commit(frame, device=device, brightness=25)
+
+    assert diff.pending(frame, device=device, brightness=25, granularity="frame") is None
+    frame[(1, 1)] = (1, 1, 1)
+    assert diff.pending(frame, device=device, brightness=25, granularity="frame") is frame
+
+
+def test_key_granularity_hands_only_changed_cells() -> None:
+    diff = PerKeyFrameDiff()
+    device = object()
+    frame = _frame()
+    diff.commit(frame, device=device, brightness=25)
+
+    frame[(0, 3)] = (9, 9, 9)
+    frame[(2, 0)] = (8, 8, 8)
+
+    assert diff.pending(frame, device=device, brightness=25, granularity="key") == {
+        (0, 3): (9, 9, 9),
+        (2, 0): (8, 8, 8),
+    }
+
+
+def test_row_granularity_coalesces_changes_to_whole_rows() -> None:
+    diff = PerKeyFrameDiff()
+    device = object()
+    color_map = {(r, c): (0, 0, 0) for r in range(3) for c in range(2)}
+    diff.commit(color_map, device=device, brightness=25)
+
+    changed = {**color_map, (1, 0): (5, 5, 5)}
+
+    assert diff.pending(changed, device=device, brightness=25, granularity="row") == {
+        (1, 0): (5, 5, 5),
+        (1, 1): (0, 0, 0),
+    }
+
+
+@pytest.mark.parametrize("change", ["device", "brightness", "invalidate", "env"])
+def test_full_rewrite_after_device_brightness_or_invalidation(monkeypatch, change: str) -> None:
+    diff = PerKeyFrameDiff()
+    device = object()
+    frame = _frame()
+    diff.commit(frame, device=device, brightness=25)
+
+    if change == "device":
+        device = object()
+    if change == "brightness":
+        diff.commit(frame, device=device, brightness=30)
+    if change == "invalidate":
+        diff.invalidate()
+    if change == "env":
+        monkeypatch.setenv(frame_diff.DISABLE_FRAME_DIFF_ENV, "1")
+
+    assert diff.pending(frame, device=device, brightness=25, granularity="key") is frame
+
+
+def test_write_granularity_defaults_to_frame_and_honours_env(monkeypatch) -> None:
+    monkeypatch.delenv(WRITE_GRANULARITY_ENV, raising=False)
+
+    assert per_key_write_granularity(SimpleNamespace()) == "frame"
+    assert per_key_write_granularity(SimpleNamespace(keyrgb_per_key_write_granularity="KEY")) == "key"
+    assert per_key_write_granularity(SimpleNamespace(keyrgb_per_key_write_granularity="bogus")) == "frame"
+
+    monkeypatch.setenv(WRITE_GRANULARITY_ENV, "row")
+    assert per_key_write_granularity(SimpleNamespace(keyrgb_per_key_write_granularity="key")) == "row"
+    # A full-frame device is never handed partial maps, whatever the override asks for.
+    assert per_key_write_granularity(SimpleNamespace()) == "frame"
+    monkeypatch.setenv(WRITE_GRANULARITY_ENV, "frame")
+    assert per_key_write_granularity(SimpleNamespace(keyrgb_per_key_write_granularity="key")) == "frame"
+
+
+def _mk_engine() -> SimpleNamespace:
+    kb = SimpleNamespace(
+        backend_caps=SimpleNamespace(per_key=True),
+        keyrgb_per_key_write_granularity="key",
+        set_key_colors=MagicMock(),
+        set_brightness=MagicMock(),
+        set_color=MagicMock(),
+    )
+    return SimpleNamespace(
+        backend_caps=SimpleNamespace(per_key=True),
+        kb=kb,
+        kb_lock=RLock(),
+        brightness=25,
+        speed=4,
+        current_color=(255, 0, 0),
+        per_key_colors=None,
+        _last_hw_mode_brightness=25,
+    )
+
+
+def test_software_render_skips_unchanged_frames_and_sends_deltas() -> None:
+    engine = _mk_engine()
+    frame = _frame()
+
+    sw_base.render(engine, color_map=frame)
+    sw_base.render(engine, color_map=frame)
+    frame[(2, 2)] = (0, 255, 0)
+    sw_base.render(engine, color_map=frame)
+
+    calls = engine.kb.set_key_colors.call_args_list
+    assert len(calls) == 2
+    assert calls[0].args[0] is frame
+    assert calls[1].args[0] == {(2, 2): (0, 255, 0)}
+
+
+def test_software_render_rewrites_in_full_after_invalidation() -> None:
+    engine = _mk_engine()
+    frame = _frame()
+    sw_base.render(engine, color_map=frame)
+
+    invalidate_engine_frame_diff(engine)
+    sw_base.render(engine, color_map=frame)
+
+    assert engine.kb.set_key_colors.call_count == 2
+    assert engine_frame_diff(engine) is engine_frame_diff(engine)
+
+
+def test_software_render_failed_write_forces_full_retry() -> None:
+    engine = _mk_engine()
+    frame = _frame()
+    engine.kb.set_key_colors.side_effect = [RuntimeError("busy"), None]
+
+    sw_base.render(engine, color_map=frame)
+    sw_base.render(engine, color_map=frame)
+
+    assert engine.kb.set_key_colors.call_args_list[-1].args[0] is frame
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from keyrgb.core.effects import frame_output
+from keyrgb.core.effects.frame_buffer import FrameBuffer
+from keyrgb.core.effects.frame_output import (
+    AsyncFrameWriter,
+    engine_frame_output_stats,
+    publish_engine_frame,
+    start_engine_frame_writer,
+    stop_engine_frame_writer,
+)
+
+
+class _BlockingSink:
+    def __init__(self) -> None:
+        self.frames: list[dict[tuple[int, int], tuple[int, int, int]]] = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.written = threading.Condition()
+
+    def write(self, color_map) -> None:
+        self.entered.set()
+        assert self.release.wait(timeout=5.0)
+        with self.written:
+            self.frames.append(dict(color_map))
+            self.written.notify_all()
+
+    def wait_for(self, count: int) -> None:
+        with self.written:
+            assert self.written.wait_for(lambda: len(self.frames) >= count, timeout=5.0)
+
+
+def _frame(value: int) -> FrameBuffer:
+    frame = FrameBuffer(2, 3)
+    frame.fill((value, value, value))
+    return frame
+
+
+def test_writer_keeps_only_the_latest_frame_while_the_device_is_busy() -> None:
+    sink = _BlockingSink()
+    writer = AsyncFrameWriter()
+    writer.start()
+    try:
+        assert writer.publish(sink.write, _frame(1))
+        assert sink.entered.wait(timeout=5.0)
+
+        reused = _frame(2)
+        assert writer.publish(sink.write, reused)
+        reused.fill((3, 3, 3))
+        assert writer.publish(sink.write, reused)
+        reused.fill((9, 9, 9))
+
+        sink.release.set()
+        sink.wait_for(2)
+    finally:
+        assert writer.stop()
+
+    assert [frame[(0, 0)] for frame in sink.frames] == [(1, 1, 1), (3, 3, 3)]
+    assert writer.stats() == frame_output.FrameOutputStats(written=2, dropped=1)
+
+
+def test_write_errors_are_raised_on_the_next_publish() -> None:
+    failed = threading.Event()
+
+    def _fail(_color_map) -> None:
+        failed.set()
+        raise OSError("busy")
+
+    writer = AsyncFrameWriter()
+    writer.start()
+    try:
+        assert writer.publish(_fail, {(0, 0): (1, 2, 3)})
+        assert failed.wait(timeout=5.0)
+        with pytest.raises(OSError, match="busy"):
+            for _ in range(500):
+                writer.publish(lambda _m: None, {(0, 0): (1, 2, 3)})
+                threading.Event().wait(0.01)
+    finally:
+        writer.stop()
+
+
+def test_stopped_writer_discards_pending_frame_and_declines_new_ones() -> None:
+    sink = _BlockingSink()
+    writer = AsyncFrameWriter()
+    writer.start()
+    assert writer.publish(sink.write, _frame(1))
+    assert sink.entered.wait(timeout=5.0)
+    assert writer.publish(sink.write, _frame(2))
+
+    stopper = threading.Thread(target=writer.stop)
+    stopper.start()
+    sink.release.set()
+    stopper.join(timeout=5.0)
+
+    assert not writer.running
+    assert not writer.publish(sink.write, _frame(3))
+    assert [frame[(0, 0)] for frame in sink.frames] == [(1, 1, 1)]
+    assert writer.stats().dropped == 1
+
+
+def test_engine_helpers_fall_back_to_inline_writes(monkeypatch) -> None:
+    engine = SimpleNamespace()
+    assert not publish_engine_frame(engine, lambda _m: None, {})
+    assert engine_frame_output_stats(engine) is None
+
+    monkeypatch.setenv(frame_output.SYNC_FRAME_WRITES_ENV, "1")
+    assert start_engine_frame_writer(engine) is None
+
+    monkeypatch.delenv(frame_output.SYNC_FRAME_WRITES_ENV)
+    writer = start_engine_frame_writer(engine)
+    try:
+        assert writer is not None
+        assert start_engine_frame_writer(engine) is writer
+        assert engine_frame_output_stats(engine) == frame_output.FrameOutputStats()
+    finally:
+        assert stop_engine_frame_writer(engine)
+    assert not publish_engine_frame(engine, lambda _m: None, {})
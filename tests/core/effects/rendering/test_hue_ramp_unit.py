@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+from keyrgb.core.effects.colors import (
+    HUE_LUT_SIZE,
+    hsv_to_rgb,
+    hue_index,
+    hue_ramp,
+    hue_rgb,
+    scaled_hue_ramp,
+    unpack_rgb,
+)
+
+
+def _close(a: tuple[int, int, int], b: tuple[int, int, int]) -> bool:
+    return all(abs(x - y) <= 1 for x, y in zip(a, b))
+
+
+def test_hue_ramp_entries_are_exact_hsv_conversions() -> None:
+    ramp = hue_ramp()
+
+    assert len(ramp) == HUE_LUT_SIZE
+    assert ramp is hue_ramp()
+    for index in (0, 1, 255, 256, 700, 1024, HUE_LUT_SIZE - 1):
+        assert unpack_rgb(ramp[index]) == hsv_to_rgb(index / HUE_LUT_SIZE, 1.0, 1.0)
+
+
+@pytest.mark.parametrize("hue", [0.0, 0.013, 0.25, 0.5, 0.6667, 0.999, 1.0, 1.37, -0.2])
+def test_hue_rgb_tracks_hsv_to_rgb_within_one_step(hue: float) -> None:
+    assert _close(hue_rgb(hue), hsv_to_rgb(hue % 1.0, 1.0, 1.0))
+    assert _close(hue_rgb(hue, saturation=0.4), hsv_to_rgb(hue % 1.0, 0.4, 1.0))
+    assert 0 <= hue_index(hue) < HUE_LUT_SIZE
+
+
+def test_scaled_hue_ramp_matches_scaling_the_full_ramp() -> None:
+    full = hue_ramp()
+    half = scaled_hue_ramp(128)
+
+    for index in range(0, HUE_LUT_SIZE, 97):
+        expected = tuple(min(255, round(channel * 128 / 255)) for channel in unpack_rgb(full[index]))
+        assert unpack_rgb(half[index]) == expected
+    assert scaled_hue_ramp(0) == (0,) * HUE_LUT_SIZE
+    assert _close(hue_rgb(0.3, level=128), hsv_to_rgb(0.3, 1.0, 128 / 255))
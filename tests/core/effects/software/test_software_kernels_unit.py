@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from keyrgb.core.effects.colors import hue_rgb
+from keyrgb.core.effects.frame_buffer import FrameBuffer
+from keyrgb.core.effects.software import kernels
+from keyrgb.core.effects.software.base import mix
+
+
+def _hue_offsets(rows: int, cols: int) -> list[float]:
+    return [(c / max(1, cols - 1)) + 0.18 * (r / max(1, rows - 1)) for r in range(rows) for c in range(cols)]
+
+
+def test_numpy_or_none_honours_disable_env(monkeypatch) -> None:
+    monkeypatch.setenv(kernels.DISABLE_NUMPY_KERNELS_ENV, "1")
+
+    assert kernels.numpy_or_none() is None
+    assert isinstance(kernels.hue_field_kernel([0.0], frame=FrameBuffer(1, 1)), kernels.PyHueFieldKernel)
+    assert isinstance(kernels.fire_kernel({}, frame=FrameBuffer(1, 1), pace=1.0), kernels.PyFireKernel)
+
+
+def test_python_hue_field_kernel_matches_hue_ramp() -> None:
+    frame = FrameBuffer(2, 3)
+    offsets = _hue_offsets(2, 3)
+    kernel = kernels.PyHueFieldKernel(offsets, frame=frame)
+
+    out = kernel.compute_frame(0.37)
+
+    assert out is frame
+    for index, key in enumerate(frame):
+        assert frame[key] == hue_rgb(0.37 + offsets[index])
+
+
+def test_python_blend_kernel_matches_mix() -> None:
+    prev = FrameBuffer(1, 2)
+    target = FrameBuffer(1, 2)
+    prev.update({(0, 0): (0, 10, 255), (0, 1): (3, 4, 5)})
+    target.update({(0, 0): (255, 11, 0), (0, 1): (200, 4, 6)})
+    kernel = kernels.PyBlendKernel(prev, target, frame=FrameBuffer(1, 2))
+
+    out = kernel.compute_frame(0.5)
+
+    for key in out:
+        assert out[key] == mix(prev[key], target[key], 0.5)
+
+
+def test_scale_kernel_scales_base() -> None:
+    base = FrameBuffer(1, 1)
+    base[(0, 0)] = (200, 100, 51)
+
+    out = kernels.scale_kernel(base, frame=FrameBuffer(1, 1)).compute_frame(0.5)
+
+    assert out[(0, 0)] == (100, 50, 26)
+
+
+@pytest.mark.parametrize("shape", [(6, 21), (7, 20), (1, 1)])
+def test_numpy_hue_field_kernel_is_byte_identical_to_python(shape) -> None:
+    np = pytest.importorskip("numpy")
+    from keyrgb.core.effects.software.kernels._numpy import NumpyHueFieldKernel
+
+    rows, cols = shape
+    offsets = _hue_offsets(rows, cols)
+    py_kernel = kernels.PyHueFieldKernel(offsets, frame=FrameBuffer(rows, cols))
+    np_kernel = NumpyHueFieldKernel(np, offsets, frame=FrameBuffer(rows, cols))
+
+    for step in range(64):
+        hue = (step * 0.0371) % 1.0
+        assert np_kernel.compute_frame(hue).data == py_kernel.compute_frame(hue).data
+
+
+def test_numpy_blend_kernel_is_byte_identical_to_python() -> None:
+    np = pytest.importorskip("numpy")
+    from keyrgb.core.effects.software.kernels._numpy import NumpyBlendKernel
+
+    rng = random.Random(7)
+    prev = FrameBuffer(6, 20)
+    target = FrameBuffer(6, 20)
+    prev.data[:] = bytes(rng.randrange(256) for _ in range(len(prev.data)))
+    target.data[:] = bytes(rng.randrange(256) for _ in range(len(target.data)))
+    py_kernel = kernels.PyBlendKernel(prev, target, frame=FrameBuffer(6, 20))
+    np_kernel = NumpyBlendKernel(np, prev, target, frame=FrameBuffer(6, 20))
+
+    for t in (0.0, 0.25, 0.5, 0.731, 1.0, 1.5):
+        assert np_kernel.compute_frame(t).data == py_kernel.compute_frame(t).data
+
+
+def test_numpy_fire_kernel_is_byte_identical_to_python() -> None:
+    np = pytest.importorskip("numpy")
+    from keyrgb.core.effects.software.kernels._numpy import NumpyFireKernel
+
+    base = {(r, c): (r * 30, c * 10, 90) for r in range(7) for c in range(20)}
+    py_kernel = kernels.PyFireKernel(base, frame=FrameBuffer(7, 20), pace=2.0)
+    np_kernel = NumpyFireKernel(np, base, frame=FrameBuffer(7, 20), pace=2.0)
+
+    for step in range(40):
+        step_ratio = 1.0 + (step % 3) * 0.1
+        random.seed(step)
+        expected = bytes(py_kernel.compute_frame(step_ratio).data)
+        random.seed(step)
+        assert bytes(np_kernel.compute_frame(step_ratio).data) == expected
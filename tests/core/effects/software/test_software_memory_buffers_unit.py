@@ -192,3 +192,24 @@ def test_run_random_reuses_transition_buffers() -> None:
     assert len(set(prev_ids)) == 1
     assert len(target_ids) == 2
     assert len(set(target_ids)) == 1
+
+
+def test_get_engine_frame_buffer_reallocates_only_on_geometry_change() -> None:
+    from types import SimpleNamespace
+
+    from keyrgb.core.effects.frame_buffer import FrameBuffer
+    from keyrgb.core.effects.matrix_layout import EffectGridGeometry
+    from keyrgb.core.effects.software._buffers import get_engine_frame_buffer
+
+    engine = SimpleNamespace(effect_geometry=EffectGridGeometry(rows=6, cols=20, source="backend"))
+
+    first = get_engine_frame_buffer(engine, "_sw_frame_map")
+    second = get_engine_frame_buffer(engine, "_sw_frame_map")
+    assert isinstance(first, FrameBuffer)
+    assert second is first
+    assert len(first.data) == 6 * 20 * 3
+
+    engine.effect_geometry = EffectGridGeometry(rows=7, cols=20, source="backend")
+    resized = get_engine_frame_buffer(engine, "_sw_frame_map")
+    assert resized is not first
+    assert (resized.rows, resized.cols) == (7, 20)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from keyrgb.core.effects import _output_snapshot, instant_on
+from keyrgb.core.effects._output_snapshot import OutputKind, OutputSnapshot
+from keyrgb.core.effects.device import NullKeyboard
+from keyrgb.core.effects.engine import EffectsEngine
+from keyrgb.core.effects.instant_on import OutputRecorder
+
+_FP = bytes(range(32))
+
+
+@pytest.fixture(autouse=True)
+def _no_recorder(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(instant_on.DISABLE_INSTANT_ON_ENV, raising=False)
+    monkeypatch.setattr(instant_on, "_recorder", None)
+    monkeypatch.setattr(instant_on, "_WRITE_DELAY_S", 0.0)
+
+
+class _SpyKeyboard(NullKeyboard):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, object, object]] = []
+
+    def set_color(self, color, *, brightness: int):
+        self.calls.append(("color", tuple(color), brightness))
+
+    def set_key_colors(self, color_map, *, brightness: int, enable_user_mode: bool = True):
+        self.calls.append(("keys", dict(color_map), brightness))
+
+    def set_effect(self, effect_data) -> None:
+        self.calls.append(("effect", effect_data, None))
+
+    def set_brightness(self, brightness: int) -> None:
+        self.calls.append(("brightness", brightness, None))
+
+
+def test_snapshot_round_trips_and_rejects_damaged_files() -> None:
+    per_key = OutputSnapshot("ite8291r3_perkey", _FP, OutputKind.PER_KEY, 30, bytes([0, 1, 255, 0, 0, 5, 20, 0, 0, 9]))
+    encoded = per_key.encode()
+
+    decoded = OutputSnapshot.decode(encoded)
+
+    assert decoded == per_key
+    assert decoded.per_key_colors() == {(0, 1): (255, 0, 0), (5, 20): (0, 0, 9)}
+    assert OutputSnapshot.decode(encoded[:-1]) is None
+    assert OutputSnapshot.decode(b"XXXX" + encoded[4:]) is None
+
+
+def test_recorder_coalesces_writes_and_keeps_the_committed_brightness(tmp_path: Path) -> None:
+    path = tmp_path / instant_on.INSTANT_ON_STATE_FILENAME
+    recorder = instant_on.start_output_recording("sysfs-leds", fingerprint=_FP, path=path)
+    assert recorder is not None
+
+    instant_on.record_uniform_output((1, 2, 3), brightness=1)
+    instant_on.record_output_brightness(40)
+    instant_on.record_output_brightness(0)
+    instant_on.stop_output_recording()
+
+    snapshot = instant_on.load_output_snapshot(path=path)
+    assert snapshot == OutputSnapshot("sysfs-leds", _FP, OutputKind.UNIFORM, 40, bytes([1, 2, 3]))
+
+
+def test_unrepresentable_output_removes_the_old_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "last.bin"
+    path.write_bytes(OutputSnapshot("b", _FP, OutputKind.UNIFORM, 10, b"\x01\x02\x03").encode())
+    recorder = OutputRecorder(backend="b", fingerprint=_FP, path=path)
+
+    recorder.close()
+    assert path.exists()
+
+    recorder.record(OutputKind.HARDWARE_EFFECT, _output_snapshot.effect_bytes({"name": "wave"}), 10)
+    recorder.close()
+    assert not path.exists()
+
+
+def test_replay_writes_only_a_matching_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "last.bin"
+    backend = "ite8291r3_perkey"
+    path.write_bytes(OutputSnapshot(backend, _FP, OutputKind.HARDWARE_EFFECT, 20, bytes([3, 5, 20, 1])).encode())
+    kb = _SpyKeyboard()
+    lock = threading.RLock()
+
+    assert instant_on.replay_output_snapshot(kb, lock, backend_name="sysfs-leds", fingerprint=_FP, path=path) is None
+    assert instant_on.replay_output_snapshot(kb, lock, backend_name=backend, fingerprint=b"\0" * 32, path=path) is None
+    assert kb.calls == []
+
+    assert instant_on.replay_output_snapshot(kb, lock, backend_name=backend, fingerprint=_FP, path=path)
+    assert kb.calls == [("effect", [3, 5, 20, 1], None), ("brightness", 20, None)]
+
+    monkeypatch.setenv(instant_on.DISABLE_INSTANT_ON_ENV, "1")
+    assert instant_on.replay_output_snapshot(kb, lock, backend_name=backend, fingerprint=_FP, path=path) is None
+
+
+def test_engine_records_integer_hardware_effect_payloads(tmp_path: Path) -> None:
+    class _Backend:
+        name = "ite8291r3_perkey"
+
+        def capabilities(self):
+            from keyrgb.core.backends.base import BackendCapabilities
+
+            return BackendCapabilities(brightness=True, per_key=False, color=True, hardware_effects=True, palette=False)
+
+        def effects(self):
+            return {"wave": lambda **kwargs: [3, kwargs.get("speed", 0), kwargs.get("brightness", 0)]}
+
+        def colors(self):
+            return {}
+
+    recorder = instant_on.start_output_recording("ite8291r3_perkey", fingerprint=_FP, path=tmp_path / "last.bin")
+    engine = EffectsEngine(backend=_Backend())
+    engine.kb = _SpyKeyboard()
+    engine._ensure_device_available = lambda: True  # type: ignore[assignment]
+
+    engine.start_effect("wave", speed=4, brightness=22)
+
+    assert recorder is not None and recorder.snapshot is not None
+    assert recorder.snapshot.kind is OutputKind.HARDWARE_EFFECT
+    assert recorder.snapshot.payload == bytes([3, 4, 22])
+    instant_on.stop_output_recording()
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import socket
+
+import pytest
+
+from keyrgb.core.utils.dbus import connection
+from keyrgb.core.utils.dbus.connection import BusConnection
+from keyrgb.core.utils.dbus.marshalling import ERROR, SIGNAL, DBusError, encode_message
+
+
+def test_error_replies_raise_and_earlier_signals_are_kept() -> None:
+    ours, theirs = socket.socketpair()
+    connection = BusConnection(ours)
+    try:
+        theirs.sendall(encode_message(SIGNAL, 5, interface="a.b", member="Early"))
+        theirs.sendall(encode_message(ERROR, 6, reply_serial=1, error_name="org.freedesktop.DBus.Error.AccessDenied"))
+        with pytest.raises(DBusError, match="AccessDenied"):
+            connection.add_match("type='signal'")
+
+        theirs.shutdown(socket.SHUT_WR)
+        assert [message.member for message in connection.messages()] == ["Early"]
+    finally:
+        connection.close()
+        theirs.close()
+
+
+def test_unix_bus_addresses_are_parsed() -> None:
+    assert connection._unix_socket_target("unix:path=/run/dbus/system_bus_socket") == "/run/dbus/system_bus_socket"
+    assert connection._unix_socket_target("unix:abstract=/tmp/dbus-x,guid=0") == "\0/tmp/dbus-x"
+    assert connection._unix_socket_target("tcp:host=localhost,port=1") is None
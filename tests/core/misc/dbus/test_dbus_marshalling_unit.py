@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+from keyrgb.core.utils.dbus.marshalling import SIGNAL, DBusError, decode_message, encode_message, message_length
+
+
+def test_messages_round_trip_through_the_wire_format() -> None:
+    data = encode_message(
+        SIGNAL,
+        7,
+        path="/org/freedesktop/login1",
+        interface="org.freedesktop.login1.Manager",
+        member="PrepareForSleep",
+        sender=":1.3",
+        signature="bsu",
+        values=(True, "hé", 42),
+    )
+
+    assert len(data) == message_length(data[:16])
+    message = decode_message(data)
+    assert (message.message_type, message.serial, message.member, message.sender) == (
+        SIGNAL,
+        7,
+        "PrepareForSleep",
+        ":1.3",
+    )
+    assert message.unpack_body() == (True, "hé", 42)
+
+
+def test_big_endian_messages_decode() -> None:
+    # PrepareForSleep(false) as a big-endian sender would marshal it.
+    fields = (
+        b"\x03\x01s\x00\x00\x00\x00\x0fPrepareForSleep\x00"
+        + b"\x02\x01s\x00\x00\x00\x00\x1eorg.freedesktop.login1.Manager\x00"
+        + b"\x00"
+        + b"\x08\x01g\x00\x01b\x00"
+    )
+    header = b"B\x04\x00\x01" + (4).to_bytes(4, "big") + (9).to_bytes(4, "big") + len(fields).to_bytes(4, "big")
+    data = header + fields + b"\x00" * (-len(fields) % 8) + (0).to_bytes(4, "big")
+
+    message = decode_message(data)
+
+    assert message.interface == "org.freedesktop.login1.Manager"
+    assert message.unpack_body() == (False,)
+
+
+def test_garbage_streams_are_rejected() -> None:
+    with pytest.raises(DBusError):
+        message_length(b"x" * 16)
+    with pytest.raises(DBusError):
+        decode_message(encode_message(SIGNAL, 1, member="Ping")[:-4])
+
+
+def test_integer_codes_reject_non_integers() -> None:
+    with pytest.raises(TypeError, match="needs an int"):
+        encode_message(SIGNAL, 1, member="Ping", signature="u", values=("7",))
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from keyrgb.core.utils.linux import evdev_reader
+from keyrgb.core.utils.linux.evdev_reader import (
+    EV_KEY,
+    INPUT_EVENT,
+    KeydownReader,
+    device_fd,
+    looks_like_keyboard,
+    raw_evdev_enabled,
+    read_udev_input_properties,
+)
+
+_EV_SYN = 0x00
+_EV_MSC = 0x04
+
+
+def _record(ev_type: int, code: int, value: int) -> bytes:
+    return INPUT_EVENT.pack(1, 2, ev_type, code, value)
+
+
+@pytest.fixture
+def pipe_fds():
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def test_reader_keeps_only_key_presses(pipe_fds) -> None:
+    read_fd, write_fd = pipe_fds
+    os.write(
+        write_fd,
+        b"".join(
+            [
+                _record(_EV_MSC, 4, 30),
+                _record(EV_KEY, 30, 1),
+                _record(_EV_SYN, 0, 0),
+                _record(EV_KEY, 30, 0),
+                _record(EV_KEY, 48, 2),
+                _record(EV_KEY, 48, 1),
+            ]
+        ),
+    )
+    codes: list[int] = []
+
+    KeydownReader().read_keydown_codes(read_fd, codes)
+
+    assert codes == [30, 48]
+
+
+def test_reader_drains_more_than_one_buffer(pipe_fds) -> None:
+    read_fd, write_fd = pipe_fds
+    os.write(write_fd, b"".join(_record(EV_KEY, code, 1) for code in range(1, 11)))
+    codes: list[int] = []
+
+    KeydownReader(capacity_events=4).read_keydown_codes(read_fd, codes)
+
+    assert codes == list(range(1, 11))
+    with pytest.raises(BlockingIOError):
+        os.read(read_fd, 1)
+
+
+def test_reader_with_nothing_pending_adds_nothing(pipe_fds) -> None:
+    read_fd, _write_fd = pipe_fds
+    codes: list[int] = []
+
+    KeydownReader().read_keydown_codes(read_fd, codes)
+
+    assert codes == []
+
+
+def test_device_fd_requires_a_valid_fileno() -> None:
+    class _Device:
+        def __init__(self, fd: object) -> None:
+            self._fd = fd
+
+        def fileno(self) -> object:
+            return self._fd
+
+    assert device_fd(_Device(7)) == 7
+    assert device_fd(_Device(-1)) is None
+    assert device_fd(_Device("7")) is None
+    assert device_fd(object()) is None
+
+
+def test_disable_flag_turns_raw_reads_off(monkeypatch) -> None:
+    monkeypatch.setenv("KEYRGB_DISABLE_RAW_EVDEV", "1")
+
+    assert not raw_evdev_enabled()
+
+
+class _CapsDevice:
+    def __init__(self, key_codes: set[int]) -> None:
+        self._key_codes = key_codes
+
+    def capabilities(self, verbose: bool = False) -> dict[object, list[object]]:
+        return {EV_KEY: list(self._key_codes)}
+
+
+def test_looks_like_keyboard_needs_letters_and_typing_keys() -> None:
+    letters = {30, 48, 46, 32, 18, 33, 34, 35}  # KEY_A..KEY_H
+    typing = {57, 28, 15}  # KEY_SPACE, KEY_ENTER, KEY_TAB
+
+    assert looks_like_keyboard(_CapsDevice(letters | typing))
+    assert not looks_like_keyboard(_CapsDevice(letters))
+    assert not looks_like_keyboard(_CapsDevice(typing | {30, 48}))
+
+
+def test_looks_like_keyboard_rejects_unreadable_capabilities() -> None:
+    class _Broken:
+        def capabilities(self, verbose: bool = False) -> dict[object, list[object]]:
+            raise OSError("gone")
+
+    assert not looks_like_keyboard(_Broken())
+
+
+def test_read_udev_input_properties_parses_e_lines(tmp_path, monkeypatch) -> None:
+    assert read_udev_input_properties(str(tmp_path / "missing")) == {}
+
+    data_file = tmp_path / "c13:64"
+    data_file.write_text("E:ID_INPUT_KEYBOARD=1\nE:ID_INPUT_MOUSE=0\nX:ignored\nbad\n", encoding="utf-8")
+    (tmp_path / "event0").touch()
+    monkeypatch.setattr(evdev_reader.os, "major", lambda _rdev: 13)
+    monkeypatch.setattr(evdev_reader.os, "minor", lambda _rdev: 64)
+    monkeypatch.setattr(evdev_reader, "Path", lambda value: data_file if value.startswith("/run/udev/") else value)
+
+    assert read_udev_input_properties(str(tmp_path / "event0")) == {"ID_INPUT_KEYBOARD": "1", "ID_INPUT_MOUSE": "0"}
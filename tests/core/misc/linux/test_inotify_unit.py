@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from keyrgb.core.utils.linux import inotify
+from keyrgb.core.utils.linux.inotify import DirectoryWatch
+
+
+@pytest.fixture
+def watch(tmp_path):
+    watcher = DirectoryWatch.open(tmp_path, ("config.json",))
+    if watcher is None:
+        pytest.skip("inotify unavailable")
+    yield watcher
+    watcher.close()
+
+
+def test_atomic_replace_of_watched_name_is_reported(tmp_path, watch: DirectoryWatch) -> None:
+    tmp = tmp_path / "config.json.tmp"
+    tmp.write_text("{}", encoding="utf-8")
+    os.replace(tmp, tmp_path / "config.json")
+
+    assert watch.wait(1.0) is True
+    assert watch.wait(0.0) is False
+
+
+def test_in_place_write_is_reported_and_other_names_are_ignored(tmp_path, watch: DirectoryWatch) -> None:
+    (tmp_path / "other.json").write_text("{}", encoding="utf-8")
+    assert watch.wait(0.05) is False
+
+    (tmp_path / "config.json").write_text("{}", encoding="utf-8")
+    assert watch.wait(1.0) is True
+
+
+def test_removing_the_directory_marks_the_watch_lost(tmp_path) -> None:
+    directory = tmp_path / "cfg"
+    directory.mkdir()
+    watcher = DirectoryWatch.open(directory, ("config.json",))
+    if watcher is None:
+        pytest.skip("inotify unavailable")
+    try:
+        directory.rmdir()
+        assert watcher.wait(1.0) is True
+        assert watcher.lost is True
+    finally:
+        watcher.close()
+
+
+def test_open_returns_none_without_inotify(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(inotify, "_libc", lambda: None)
+
+    assert DirectoryWatch.open(tmp_path, ("config.json",)) is None
+
+
+def test_open_returns_none_for_missing_directory(tmp_path) -> None:
+    assert DirectoryWatch.open(tmp_path / "missing", ("config.json",)) is None
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import errno
+
+import pytest
+
+from keyrgb.core.utils.linux.uevent import parse_uevent, read_uevents
+
+
+def _datagram(header: str, **env: str) -> bytes:
+    return b"\0".join([header.encode(), *(f"{key}={value}".encode() for key, value in env.items())]) + b"\0"
+
+
+def test_kernel_uevents_parse_into_action_devpath_and_env() -> None:
+    event = parse_uevent(
+        _datagram(
+            "change@/devices/LNXSYSTM:00/ACPI0003:00/power_supply/AC",
+            ACTION="change",
+            DEVPATH="/devices/LNXSYSTM:00/ACPI0003:00/power_supply/AC",
+            SUBSYSTEM="power_supply",
+            POWER_SUPPLY_ONLINE="1",
+        )
+    )
+
+    assert event is not None
+    assert (event.action, event.subsystem) == ("change", "power_supply")
+    assert event.devpath.endswith("/power_supply/AC")
+    assert event.env["POWER_SUPPLY_ONLINE"] == "1"
+
+
+def test_udev_rebroadcasts_and_garbage_are_ignored() -> None:
+    assert parse_uevent(b"libudev\0\xfe\xed\xca\xfe") is None
+    assert parse_uevent(b"no header\0KEY=value\0") is None
+
+
+class _FakeNetlinkSocket:
+    def __init__(self, datagrams: list[tuple[object, object]]) -> None:
+        self._datagrams = list(datagrams)
+
+    def recvfrom(self, _size: int):
+        if not self._datagrams:
+            raise BlockingIOError
+        item = self._datagrams.pop(0)
+        if isinstance(item, OSError):
+            raise item
+        return item
+
+
+def test_reader_drains_kernel_messages_and_flags_overflow() -> None:
+    kernel = _datagram("add@/devices/x", SUBSYSTEM="usb")
+    sock = _FakeNetlinkSocket(
+        [
+            (kernel, (0, 1)),
+            # Sent by another process rather than the kernel: ignored.
+            (_datagram("add@/devices/spoofed", SUBSYSTEM="usb"), (4242, 1)),
+            OSError(errno.ENOBUFS, "No buffer space available"),
+            (kernel, (0, 1)),
+        ]
+    )
+    events: list = []
+
+    assert read_uevents(sock, events) is False  # type: ignore[arg-type]
+    assert [event.devpath for event in events] == ["/devices/x", "/devices/x"]
+
+
+def test_reader_propagates_other_socket_errors() -> None:
+    sock = _FakeNetlinkSocket([OSError(errno.EBADF, "Bad file descriptor")])
+
+    with pytest.raises(OSError):
+        read_uevents(sock, [])  # type: ignore[arg-type]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import select
+
+import pytest
+
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+
+
+def _readable(fd: int) -> bool:
+    readable, _, _ = select.select([fd], [], [], 0)
+    return bool(readable)
+
+
+def test_wake_fd_mirrors_set_and_clear() -> None:
+    event = WakeEvent()
+    fd = event.wake_fd()
+    if fd is None:
+        pytest.skip("eventfd unavailable")
+
+    assert not _readable(fd)
+    event.set()
+    assert event.is_set()
+    assert _readable(fd)
+    event.clear()
+    assert not event.is_set()
+    assert not _readable(fd)
+
+
+def test_wake_fd_created_after_set_starts_readable() -> None:
+    event = WakeEvent()
+    event.set()
+    fd = event.wake_fd()
+    if fd is None:
+        pytest.skip("eventfd unavailable")
+
+    assert _readable(fd)
+    assert event.wake_fd() == fd
+
+
+def test_event_without_requested_fd_behaves_like_threading_event() -> None:
+    event = WakeEvent()
+
+    assert event.wait(0.0) is False
+    event.set()
+    assert event.wait(0.0) is True
+    event.clear()
+    assert event._fd is None
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from keyrgb.core.utils import control_wire
+from keyrgb.core.utils.control_wire import ControlProtocolError, MessageType
+
+
+def test_messages_are_taken_only_once_complete() -> None:
+    data = control_wire.encode_message(MessageType.SET_COLOR, control_wire.color_payload((255, 0, 9)))
+    data += control_wire.encode_message(MessageType.QUERY)
+    buffer = bytearray(data[:-2])
+
+    first = control_wire.take_messages(buffer)
+    buffer += data[-2:]
+    second = control_wire.take_messages(buffer)
+
+    assert first == [(MessageType.SET_COLOR, b"\xff\x00\x09")]
+    assert second == [(MessageType.QUERY, b"")]
+    assert buffer == bytearray()
+    assert control_wire.decode_color(first[0][1]) == (255, 0, 9)
+
+
+def test_key_records_and_frames_decode_to_per_key_colors() -> None:
+    records = control_wire.key_records_payload({(0, 1): (1, 2, 3), (5, 20): (4, 5, 6)})
+
+    assert control_wire.decode_key_records(records) == {(0, 1): (1, 2, 3), (5, 20): (4, 5, 6)}
+    frame = control_wire.decode_frame(bytes(range(18)), rows=2, cols=3)
+    assert frame[(0, 0)] == (0, 1, 2)
+    assert frame[(1, 2)] == (15, 16, 17)
+
+
+def test_malformed_messages_are_rejected() -> None:
+    with pytest.raises(ControlProtocolError):
+        control_wire.take_messages(bytearray(b"\x00\x00\x00\x00\x09"))
+    with pytest.raises(ControlProtocolError):
+        control_wire.take_messages(bytearray((control_wire.MAX_PAYLOAD_BYTES + 1).to_bytes(4, "little") + b"\x01"))
+    with pytest.raises(ControlProtocolError):
+        control_wire.decode_frame(b"\x00" * 17, rows=2, cols=3)
+    with pytest.raises(ControlProtocolError):
+        control_wire.color_payload((256, 0, 0))
+    with pytest.raises(ControlProtocolError):
+        control_wire.decode_state(b"[1, 2]")
+
+
+@pytest.mark.parametrize(
+    "state", [b"{}", b'{"rows": "6", "cols": 21}', b'{"rows": true, "cols": 21}', b'{"rows": 0, "cols": 21}']
+)
+def test_states_without_a_usable_keyboard_size_are_rejected(state: bytes) -> None:
+    assert control_wire.state_geometry(control_wire.decode_state(b'{"rows": 6, "cols": 21}')) == (6, 21)
+    with pytest.raises(ControlProtocolError, match="keyboard size"):
+        control_wire.state_geometry(control_wire.decode_state(state))
@@ -432,6 +432,36 @@ class TestPowerManagerEventHandlerRoutingSeams:
         assert kwargs["policy_method"].__self__ is pm._event_policy
         assert kwargs["policy_method"].__name__ == "handle_power_restore_event"
 
+    def test_suspend_arms_and_resume_takes_the_fast_path_without_the_wakeup_delay(self, monkeypatch):
+        from keyrgb.core.power.management.manager import DISABLE_RESUME_FAST_PATH_ENV, PowerManager
+
+        class _Tray:
+            def __init__(self) -> None:
+                self.armed = 0
+
+            def arm_resume_restore(self) -> None:
+                self.armed += 1
+
+            def restore_after_resume(self) -> None:
+                pass
+
+        monkeypatch.delenv(DISABLE_RESUME_FAST_PATH_ENV, raising=False)
+        tray = _Tray()
+        pm = PowerManager(tray)
+
+        with patch.object(pm, "_dispatch_power_event_route") as dispatch:
+            pm._on_suspend()
+            pm._on_resume()
+            monkeypatch.setenv(DISABLE_RESUME_FAST_PATH_ENV, "1")
+            pm._on_suspend()
+            pm._on_resume()
+
+        assert tray.armed == 1
+        fast_kwargs = dispatch.call_args_list[1].kwargs
+        assert (fast_kwargs["delay_s"], fast_kwargs["kb_method_name"]) == (0.0, "restore_after_resume")
+        slow_kwargs = dispatch.call_args_list[3].kwargs
+        assert (slow_kwargs["delay_s"], slow_kwargs["kb_method_name"]) == (0.5, "restore")
+
     def test_on_lid_close_delegates_turn_off_route_metadata_to_shared_helper(self):
         from keyrgb.core.power.management.manager import PowerManager, TurnOffFromEvent
 
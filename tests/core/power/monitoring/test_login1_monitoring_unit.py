@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import socket
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
 from keyrgb.core.power.monitoring.login1_monitoring import iter_prepare_for_sleep_events
+from keyrgb.core.utils.dbus import marshalling
+from keyrgb.core.utils.dbus.connection import BusConnection
 
 
 class _FakeStdout:
@@ -52,6 +57,7 @@ def test_monitor_prepare_for_sleep_calls_on_started_and_emits_callbacks(
 ) -> None:
     from keyrgb.core.power.monitoring import login1_monitoring
 
+    monkeypatch.setenv("KEYRGB_DISABLE_NATIVE_LOGIND", "1")
     fake = _FakeProcess(
         [
             "noise\n",
@@ -98,6 +104,7 @@ def test_monitor_prepare_for_sleep_ignores_unexpected_boolean_value(
 ) -> None:
     from keyrgb.core.power.monitoring import login1_monitoring
 
+    monkeypatch.setenv("KEYRGB_DISABLE_NATIVE_LOGIND", "1")
     fake = _FakeProcess(
         [
             "signal -> PrepareForSleep\n",
@@ -128,6 +135,7 @@ def test_monitor_prepare_for_sleep_does_not_callback_after_shutdown_during_read(
 ) -> None:
     from keyrgb.core.power.monitoring import login1_monitoring
 
+    monkeypatch.setenv("KEYRGB_DISABLE_NATIVE_LOGIND", "1")
     running = {"value": True}
     fake = _FakeProcess(
         ["signal -> PrepareForSleep\n", "   boolean true\n"],
@@ -149,3 +157,179 @@ def test_monitor_prepare_for_sleep_does_not_callback_after_shutdown_during_read(
     on_suspend.assert_not_called()
     on_process_started.assert_called_once_with(fake)
     on_process_stopped.assert_called_once_with(fake)
+
+
+class _MockSystemBus:
+    """One-connection system bus speaking just enough D-Bus for the listener."""
+
+    def __init__(self, path, *, signals: list[bool], reject_auth: bool = False) -> None:
+        self.match_rules: list[str] = []
+        self._signals = signals
+        self._reject_auth = reject_auth
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(str(path))
+        self._server.listen(1)
+        self.address = f"unix:path={path}"
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        conn, _addr = self._server.accept()
+        buffer = bytearray()
+
+        def fill(condition) -> bool:
+            while not condition():
+                chunk = conn.recv(4096)
+                if not chunk:
+                    return False
+                buffer.extend(chunk)
+            return True
+
+        def read_line() -> bytes:
+            fill(lambda: b"\r\n" in buffer)
+            line, _, rest = bytes(buffer).partition(b"\r\n")
+            buffer[:] = rest
+            return line
+
+        with conn:
+            assert read_line().startswith(b"\0AUTH EXTERNAL ")
+            if self._reject_auth:
+                conn.sendall(b"REJECTED EXTERNAL\r\n")
+                return
+            conn.sendall(b"OK 0123456789abcdef0123456789abcdef\r\n")
+            assert read_line() == b"BEGIN"
+            serial = 100
+            while fill(lambda: len(buffer) >= 16) and fill(
+                lambda: len(buffer) >= marshalling.message_length(bytes(buffer[:16]))
+            ):
+                length = marshalling.message_length(bytes(buffer[:16]))
+                call = marshalling.decode_message(bytes(buffer[:length]))
+                del buffer[:length]
+                serial += 1
+                if call.member == "Hello":
+                    conn.sendall(
+                        marshalling.encode_message(
+                            marshalling.METHOD_RETURN,
+                            serial,
+                            reply_serial=call.serial,
+                            signature="s",
+                            values=(":1.42",),
+                        )
+                    )
+                    continue
+                self.match_rules.append(str(call.unpack_body()[0]))
+                # A signal that slips in before the AddMatch reply must not be lost.
+                conn.sendall(self._prepare_for_sleep(serial, self._signals[0]))
+                conn.sendall(
+                    marshalling.encode_message(marshalling.METHOD_RETURN, serial + 1, reply_serial=call.serial)
+                )
+                conn.sendall(
+                    marshalling.encode_message(
+                        marshalling.SIGNAL,
+                        serial + 2,
+                        path="/org/freedesktop/DBus",
+                        interface="org.freedesktop.DBus",
+                        member="NameAcquired",
+                        signature="s",
+                        values=(":1.42",),
+                    )
+                )
+                for offset, start in enumerate(self._signals[1:], start=3):
+                    conn.sendall(self._prepare_for_sleep(serial + offset, start))
+                return
+
+    @staticmethod
+    def _prepare_for_sleep(serial: int, start: bool) -> bytes:
+        return marshalling.encode_message(
+            marshalling.SIGNAL,
+            serial,
+            path="/org/freedesktop/login1",
+            interface="org.freedesktop.login1.Manager",
+            member="PrepareForSleep",
+            sender=":1.3",
+            signature="b",
+            values=(start,),
+        )
+
+    def close(self) -> None:
+        self._thread.join(2.0)
+        self._server.close()
+
+
+def test_native_listener_delivers_suspend_and_resume_edges(monkeypatch, tmp_path) -> None:
+    from keyrgb.core.power.monitoring import login1_monitoring
+
+    bus = _MockSystemBus(tmp_path / "system_bus_socket", signals=[True, False, True])
+    monkeypatch.setenv("DBUS_SYSTEM_BUS_ADDRESS", "unix:path=/nonexistent/keyrgb-bus;" + bus.address)
+    monkeypatch.setattr(
+        login1_monitoring.subprocess, "Popen", MagicMock(side_effect=AssertionError("dbus-monitor spawned"))
+    )
+    edges: list[str] = []
+    handles: list[object] = []
+
+    try:
+        login1_monitoring.monitor_prepare_for_sleep(
+            is_running=lambda: True,
+            on_suspend=lambda: edges.append("suspend"),
+            on_resume=lambda: edges.append("resume"),
+            on_started=lambda: edges.append("started"),
+            on_process_started=handles.append,
+            on_process_stopped=handles.append,
+        )
+    finally:
+        bus.close()
+
+    assert edges == ["started", "suspend", "resume", "suspend"]
+    assert bus.match_rules and "member='PrepareForSleep'" in bus.match_rules[0]
+    assert len(handles) == 2 and handles[0] is handles[1]
+    assert callable(getattr(handles[0], "terminate", None))
+
+
+def test_native_listener_falls_back_to_dbus_monitor_when_auth_is_rejected(monkeypatch, tmp_path) -> None:
+    from keyrgb.core.power.monitoring import login1_monitoring
+
+    bus = _MockSystemBus(tmp_path / "system_bus_socket", signals=[], reject_auth=True)
+    monkeypatch.setenv("DBUS_SYSTEM_BUS_ADDRESS", bus.address)
+    fake = _FakeProcess(["signal -> PrepareForSleep\n", "   boolean true\n"])
+    monkeypatch.setattr(login1_monitoring.subprocess, "Popen", lambda *a, **k: fake)
+    on_suspend = MagicMock()
+
+    try:
+        login1_monitoring.monitor_prepare_for_sleep(
+            is_running=lambda: True, on_suspend=on_suspend, on_resume=MagicMock()
+        )
+    finally:
+        bus.close()
+
+    on_suspend.assert_called_once()
+
+
+def test_native_listener_terminate_unblocks_the_read() -> None:
+    from keyrgb.core.power.monitoring import login1_monitoring
+
+    ours, theirs = socket.socketpair()
+    connection = BusConnection(ours)
+    handles: list[object] = []
+    worker = threading.Thread(
+        target=login1_monitoring._listen_prepare_for_sleep,
+        args=(connection,),
+        kwargs={
+            "is_running": lambda: True,
+            "on_suspend": MagicMock(),
+            "on_resume": MagicMock(),
+            "on_started": None,
+            "on_process_started": handles.append,
+            "on_process_stopped": None,
+        },
+        daemon=True,
+    )
+    try:
+        worker.start()
+        deadline = time.monotonic() + 1.0
+        while not handles and time.monotonic() < deadline:
+            time.sleep(0.005)
+        handles[0].terminate()
+        worker.join(1.0)
+        assert not worker.is_alive()
+    finally:
+        theirs.close()
@@ -6,6 +6,7 @@ import pytest
 
 from keyrgb.core.power.monitoring.power_supply_sysfs import (
     iter_ac_online_files,
+    read_mains_online_from_sysfs,
     read_on_ac_power,
 )
 
@@ -46,6 +47,20 @@ def test_read_on_ac_power_parses_online_values(tmp_path: Path) -> None:
     assert read_on_ac_power(power_supply_root=tmp_path) is True
 
 
+def test_read_mains_online_from_sysfs_reports_every_mains_supply(tmp_path: Path) -> None:
+    _write(tmp_path / "AC" / "type", "Mains\n")
+    _write(tmp_path / "AC" / "online", "0\n")
+    _write(tmp_path / "ucsi-source-psy-USBC000:001" / "type", "Mains\n")
+    _write(tmp_path / "ucsi-source-psy-USBC000:001" / "online", "maybe\n")
+    _write(tmp_path / "BAT0" / "type", "Battery\n")
+    _write(tmp_path / "BAT0" / "online", "1\n")
+
+    assert read_mains_online_from_sysfs(power_supply_root=tmp_path) == {
+        "AC": False,
+        "ucsi-source-psy-USBC000:001": None,
+    }
+
+
 def test_iter_ac_online_files_ignores_unreadable_type_and_keeps_readable_mains(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import pytest
+
+import keyrgb.core.effects.reactive.input as reactive_input
+from keyrgb.core.runtime.input_hub import InputHub
+from keyrgb.core.utils.linux.evdev_reader import EV_KEY, INPUT_EVENT, KeydownReader
+from keyrgb.tray.pollers.idle_power._input_idle import InputIdleTracker
+
+_KEYBOARD = {"ID_INPUT": "1", "ID_INPUT_KEYBOARD": "1"}
+_MOUSE = {"ID_INPUT": "1", "ID_INPUT_MOUSE": "1"}
+_POWER_BUTTON = {"ID_INPUT": "1", "ID_INPUT_KEY": "1"}
+
+
+class _PipeDevice:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        self.closed = False
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    def read(self):
+        raise AssertionError("the hub reads raw fds")
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            os.close(self._read_fd)
+            os.close(self.write_fd)
+
+    def press(self, *codes: int) -> None:
+        os.write(self.write_fd, b"".join(INPUT_EVENT.pack(0, 0, EV_KEY, code, 1) for code in codes))
+
+
+def _wait_for(condition: Callable[[], bool], timeout_s: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+@pytest.fixture
+def make_hub(tmp_path):
+    hubs: list[InputHub] = []
+    opened: dict[str, _PipeDevice] = {}
+
+    def _make(props: dict[str, dict[str, str]], *, looks_like_keyboard: bool = False):
+        def _open(path: str) -> _PipeDevice:
+            opened[path] = _PipeDevice(path)
+            return opened[path]
+
+        hub = InputHub(
+            input_dir=str(tmp_path),
+            list_devices_fn=lambda: list(props),
+            open_device_fn=_open,
+            read_properties_fn=lambda path: props[path],
+            looks_like_keyboard_fn=lambda _dev: looks_like_keyboard,
+        )
+        if not hub.start():
+            pytest.skip("epoll unavailable")
+        hubs.append(hub)
+        return hub, opened
+
+    yield _make
+    for hub in hubs:
+        assert hub.stop(timeout_s=1.0)
+    assert all(dev.closed for dev in opened.values())
+
+
+def test_hub_classifies_devices_once_and_skips_non_user_input(make_hub) -> None:
+    hub, opened = make_hub(
+        {"/dev/input/event0": _KEYBOARD, "/dev/input/event1": _MOUSE, "/dev/input/event2": _POWER_BUTTON}
+    )
+
+    assert sorted(opened) == ["/dev/input/event0", "/dev/input/event1"]
+    assert hub.input_device_count == 2
+    assert hub.keyboard_count == 1
+
+
+def test_keyboard_keydowns_reach_subscribers_and_idle_timestamps(make_hub) -> None:
+    hub, opened = make_hub({"/dev/input/event0": _KEYBOARD, "/dev/input/event1": _MOUSE})
+    subscription = hub.subscribe_keypresses()
+    assert subscription is not None
+    try:
+        started = hub.last_activity_at
+        opened["/dev/input/event0"].press(125)
+        assert _wait_for(lambda: hub.last_activity_at > started)
+        assert hub.last_keyboard_activity_at == 0.0
+
+        opened["/dev/input/event1"].press(272)
+        opened["/dev/input/event0"].press(30, 48)
+        assert _wait_for(lambda: hub.last_keyboard_activity_at > 0.0)
+
+        codes: list[int] = []
+        assert _wait_for(lambda: KeydownReader().read_keydown_codes(subscription.fileno(), codes) or len(codes) >= 3)
+        # Mouse buttons feed idle activity but never reactive pulses.
+        assert codes == [125, 30, 48]
+    finally:
+        subscription.close()
+
+
+def test_pointer_devices_wake_the_hub_once_per_rearm(make_hub) -> None:
+    hub, opened = make_hub({"/dev/input/event1": _MOUSE})
+    mouse = opened["/dev/input/event1"]
+
+    started = hub.last_activity_at
+    mouse.press(272)
+    assert _wait_for(lambda: hub.last_activity_at > started)
+    first = hub.last_activity_at
+
+    # Disarmed until the idle poll re-arms it, so further motion costs no wakeups.
+    mouse.press(272)
+    assert not _wait_for(lambda: hub.last_activity_at > first, timeout_s=0.1)
+
+    hub.rearm_activity_devices()
+    assert _wait_for(lambda: hub.last_activity_at > first)
+
+
+def test_propless_devices_open_only_when_they_look_like_keyboards(make_hub) -> None:
+    hub, opened = make_hub({"/dev/input/event5": {}}, looks_like_keyboard=True)
+
+    assert list(opened) == ["/dev/input/event5"]
+    assert hub.keyboard_count == 1
+    # Without a udev record the device is not a known user-input device.
+    assert hub.input_device_count == 0
+
+
+def test_hotplugged_devices_are_picked_up_through_inotify(tmp_path, make_hub) -> None:
+    props: dict[str, dict[str, str]] = {}
+    hub, opened = make_hub(props)
+    if hub._watch is None:
+        pytest.skip("inotify unavailable")
+    assert not hub.has_keyboards
+
+    props["/dev/input/event7"] = _KEYBOARD
+    (tmp_path / "event7").touch()
+    assert _wait_for(lambda: hub.has_keyboards)
+
+    del props["/dev/input/event7"]
+    (tmp_path / "event7").unlink()
+    assert _wait_for(lambda: not hub.has_keyboards)
+    assert opened["/dev/input/event7"].closed
+
+
+def test_idle_tracker_reads_hub_timestamps_without_opening_devices(make_hub) -> None:
+    hub, opened = make_hub({"/dev/input/event0": _KEYBOARD})
+
+    def _no_devices():
+        raise AssertionError("the tracker must not open devices while the hub runs")
+
+    tracker = InputIdleTracker(list_devices_fn=_no_devices, input_hub_fn=lambda: hub)
+    opened["/dev/input/event0"].press(30)
+    assert _wait_for(lambda: hub.last_keyboard_activity_at > 0.0)
+
+    idle_s = tracker.seconds_since_activity()
+
+    assert idle_s is not None and idle_s < 1.0
+    assert tracker.last_keyboard_activity_at == hub.last_keyboard_activity_at
+
+
+def test_reactive_input_subscribes_to_the_running_hub(monkeypatch, make_hub) -> None:
+    hub, opened = make_hub({"/dev/input/event0": _KEYBOARD})
+    monkeypatch.setattr(reactive_input, "running_input_hub", lambda: hub)
+    monkeypatch.setitem(sys.modules, "evdev", SimpleNamespace(ecodes=SimpleNamespace(EV_KEY=EV_KEY, KEY={})))
+
+    devices = reactive_input.try_open_evdev_keyboards()
+    assert devices is not None and len(devices) == 1
+    try:
+        opened["/dev/input/event0"].press(30)
+        codes: list[int] = []
+        assert _wait_for(lambda: codes.extend(reactive_input.poll_keypress_codes(devices)) or codes == [30])
+    finally:
+        reactive_input.close_evdev_keyboards(devices)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from keyrgb.core.runtime import metrics
+from keyrgb.core.runtime.metrics import Histogram, MetricsRegistry
+
+
+def test_histogram_quantiles_report_bucket_upper_bounds() -> None:
+    hist = Histogram("t", (1.0, 2.0, 4.0))
+    assert hist.quantile(0.5) is None
+
+    for value in (0.5, 0.7, 1.5, 3.0, 9.0):
+        hist.observe(value)
+
+    assert hist.counts == [2, 1, 1, 1]
+    assert hist.quantile(0.5) == 2.0
+    assert hist.quantile(0.99) == 4.0
+    assert hist.snapshot()["mean"] == pytest.approx(2.94)
+
+
+def test_registry_reuses_named_metrics_and_resets_in_place() -> None:
+    registry = MetricsRegistry(enabled=True)
+    counter = registry.counter("hid.reports")
+    counter.add(3)
+    registry.histogram("render.write_ms").observe(5.0)
+
+    assert registry.counter("hid.reports") is counter
+    snapshot = registry.snapshot()
+    assert snapshot["counters"] == {"hid.reports": 3}
+
+    registry.reset()
+    assert counter.value == 0
+    assert registry.histogram("render.write_ms").count == 0
+
+
+@pytest.fixture
+def fresh_registry(monkeypatch) -> MetricsRegistry:
+    registry = MetricsRegistry(enabled=True)
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    for name in ("_FRAME_INTERVAL_MS", "_COMPUTE_MS", "_WRITE_MS", "_HID_REPORT_MS"):
+        monkeypatch.setattr(metrics, name, registry.histogram(getattr(metrics, name).name))
+    monkeypatch.setattr(
+        metrics, "_REPORTS_PER_FRAME", registry.histogram("render.reports_per_frame", metrics.COUNT_BUCKETS)
+    )
+    monkeypatch.setattr(metrics, "_HID_REPORTS", registry.counter("hid.reports"))
+    monkeypatch.setattr(metrics, "_HID_ERRORS", registry.counter("hid.errors"))
+    return registry
+
+
+def test_frame_write_counts_the_reports_it_sent(fresh_registry: MetricsRegistry) -> None:
+    def _write() -> None:
+        for _ in range(12):
+            metrics.timed_hid_report(lambda report: len(report), b"\x00" * 8)
+
+    metrics.timed_frame_write(_write)
+
+    with pytest.raises(OSError):
+        metrics.timed_hid_report(lambda _report: (_ for _ in ()).throw(OSError("pipe")), b"\x00")
+    assert metrics.timed_hid_report(lambda _report: -1, b"\x00") == -1
+
+    snapshot = fresh_registry.snapshot()
+    assert snapshot["counters"] == {"hid.errors": 2, "hid.reports": 12}
+    assert snapshot["histograms"]["render.reports_per_frame"]["p50"] == 12.0
+    assert snapshot["histograms"]["render.write_ms"]["count"] == 1
+
+
+def test_frame_write_ignores_reports_from_other_threads(fresh_registry: MetricsRegistry) -> None:
+    def _other_writer() -> None:
+        for _ in range(5):
+            metrics.timed_hid_report(lambda report: len(report), b"\x00")
+
+    def _write() -> None:
+        other = threading.Thread(target=_other_writer)
+        other.start()
+        other.join()
+        metrics.timed_hid_report(lambda report: len(report), b"\x00")
+
+    metrics.timed_frame_write(_write)
+
+    snapshot = fresh_registry.snapshot()
+    assert snapshot["counters"]["hid.reports"] == 6
+    assert snapshot["histograms"]["render.reports_per_frame"]["p50"] == 1.0
+
+
+def test_render_calls_record_interval_and_compute(fresh_registry: MetricsRegistry, monkeypatch) -> None:
+    exports: list[object] = []
+    monkeypatch.setattr(metrics, "export_snapshot", lambda path=None: exports.append(path))
+    monkeypatch.setattr(metrics, "_last_export_s", 0.0)
+    metrics.begin_frame()
+    metrics.note_render_call()
+    metrics.note_render_call()
+
+    histograms = fresh_registry.snapshot()["histograms"]
+    assert histograms["effects.compute_ms"]["count"] == 1
+    assert histograms["effects.frame_interval_ms"]["count"] >= 1
+    # Exporting is file I/O; it belongs to the tray reactor, not the render path.
+    assert exports == []
+
+
+def test_disabled_registry_records_nothing(fresh_registry: MetricsRegistry) -> None:
+    fresh_registry.enabled = False
+    metrics.timed_frame_write(lambda: metrics.record_hid_report(0.001))
+
+    assert fresh_registry.snapshot()["counters"] == {"hid.errors": 0, "hid.reports": 0}
+
+
+def test_exported_snapshot_round_trips(tmp_path, fresh_registry: MetricsRegistry) -> None:
+    fresh_registry.histogram("render.write_ms").observe(3.0)
+    target = tmp_path / "perf.json"
+
+    metrics.export_snapshot(target)
+
+    exported = metrics.read_exported_snapshot(target)
+    assert exported is not None
+    assert exported["metrics"]["histograms"]["render.write_ms"]["count"] == 1
+    assert metrics.read_exported_snapshot(tmp_path / "missing.json") is None
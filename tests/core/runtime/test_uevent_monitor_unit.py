@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+
+import pytest
+
+from keyrgb.core.power.monitoring import power_supply_sysfs
+from keyrgb.core.runtime import uevent_monitor
+from keyrgb.core.runtime.uevent_monitor import (
+    PowerSupplyEvent,
+    UeventMonitor,
+    UsbDeviceEvent,
+    classify_uevent,
+)
+from keyrgb.core.utils.linux.uevent import Uevent
+
+
+class _FakeNetlinkSocket:
+    """A datagram socketpair whose messages appear to come from the kernel."""
+
+    def __init__(self) -> None:
+        self._ours, self.kernel = socket.socketpair(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._ours.setblocking(False)
+
+    def fileno(self) -> int:
+        return self._ours.fileno()
+
+    def recvfrom(self, size: int):
+        return self._ours.recv(size), (0, 1)
+
+    def close(self) -> None:
+        self._ours.close()
+        self.kernel.close()
+
+    def send(self, header: str, **env: str) -> None:
+        fields = [header, f"ACTION={header.split('@')[0]}", f"DEVPATH={header.split('@')[1]}"]
+        fields += [f"{key}={value}" for key, value in env.items()]
+        self.kernel.send("\0".join(fields).encode() + b"\0")
+
+
+def _wait_for(condition, timeout_s: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+def _mains(online: str, name: str = "AC") -> dict[str, str]:
+    return {
+        "SUBSYSTEM": "power_supply",
+        "POWER_SUPPLY_NAME": name,
+        "POWER_SUPPLY_TYPE": "Mains",
+        "POWER_SUPPLY_ONLINE": online,
+    }
+
+
+def _uevent(action: str, devpath: str, subsystem: str, **env: str) -> Uevent:
+    return Uevent(action=action, devpath=devpath, subsystem=subsystem, env=env)
+
+
+def test_classify_maps_subsystems_to_typed_events() -> None:
+    hidraw = "/devices/pci0000:00/0000:00:14.0/usb1/1-3/1-3:1.1/0003:048D:6004.0005/hidraw/hidraw3"
+
+    ac_change = _uevent(
+        "change",
+        "/x/power_supply/AC",
+        "power_supply",
+        POWER_SUPPLY_NAME="AC",
+        POWER_SUPPLY_TYPE="Mains",
+        POWER_SUPPLY_ONLINE="0",
+    )
+    assert classify_uevent(ac_change) == PowerSupplyEvent(action="change", name="AC", supply_type="Mains", online=False)
+    assert classify_uevent(_uevent("add", hidraw, "hidraw", DEVNAME="hidraw3")) == UsbDeviceEvent(
+        action="add", subsystem="hidraw", vendor_id=0x048D, product_id=0x6004, devname="/dev/hidraw3"
+    )
+    usb_remove = _uevent(
+        "remove", "/devices/usb1/1-3", "usb", DEVTYPE="usb_device", PRODUCT="48d/ce00/3", DEVNAME="bus/usb/001/004"
+    )
+    assert classify_uevent(usb_remove) == UsbDeviceEvent(
+        action="remove", subsystem="usb", vendor_id=0x048D, product_id=0xCE00, devname="/dev/bus/usb/001/004"
+    )
+
+
+def test_classify_ignores_other_vendors_interfaces_and_subsystems() -> None:
+    assert classify_uevent(_uevent("add", "/x/0003:046D:C52B.0001/hidraw/hidraw0", "hidraw")) is None
+    assert classify_uevent(_uevent("add", "/devices/usb1/1-3/1-3:1.0", "usb", DEVTYPE="usb_interface")) is None
+    assert classify_uevent(_uevent("add", "/x/input/input7", "input")) is None
+    assert classify_uevent(_uevent("change", "/x/backlight/intel_backlight", "backlight")) is None
+
+
+@pytest.fixture
+def monitor():
+    sock = _FakeNetlinkSocket()
+    sysfs_reads: list[str] = []
+
+    def _read_sysfs() -> dict[str, bool | None]:
+        sysfs_reads.append("read")
+        return {"AC": True}
+
+    monitor = UeventMonitor(
+        open_socket_fn=lambda: sock,  # type: ignore[arg-type,return-value]
+        read_mains_online_fn=_read_sysfs,
+    )
+    assert monitor.start()
+    yield monitor, sock, sysfs_reads
+    assert monitor.stop(timeout_s=1.0)
+
+
+def test_power_supply_uevents_update_the_cached_ac_state(monitor) -> None:
+    monitor, sock, sysfs_reads = monitor
+    assert monitor.on_ac_power is True
+
+    sock.send("change@/x/power_supply/AC", **_mains("0"))
+    assert _wait_for(lambda: monitor.on_ac_power is False)
+    # A battery capacity update does not change the AC state.
+    sock.send(
+        "change@/x/power_supply/BAT0", SUBSYSTEM="power_supply", POWER_SUPPLY_TYPE="Battery", POWER_SUPPLY_ONLINE="1"
+    )
+    time.sleep(0.05)
+
+    assert monitor.on_ac_power is False
+    assert sysfs_reads == ["read"]
+
+
+def test_ac_state_stays_unknown_until_every_mains_supply_is_known() -> None:
+    sock = _FakeNetlinkSocket()
+    monitor = UeventMonitor(
+        open_socket_fn=lambda: sock,  # type: ignore[arg-type,return-value]
+        read_mains_online_fn=lambda: {"AC": False, "USBC0": None},
+    )
+    assert monitor.start()
+    try:
+        assert monitor.on_ac_power is None
+
+        sock.send("change@/x/power_supply/USBC0", **_mains("0", name="USBC0"))
+        assert _wait_for(lambda: monitor.on_ac_power is False)
+        sock.send("change@/x/power_supply/USBC0", **_mains("1", name="USBC0"))
+        assert _wait_for(lambda: monitor.on_ac_power is True)
+        sock.send("remove@/x/power_supply/USBC0", SUBSYSTEM="power_supply", POWER_SUPPLY_NAME="USBC0")
+        assert _wait_for(lambda: monitor.on_ac_power is False)
+    finally:
+        assert monitor.stop(timeout_s=1.0)
+
+
+def test_power_supply_uevents_wake_waiters(monitor) -> None:
+    monitor, sock, _sysfs_reads = monitor
+    woke: list[bool] = []
+    waiter = threading.Thread(target=lambda: woke.append(monitor.wait_for_power_supply_change(2.0)))
+    waiter.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    sock.send("change@/x/power_supply/AC", **_mains("1"))
+    waiter.join(2.0)
+
+    assert woke == [True]
+    assert time.monotonic() - started < 1.0
+    assert monitor.wait_for_power_supply_change(0.01) is False
+
+
+def test_subscribers_get_typed_events_until_they_unsubscribe(monitor) -> None:
+    monitor, sock, _sysfs_reads = monitor
+    seen: list[object] = []
+    unsubscribe = monitor.subscribe(seen.append)
+
+    sock.send("add@/x/0003:048D:8910.0002/hidraw/hidraw1", SUBSYSTEM="hidraw", DEVNAME="hidraw1")
+    sock.send("add@/x/input/input9", SUBSYSTEM="input")
+    assert _wait_for(lambda: len(seen) == 1)
+    unsubscribe()
+    sock.send("change@/x/backlight/acpi_video0", SUBSYSTEM="backlight")
+    sock.send("remove@/x/0003:048D:8910.0002/hidraw/hidraw1", SUBSYSTEM="hidraw", DEVNAME="hidraw1")
+    time.sleep(0.05)
+
+    assert seen == [UsbDeviceEvent("add", "hidraw", 0x048D, 0x8910, "/dev/hidraw1")]
+
+
+def test_read_on_ac_power_uses_the_running_monitor_without_sysfs(monkeypatch, monitor) -> None:
+    monitor, _sock, _sysfs_reads = monitor
+    monkeypatch.delenv("KEYRGB_SYSFS_POWER_SUPPLY_ROOT", raising=False)
+    monkeypatch.setattr(uevent_monitor, "_monitor", monitor)
+    monkeypatch.setattr(power_supply_sysfs, "iter_ac_online_files", lambda _root: pytest.fail("sysfs was read"))
+
+    assert power_supply_sysfs.read_on_ac_power() is True
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import io
+import socket
+import threading
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from keyrgb.core import control_cli
+from keyrgb.core.utils import control_wire
+from keyrgb.core.utils.control_wire import ControlConnection, ControlProtocolError, MessageType
+
+_KEYMAP = {"frow_00": ((5, 0),), "home_01": ((2, 2),)}
+_STATE = {"effect": "none", "brightness": 30, "color": [1, 2, 3], "per_key": False, "off": False, "rows": 2, "cols": 3}
+
+Responder = Callable[[MessageType, bytes], tuple[MessageType, bytes]]
+
+
+def _ok_or_state(kind: MessageType, payload: bytes) -> tuple[MessageType, bytes]:
+    if kind is MessageType.QUERY:
+        return MessageType.STATE, control_wire.state_payload(_STATE)
+    if kind is MessageType.SET_EFFECT and payload == b"nope":
+        return MessageType.ERROR, b"unknown effect"
+    return MessageType.OK, b""
+
+
+@pytest.fixture
+def _tray() -> Iterator[tuple[ControlConnection, list[tuple[MessageType, bytes]]]]:
+    ours, theirs = socket.socketpair()
+    received: list[tuple[MessageType, bytes]] = []
+
+    def serve() -> None:
+        buffer = bytearray()
+        while data := theirs.recv(4096):
+            buffer += data
+            for kind, payload in control_wire.take_messages(buffer):
+                received.append((kind, payload))
+                theirs.sendall(control_wire.encode_message(*_ok_or_state(kind, payload)))
+        theirs.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    connection = ControlConnection(ours)
+    yield connection, received
+    connection.close()
+    thread.join(timeout=5.0)
+
+
+def test_batches_parse_to_requests_and_adjacent_keys_merge() -> None:
+    requests = control_cli.parse_batch(
+        "brightness 30; color 255,0,0\nkey esc 0,255,0; key 1,4 #0000ff; effect wave; state",
+        load_keymap=lambda: _KEYMAP,
+    )
+
+    assert [request.kind for request in requests] == [
+        MessageType.SET_BRIGHTNESS,
+        MessageType.SET_COLOR,
+        MessageType.SET_KEYS,
+        MessageType.SET_EFFECT,
+        MessageType.QUERY,
+    ]
+    assert requests[1].payload == b"\xff\x00\x00"
+    assert control_wire.decode_key_records(requests[2].payload) == {(5, 0): (0, 255, 0), (1, 4): (0, 0, 255)}
+
+
+@pytest.mark.parametrize("batch", ["color red", "key nokey 1,2,3", "brightness", "watch; state", "jump"])
+def test_unparseable_batches_are_rejected_before_sending(batch: str) -> None:
+    with pytest.raises(ControlProtocolError):
+        control_cli.parse_batch(batch, load_keymap=lambda: _KEYMAP)
+
+
+def test_batch_is_pipelined_and_errors_name_the_command(_tray) -> None:
+    connection, received = _tray
+    out, err = io.StringIO(), io.StringIO()
+    requests = control_cli.parse_batch("effect nope; brightness 10; state", load_keymap=dict)
+
+    status = control_cli.run_batch(connection, requests, out=out, err=err)
+
+    assert status == 1
+    kinds = [kind for kind, _payload in received]
+    assert kinds == [MessageType.SET_EFFECT, MessageType.SET_BRIGHTNESS, MessageType.QUERY]
+    assert "effect nope: unknown effect" in err.getvalue()
+    assert '"rows": 2' in out.getvalue()
+
+
+def test_frames_stream_from_stdin_in_matrix_sized_chunks(_tray) -> None:
+    connection, received = _tray
+    err = io.StringIO()
+    frames = bytes(range(18)) * 5 + b"\x00\x01"
+
+    status = control_cli.stream_frames(connection, io.BytesIO(frames), err=err)
+
+    assert status == 0
+    sent = [payload for kind, payload in received if kind is MessageType.FRAME]
+    assert sent == [bytes(range(18))] * 5
+    assert "partial frame of 2 bytes" in err.getvalue()
+
+
+def test_unreachable_tray_exits_with_its_own_status(tmp_path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert control_cli.main(["--socket", str(tmp_path / "missing.sock"), "state"]) == 3
+    assert "not reachable" in capsys.readouterr().err
@@ -1,4 +1,4 @@
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 
 from keyrgb.tray.app import _runtime_deps
 
@@ -21,3 +21,13 @@ def test_lazy_module_ref_imports_once_and_forwards_attributes(monkeypatch):
     assert calls == ["fake.runtime.module"]
     assert lazy_ref.answer is fake_module.answer
     assert calls == ["fake.runtime.module"]
+
+
+def test_ui_refresh_before_the_icon_exists_does_not_import_the_ui(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(_runtime_deps, "_module", lambda module_path: calls.append(module_path))
+
+    _runtime_deps.update_tray_icon(SimpleNamespace(icon=None))
+    _runtime_deps.update_tray_menu(SimpleNamespace())
+
+    assert calls == []
@@ -1,4 +1,6 @@
 import runpy
+import subprocess
+import sys
 
 import pytest
 
@@ -70,7 +72,7 @@ def test_main_happy_path_wires_startup_and_runs(monkeypatch):
         def run(self):
             calls["tray_run"] += 1
 
-    monkeypatch.setattr(entry, "KeyRGBTray", _Tray)
+    monkeypatch.setattr("keyrgb.tray.app.application.KeyRGBTray", _Tray)
     monkeypatch.setattr(entry.sys, "exit", lambda code: calls["exit"].append(code))
 
     entry.main()
@@ -200,7 +202,7 @@ def test_main_keyboard_interrupt_closes_engine_when_app_exists(monkeypatch):
     monkeypatch.setattr(entry, "configure_logging", lambda: None)
     monkeypatch.setattr(entry, "log_startup_diagnostics_if_debug", lambda: None)
     monkeypatch.setattr(entry, "acquire_single_instance_or_exit", lambda: None)
-    monkeypatch.setattr(entry, "KeyRGBTray", _Tray)
+    monkeypatch.setattr("keyrgb.tray.app.application.KeyRGBTray", _Tray)
     monkeypatch.setattr(entry.signal, "signal", lambda *_a, **_k: None)
     monkeypatch.setattr(entry.sys, "exit", lambda code: None)
 
@@ -235,7 +237,7 @@ def test_main_pystray_swallows_interrupt_still_closes_engine(monkeypatch):
     monkeypatch.setattr(entry, "configure_logging", lambda: None)
     monkeypatch.setattr(entry, "log_startup_diagnostics_if_debug", lambda: None)
     monkeypatch.setattr(entry, "acquire_single_instance_or_exit", lambda: None)
-    monkeypatch.setattr(entry, "KeyRGBTray", _Tray)
+    monkeypatch.setattr("keyrgb.tray.app.application.KeyRGBTray", _Tray)
     monkeypatch.setattr(entry.signal, "signal", lambda *_a, **_k: None)
 
     entry.main()
@@ -262,10 +264,32 @@ def test_main_system_exit_closes_engine(monkeypatch):
     monkeypatch.setattr(entry, "configure_logging", lambda: None)
     monkeypatch.setattr(entry, "log_startup_diagnostics_if_debug", lambda: None)
     monkeypatch.setattr(entry, "acquire_single_instance_or_exit", lambda: None)
-    monkeypatch.setattr(entry, "KeyRGBTray", _Tray)
+    monkeypatch.setattr("keyrgb.tray.app.application.KeyRGBTray", _Tray)
     monkeypatch.setattr(entry.signal, "signal", lambda *_a, **_k: None)
 
     with pytest.raises(SystemExit):
         entry.main()
 
     assert close_calls == [True]
+
+
+def test_startup_trace_flag_is_not_passed_to_runtime_capture(monkeypatch):
+    calls = []
+    monkeypatch.setattr(entry, "capture_runtime_log_from_cli", lambda argv, *, prog: calls.append(argv) or 0)
+    monkeypatch.setattr(entry, "enable_startup_trace", lambda: calls.append("trace"))
+
+    entry.main(["--startup-trace", "--capture-runtime-log"])
+
+    assert calls == ["trace", ("--capture-runtime-log",)]
+
+
+def test_importing_the_entrypoint_defers_the_tray_and_diagnostics() -> None:
+    code = (
+        "import sys, keyrgb.tray.entrypoint; "
+        "print(sorted(m for m in ('keyrgb.tray.app.application', 'keyrgb.core.diagnostics', 'PIL', 'pystray') "
+        "if m in sys.modules))"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
@@ -39,9 +39,41 @@ def test_start_power_monitoring_failure_rolls_back_partial_manager() -> None:
     pm.stop_monitoring.assert_called_once()
 
 
-def test_start_all_polling_wires_pollers() -> None:
+def test_start_all_polling_schedules_pollers_on_one_reactor() -> None:
     from keyrgb.tray.app.lifecycle import start_all_polling
 
+    tray = MagicMock()
+    reactor = MagicMock()
+
+    with (
+        patch("keyrgb.tray.app.lifecycle.PollerReactor", return_value=reactor) as reactor_cls,
+        patch("keyrgb.tray.app.lifecycle.schedule_hardware_polling") as hw,
+        patch("keyrgb.tray.app.lifecycle.schedule_config_polling") as cfg,
+        patch("keyrgb.tray.app.lifecycle.schedule_icon_color_polling") as icon,
+        patch("keyrgb.tray.app.lifecycle.schedule_idle_power_polling") as idle,
+        patch("keyrgb.tray.app.lifecycle.schedule_time_scheduler_polling") as scheduler,
+        patch("keyrgb.tray.app.lifecycle.schedule_control_socket") as control,
+        patch("keyrgb.tray.app.lifecycle.start_hardware_polling") as thread_hw,
+        patch("keyrgb.tray.app.lifecycle.start_input_hub"),
+        patch("keyrgb.tray.app.lifecycle.start_uevent_monitor"),
+    ):
+        start_all_polling(tray, ite_num_rows=6, ite_num_cols=21)
+
+    reactor_cls.assert_called_once_with(vars(tray)["_polling_shutdown_event"])
+    hw.assert_called_once_with(reactor, tray)
+    cfg.assert_called_once_with(reactor, tray, ite_num_rows=6, ite_num_cols=21)
+    icon.assert_called_once_with(reactor, tray)
+    idle.assert_called_once_with(reactor, tray, ite_num_rows=6, ite_num_cols=21)
+    scheduler.assert_called_once_with(reactor, tray)
+    control.assert_called_once_with(reactor, tray, ite_num_rows=6, ite_num_cols=21)
+    thread_hw.assert_not_called()
+    assert vars(tray)["_polling_threads"] == [reactor.start.return_value]
+
+
+def test_start_all_polling_wires_pollers(monkeypatch) -> None:
+    from keyrgb.tray.app.lifecycle import start_all_polling
+
+    monkeypatch.setenv("KEYRGB_DISABLE_POLLER_REACTOR", "1")
     tray = MagicMock()
 
     with (
@@ -50,14 +82,21 @@ def test_start_all_polling_wires_pollers() -> None:
         patch("keyrgb.tray.app.lifecycle.start_icon_color_polling") as icon,
         patch("keyrgb.tray.app.lifecycle.start_idle_power_polling") as idle,
         patch("keyrgb.tray.app.lifecycle.start_time_scheduler_polling") as scheduler,
+        patch("keyrgb.tray.app.lifecycle.start_control_socket") as control,
+        patch("keyrgb.tray.app.lifecycle.start_input_hub") as input_hub,
+        patch("keyrgb.tray.app.lifecycle.start_uevent_monitor") as uevent_monitor,
     ):
         start_all_polling(tray, ite_num_rows=6, ite_num_cols=21)
 
+    input_hub.assert_called_once_with()
+    uevent_monitor.assert_called_once_with()
+
     hw.assert_called_once_with(tray)
     cfg.assert_called_once_with(tray, ite_num_rows=6, ite_num_cols=21)
     icon.assert_called_once_with(tray)
     idle.assert_called_once_with(tray, ite_num_rows=6, ite_num_cols=21)
     scheduler.assert_called_once_with(tray)
+    control.assert_called_once_with(tray, ite_num_rows=6, ite_num_cols=21)
 
 
 def test_shutdown_tray_runtime_stops_producers_before_engine_close(monkeypatch) -> None:
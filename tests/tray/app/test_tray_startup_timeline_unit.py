@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from keyrgb.tray.app import _application_bindings as bindings_mod
+from keyrgb.tray.startup import timeline
+
+
+@pytest.fixture(autouse=True)
+def _no_trace(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(timeline.STARTUP_TRACE_ENV, raising=False)
+    monkeypatch.setattr(timeline, "_timeline", None)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 10.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_timeline_records_phases_relative_to_its_start() -> None:
+    clock = _Clock()
+    trace = timeline.StartupTimeline(clock=clock, process_age_ms=40.0)
+
+    clock.now = 10.005
+    with trace.phase("config load"):
+        clock.now = 10.025
+    trace.mark("icon shown")
+
+    assert [(p.name, round(p.start_ms, 3), round(p.duration_ms, 3)) for p in trace.phases] == [
+        ("interpreter", -40.0, 40.0),
+        ("config load", 5.0, 20.0),
+        ("icon shown", 25.0, 0.0),
+    ]
+    assert trace.report()["total_ms"] == 65.0
+    assert "config load" in trace.format_report()
+
+
+def test_flag_is_stripped_and_env_enables_tracing(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert timeline.startup_trace_requested(("--startup-trace", "--x")) == (True, ("--x",))
+    assert timeline.startup_trace_requested(("--x",)) == (False, ("--x",))
+    monkeypatch.setenv(timeline.STARTUP_TRACE_ENV, "1")
+    assert timeline.startup_trace_requested(()) == (True, ())
+
+
+def test_phases_are_free_when_tracing_is_off(tmp_path: Path) -> None:
+    with timeline.startup_phase("backend probe"):
+        pass
+    timeline.mark_startup("icon shown")
+
+    assert not timeline.startup_trace_active()
+    assert timeline.finish_startup_trace(path=tmp_path / "trace.json") is None
+    assert not (tmp_path / "trace.json").exists()
+
+
+def test_finish_logs_and_writes_the_report_once(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    timeline.enable_startup_trace()
+    with timeline.startup_phase("first frame"):
+        pass
+    path = tmp_path / "run" / timeline.STARTUP_TRACE_FILENAME
+
+    with caplog.at_level(logging.INFO, logger=timeline.__name__):
+        report = timeline.finish_startup_trace(path=path)
+
+    assert report is not None
+    assert "first frame" in [phase["name"] for phase in report["phases"]]
+    assert json.loads(path.read_text(encoding="utf-8")) == report
+    assert "Startup trace" in caplog.text
+    assert timeline.finish_startup_trace(path=path) is None
+
+
+def test_run_tray_reports_once_the_icon_is_shown(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("KEYRGB_RUNTIME_DIR", str(tmp_path))
+
+    class _Icon:
+        visible = False
+
+        def __init__(self, name, image, title, menu) -> None:
+            pass
+
+        def run(self, setup=None) -> None:
+            assert setup is not None
+            setup(self)
+
+    tray = SimpleNamespace(config=SimpleNamespace(effect="static", speed=4, brightness=25), is_off=False, backend=None)
+    run_bindings = bindings_mod.TrayRunBindings(
+        get_pystray=lambda: (SimpleNamespace(Icon=_Icon), object()),
+        create_icon_for_state=lambda **_kwargs: "IMAGE",
+        build_menu=lambda *_args, **_kwargs: "MENU",
+        flush_pending_notifications=lambda _tray: None,
+        logger=logging.getLogger("test"),
+    )
+    timeline.enable_startup_trace()
+
+    bindings_mod.run_tray(tray, bindings=run_bindings)
+
+    assert tray.icon.visible is True
+    assert not timeline.startup_trace_active()
+    report = json.loads((tmp_path / timeline.STARTUP_TRACE_FILENAME).read_text(encoding="utf-8"))
+    assert [phase["name"] for phase in report["phases"]][-3:] == ["ui imports", "icon and menu", "icon shown"]
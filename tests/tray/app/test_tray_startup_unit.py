@@ -49,3 +49,61 @@ def test_migrate_builtin_profile_brightness_best_effort_propagates_unexpected_er
 
     with pytest.raises(AssertionError, match="unexpected migration bug"):
         migrate_builtin_profile_brightness_best_effort(SimpleNamespace())
+
+
+def test_replay_last_output_best_effort_replays_only_for_autostart_and_starts_recording(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from keyrgb.core.backends import probe_cache
+    from keyrgb.core.effects import instant_on
+    from keyrgb.tray.app._startup import replay_last_output_best_effort
+
+    calls: list[tuple[str, object]] = []
+    monkeypatch.delenv(instant_on.DISABLE_INSTANT_ON_ENV, raising=False)
+    monkeypatch.setattr(probe_cache, "hardware_fingerprint", lambda: "ab" * 32)
+    monkeypatch.setattr(
+        instant_on,
+        "replay_output_snapshot",
+        lambda kb, _lock, *, backend_name, fingerprint: calls.append(("replay", backend_name)) or object(),
+    )
+    monkeypatch.setattr(
+        instant_on, "start_output_recording", lambda name, *, fingerprint: calls.append(("record", fingerprint))
+    )
+    engine = SimpleNamespace(kb=object(), kb_lock=object(), device_available=True)
+    backend = SimpleNamespace(name="sysfs-leds")
+
+    assert replay_last_output_best_effort(engine, config=SimpleNamespace(autostart=True), backend=backend) is True
+    assert replay_last_output_best_effort(engine, config=SimpleNamespace(autostart=False), backend=backend) is False
+    assert calls == [("replay", "sysfs-leds"), ("record", "ab" * 32), ("record", "ab" * 32)]
+
+
+@pytest.mark.parametrize(
+    ("config_fields", "on_ac"),
+    [
+        ({"brightness": 0}, True),
+        ({"effect": "perkey", "brightness": 25, "perkey_brightness": 0}, True),
+        ({"brightness": 25, "battery_lighting_enabled": False}, False),
+        ({"brightness": 25, "ac_lighting_enabled": False}, True),
+    ],
+)
+def test_replay_last_output_best_effort_skips_replay_while_lighting_is_configured_off(
+    monkeypatch: pytest.MonkeyPatch,
+    config_fields: dict[str, object],
+    on_ac: bool,
+) -> None:
+    from keyrgb.core.backends import probe_cache
+    from keyrgb.core.effects import instant_on
+    from keyrgb.core.power.monitoring import power_supply_sysfs
+    from keyrgb.tray.app._startup import replay_last_output_best_effort
+
+    calls: list[str] = []
+    monkeypatch.delenv(instant_on.DISABLE_INSTANT_ON_ENV, raising=False)
+    monkeypatch.setattr(probe_cache, "hardware_fingerprint", lambda: "ab" * 32)
+    monkeypatch.setattr(power_supply_sysfs, "read_on_ac_power", lambda: on_ac)
+    monkeypatch.setattr(instant_on, "replay_output_snapshot", lambda *_args, **_kwargs: calls.append("replay"))
+    monkeypatch.setattr(instant_on, "start_output_recording", lambda _name, *, fingerprint: calls.append("record"))
+    engine = SimpleNamespace(kb=object(), kb_lock=object(), device_available=True)
+    config = SimpleNamespace(autostart=True, **config_fields)
+
+    assert replay_last_output_best_effort(engine, config=config, backend=SimpleNamespace(name="sysfs-leds")) is False
+    assert calls == ["record"]
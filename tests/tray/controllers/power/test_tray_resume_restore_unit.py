@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from keyrgb.core.effects import instant_on
+from keyrgb.core.effects._output_snapshot import OutputKind, OutputSnapshot
+from keyrgb.tray.controllers._power import _resume_restore as resume_restore
+from keyrgb.tray.controllers._power._transition_constants import SOFT_ON_START_BRIGHTNESS
+from tests.tray.fakes import make_owner_backed_simple_tray
+
+_OUTPUT = OutputSnapshot("sysfs-leds", b"\0" * 32, OutputKind.UNIFORM, 10, b"\x01\x02\x03")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class _Keyboard:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.fail = fail
+        self.writes: list[tuple[tuple[int, int, int], int]] = []
+
+    def set_color(self, color, *, brightness: int) -> None:
+        if self.fail:
+            raise OSError(19, "No such device")
+        self.writes.append((tuple(color), brightness))
+
+
+class _Engine:
+    def __init__(self, kb: _Keyboard, *, opens_after: int = 0) -> None:
+        self.backend = object()
+        self.kb = kb
+        self.kb_lock = threading.RLock()
+        self.device_available = True
+        self.current_color = (9, 9, 9)
+        self.reopened_kb = _Keyboard()
+        self._opens_after = opens_after
+        self.open_attempts = 0
+
+    def reopen_device(self, *, stale_kb: object | None = None) -> bool:
+        if self.kb is stale_kb:
+            self.kb = _Keyboard(fail=True)
+            self.device_available = False
+        self.open_attempts += 1
+        if self.open_attempts <= self._opens_after:
+            return False
+        self.kb = self.reopened_kb
+        self.device_available = True
+        return True
+
+
+def _tray(engine: _Engine, *, effect: str = "none", **owner: object) -> SimpleNamespace:
+    return make_owner_backed_simple_tray(
+        config=SimpleNamespace(brightness=30, effect=effect),
+        engine=engine,
+        is_off=True,
+        _refresh_ui=MagicMock(),
+        power_forced_off=True,
+        **owner,
+    )
+
+
+def _restore(tray: SimpleNamespace, clock: _Clock, start_current_effect: MagicMock):
+    return resume_restore.restore_after_resume_impl(
+        tray,
+        try_log_event=MagicMock(),
+        safe_int_attr_fn=lambda obj, name, default=0: int(getattr(obj, name, default)),
+        safe_str_attr_fn=lambda obj, name, default="": str(getattr(obj, name, default)),
+        is_software_effect_fn=lambda _effect: False,
+        is_reactive_effect_fn=lambda _effect: False,
+        start_current_effect=start_current_effect,
+        clock=clock,
+        sleep_fn=clock.sleep,
+    )
+
+
+@pytest.fixture
+def _armed_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(instant_on, "current_output_snapshot", lambda: _OUTPUT)
+
+
+@pytest.mark.usefixtures("_armed_output")
+def test_armed_output_is_written_at_full_brightness_on_the_kept_handle() -> None:
+    engine = _Engine(_Keyboard())
+    tray = _tray(engine)
+    start = MagicMock()
+    resume_restore.arm_resume_restore_impl(tray, resolve_target_brightness_fn=lambda t: t.config.brightness)
+
+    timing = _restore(tray, _Clock(), start)
+
+    assert engine.kb.writes == [((1, 2, 3), 30)]
+    assert engine.open_attempts == 0
+    start.assert_called_once_with(tray)
+    assert tray.is_off is False
+    assert timing is not None and timing.reopened is False and timing.first_write_ms is not None
+    assert tray.tray_idle_power_state.resume_restore_plan is None
+
+
+@pytest.mark.usefixtures("_armed_output")
+def test_stale_handle_is_reopened_with_retries_before_the_first_write() -> None:
+    engine = _Engine(_Keyboard(fail=True), opens_after=2)
+    tray = _tray(engine)
+    clock = _Clock()
+    start = MagicMock()
+    resume_restore.arm_resume_restore_impl(tray, resolve_target_brightness_fn=lambda t: t.config.brightness)
+
+    timing = _restore(tray, clock, start)
+
+    assert engine.open_attempts == 3
+    assert engine.reopened_kb.writes == [((1, 2, 3), 30)]
+    start.assert_called_once_with(tray)
+    assert timing is not None and timing.reopened is True
+    assert timing.reopen_ms == pytest.approx(40.0)
+
+
+@pytest.mark.usefixtures("_armed_output")
+def test_plan_for_another_effect_falls_back_to_the_soft_on_fade() -> None:
+    engine = _Engine(_Keyboard())
+    tray = _tray(engine)
+    start = MagicMock()
+    resume_restore.arm_resume_restore_impl(tray, resolve_target_brightness_fn=lambda t: t.config.brightness)
+    tray.config.effect = "rainbow_wave"
+
+    timing = _restore(tray, _Clock(), start)
+
+    assert engine.kb.writes == []
+    assert engine.open_attempts == 0
+    assert start.call_args.kwargs["brightness_override"] == SOFT_ON_START_BRIGHTNESS
+    assert timing is not None and timing.first_write_ms is None
+
+
+def test_missing_device_without_a_plan_is_reopened_before_the_soft_on_fade() -> None:
+    engine = _Engine(_Keyboard())
+    engine.device_available = False
+    tray = _tray(engine)
+    start = MagicMock()
+
+    timing = _restore(tray, _Clock(), start)
+
+    assert engine.open_attempts == 1
+    assert start.call_args.kwargs["brightness_override"] == SOFT_ON_START_BRIGHTNESS
+    assert timing is not None and timing.reopened is True
+
+
+@pytest.mark.usefixtures("_armed_output")
+def test_user_forced_off_keeps_the_keyboard_dark() -> None:
+    engine = _Engine(_Keyboard())
+    tray = _tray(engine, user_forced_off=True)
+    start = MagicMock()
+    resume_restore.arm_resume_restore_impl(tray, resolve_target_brightness_fn=lambda t: t.config.brightness)
+
+    assert _restore(tray, _Clock(), start) is None
+    assert engine.kb.writes == []
+    start.assert_not_called()
+
+
+def test_timing_breakdown_reports_each_step() -> None:
+    timing = resume_restore.ResumeRestoreTiming(
+        reopen_ms=12.0, reopened=True, first_write_ms=3.0, effect_running_ms=20.0, total_ms=300.0
+    )
+
+    assert timing.over_budget
+    assert timing.format() == (
+        "device reopen 12.0 ms, first write 3.0 ms, effect running 20.0 ms, total 300.0 ms (budget 250 ms)"
+    )
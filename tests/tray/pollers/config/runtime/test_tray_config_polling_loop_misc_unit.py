@@ -9,6 +9,12 @@ from keyrgb.tray.pollers import config_polling
 from keyrgb.tray.pollers.config_polling import start_config_polling
 
 
+@pytest.fixture(autouse=True)
+def _mtime_polling_fallback(monkeypatch) -> None:
+    # These tests drive the polling loop through a fake ``time.sleep``.
+    monkeypatch.setattr(config_polling, "_open_config_watcher", lambda _path: None)
+
+
 def _mk_tray_base(*, effect: str, brightness: int) -> MagicMock:
     from tests.tray.fakes import make_owner_backed_mock_tray
 
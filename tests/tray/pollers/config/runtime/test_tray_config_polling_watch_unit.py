@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from keyrgb.core.utils.linux.inotify import DirectoryWatch
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+from keyrgb.tray.pollers import config_polling
+from keyrgb.tray.pollers._reactor import PollerReactor
+
+
+def _start(monkeypatch, config_file) -> tuple[SimpleNamespace, list[str], threading.Event, threading.Thread]:
+    causes: list[str] = []
+    applied = threading.Event()
+
+    def _apply_once(_tray, *, cause: str, last_applied, last_apply_warn_at, **_kwargs):
+        causes.append(cause)
+        applied.set()
+        return last_applied, last_apply_warn_at
+
+    monkeypatch.setattr(config_polling, "_apply_from_config_once", _apply_once)
+    monkeypatch.setattr(config_polling, "run_tray_transition", lambda _tray, fn: fn())
+
+    tray = SimpleNamespace(config=SimpleNamespace(CONFIG_FILE=str(config_file), reload=MagicMock()))
+    tray._polling_shutdown_event = threading.Event()
+    thread = config_polling.start_config_polling(tray, ite_num_rows=6, ite_num_cols=21)
+    assert applied.wait(2.0)
+    applied.clear()
+    return tray, causes, applied, thread
+
+
+def _replace(path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def test_watcher_applies_atomic_replacements_and_skips_identical_rewrites(monkeypatch, tmp_path) -> None:
+    probe = DirectoryWatch.open(tmp_path, ("config.json",))
+    if probe is None:
+        pytest.skip("inotify unavailable")
+    probe.close()
+
+    config_file = tmp_path / "config.json"
+    config_file.write_text('{"effect": "wave"}', encoding="utf-8")
+    opened: list[DirectoryWatch | None] = []
+    real_open = config_polling._open_config_watcher
+
+    def _recording_open(path):
+        opened.append(real_open(path))
+        return opened[-1]
+
+    monkeypatch.setattr(config_polling, "_open_config_watcher", _recording_open)
+    tray, causes, applied, thread = _start(monkeypatch, config_file)
+    try:
+        deadline = time.monotonic() + 2.0
+        while not opened and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert opened and opened[0] is not None
+
+        _replace(config_file, '{"effect": "fire"}')
+        assert applied.wait(2.0)
+        applied.clear()
+
+        os.utime(config_file, ns=(1, 1))
+        _replace(config_file, '{"effect": "fire"}')
+        assert not applied.wait(0.3)
+    finally:
+        tray._polling_shutdown_event.set()
+        thread.join(2.0)
+
+    assert causes == ["startup", "mtime_change"]
+    assert not thread.is_alive()
+    assert opened[0].fileno() == -1
+
+
+def test_disable_flag_keeps_mtime_polling(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("KEYRGB_DISABLE_CONFIG_WATCH", "1")
+    monkeypatch.setattr(DirectoryWatch, "open", MagicMock(side_effect=AssertionError("inotify used")))
+    config_file = tmp_path / "config.json"
+    config_file.write_text("{}", encoding="utf-8")
+    tray, causes, applied, thread = _start(monkeypatch, config_file)
+    try:
+        _replace(config_file, '{"brightness": 5}')
+        assert applied.wait(2.0)
+    finally:
+        tray._polling_shutdown_event.set()
+        thread.join(2.0)
+
+    assert causes == ["startup", "mtime_change"]
+    assert not thread.is_alive()
+
+
+def test_reactor_watches_the_config_dir_fd(monkeypatch, tmp_path) -> None:
+    probe = DirectoryWatch.open(tmp_path, ("config.json",))
+    if probe is None:
+        pytest.skip("inotify unavailable")
+    probe.close()
+
+    config_file = tmp_path / "config.json"
+    config_file.write_text('{"effect": "wave"}', encoding="utf-8")
+    causes: list[str] = []
+    applied = threading.Event()
+
+    def _apply_once(_tray, *, cause: str, last_applied, last_apply_warn_at, **_kwargs):
+        causes.append(cause)
+        applied.set()
+        return last_applied, last_apply_warn_at
+
+    monkeypatch.setattr(config_polling, "_apply_from_config_once", _apply_once)
+    monkeypatch.setattr(config_polling, "run_tray_transition", lambda _tray, fn: fn())
+    tray = SimpleNamespace(config=SimpleNamespace(CONFIG_FILE=str(config_file), reload=MagicMock()))
+    tray._polling_shutdown_event = WakeEvent()
+    reactor = PollerReactor(tray._polling_shutdown_event)
+    config_polling.schedule_config_polling(reactor, tray, ite_num_rows=6, ite_num_cols=21)
+    thread = reactor.start()
+    try:
+        assert applied.wait(2.0)
+        applied.clear()
+        deadline = time.monotonic() + 2.0
+        while len(reactor._selector.get_map()) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        _replace(config_file, '{"effect": "fire"}')
+        assert applied.wait(2.0)
+    finally:
+        tray._polling_shutdown_event.set()
+        thread.join(2.0)
+
+    assert causes == ["startup", "mtime_change"]
+    assert not thread.is_alive()
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from keyrgb.core.utils import control_wire
+from keyrgb.core.utils.control_wire import MessageType
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+from keyrgb.tray.pollers._reactor import PollerReactor
+from keyrgb.tray.pollers.control import server as control_socket
+from keyrgb.tray.protocols import TrayControlState
+
+
+class _Connection:
+    def __init__(self, path: Path) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(5.0)
+        self.sock.connect(str(path))
+        self.buffer = bytearray()
+        self.pending: list[tuple[MessageType, bytes]] = []
+
+    def receive(self) -> tuple[MessageType, bytes]:
+        while not self.pending:
+            data = self.sock.recv(4096)
+            assert data, "tray closed the connection"
+            self.buffer += data
+            self.pending.extend(control_wire.take_messages(self.buffer))
+        return self.pending.pop(0)
+
+    def request(self, kind: MessageType, payload: bytes = b"") -> tuple[MessageType, bytes]:
+        self.sock.sendall(control_wire.encode_message(kind, payload))
+        return self.receive()
+
+
+class _Keyboard:
+    def __init__(self) -> None:
+        self.writes: list[tuple[dict[tuple[int, int], tuple[int, int, int]], int, bool]] = []
+        self.threads: list[str] = []
+
+    def set_key_colors(self, color_map, *, brightness: int, enable_user_mode: bool = True) -> None:
+        self.writes.append((dict(color_map), brightness, enable_user_mode))
+        self.threads.append(threading.current_thread().name)
+
+
+@pytest.fixture
+def _tray(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[SimpleNamespace]:
+    from keyrgb.core.config import Config
+
+    monkeypatch.setenv("KEYRGB_CONFIG_DIR", str(tmp_path / "cfg"))
+    monkeypatch.setenv("KEYRGB_RUNTIME_DIR", str(tmp_path / "run"))
+    monkeypatch.delenv(control_socket.DISABLE_CONTROL_SOCKET_ENV, raising=False)
+    monkeypatch.setattr(control_socket, "_PERSIST_DELAY_S", 0.0)
+    applied: list[tuple[str, str, int]] = []
+    engine = SimpleNamespace(
+        kb=_Keyboard(), kb_lock=threading.RLock(), running=False, per_key_colors=None, wake_render_loop=lambda: None
+    )
+    tray = SimpleNamespace(config=Config(), is_off=False, engine=engine, tray_control_state=TrayControlState())
+    tray.tray_control_state.config_apply = lambda *, cause: applied.append(
+        (cause, tray.config.effect, tray.config.brightness)
+    )
+    tray.applied = applied
+    shutdown = WakeEvent()
+    reactor = PollerReactor(shutdown)
+    assert control_socket.schedule_control_socket(reactor, tray, ite_num_rows=2, ite_num_cols=3) is not None
+    thread = reactor.start()
+    yield tray
+    shutdown.set()
+    thread.join(timeout=5.0)
+    assert not thread.is_alive()
+    assert not control_wire.control_socket_path().exists()
+
+
+def test_commands_apply_in_memory_and_persist_afterwards(_tray: SimpleNamespace) -> None:
+    from keyrgb.core.config import Config
+
+    connection = _Connection(control_wire.control_socket_path())
+
+    assert connection.request(MessageType.SET_EFFECT, b"rainbow_wave") == (MessageType.OK, b"")
+    assert connection.request(MessageType.SET_BRIGHTNESS, b"\x1e") == (MessageType.OK, b"")
+    kind, payload = connection.request(MessageType.QUERY)
+
+    assert kind is MessageType.STATE
+    state = control_wire.decode_state(payload)
+    assert (state["effect"], state["brightness"], state["rows"], state["cols"]) == ("rainbow_wave", 30, 2, 3)
+    assert _tray.applied == [("control_socket", "rainbow_wave", 25), ("control_socket", "rainbow_wave", 30)]
+    # The persist timer ran before the query was answered.
+    reloaded = Config()
+    assert (reloaded.effect, reloaded.brightness) == ("rainbow_wave", 30)
+
+
+def test_frames_and_keys_go_to_the_device_without_touching_config(_tray: SimpleNamespace) -> None:
+    from keyrgb.core.config import Config
+
+    connection = _Connection(control_wire.control_socket_path())
+    _tray.config.effect = "wave"
+    _tray.config.brightness = 40
+
+    assert connection.request(MessageType.FRAME, bytes(range(18))) == (MessageType.OK, b"")
+    assert connection.request(MessageType.SET_KEYS, b"\x00\x00\x09\x09\x09") == (MessageType.OK, b"")
+
+    first, merged = _tray.engine.kb.writes
+    assert (first[0][(1, 2)], first[1], first[2]) == ((15, 16, 17), 40, True)
+    assert (merged[0][(0, 0)], merged[0][(1, 2)], merged[2]) == ((9, 9, 9), (15, 16, 17), False)
+    assert (_tray.config.effect, _tray.config.per_key_colors) == ("wave", {})
+    assert _tray.applied == []
+    assert Config().per_key_colors == {}
+    kind, reason = connection.request(MessageType.FRAME, b"\x00" * 4)
+    assert kind is MessageType.ERROR and b"18 bytes" in reason
+
+    assert connection.request(MessageType.SET_COLOR, b"\x01\x02\x03") == (MessageType.OK, b"")
+    assert _tray.config.color == (1, 2, 3)
+
+
+def test_pipelined_commands_run_off_the_reactor_and_reply_in_order(_tray: SimpleNamespace) -> None:
+    connection = _Connection(control_wire.control_socket_path())
+    connection.sock.sendall(
+        control_wire.encode_message(MessageType.FRAME, bytes(range(18)))
+        + control_wire.encode_message(MessageType.FRAME, b"\x00")
+        + control_wire.encode_message(MessageType.SET_BRIGHTNESS, b"\x0a")
+        + control_wire.encode_message(MessageType.QUERY)
+    )
+
+    replies = [connection.receive() for _ in range(4)]
+
+    assert [kind for kind, _payload in replies] == [
+        MessageType.OK,
+        MessageType.ERROR,
+        MessageType.OK,
+        MessageType.STATE,
+    ]
+    assert control_wire.decode_state(replies[3][1])["brightness"] == 10
+    assert _tray.engine.kb.threads == ["keyrgb-poller-actions"]
+    assert _tray.applied == [("control_socket", _tray.config.effect, 10)]
+
+
+def test_frames_become_the_base_of_a_running_software_effect(_tray: SimpleNamespace) -> None:
+    connection = _Connection(control_wire.control_socket_path())
+    _tray.config.effect = "rainbow_wave"
+    _tray.engine.running = True
+
+    assert connection.request(MessageType.FRAME, bytes(range(18))) == (MessageType.OK, b"")
+
+    assert _tray.engine.per_key_colors[(1, 2)] == (15, 16, 17)
+    assert _tray.engine.kb.writes == []
+
+    _tray.is_off = True
+    kind, reason = connection.request(MessageType.FRAME, bytes(range(18)))
+    assert kind is MessageType.ERROR and b"off" in reason
+
+
+def test_subscribers_get_the_state_when_the_tray_reports_a_change(_tray: SimpleNamespace) -> None:
+    connection = _Connection(control_wire.control_socket_path())
+    kind, payload = connection.request(MessageType.SUBSCRIBE)
+    assert kind is MessageType.STATE
+
+    _tray.is_off = True
+    control_socket.notify_state_changed(_tray)
+
+    kind, payload = connection.receive()
+    assert kind is MessageType.STATE
+    assert json.loads(payload)["off"] is True
+
+
+def test_disabled_socket_is_not_opened(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("KEYRGB_RUNTIME_DIR", str(tmp_path))
+    monkeypatch.setenv(control_socket.DISABLE_CONTROL_SOCKET_ENV, "1")
+
+    reactor = PollerReactor(WakeEvent())
+
+    assert control_socket.schedule_control_socket(reactor, SimpleNamespace(), ite_num_rows=6, ite_num_cols=21) is None
+    assert not (tmp_path / control_wire.CONTROL_SOCKET_FILENAME).exists()
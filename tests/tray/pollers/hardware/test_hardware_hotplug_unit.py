@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from keyrgb.core.runtime.uevent_monitor import PowerSupplyEvent, UsbDeviceEvent
+from keyrgb.tray.pollers.hardware import _hotplug
+
+
+def _event(action: str) -> UsbDeviceEvent:
+    return UsbDeviceEvent(action, "hidraw", 0x048D, 0x6004, "/dev/hidraw3")
+
+
+def _tray(*, available: bool, reopen_results: list[bool], is_off: bool = False) -> SimpleNamespace:
+    calls: list[str] = []
+
+    def reopen_device() -> bool:
+        calls.append("reopen")
+        engine.device_available = reopen_results.pop(0)
+        return engine.device_available
+
+    engine = SimpleNamespace(device_available=available, reopen_device=reopen_device)
+    return SimpleNamespace(
+        engine=engine,
+        is_off=is_off,
+        calls=calls,
+        _start_current_effect=lambda **_kwargs: calls.append("start"),
+        _refresh_ui=lambda **_kwargs: None,
+        _log_event=lambda *_args, **_kwargs: None,
+    )
+
+
+def test_arrival_reopens_a_missing_device_and_restarts_the_effect() -> None:
+    tray = _tray(available=False, reopen_results=[True])
+
+    assert _hotplug.reacquire_after_hotplug(tray, _event("add")) is True
+    assert tray.calls == ["reopen", "start"]
+
+
+def test_arrival_leaves_an_open_device_and_an_off_keyboard_dark() -> None:
+    open_tray = _tray(available=True, reopen_results=[])
+    off_tray = _tray(available=False, reopen_results=[True], is_off=True)
+
+    assert _hotplug.reacquire_after_hotplug(open_tray, _event("add")) is True
+    assert _hotplug.reacquire_after_hotplug(off_tray, _event("add")) is True
+    assert open_tray.calls == []
+    assert off_tray.calls == ["reopen"]
+
+
+def test_removal_drops_the_handle_without_restarting() -> None:
+    tray = _tray(available=True, reopen_results=[False])
+
+    assert _hotplug.reacquire_after_hotplug(tray, _event("remove")) is True
+    assert tray.calls == ["reopen"]
+    assert tray.engine.device_available is False
+
+
+def test_failed_arrival_is_retried_a_bounded_number_of_times() -> None:
+    tray = _tray(available=False, reopen_results=[False] * _hotplug.HOTPLUG_MAX_ATTEMPTS)
+    step = _hotplug._hotplug_step(tray, _event("add"))
+
+    delays = [step() for _ in range(_hotplug.HOTPLUG_MAX_ATTEMPTS)]
+
+    assert delays == [_hotplug.HOTPLUG_RETRY_DELAY_S] * (_hotplug.HOTPLUG_MAX_ATTEMPTS - 1) + [None]
+
+
+def test_subscription_posts_controller_events_to_the_reactor(monkeypatch) -> None:
+    subscribers: list = []
+    monitor = SimpleNamespace(subscribe=lambda callback: subscribers.append(callback) or (lambda: subscribers.clear()))
+    monkeypatch.setattr(_hotplug, "running_uevent_monitor", lambda: monitor)
+    posted: list = []
+    scheduled: list[tuple[str, bool]] = []
+    exits: list = []
+    reactor = SimpleNamespace(
+        call_soon_threadsafe=lambda callback, *, name: posted.append(callback),
+        call_later=lambda _delay, _callback, *, name, blocking=False: scheduled.append((name, blocking)),
+        at_exit=exits.append,
+    )
+
+    assert _hotplug.subscribe_hardware_hotplug(reactor, _tray(available=False, reopen_results=[])) is not None
+    subscribers[0](PowerSupplyEvent("change", "AC", "Mains", True))
+    subscribers[0](_event("change"))
+    subscribers[0](_event("add"))
+    for callback in posted:
+        callback()
+    exits[0]()
+
+    assert scheduled == [("hardware_hotplug", True)]
+    assert subscribers == []
+
+
+def test_subscription_is_skipped_without_a_monitor(monkeypatch) -> None:
+    monkeypatch.setattr(_hotplug, "running_uevent_monitor", lambda: None)
+
+    assert _hotplug.subscribe_hardware_hotplug(SimpleNamespace(), SimpleNamespace()) is None
@@ -214,3 +214,45 @@ def test_open_failure_is_skipped() -> None:
     )
 
     assert tracker.seconds_since_activity() is None
+
+
+def test_raw_fd_keyboard_reads_ignore_modifier_only_presses() -> None:
+    import os
+
+    from keyrgb.core.utils.linux.evdev_reader import EV_KEY, INPUT_EVENT
+
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+
+    class _PipeDevice:
+        path = "/dev/input/event-keyboard"
+
+        def fileno(self) -> int:
+            return read_fd
+
+        def read(self) -> Iterable[object]:
+            raise AssertionError("raw fd devices must not go through python-evdev read()")
+
+        def close(self) -> None:
+            return None
+
+    try:
+        tracker = input_idle.InputIdleTracker(
+            monotonic_fn=iter([0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]).__next__,
+            list_devices_fn=lambda: ["/dev/input/event-keyboard"],
+            open_device_fn=lambda _path: _PipeDevice(),
+            is_input_device_fn=lambda _path: True,
+            is_keyboard_device_fn=lambda _path: True,
+            select_fn=lambda r, w, x, t: (list(r), [], []),
+        )
+
+        os.write(write_fd, INPUT_EVENT.pack(0, 0, EV_KEY, 125, 1))
+        tracker.seconds_since_activity()
+        assert tracker.last_keyboard_activity_at == 0.0
+
+        os.write(write_fd, INPUT_EVENT.pack(0, 0, EV_KEY, 30, 1))
+        tracker.seconds_since_activity()
+        assert tracker.last_keyboard_activity_at == 4.0
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+import threading
+
+from keyrgb.core.utils.linux.wake_event import WakeEvent
+from keyrgb.tray.pollers._reactor import PollerReactor, poller_reactor_enabled
+
+
+def test_timers_reschedule_with_the_returned_delay_and_stop_on_none() -> None:
+    event = WakeEvent()
+    reactor = PollerReactor(event)
+    runs: list[str] = []
+
+    def three_times() -> float | None:
+        runs.append("a")
+        return 0.0 if len(runs) < 3 else None
+
+    reactor.call_later(0.0, three_times, name="a")
+    reactor.run()
+
+    # The loop ends on its own once no timer or reader is left.
+    assert runs == ["a", "a", "a"]
+
+
+def test_timers_due_together_share_one_wakeup() -> None:
+    now = [100.0]
+    reactor = PollerReactor(threading.Event(), monotonic_fn=lambda: now[0])
+    runs: list[str] = []
+    reactor.call_later(0.0, lambda: runs.append("first"), name="first")
+    reactor.call_later(0.01, lambda: runs.append("second"), name="second")
+    reactor.call_later(5.0, lambda: runs.append("late"), name="late")
+
+    reactor._run_due_timers()
+
+    assert runs == ["first", "second"]
+
+
+def test_readers_run_when_their_fd_is_readable() -> None:
+    event = WakeEvent()
+    reactor = PollerReactor(event)
+    read_fd, write_fd = os.pipe()
+    seen: list[bytes] = []
+
+    def on_readable() -> None:
+        seen.append(os.read(read_fd, 16))
+        reactor.remove_reader(read_fd)
+
+    try:
+        reactor.add_reader(read_fd, on_readable, name="pipe")
+        os.write(write_fd, b"ping")
+        reactor.run()
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+    assert seen == [b"ping"]
+
+
+def test_shutdown_event_wakes_the_reactor_and_runs_exit_callbacks() -> None:
+    event = WakeEvent()
+    reactor = PollerReactor(event)
+    exited: list[str] = []
+    reactor.call_later(3600.0, lambda: 1.0, name="hourly")
+    reactor.at_exit(lambda: exited.append("closed"))
+
+    thread = reactor.start()
+    event.set()
+    thread.join(timeout=1.0)
+
+    assert not thread.is_alive()
+    assert exited == ["closed"]
+
+
+def test_a_raising_callback_is_dropped_without_stopping_the_others() -> None:
+    reactor = PollerReactor(WakeEvent())
+    runs: list[str] = []
+
+    def broken() -> float:
+        runs.append("broken")
+        raise RuntimeError("boom")
+
+    def healthy() -> float | None:
+        runs.append("healthy")
+        return 0.0 if runs.count("healthy") < 2 else None
+
+    reactor.call_later(0.0, broken, name="broken")
+    reactor.call_later(0.0, healthy, name="healthy")
+    reactor.run()
+
+    assert runs.count("broken") == 1
+    assert runs.count("healthy") == 2
+
+
+def test_blocking_timers_run_on_the_worker_and_reschedule_from_the_reactor() -> None:
+    reactor = PollerReactor(WakeEvent())
+    threads: list[str] = []
+
+    def step() -> float | None:
+        threads.append(threading.current_thread().name)
+        return 0.0 if len(threads) < 2 else None
+
+    reactor.call_later(0.0, step, name="slow", blocking=True)
+    reactor.run()
+
+    assert threads == ["keyrgb-poller-actions", "keyrgb-poller-actions"]
+
+
+def test_reactor_keeps_serving_timers_while_a_blocking_job_runs() -> None:
+    reactor = PollerReactor(WakeEvent())
+    release = threading.Event()
+    ticks: list[str] = []
+    results: list[tuple[str, str]] = []
+
+    def blocking_job() -> str:
+        release.wait(2.0)
+        return "done"
+
+    def tick() -> float | None:
+        ticks.append("tick")
+        if len(ticks) < 3:
+            return 0.0
+        release.set()
+        return None
+
+    reactor.run_blocking(
+        blocking_job,
+        name="job",
+        then=lambda result: results.append((result, threading.current_thread().name)),
+    )
+    reactor.call_later(0.0, tick, name="tick")
+    thread = threading.Thread(target=reactor.run, name="reactor-under-test")
+    thread.start()
+    thread.join(timeout=2.0)
+
+    assert not thread.is_alive()
+    assert ticks == ["tick", "tick", "tick"]
+    assert results == [("done", "reactor-under-test")]
+
+
+def test_disable_flag_turns_the_reactor_off(monkeypatch) -> None:
+    monkeypatch.setenv("KEYRGB_DISABLE_POLLER_REACTOR", "1")
+
+    assert not poller_reactor_enabled()
@@ -239,3 +239,26 @@ def test_device_context_entries_use_sysfs_mouse_context_key_and_backend_name() -
     assert entries[1]["key"] == "mouse:sysfs:usbmouse__rgb"
     assert entries[1]["backend_name"] == "sysfs-mouse"
     assert entries[1]["text"] == "Mouse: usbmouse::rgb"
+
+
+def test_performance_status_lines_summarize_the_metrics_registry(monkeypatch) -> None:
+    from keyrgb.core.runtime.metrics import MetricsRegistry
+
+    registry = MetricsRegistry(enabled=True)
+    monkeypatch.setattr("keyrgb.core.runtime.metrics.REGISTRY", registry)
+    assert menu_status.performance_status_lines() == ["No frames rendered yet"]
+
+    for _ in range(10):
+        registry.histogram("effects.frame_interval_ms").observe(40.0)
+        registry.histogram("effects.compute_ms").observe(0.8)
+        registry.histogram("render.write_ms").observe(30.0)
+    registry.counter("frames.written").add(1200)
+    registry.counter("frames.dropped").add(3)
+
+    assert menu_status.performance_status_lines() == [
+        "Frame rate: 25.0 fps",
+        "Compute: p50 1 ms · p90 1 ms",
+        "Device write: p50 33 ms · p90 33 ms",
+        "Frames: 1,200 written · 3 dropped",
+        "Limited by: device writes",
+    ]